@@ -88,7 +88,7 @@ class Athena_Vortex_Lattice(Aerodynamics):
          
         settings.number_of_control_surfaces                          = 0 
         settings.filenames                                           = Data()
-        settings.filenames.avl_bin_name                              = 'avl' # to call avl from command line. If avl is not on the system path, include absolute path to the avl binary i.e. '/your/path/to/avl'
+        settings.filenames.avl_bin_name                              = 'avl' # to call avl from command line. If avl is not on the system path, include absolute path to the avl binary i.e. '/your/path/to/avl', a list runs a program with arguments
         settings.filenames.run_folder                                = 'avl_files'  
         settings.filenames.features                                  = 'aircraft.avl'
         settings.filenames.mass_file                                 = 'aircraft.mass'
@@ -111,6 +111,7 @@ class Athena_Vortex_Lattice(Aerodynamics):
         settings.print_output                                        = False 
         settings.keep_files                                          = False        
         settings.new_regression_results                              = False  
+        settings.number_of_workers                                   = 1     # AVL processes run at once, 1 runs the batches one at a time
         settings.side_slip_angle                                     = 0.0
         settings.roll_rate_coefficient                               = 0.0
         settings.pitch_rate_coefficient                              = 0.0 
@@ -110,6 +110,12 @@ class Vortex_Lattice_Method(Aerodynamics):
         self.settings.leading_edge_suction_multiplier                    = 1.0  
         self.settings.use_VORLAX_matrix_calculation                      = False
         self.settings.floating_point_precision                           = np.float32     
+        self.settings.cache_influence_matrices                           = True
+        self.settings.influence_matrix_cache_memory                      = 2.5E8 # bytes
+        self.settings.cache_vortex_distributions                         = True
+        self.settings.vortex_distribution_cache_size                     = 16    # geometries kept in the vortex distribution cache
+        self.settings.number_of_training_workers                         = 1     # processes used to train the surrogates
+        self.settings.surrogate_cache_directory                          = None  # directory of stored surrogate training data, None disables it
     
         # conditions table, used for surrogate model training
         self.training                                               = Data()
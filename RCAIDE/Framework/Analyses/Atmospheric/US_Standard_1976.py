@@ -3,6 +3,7 @@
 # Created: 
 # Modified: Feb 2016, Andrew Wendorff
 #           Jan 2018, W. Maier
+#           Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -18,6 +19,10 @@ from RCAIDE.Framework.Core.Arrays import atleast_2d_col
 
 from RCAIDE.Library.Attributes.Gases import Air
 from RCAIDE.Library.Attributes.Planets import Earth
+
+# fluid and planet properties of the standard atmosphere
+standard_gas    = Air()
+standard_planet = Earth()
  
 
 # ----------------------------------------------------------------------
@@ -102,9 +107,9 @@ class US_Standard_1976(Atmospheric):
         delta_isa = temperature_deviation
         
         # check properties
-        if not gas == Air():
+        if not gas == standard_gas:
             warn('US Standard Atmosphere not using Air fluid properties')
-        if not planet == Earth():
+        if not planet == standard_planet:
             warn('US Standard Atmosphere not using Earth planet properties')          
         
         # convert input if necessary
@@ -125,27 +130,16 @@ class US_Standard_1976(Atmospheric):
             print("Warning: altitude requested above maximum for this atmospheric model; returning values for h = 86.0 km")   
             zs[zs > zmax] = zmax        
 
-        # initialize return data
-        zeros = np.zeros_like(zs)
-        p     = zeros * 0.0
-        T     = zeros * 0.0
-        rho   = zeros * 0.0
-        a     = zeros * 0.0
-        mu    = zeros * 0.0
-        z0    = zeros * 0.0
-        T0    = zeros * 0.0
-        p0    = zeros * 0.0
-        alpha = zeros * 0.0
-        
-        # populate the altitude breaks
-        # this uses >= and <= to capture both edges and because values should be the same at the edges
-        for i in range( len(self.breaks.altitude)-1 ): 
-            i_inside = (zs >= self.breaks.altitude[i]) & (zs <= self.breaks.altitude[i+1])
-            z0[ i_inside ]    = self.breaks.altitude[i]
-            T0[ i_inside ]    = self.breaks.temperature[i]
-            p0[ i_inside ]    = self.breaks.pressure[i]
-            alpha[ i_inside ] = -(self.breaks.temperature[i+1] - self.breaks.temperature[i])/ \
-                                 (self.breaks.altitude[i+1]    - self.breaks.altitude[i])
+        # locate the layer of each altitude, an altitude on a break uses the layer above the break
+        breaks  = self.breaks
+        z_break = breaks.altitude
+        T_break = breaks.temperature
+        i_layer = np.clip(np.searchsorted(z_break,zs,side='right') - 1,0,len(z_break) - 2)
+        z0      = z_break[i_layer]
+        T0      = T_break[i_layer]
+        p0      = breaks.pressure[i_layer]
+        alpha   = (-(T_break[1:] - T_break[:-1])/(z_break[1:] - z_break[:-1]))[i_layer]
+        p       = np.zeros_like(zs)
         
         # interpolate the breaks
         dz = zs-z0
@@ -40,6 +40,10 @@ class Emission_Index_CRN_Method(Emissions):
         
         # surrogoate models                 
         self.surrogates                 = Data() 
+        
+        self.settings.number_of_training_workers   = 1    # processes evaluating the training grid points, 1 evaluates them serially 
+        self.settings.training_checkpoint_file     = None # file of the finished training grid points, without extension, None disables it 
+        self.settings.training_checkpoint_interval = 60.  # seconds between writes of the checkpoint file, it is also written when the training ends 
 
         # build the evaluation process
         compute                         = Process()  
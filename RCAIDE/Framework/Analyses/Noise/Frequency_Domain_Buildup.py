@@ -9,13 +9,15 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 # RCAIDE Imports
 import RCAIDE
+from RCAIDE.Framework.Core                                                            import Data
 from RCAIDE.Library.Methods.Noise.Common.decibel_arithmetic                           import SPL_arithmetic  
 from RCAIDE.Library.Methods.Noise.Common.generate_hemisphere_microphone_locations     import generate_hemisphere_microphone_locations  
-from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.compute_rotor_noise  import compute_rotor_noise 
+from RCAIDE.Library.Methods.Noise.Frequency_Domain_Buildup.Rotor.compute_rotor_noise  import compute_rotor_noise, assemble_rotor_noise, evaluate_rotor_noise_control_point, initialize_noise_worker
 from .Noise      import Noise
 
 # package imports
 import numpy as np 
+from concurrent.futures import ProcessPoolExecutor
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Frequency_Domain_Buildup
@@ -63,6 +65,7 @@ class Frequency_Domain_Buildup(Noise):
         self.tag                                   =  "Frequency_Domain_Buildup"        
         self.settings.fidelity                     = 'line_source'
         self.settings.use_plane_loading_surrogate =  True 
+        self.settings.number_of_workers           = 1 # processes evaluating the rotors and control points, 1 evaluates them serially 
     def evaluate_noise(self,segment):
         """ Process vehicle to setup vehicle, condititon and configuration
     
@@ -74,7 +77,8 @@ class Frequency_Domain_Buildup(Noise):
     
         Inputs:
         self.settings.
-            center_frequencies  - 1/3 octave band frequencies   [unitless]
+            center_frequencies  - 1/3 octave band frequencies                    [unitless]
+            number_of_workers   - processes evaluating rotors and control points [unitless]
     
         Outputs:
         None
@@ -97,17 +101,35 @@ class Frequency_Domain_Buildup(Noise):
         total_SPL_dBA          = np.ones((ctrl_pts,N_hemisphere_mics))*1E-16 
         total_SPL_spectra      = np.ones((ctrl_pts,N_hemisphere_mics,dim_cf))*1E-16  
          
-        # iterate through sources and iteratively add rotor noise
+        # list the rotors in the order their noise is added
+        rotors    = []
         rotor_tag = None
         i = 0
-        for network in config.networks:
-            for propulsor in network.propulsors:
+        for network_tag, network in config.networks.items():
+            for propulsor_tag, propulsor in network.propulsors.items():
                 for sub_tag , sub_item in  propulsor.items():
                     if isinstance(sub_item, RCAIDE.Library.Components.Propulsors.Converters.Rotor): 
-                        rotor_tag         = compute_rotor_noise(microphone_locations,propulsor,sub_item,segment,settings, rotor_index = i, previous_rotor_tag= rotor_tag, identical_propulsors=network.identical_propulsors)   
-                        total_SPL_dBA     = SPL_arithmetic(np.concatenate((total_SPL_dBA[:,None,:],conditions.noise[propulsor.tag][sub_item.tag].SPL_dBA[:,None,:]),axis =1),sum_axis=1)
-                        total_SPL_spectra = SPL_arithmetic(np.concatenate((total_SPL_spectra[:,None,:,:],conditions.noise[propulsor.tag][sub_item.tag].SPL_1_3_spectrum[:,None,:,:]),axis =1),sum_axis=1) 
+                        rotors.append(Data(network = network, propulsor = propulsor, rotor = sub_item, keys = [network_tag, propulsor_tag, sub_tag], rotor_index = i, previous_rotor_tag = rotor_tag))
+                        rotor_tag = sub_item.tag
                         i += 1
+        
+        # the rotors and control points are independent, with more than one worker they are distributed over a pool of processes
+        workers = settings.number_of_workers if 'number_of_workers' in settings.keys() else 1
+        if workers > 1 and len(rotors)*ctrl_pts > 1:
+            units = [Data(keys = r.keys, control_point = cpt, rotor_index = r.rotor_index, previous_rotor_tag = r.previous_rotor_tag) 
+                     for r in rotors for cpt in range(ctrl_pts)]
+            with ProcessPoolExecutor(max_workers = min(workers,len(units)), initializer = initialize_noise_worker, initargs = (config, conditions, microphone_locations, settings)) as executor:
+                outputs = list(executor.map(evaluate_rotor_noise_control_point, units))
+            for j, r in enumerate(rotors):
+                conditions.noise[r.propulsor.tag][r.rotor.tag] = assemble_rotor_noise(outputs[j*ctrl_pts:(j+1)*ctrl_pts],microphone_locations,settings)
+        else:
+            for r in rotors:
+                compute_rotor_noise(microphone_locations,r.propulsor,r.rotor,segment,settings, rotor_index = r.rotor_index, previous_rotor_tag= r.previous_rotor_tag, identical_propulsors=r.network.identical_propulsors)   
+         
+        # add the rotor noise in a fixed order 
+        for r in rotors:
+            total_SPL_dBA     = SPL_arithmetic(np.concatenate((total_SPL_dBA[:,None,:],conditions.noise[r.propulsor.tag][r.rotor.tag].SPL_dBA[:,None,:]),axis =1),sum_axis=1)
+            total_SPL_spectra = SPL_arithmetic(np.concatenate((total_SPL_spectra[:,None,:,:],conditions.noise[r.propulsor.tag][r.rotor.tag].SPL_1_3_spectrum[:,None,:,:]),axis =1),sum_axis=1) 
                         
         conditions.noise.hemisphere_SPL_dBA              = total_SPL_dBA
         conditions.noise.hemisphere_SPL_1_3_spectrum_dBA = total_SPL_spectra  
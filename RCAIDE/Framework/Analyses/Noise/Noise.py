@@ -66,6 +66,7 @@ class Noise(Analysis):
         self.settings.microphone_x_resolution                = 11 
         self.settings.microphone_y_resolution                = 11 
         self.settings.noise_times_steps                      = 101 
+        self.settings.microphone_chunk_memory                = 2.5E8 # bytes, memory of the arrays of a block of microphones evaluated together 
         self.settings.number_of_microphone_in_stencil        = 10
         self.settings.microphone_min_x                       = 0  
         self.settings.microphone_max_x                       = 1000 
@@ -47,6 +47,7 @@ class Momentum_Theory_Wake(Component):
 
         self.tag            = 'rotor_wake'
         self.wake_method    = 'Fidelity_Zero'
+        self.inflow_solver  = 'fsolve' # 'fsolve' or 'newton' (element-wise iteration of the decoupled stations)
 
     
     def evaluate(self,rotor,wake_inputs,conditions):
@@ -0,0 +1,211 @@
+# RCAIDE/Framework/Core/Packing_Layout.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# Package imports
+import numpy as np
+from .Arrays import atleast_2d_col, array_type, matrix_type
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Packing_Layout
+# ----------------------------------------------------------------------------------------------------------------------
+class Packing_Layout(object):
+    """ A precomputed map between a Data dictionary and the 1D vector produced by Data.pack_array().
+        The key paths, offsets and shapes are found once, after which packing and unpacking are plain
+        slice copies without recursion, type checking or stacking.
+
+        When share_memory is True the floating point arrays of the data are replaced by views into the
+        packed vector, so unpacking a vector is a single copy and packing arrays that were written in
+        place costs nothing. Values that are reassigned after the layout is built are detected and copied.
+
+        Assumptions:
+        The structure of the data does not change after the layout is built, a change in the number of
+        keys of any packed dictionary triggers a rebuild of the layout
+
+        Source:
+        N/A
+    """
+
+    def __init__(self,data,share_memory=True):
+        """ Builds the layout of data
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            data          [Data]
+            share_memory  [Boolean]
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self.data         = data
+        self.share_memory = share_memory
+        self.build()
+
+    def build(self):
+        """ Walks the data in the same order as Data.pack_array() and stores every packed entry
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+
+        valid_types = ( int, float,
+                        array_type,
+                        matrix_type )
+
+        entries = []
+        parents = []
+        size    = [0]
+
+        def do_build(D):
+            parents.append((D,len(D)))
+            for k,v in D.items():
+                try:
+                    rank = v.ndim
+                except:
+                    rank = 0
+                if isinstance(v,dict):
+                    do_build(v) # recursion!
+                    continue
+                elif not isinstance(v,valid_types): continue
+                elif rank > 2: continue
+                shape = atleast_2d_col(v).shape
+                start = size[0]
+                size[0] += shape[0]*shape[1]
+                entries.append([D,k,rank,np.shape(v),start,size[0],None])
+
+        do_build(self.data)
+
+        self.entries = entries
+        self.parents = parents
+        self.vector  = np.zeros(size[0])
+
+        for entry in entries:
+            D,k,rank,shape,start,stop,_ = entry
+            v = D[k]
+            self.vector[start:stop] = np.ravel(atleast_2d_col(v),order='F')
+
+            # share the memory of floating point arrays with the packed vector
+            if self.share_memory and rank > 0 and isinstance(v,array_type) and v.dtype == np.float64:
+                view     = self.vector[start:stop].reshape(shape,order='F')
+                D[k]     = view
+                entry[6] = view
+
+        return
+
+    def changed(self):
+        """ Checks if keys were added or removed from the data since the layout was built
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            changed  [Boolean]
+
+            Properties Used:
+            N/A
+        """
+        for D,n_keys in self.parents:
+            if len(D) != n_keys:
+                return True
+        return False
+
+    def pack(self):
+        """ Packs the data into the preallocated vector and returns it. The vector is reused
+            on the next call, copy it if it needs to be kept.
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            vector   [array]
+
+            Properties Used:
+            N/A
+        """
+        if self.changed():
+            self.build()
+
+        vector = self.vector
+        for D,k,rank,shape,start,stop,view in self.entries:
+            v = D[k]
+            if v is view:
+                continue
+            v = np.ravel(atleast_2d_col(v),order='F')
+            if v.size != stop - start:
+                raise ValueError('size of "%s" changed since the packing layout was built' % k)
+            vector[start:stop] = v
+
+        return vector
+
+    def unpack(self,M):
+        """ Unpacks a 1D vector into the data, updates the data in place
+
+            Assumptions:
+            M has the size of the layout
+
+            Source:
+            N/A
+
+            Inputs:
+            M        [array]
+
+            Outputs:
+            data     [Data]
+
+            Properties Used:
+            N/A
+        """
+        if self.changed():
+            self.build()
+
+        vector    = self.vector
+        vector[:] = M
+        for D,k,rank,shape,start,stop,view in self.entries:
+            v = D[k]
+            if v is view:
+                continue
+            if rank == 0:
+                D[k] = vector[start]
+            elif rank == 1:
+                D[k][:] = vector[start:stop]
+            else:
+                D[k][:,:] = np.reshape(vector[start:stop],shape,order='F')
+
+        return self.data
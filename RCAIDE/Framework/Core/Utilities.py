@@ -3,6 +3,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -308,4 +309,55 @@ def new_tensor(a):
     
     T = np.resize(T,[n_a,3,3])
     
-    return T
\ No newline at end of file
+    return T
+
+# ----------------------------------------------------------------------------------------------------------------------
+# update_hash
+# ----------------------------------------------------------------------------------------------------------------------
+
+def update_hash(key_hash, value, skip_keys = ()):
+    """Updates a hash with the contents of a value, recursing into dictionaries, lists and arrays.
+    Equal inputs give the same hash in any process, unlike the built-in hash of strings.
+
+    Assumptions:
+    Functions and other objects only contribute their type
+
+    Source:
+    N/A
+
+    Inputs:
+    key_hash     [-] hashlib hash object
+    value        [-] value added to the hash
+    skip_keys    [-] dictionary keys left out of the hash
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """
+    if isinstance(value,dict):
+        key_hash.update(type(value).__name__.encode())
+        for k,v in value.items():
+            if k in skip_keys:
+                continue
+            key_hash.update(str(k).encode())
+            update_hash(key_hash,v,skip_keys)
+    elif isinstance(value,(list,tuple)):
+        key_hash.update(str(len(value)).encode())
+        for v in value:
+            update_hash(key_hash,v,skip_keys)
+    elif isinstance(value,np.ndarray) and value.dtype != object:
+        key_hash.update(str((value.dtype.str,value.shape)).encode())
+        key_hash.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value,np.ndarray):
+        update_hash(key_hash,value.tolist(),skip_keys)
+    elif isinstance(value,(str,bool,int,float,complex,np.number,np.bool_)) or value is None:
+        key_hash.update(repr(value).encode())
+    elif isinstance(value,type):
+        key_hash.update((value.__module__ + '.' + value.__qualname__).encode())
+    else:
+        # functions and other objects only contribute their type
+        key_hash.update(type(value).__qualname__.encode())
+
+    return
@@ -16,4 +16,5 @@ from .Diffed_Data      import Diffed_Data, diff
 from .Container        import Container
 from .ContainerOrdered import ContainerOrdered
 from .Utilities        import *
+from .Packing_Layout   import Packing_Layout
 from .Units            import Units
\ No newline at end of file
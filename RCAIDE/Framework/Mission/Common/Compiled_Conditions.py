@@ -0,0 +1,106 @@
+# RCAIDE/Framework/Mission/Common/Compiled_Conditions.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+from .Conditions import Conditions
+from .Results    import Results
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Compiled_Conditions
+# ----------------------------------------------------------------------------------------------------------------------
+class Compiled_Conditions(Conditions):
+    """ A fast attribute access form of Conditions used while a segment is solved. The instance dictionary
+        is the data dictionary itself, so an attribute such as conditions.freestream.mach_number is found by
+        the interpreter's native lookup instead of the try/except lookups of Data.__getattribute__ and
+        Data.__setattr__. Attribute paths, keys and all Data/Conditions methods are unchanged.
+
+        Copies and pickles of a compiled conditions are regular Conditions.
+
+        Assumptions:
+        Keys do not shadow Data/Conditions methods
+
+        Source:
+        None
+    """
+
+    __slots__        = ('_compiled_size',)
+    __getattribute__ = object.__getattribute__
+    __setattr__      = object.__setattr__
+
+    def __new__(cls,*args,**kwarg):
+        """ Creates an empty Compiled_Conditions with the data dictionary as its instance dictionary
+
+            Assumptions:
+            N/A
+
+            Source:
+            N/A
+
+            Inputs:
+            N/A
+
+            Outputs:
+            N/A
+
+            Properties Used:
+            N/A
+        """
+        self = dict.__new__(cls)
+        object.__setattr__(self,'__dict__',self)
+        self._compiled_size = Conditions._size
+        return self
+
+    def __init__(self,*args,**kwarg):
+        """ :meta private:"""
+        pass
+
+    @property
+    def _size(self):
+        """ :meta private:"""
+        return self._compiled_size
+
+    @_size.setter
+    def _size(self,rows):
+        """ :meta private:"""
+        self._compiled_size = rows
+
+    def __reduce_ex__(self,protocol):
+        """ :meta private:"""
+        return (Conditions,(),{'_size':self._compiled_size},None,iter(dict.items(self)))
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compile_conditions
+# ----------------------------------------------------------------------------------------------------------------------
+def compile_conditions(conditions):
+    """ Recursively converts a Conditions data structure into Compiled_Conditions. Only plain Conditions
+        and Results nodes are converted, specialized subclasses are kept as they are.
+
+        Assumptions:
+        N/A
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions            [Conditions]
+
+        Outputs:
+        compiled_conditions   [Compiled_Conditions]
+
+        Properties Used:
+        N/A
+    """
+    compiled       = Compiled_Conditions()
+    compiled._size = conditions._size
+    for k,v in conditions.items():
+        if type(v) in (Conditions,Results):
+            v = compile_conditions(v)
+        dict.__setitem__(compiled,k,v)
+
+    return compiled
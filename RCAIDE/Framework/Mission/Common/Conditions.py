@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, RCAIDE Team
  
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -269,6 +270,45 @@ class expanded_array(Data):
         
         self._array = np.resize(other,[1,1])
         
-        return self    
-        
-    
\ No newline at end of file
+        return self
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  share_conditions
+# ----------------------------------------------------------------------------------------------------------------------
+def share_conditions(conditions):
+    """ Recursively copies the Data nodes of a conditions data structure while keeping references to the arrays
+        and other values stored in them. The copy has its own keys, so a value can be rebound on the copy without
+        changing the original, but the arrays are shared with the original. This replaces a deepcopy of the
+        results of one component for identical components at the cost of building the nodes only.
+
+        Assumptions:
+        Shared arrays are not modified in place for a single component. Values that differ between the
+        components are rebound on the copy.
+
+        Source:
+        N/A
+
+        Inputs:
+        conditions            [Data]
+
+        Outputs:
+        shared_conditions     [Data]
+
+        Properties Used:
+        N/A
+    """
+    cls    = type(conditions)
+    shared = cls.__new__(cls)
+    for k,v in dict.items(conditions):
+        if isinstance(v,Data):
+            v = share_conditions(v)
+        dict.__setitem__(shared,k,v)
+
+    # attributes that are not keys, e.g. the number of rows
+    attributes = object.__getattribute__(conditions,'__dict__')
+    if attributes is conditions:
+        shared._size = conditions._size
+    else:
+        object.__getattribute__(shared,'__dict__').update(attributes)
+
+    return shared
@@ -47,10 +47,16 @@ class Numerics(Conditions):
         self.number_of_control_points         = 16
         self.discretization_method            = chebyshev_data 
         self.solver_jacobian                  = "none"
+        self.jacobian_sparsity                = None # sparsity pattern of the "colored" solver jacobian, probed on the first solve when None
         self.tolerance_solution               = 1e-8
         self.converged                        = None
         self.max_evaluations                  = 0.
         self.step_size                        = None
+        self.unknowns_layout                  = None
+        self.residuals_layout                 = None
+        self.compiled_conditions              = False
+        self.memoize_atmosphere               = True
+        self.atmosphere_memo                  = None
         
         self.dimensionless                    = Conditions()
         self.dimensionless.control_points     = np.empty([0,0])
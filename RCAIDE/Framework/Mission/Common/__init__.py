@@ -8,7 +8,8 @@
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 
-from .Conditions   import Conditions
+from .Conditions   import Conditions, share_conditions
+from .Compiled_Conditions import Compiled_Conditions, compile_conditions
 from .Numerics     import Numerics
 from .Residuals    import Residuals
 from .Results      import Results
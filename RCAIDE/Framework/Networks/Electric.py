@@ -60,6 +60,7 @@ class Electric(Network):
         self.system_voltage               = None   
         self.reverse_thrust               = False
         self.wing_mounted                 = True        
+        self.batched_battery_evaluation   = True 
 
     # manage process with a driver function
     def evaluate(network,state,center_of_gravity):
@@ -159,30 +160,45 @@ class Electric(Network):
 
         time               = state.conditions.frames.inertial.time[:,0] 
         delta_t            = np.diff(time)
-        for t_idx in range(state.numerics.number_of_control_points):    
+        if network.batched_battery_evaluation and batched_battery_evaluation_valid(network,conditions):
+            # all control points of each battery module are computed at once 
             for bus in  busses:
                 stored_results_flag  = False
                 stored_battery_tag   = None                          
-                for battery_module in  bus.battery_modules:                   
-                    if bus.identical_battery_modules == False:
-                        # run analysis  
-                        stored_results_flag, stored_battery_tag =  battery_module.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
-                    else:             
-                        if stored_results_flag == False: 
-                            # run battery analysis 
-                            stored_results_flag, stored_battery_tag  =  battery_module.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
-                        else:
-                            # use previous battery results 
-                            battery_module.reuse_stored_data(state,bus,coolant_lines, t_idx, delta_t,stored_results_flag, stored_battery_tag)
-                bus.compute_distributor_conditions(state,t_idx, delta_t)
+                for battery_module in  bus.battery_modules: 
+                    if stored_results_flag == False: 
+                        # run battery analysis 
+                        stored_results_flag, stored_battery_tag  =  battery_module.energy_calc_batch(state,bus,delta_t)
+                    else:
+                        # use previous battery results 
+                        battery_module.reuse_stored_data(state,bus,coolant_lines, None, delta_t,stored_results_flag, stored_battery_tag)
+                for t_idx in range(state.numerics.number_of_control_points):    
+                    bus.compute_distributor_conditions(state,t_idx, delta_t)
+        else:
+            for t_idx in range(state.numerics.number_of_control_points):    
+                for bus in  busses:
+                    stored_results_flag  = False
+                    stored_battery_tag   = None                          
+                    for battery_module in  bus.battery_modules:                   
+                        if bus.identical_battery_modules == False:
+                            # run analysis  
+                            stored_results_flag, stored_battery_tag =  battery_module.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
+                        else:             
+                            if stored_results_flag == False: 
+                                # run battery analysis 
+                                stored_results_flag, stored_battery_tag  =  battery_module.energy_calc(state,bus,coolant_lines, t_idx, delta_t)
+                            else:
+                                # use previous battery results 
+                                battery_module.reuse_stored_data(state,bus,coolant_lines, t_idx, delta_t,stored_results_flag, stored_battery_tag)
+                    bus.compute_distributor_conditions(state,t_idx, delta_t)
                 
-                # Thermal Management Calculations                    
-                for coolant_line in  coolant_lines:
-                    if t_idx != state.numerics.number_of_control_points-1: 
-                        for heat_exchanger in coolant_line.heat_exchangers: 
-                            heat_exchanger.compute_heat_exchanger_performance(state,bus,coolant_line,delta_t[t_idx],t_idx) 
-                        for reservoir in coolant_line.reservoirs:   
-                            reservoir.compute_reservior_coolant_temperature(state,coolant_line,delta_t[t_idx],t_idx)
+                    # Thermal Management Calculations                    
+                    for coolant_line in  coolant_lines:
+                        if t_idx != state.numerics.number_of_control_points-1: 
+                            for heat_exchanger in coolant_line.heat_exchangers: 
+                                heat_exchanger.compute_heat_exchanger_performance(state,bus,coolant_line,delta_t[t_idx],t_idx) 
+                            for reservoir in coolant_line.reservoirs:   
+                                reservoir.compute_reservior_coolant_temperature(state,coolant_line,delta_t[t_idx],t_idx)
         
         if reverse_thrust ==  True:
             total_thrust =  total_thrust * -1     
@@ -342,4 +358,40 @@ class Electric(Network):
         segment.process.iterate.residuals.network           = self.residuals        
 
         return segment
-    __call__ = evaluate 
\ No newline at end of file
+    __call__ = evaluate
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  batched_battery_evaluation_valid
+# ----------------------------------------------------------------------------------------------------------------------  
+def batched_battery_evaluation_valid(network,conditions):
+    """ Checks if the battery modules of a network can be evaluated at all control points at once. This
+        requires that no thermal management system is attached, the network is not recharging and every
+        bus carries a single battery module or identical battery modules that support batched evaluation.
+
+        Assumptions:
+        None
+
+        Source:
+        N/A
+
+        Inputs:
+        network                     [Data]
+        conditions.energy.recharging [boolean]
+
+        Outputs:
+        valid                       [boolean]
+
+        Properties Used:
+        N/A
+    """
+    if conditions.energy.recharging or len(network.coolant_lines) != 0:
+        return False
+    for bus in network.busses:
+        if len(bus.battery_modules) > 1 and bus.identical_battery_modules == False:
+            return False
+        if bus.battery_module_electric_configuration not in ['Series','Parallel']:
+            return False
+        for battery_module in bus.battery_modules:
+            if not callable(getattr(type(battery_module),'energy_calc_batch',None)):
+                return False
+    return True
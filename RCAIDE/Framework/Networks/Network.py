@@ -3,6 +3,7 @@
 #
 # Created:  Jul 2024, RCAIDE Team
 # Modified: Aug 2023, E. Botero
+#           Oct 2026, RCAIDE Team
 
 
 # ----------------------------------------------------------------------------------------------------------------------
@@ -31,6 +32,7 @@ class Network(Component):
         self.coolant_lines                = Container()
         self.fuel_lines                   = Container() 
         self.identical_propulsors         = True
+        self.share_identical_propulsor_conditions = True # identical propulsors reference the arrays of the first propulsor instead of deep copies
         
 # ----------------------------------------------------------------------
 #  Component Container
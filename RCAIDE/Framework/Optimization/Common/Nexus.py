@@ -8,10 +8,19 @@ import RCAIDE
 from RCAIDE.Framework.Core import Data
 from RCAIDE.Framework.Analyses import Process
 from copy import deepcopy
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+import weakref
 
 from . import helper_functions as help_fun
 import numpy as np
 
+# copy of the nexus of a finite difference worker process
+nexus_worker = Data()
+
+# pools of worker processes of the running nexuses, kept outside the nexus so it can be sent to the workers
+nexus_worker_pools = {}
+
 # ----------------------------------------------------------------------------------------------------------------- 
 #  Nexus Class
 # --- ------------------------------------------------------------------------------------------------------------- 
@@ -58,6 +67,9 @@ class Nexus(Data):
         self.evaluation_count       = 0
         self.force_evaluate         = False
         self.hard_bounded_inputs    = False
+        self.evaluation_cache       = OrderedDict()
+        self.evaluation_cache_size  = 0 # past inputs whose objective and constraints are kept, 0 only remembers the last inputs 
+        self.number_of_workers      = 1 # processes evaluating finite difference steps and batches of inputs, 1 evaluates them serially 
     
     def evaluate(self,x = None):
         """This function runs the problem you setup in RCAIDE
@@ -88,6 +100,37 @@ class Nexus(Data):
             pass
         else:
             self._really_evaluate()
+    
+    def evaluate_output_values(self,x = None):
+        """Evaluates the problem only if the objective and constraints of the inputs are not in the
+            evaluation cache. Used by the objective and constraint functions, the problem is evaluated
+            with evaluate before reading other results.
+    
+            Assumptions:
+            On a hit of the evaluation cache the procedure is not run, the results and summary
+            remain those of the last evaluated inputs
+    
+            Source:
+            N/A
+    
+            Inputs:
+            x       [vector]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        self.unpack_inputs(x)
+        
+        if self.evaluation_cache_size > 0 \
+           and self.force_evaluate == False \
+           and self.cache_key() in self.evaluation_cache:
+            self.evaluation_cache.move_to_end(self.cache_key())
+        else:
+            self.evaluate(x)
         
     
     def _really_evaluate(self):
@@ -124,6 +167,9 @@ class Nexus(Data):
         # Store to cache
         self.last_inputs   = deepcopy(self.optimization_problem.inputs)
         self.last_fidelity = self.fidelity_level
+        
+        if self.evaluation_cache_size > 0:
+            self.store_output_values(self.cache_key(),self.output_values())
           
     
     def objective(self,x = None):
@@ -145,12 +191,11 @@ class Nexus(Data):
             None
         """           
     
-        self.evaluate(x)
+        self.evaluate_output_values(x)
         
-        aliases     = self.optimization_problem.aliases
         objective   = self.optimization_problem.objective
     
-        objective_value  = help_fun.get_values(self,objective,aliases)  
+        objective_value  = self.get_output_values(objective)  
         scaled_objective = help_fun.scale_obj_values(objective,objective_value)
         
         return scaled_objective.astype(np.double) 
@@ -174,9 +219,8 @@ class Nexus(Data):
             None
             """           
         
-        self.evaluate(x)
+        self.evaluate_output_values(x)
         
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints 
         
         # Setup constraints  
@@ -187,11 +231,11 @@ class Nexus(Data):
         iqconstraints = np.delete(constraints,indices,axis=0)
     
         if len(iqconstraints) == 0:
-            scaled_constraints = []
+            constraint_evaluations = []
         else:
 
             # get constaint values 
-            constraint_values = help_fun.get_values(self,iqconstraints,aliases)          
+            constraint_values = self.get_output_values(iqconstraints)          
             
             # scale bounds 
             scaled_bnd_constraints  = help_fun.scale_const_bnds(iqconstraints)
@@ -226,9 +270,8 @@ class Nexus(Data):
             None
         """         
     
-        self.evaluate(x)
+        self.evaluate_output_values(x)
 
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
         
         # Setup constraints  
@@ -243,7 +286,7 @@ class Nexus(Data):
         if len(eqconstraints) == 0:
             scaled_constraints = []
         else:
-            constraint_values  = help_fun.get_values(self,eqconstraints,aliases)
+            constraint_values  = self.get_output_values(eqconstraints)
             scaled_constraints = help_fun.scale_const_values(eqconstraints,constraint_values) - help_fun.scale_const_bnds(eqconstraints)
 
         return scaled_constraints   
@@ -267,12 +310,11 @@ class Nexus(Data):
             None
         """         
         
-        self.evaluate(x)
+        self.evaluate_output_values(x)
         
-        aliases     = self.optimization_problem.aliases
         constraints = self.optimization_problem.constraints
     
-        constraint_values  = help_fun.get_values(self,constraints,aliases) 
+        constraint_values  = self.get_output_values(constraints) 
         scaled_constraints = help_fun.scale_const_values(constraints,constraint_values) 
 
         return scaled_constraints     
@@ -315,6 +357,109 @@ class Nexus(Data):
         self    = help_fun.set_values(self,inputs,converted_values,aliases)     
 
     
+    def cache_key(self):
+        """Key of the current inputs and fidelity level in the evaluation cache.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            key                [tuple]
+    
+            Properties Used:
+            None
+        """
+        
+        values = np.asarray(self.optimization_problem.inputs[:,1],dtype=float)
+        
+        return (self.fidelity_level,) + tuple(values.tolist())
+    
+    def output_values(self):
+        """Retrieves the unscaled values of the objective and all constraints from the last evaluation.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            values             [dict]
+    
+            Properties Used:
+            None
+        """
+        
+        aliases = self.optimization_problem.aliases
+        values  = {}
+        for outputs in [self.optimization_problem.objective,self.optimization_problem.constraints]:
+            if outputs is not None and len(outputs) > 0:
+                values.update(zip(np.array(outputs)[:,0],help_fun.get_values(self,outputs,aliases)))
+        
+        return values
+    
+    def store_output_values(self,key,values):
+        """Adds the output values of some inputs to the evaluation cache, removing the least recently
+            used inputs beyond the evaluation cache size.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            key                [tuple]
+            values             [dict]
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        self.evaluation_cache[key] = values
+        self.evaluation_cache.move_to_end(key)
+        while len(self.evaluation_cache) > self.evaluation_cache_size:
+            self.evaluation_cache.popitem(last=False)
+    
+    def get_output_values(self,outputs):
+        """Retrieves the unscaled values of objectives or constraints at the current inputs, from the
+            evaluation cache if they are stored in it.
+    
+            Assumptions:
+            N/A
+    
+            Source:
+            N/A
+    
+            Inputs:
+            outputs            [array]
+    
+            Outputs:
+            values             [vector]
+    
+            Properties Used:
+            None
+        """
+        
+        if self.evaluation_cache_size > 0:
+            entry = self.evaluation_cache.get(self.cache_key())
+            if entry is not None:
+                return np.array([entry[name] for name in np.array(outputs)[:,0]],dtype=float)
+        
+        return help_fun.get_values(self,outputs,self.optimization_problem.aliases)
+    
     def constraints_individual(self,x = None):
         """Put's the values of the problem in the right place.
     
@@ -336,10 +481,11 @@ class Nexus(Data):
         pass     
 
     def finite_difference(self,x,diff_interval=1e-8):
-        """Finite difference gradients and jacobians of the problem.
+        """Finite difference gradients and jacobians of the problem. With more than one worker, the
+            perturbed inputs are evaluated on a pool of processes, each holding a copy of the nexus.
     
             Assumptions:
-            N/A
+            The procedure only depends on the inputs, not on the previous evaluations
     
             Source:
             N/A
@@ -370,12 +516,16 @@ class Nexus(Data):
         
         con2 = (con*np.ones_like(jac_con))
         
+        steps = []
         for ii in range(0,inplen):
             newx     = np.asarray(x)*1.0
             newx[ii] = newx[ii] + diff_interval
-            
-            grad_obj[ii]  = self.objective(newx)
-            jac_con[ii,:] = self.all_constraints(newx)
+            steps.append(newx)
+        
+        batch = self.evaluate_batch(steps)
+        for ii in range(0,inplen):
+            grad_obj[ii]  = batch.objective[ii]
+            jac_con[ii,:] = batch.constraints[ii]
         
         grad_obj = (grad_obj - obj)/diff_interval
         
@@ -387,6 +537,107 @@ class Nexus(Data):
         return grad_obj, jac_con
     
     
+    def evaluate_batch(self,X):
+        """Evaluates the objective and constraints of a set of inputs, such as a population or the
+            samples of a surrogate. With more than one worker, the inputs are evaluated on a pool of
+            processes, each holding a copy of the nexus with its vehicles, analyses and missions.
+            The pool is started on the first batch and kept until stop_workers, only the inputs
+            and the fidelity level are sent to it.
+    
+            Assumptions:
+            The procedure only depends on the inputs and the fidelity level, not on the previous evaluations
+    
+            Source:
+            N/A
+    
+            Inputs:
+            X                  [array]
+    
+            Outputs:
+            batch.
+              objective              [array]
+              constraints            [array]
+              inequality_constraints [array]
+              equality_constraints   [array]
+    
+            Properties Used:
+            None
+        """
+        
+        X = [np.asarray(x) for x in X]
+        
+        if self.number_of_workers > 1 and len(X) > 1:
+            if id(self) not in nexus_worker_pools:
+                self.start_workers()
+            fidelity_levels = [self.fidelity_level]*len(X)
+            steps           = list(nexus_worker_pools[id(self)].map(evaluate_nexus_step, X, fidelity_levels))
+            
+            for step in steps:
+                self.evaluation_count += step.evaluations
+                if self.evaluation_cache_size > 0:
+                    self.store_output_values(step.key,step.values)
+        else:
+            steps = [evaluate_nexus_step(x,self.fidelity_level,self) for x in X]
+        
+        batch                        = Data()
+        batch.objective              = np.array([step.objective for step in steps])
+        batch.constraints            = np.array([step.constraints for step in steps])
+        batch.inequality_constraints = np.array([step.inequality_constraints for step in steps])
+        batch.equality_constraints   = np.array([step.equality_constraints for step in steps])
+        
+        return batch
+    
+    def start_workers(self):
+        """Starts the pool of processes evaluating batches of inputs. Each worker receives a copy of
+            the nexus once, a running pool is replaced so the workers hold the current nexus.
+    
+            Assumptions:
+            Changes to the nexus other than the inputs and the fidelity level are not seen by the
+            workers until the pool is started again
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        self.stop_workers()
+        if self.number_of_workers > 1:
+            nexus_worker_pools[id(self)] = ProcessPoolExecutor(max_workers = self.number_of_workers, initializer = initialize_nexus_worker, initargs = (self,))
+            weakref.finalize(self, stop_nexus_workers, id(self))
+        
+        return
+    
+    def stop_workers(self):
+        """Shuts down the pool of processes evaluating batches of inputs, if one is running.
+    
+            Assumptions:
+            None
+    
+            Source:
+            N/A
+    
+            Inputs:
+            None
+    
+            Outputs:
+            None
+    
+            Properties Used:
+            None
+        """
+        
+        stop_nexus_workers(id(self))
+        
+        return
+    
     def translate(self,x = None):
         """Make a pretty table view of the problem with objective and constraints at the current inputs
     
@@ -438,7 +689,68 @@ class Nexus(Data):
         print(const_table)
         
         return inpu,const_table
-                               
-        
     
- 
+# ----------------------------------------------------------------------------------------------------------------- 
+#  Finite Difference Workers
+# --- ------------------------------------------------------------------------------------------------------------- 
+def evaluate_nexus_step(x, fidelity_level, nexus = None):
+    """Evaluates the objective and constraints of one set of inputs of a batch.
+    
+        Assumptions:
+        Without a nexus, the nexus of the worker process is used
+    
+        Source:
+        N/A
+    
+        Inputs:
+        x                  [vector]
+        fidelity_level     [int]
+        nexus              [nexus()]
+    
+        Outputs:
+        step.
+          objective              [vector]
+          constraints            [vector]
+          inequality_constraints [vector]
+          equality_constraints   [vector]
+          evaluations            [int]
+          key                    [tuple]
+          values                 [dict]
+    
+        Properties Used:
+        None
+    """
+    
+    worker = nexus is None
+    if worker:
+        nexus                = nexus_worker.nexus
+        nexus.fidelity_level = fidelity_level
+    
+    count                       = nexus.evaluation_count
+    step                        = Data()
+    step.objective              = nexus.objective(x)
+    step.constraints            = nexus.all_constraints(x)
+    step.inequality_constraints = nexus.inequality_constraint(x)
+    step.equality_constraints   = nexus.equality_constraint(x)
+    step.evaluations            = nexus.evaluation_count - count
+    
+    # the worker has no evaluation cache, so its state holds the outputs of the inputs
+    if worker:
+        step.key    = nexus.cache_key()
+        step.values = nexus.output_values()
+    
+    return step
+
+def initialize_nexus_worker(nexus):
+    """ :meta private:"""
+    nexus.evaluation_cache_size = 0
+    nexus.evaluation_cache      = OrderedDict()
+    nexus_worker.nexus          = nexus
+    return
+
+def stop_nexus_workers(key):
+    """ :meta private:"""
+    pool = nexus_worker_pools.pop(key,None)
+    if pool is not None:
+        pool.shutdown()
+    return 
@@ -45,7 +45,7 @@ class Additive_Solver():
         """Solves a multifidelity problem using an additive corrections
     
         Assumptions:
-        N/A
+        The samples of each fidelity level are evaluated as one batch, on the workers of the problem
     
         Source:
         N/A
@@ -99,216 +99,221 @@ class Additive_Solver():
         f = np.zeros([num_fidelity_levels,num_samples])
         g = np.zeros([num_fidelity_levels,num_samples,len(scaled_constraints)])
         
-        for level in range(1,num_fidelity_levels+1):
-            problem.fidelity_level = level
-            for ii,x in enumerate(x_samples):
-                res = self.evaluate_model(problem,x,scaled_constraints)
-                f[level-1,ii]    = res[0]  # objective value
-                g[level-1,ii,:]  = res[1]  # constraints vector
+        # the batches of the optimization share one pool of workers
+        problem.start_workers()
+        try:
+            for level in range(1,num_fidelity_levels+1):
+                problem.fidelity_level = level
+                batch = problem.evaluate_batch(x_samples)
+                for ii,x in enumerate(x_samples):
+                    f[level-1,ii]    = batch.objective[ii]    # objective value
+                    g[level-1,ii,:]  = batch.constraints[ii]  # constraints vector
         
-        converged = False
+            converged = False
         
-        for kk in range(max_iterations):
-            # Build objective surrogate
-            f_diff = f[1,:] - f[0,:]
-            f_additive_surrogate_base = gaussian_process.GaussianProcessRegressor()
-            f_additive_surrogate = f_additive_surrogate_base.fit(x_samples, f_diff)     
+            for kk in range(max_iterations):
+                # Build objective surrogate
+                f_diff = f[1,:] - f[0,:]
+                f_additive_surrogate_base = gaussian_process.GaussianProcessRegressor()
+                f_additive_surrogate = f_additive_surrogate_base.fit(x_samples, f_diff)     
             
-            # Build constraint surrogate
-            g_diff = g[1,:] - g[0,:]
-            g_additive_surrogate_base = gaussian_process.GaussianProcessRegressor()
-            g_additive_surrogate = g_additive_surrogate_base.fit(x_samples, g_diff)     
+                # Build constraint surrogate
+                g_diff = g[1,:] - g[0,:]
+                g_additive_surrogate_base = gaussian_process.GaussianProcessRegressor()
+                g_additive_surrogate = g_additive_surrogate_base.fit(x_samples, g_diff)     
             
-            # Optimize corrected model
+                # Optimize corrected model
             
-            # Chose method ---------------
-            if opt_type == 'basic': # Next point determined by surrogate optimum
-                problem.fidelity_level = 1
-                x_eval = latin_hypercube_sampling(len(x),1,bounds=(x_low_bound,x_up_bound),criterion='random')[0]
+                # Chose method ---------------
+                if opt_type == 'basic': # Next point determined by surrogate optimum
+                    problem.fidelity_level = 1
+                    x_eval = latin_hypercube_sampling(len(x),1,bounds=(x_low_bound,x_up_bound),criterion='random')[0]
                 
-                if self.local_optimizer == 'SNOPT':
-                    opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_corrected_model, \
-                                              obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)      
+                    if self.local_optimizer == 'SNOPT':
+                        opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_corrected_model, \
+                                                  obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)      
                     
-                    # Set up opt_prob
-                    self.initialize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval)  
+                        # Set up opt_prob
+                        self.initialize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval)  
                        
-                    opt = pyOpt.pySNOPT.SNOPT()      
+                        opt = pyOpt.pySNOPT.SNOPT()      
                     
-                    outputs = opt(opt_prob, sens_type='FD',problem=problem, \
-                                  obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)#, sens_step = sense_step)  
-                    fOpt = outputs[0][0]
-                    xOpt = outputs[1]
+                        outputs = opt(opt_prob, sens_type='FD',problem=problem, \
+                                      obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)#, sens_step = sense_step)  
+                        fOpt = outputs[0][0]
+                        xOpt = outputs[1]
                 
-                elif self.local_optimizer == 'SLSQP':
+                    elif self.local_optimizer == 'SLSQP':
                 
-                    x0,constraints = self.initialize_opt_vals_SLSQP(obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval,problem,g_additive_surrogate)
+                        x0,constraints = self.initialize_opt_vals_SLSQP(obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval,problem,g_additive_surrogate)
     
-                    res = minimize(self.evaluate_corrected_model, x0,constraints=constraints,args=(problem,f_additive_surrogate,g_additive_surrogate),options={'ftol':1e-6,'disp':True})
-                    fOpt = res['fun']
-                    xOpt = res['x']
+                        res = minimize(self.evaluate_corrected_model, x0,constraints=constraints,args=(problem,f_additive_surrogate,g_additive_surrogate),options={'ftol':1e-6,'disp':True})
+                        fOpt = res['fun']
+                        xOpt = res['x']
                     
-                else:
-                    raise NotImplementedError
+                    else:
+                        raise NotImplementedError
     
-            elif opt_type == 'MEI': # Next point determined by maximum expected improvement
-                fstar = np.min(f[1,:])
-                problem.fidelity_level = 1
+                elif opt_type == 'MEI': # Next point determined by maximum expected improvement
+                    fstar = np.min(f[1,:])
+                    problem.fidelity_level = 1
                 
-                if self.global_optimizer == 'ALPSO':
-                    opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_expected_improvement, \
-                                              obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate,fstar=fstar)     
+                    if self.global_optimizer == 'ALPSO':
+                        opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_expected_improvement, \
+                                                  obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate,fstar=fstar)     
                     
-                    # Set up opt_prob
-                    self.initialize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,None)     
+                        # Set up opt_prob
+                        self.initialize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,None)     
                        
-                    # Use a global optimizer
-                    opt = pyOpt.pyALPSO.ALPSO()    
-                    opt.setOption('maxOuterIter',value=20)
-                    opt.setOption('seed',value=1.)                    
+                        # Use a global optimizer
+                        opt = pyOpt.pyALPSO.ALPSO()    
+                        opt.setOption('maxOuterIter',value=20)
+                        opt.setOption('seed',value=1.)                    
                     
-                    outputs = opt(opt_prob,problem=problem, \
-                                  obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate,fstar=fstar,cons=con)#, sens_step = sense_step)
-                    fOpt  = np.nan 
-                    imOpt = outputs[0]
-                    xOpt  = outputs[1]
+                        outputs = opt(opt_prob,problem=problem, \
+                                      obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate,fstar=fstar,cons=con)#, sens_step = sense_step)
+                        fOpt  = np.nan 
+                        imOpt = outputs[0]
+                        xOpt  = outputs[1]
                     
-                elif self.global_optimizer == 'SHGO':
+                    elif self.global_optimizer == 'SHGO':
                 
-                    xb, shgo_cons = self.initialize_opt_vals_SHGO(obj, inp, x_low_bound, x_up_bound, con_low_edge, con_up_edge, nam, con, problem, g_additive_surrogate)
+                        xb, shgo_cons = self.initialize_opt_vals_SHGO(obj, inp, x_low_bound, x_up_bound, con_low_edge, con_up_edge, nam, con, problem, g_additive_surrogate)
                 
-                    #self.global_optimizer = 'SHGO'
-                    options = {} 
-                    res = shgo(self.evaluate_expected_improvement, xb, iters=2, args=(problem,f_additive_surrogate,g_additive_surrogate,fstar),constraints=shgo_cons,options=options)
+                        #self.global_optimizer = 'SHGO'
+                        options = {} 
+                        res = shgo(self.evaluate_expected_improvement, xb, iters=2, args=(problem,f_additive_surrogate,g_additive_surrogate,fstar),constraints=shgo_cons,options=options)
                    
                     
-                    fOpt  = np.nan 
-                    imOpt = res['fun']
-                    xOpt  = res['x']    
+                        fOpt  = np.nan 
+                        imOpt = res['fun']
+                        xOpt  = res['x']    
                     
-                else:
-                    raise NotImplementedError
+                    else:
+                        raise NotImplementedError
             
-            # ---------------------------------
+                # ---------------------------------
             
-            complete_flag = False
-            if np.any(np.isnan(xOpt)):
-                complete_flag = True
-            else:
+                complete_flag = False
+                if np.any(np.isnan(xOpt)):
+                    complete_flag = True
+                else:
             
-                # Add new samples and check objective and constraint values
-                f = np.hstack((f,np.zeros((num_fidelity_levels,1))))
-                g = np.hstack((g,np.zeros((num_fidelity_levels,1,len(con)))))
-                x_samples = np.vstack((x_samples,xOpt))
-                for level in range(1,num_fidelity_levels+1):
-                    problem.fidelity_level = level
-                    res = self.evaluate_model(problem,xOpt,scaled_constraints)
-                    f[level-1][-1] = res[0]
-                    g[level-1][-1] = res[1]
+                    # Add new samples and check objective and constraint values
+                    f = np.hstack((f,np.zeros((num_fidelity_levels,1))))
+                    g = np.hstack((g,np.zeros((num_fidelity_levels,1,len(con)))))
+                    x_samples = np.vstack((x_samples,xOpt))
+                    for level in range(1,num_fidelity_levels+1):
+                        problem.fidelity_level = level
+                        res = self.evaluate_model(problem,xOpt,scaled_constraints)
+                        f[level-1][-1] = res[0]
+                        g[level-1][-1] = res[1]
                     
-                # History writing
-                f_out.write('Iteration: ' + str(kk+1)    + '\n')
-                f_out.write('x0       : ' + str(xOpt[0]) + '\n')
-                f_out.write('x1       : ' + str(xOpt[1]) + '\n')
-                if opt_type == 'basic':
-                    f_out.write('expd hi  : ' + str(fOpt) + '\n')
-                elif opt_type == 'MEI':
-                    f_out.write('expd imp : ' + str(imOpt) + '\n')
-                f_out.write('low obj : ' + str(f[0][-1]) + '\n')
-                f_out.write('hi  obj : ' + str(f[1][-1]) + '\n') 
-            if kk == (max_iterations-1) or complete_flag == True: # Reached maximum number of iterations
-                f_diff = f[1,:] - f[0,:]
-                if opt_type == 'basic': # If basic setting f already has the expected optimum
-                    problem.fidelity_level = 2
-                    fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]
-                elif opt_type == 'MEI': # If MEI, find the optimum of the final surrogate
+                    # History writing
+                    f_out.write('Iteration: ' + str(kk+1)    + '\n')
+                    f_out.write('x0       : ' + str(xOpt[0]) + '\n')
+                    f_out.write('x1       : ' + str(xOpt[1]) + '\n')
+                    if opt_type == 'basic':
+                        f_out.write('expd hi  : ' + str(fOpt) + '\n')
+                    elif opt_type == 'MEI':
+                        f_out.write('expd imp : ' + str(imOpt) + '\n')
+                    f_out.write('low obj : ' + str(f[0][-1]) + '\n')
+                    f_out.write('hi  obj : ' + str(f[1][-1]) + '\n') 
+                if kk == (max_iterations-1) or complete_flag == True: # Reached maximum number of iterations
+                    f_diff = f[1,:] - f[0,:]
+                    if opt_type == 'basic': # If basic setting f already has the expected optimum
+                        problem.fidelity_level = 2
+                        fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]
+                    elif opt_type == 'MEI': # If MEI, find the optimum of the final surrogate
                 
-                    min_ind = np.argmin(f[1])
-                    x_eval = x_samples[min_ind]
+                        min_ind = np.argmin(f[1])
+                        x_eval = x_samples[min_ind]
                 
-                    if self.local_optimizer == 'SNOPT':
-                        opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_corrected_model, \
-                                                      obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)                         
+                        if self.local_optimizer == 'SNOPT':
+                            opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_corrected_model, \
+                                                          obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)                         
                         
-                        # Set up opt_prob
-                        self.initialize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval)                           
+                            # Set up opt_prob
+                            self.initialize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval)                           
                         
-                        fOpt, xOpt = self.run_objective_optimization(opt_prob,problem,f_additive_surrogate,g_additive_surrogate)
+                            fOpt, xOpt = self.run_objective_optimization(opt_prob,problem,f_additive_surrogate,g_additive_surrogate)
                     
-                    elif self.local_optimizer == 'SLSQP':
-                        problem.fidelity_level = 1
-                        x0,constraints = self.initialize_opt_vals_SLSQP(obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval,problem,g_additive_surrogate)
+                        elif self.local_optimizer == 'SLSQP':
+                            problem.fidelity_level = 1
+                            x0,constraints = self.initialize_opt_vals_SLSQP(obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval,problem,g_additive_surrogate)
                         
-                        res = minimize(self.evaluate_corrected_model, x0,constraints=constraints,args=(problem,f_additive_surrogate,g_additive_surrogate),options={'ftol':1e-6,'disp':True})
-                        fOpt = res['fun']
-                        xOpt = res['x'] 
+                            res = minimize(self.evaluate_corrected_model, x0,constraints=constraints,args=(problem,f_additive_surrogate,g_additive_surrogate),options={'ftol':1e-6,'disp':True})
+                            fOpt = res['fun']
+                            xOpt = res['x'] 
                     
-                    problem.fidelity_level = 2
-                    fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]               
+                        problem.fidelity_level = 2
+                        fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]               
             
-                    f_out.write('x0_opt  : ' + str(xOpt[0]) + '\n')
-                    f_out.write('x1_opt  : ' + str(xOpt[1]) + '\n')                
-                    f_out.write('final opt : ' + str(fOpt) + '\n')
+                        f_out.write('x0_opt  : ' + str(xOpt[0]) + '\n')
+                        f_out.write('x1_opt  : ' + str(xOpt[1]) + '\n')                
+                        f_out.write('final opt : ' + str(fOpt) + '\n')
                     
-                print('Iteration Limit Reached')
-                break        
+                    print('Iteration Limit Reached')
+                    break        
                 
             
-            if np.abs(fOpt-f[1][-1]) < tolerance: # Converged within a tolerance
-                print('Convergence reached')      
-                f_out.write('Convergence reached')
-                f_diff = f[1,:] - f[0,:]
-                converged = True
-                if opt_type == 'MEI':
+                if np.abs(fOpt-f[1][-1]) < tolerance: # Converged within a tolerance
+                    print('Convergence reached')      
+                    f_out.write('Convergence reached')
+                    f_diff = f[1,:] - f[0,:]
+                    converged = True
+                    if opt_type == 'MEI':
                     
-                    problem.fidelity_level = 1
-                    min_ind = np.argmin(f[1])
-                    x_eval = x_samples[min_ind]
+                        problem.fidelity_level = 1
+                        min_ind = np.argmin(f[1])
+                        x_eval = x_samples[min_ind]
                     
-                    if self.local_optimizer == 'SNOPT':
+                        if self.local_optimizer == 'SNOPT':
                     
-                        opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_corrected_model, \
-                                                      obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)       
+                            opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_corrected_model, \
+                                                          obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)       
                     
-                        initalize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval)    
+                            initalize_opt_vals(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval)    
                     
-                        opt = pyOpt.pySNOPT.SNOPT()      
+                            opt = pyOpt.pySNOPT.SNOPT()      
                     
                         
-                        outputs = opt(opt_prob, sens_type='FD',problem=problem, \
-                                      obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)#, sens_step = sense_step)  
-                        fOpt = outputs[0][0]
-                        xOpt = outputs[1]
+                            outputs = opt(opt_prob, sens_type='FD',problem=problem, \
+                                          obj_surrogate=f_additive_surrogate,cons_surrogate=g_additive_surrogate)#, sens_step = sense_step)  
+                            fOpt = outputs[0][0]
+                            xOpt = outputs[1]
                         
-                    elif self.local_optimizer == 'SLSQP':
+                        elif self.local_optimizer == 'SLSQP':
                     
-                        x0,constraints = self.initialize_opt_vals_SLSQP(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval,problem,g_additive_surrogate)
+                            x0,constraints = self.initialize_opt_vals_SLSQP(opt_prob,obj,inp,x_low_bound,x_up_bound,con_low_edge,con_up_edge,nam,con,x_eval,problem,g_additive_surrogate)
                         
-                        res = minimize(self.evaluate_corrected_model, x0,constraints=constraints,args=(problem,f_additive_surrogate,g_additive_surrogate),options={'ftol':1e-6,'disp':True})
-                        fOpt = res['fun']
-                        xOpt = res['x']
+                            res = minimize(self.evaluate_corrected_model, x0,constraints=constraints,args=(problem,f_additive_surrogate,g_additive_surrogate),options={'ftol':1e-6,'disp':True})
+                            fOpt = res['fun']
+                            xOpt = res['x']
                         
-                    else:
-                        raise NotImplementedError
+                        else:
+                            raise NotImplementedError
                     
-                    problem.fidelity_level = 2
-                    fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]                      
+                        problem.fidelity_level = 2
+                        fOpt = self.evaluate_model(problem,xOpt,scaled_constraints)[0][0]                      
                     
-                    f_out.write('x0_opt  : ' + str(xOpt[0]) + '\n')
-                    f_out.write('x1_opt  : ' + str(xOpt[1]) + '\n')                
-                    f_out.write('final opt : ' + str(fOpt) + '\n')            
-                break        
+                        f_out.write('x0_opt  : ' + str(xOpt[0]) + '\n')
+                        f_out.write('x1_opt  : ' + str(xOpt[1]) + '\n')                
+                        f_out.write('final opt : ' + str(fOpt) + '\n')            
+                    break        
             
-            fOpt = f[1][-1]*1.
-        
-        if converged == False:
-            print('Iteration Limit reached')
-            f_out.write('Maximum iteration limit reached')
-        
-        # Save sample data
-        np.save('x_samples.npy',x_samples)
-        np.save('f_data.npy',f)
-        f_out.close()
+                fOpt = f[1][-1]*1.
+        
+            if converged == False:
+                print('Iteration Limit reached')
+                f_out.write('Maximum iteration limit reached')
+        
+            # Save sample data
+            np.save('x_samples.npy',x_samples)
+            np.save('f_data.npy',f)
+            f_out.close()
+        finally:
+            problem.stop_workers()
         print(fOpt,xOpt)
         if print_output == False:
             sys.stdout = sys.__stdout__
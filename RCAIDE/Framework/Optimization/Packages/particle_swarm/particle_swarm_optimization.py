@@ -12,7 +12,7 @@ import scipy as sp
   
 def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(), kwargs={}, 
         swarmsize=100, omega=0.5, phip=0.5, phig=0.5, maxiter=100, 
-        minstep=1e-8, minfunc=1e-8, debug=False):
+        minstep=1e-8, minfunc=1e-8, debug=False, f_batch=None):
     """
     This function perform a particle swarm optimization (PSO)
     
@@ -39,6 +39,10 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
         minstep   : The minimum stepsize of swarm's best position before the search terminates (Default: 1e-8)      [scalar]
         minfunc   : The minimum change of swarm's best objective value before the search terminates (Default: 1e-8) [scalar]
         debug     : If True, progress statements will be displayed every iteration (Default: False)                 [boolean]
+        f_batch   : Returns the objective values and the constraint values of all particles of the swarm,          
+                    evaluating the whole swarm at once. If f_batch is specified, the particles of an               
+                    iteration are moved together with the swarm's best position of the previous                    
+                    iteration (Default: None)                                                                       [function]
    
     Outputs:
         g         : The swarm's best known position (optimal design)                                                [list] 
@@ -104,9 +108,14 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
             print('Single constraint function given in f_ieqcons')
         cons = lambda x: np.array(f_ieqcons(x, *args, **kwargs))
         
-    def is_feasible(x):
-        check = np.all(cons(x)>=0)
+    def is_feasible(x, c=None):
+        if c is None:
+            c = cons(x)
+        check = np.all(c>=0)
         return check
+    
+    if f_batch is not None:
+        batch = lambda X: f_batch(X, *args, **kwargs)
         
     # Initialize the particle swarm ############################################
     S = swarmsize
@@ -117,16 +126,26 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     fp = np.zeros(S)  # best particle function values
     g = []  # best swarm position
     fg = 1e100  # artificial best swarm position starting value
+    c = [None]*S  # constraint values of the batch evaluations
+    
+    if f_batch is not None:
+        # Initialize and evaluate the positions of the whole swarm
+        x = lb + x*(ub - lb)
+        fxs, c = batch(x)
     
     for i in range(S):
         # Initialize the particle's position
-        x[i, :] = lb + x[i, :]*(ub - lb)
+        if f_batch is None:
+            x[i, :] = lb + x[i, :]*(ub - lb)
    
         # Initialize the particle's best known position
         p[i, :] = x[i, :]
        
         # Calculate the objective's value at the current particle's
-        fp[i] = obj(p[i, :])
+        if f_batch is None:
+            fp[i] = obj(p[i, :])
+        else:
+            fp[i] = fxs[i]
        
         # At the start, there may not be any feasible starting point, so just
         # give it a temporary "best" point since it's likely to change
@@ -135,7 +154,7 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
 
         # If the current particle's position is better than the swarm's,
         # update the best swarm position
-        if fp[i]<fg and is_feasible(p[i, :]):
+        if fp[i]<fg and is_feasible(p[i, :], c[i]):
             fg = fp[i]
             g = p[i, :].copy()
        
@@ -147,23 +166,36 @@ def particle_swarm_optimization(func, lb, ub, ieqcons=[], f_ieqcons=None, args=(
     while it<=maxiter:
         rp = np.random.uniform(size=(S, D))
         rg = np.random.uniform(size=(S, D))
+        
+        if f_batch is not None:
+            # Update the velocities and positions of the whole swarm, correcting lower and  
+            # upper bound violations, then evaluate the swarm
+            v = omega*v + phip*rp*(p - x) + phig*rg*(g - x)
+            x = x + v
+            x = np.where(x<lb, lb, x)
+            x = np.where(x>ub, ub, x)
+            fxs, c = batch(x)
+            
         for i in range(S):
 
-            # Update the particle's velocity
-            v[i, :] = omega*v[i, :] + phip*rp[i, :]*(p[i, :] - x[i, :]) + \
-                      phig*rg[i, :]*(g - x[i, :])
-                      
-            # Update the particle's position, correcting lower and upper bound 
-            # violations, then update the objective function value
-            x[i, :] = x[i, :] + v[i, :]
-            mark1 = x[i, :]<lb
-            mark2 = x[i, :]>ub
-            x[i, mark1] = lb[mark1]
-            x[i, mark2] = ub[mark2]
-            fx = obj(x[i, :])
+            if f_batch is None:
+                # Update the particle's velocity
+                v[i, :] = omega*v[i, :] + phip*rp[i, :]*(p[i, :] - x[i, :]) + \
+                          phig*rg[i, :]*(g - x[i, :])
+                          
+                # Update the particle's position, correcting lower and upper bound 
+                # violations, then update the objective function value
+                x[i, :] = x[i, :] + v[i, :]
+                mark1 = x[i, :]<lb
+                mark2 = x[i, :]>ub
+                x[i, mark1] = lb[mark1]
+                x[i, mark2] = ub[mark2]
+                fx = obj(x[i, :])
+            else:
+                fx = fxs[i]
             
             # Compare particle's best position (if constraints are satisfied)
-            if fx<fp[i] and is_feasible(x[i, :]):
+            if fx<fp[i] and is_feasible(x[i, :], c[i]):
                 p[i, :] = x[i, :].copy()
                 fp[i] = fx
 
@@ -69,47 +69,58 @@ def SciPy_Solve(problem,solver='SLSQP', sense_step = 1.4901161193847656e-08, ite
         ub[ii]   = bndu[ii]/scl[ii]
         de_bnds.append((bndl[ii]/scl[ii],bndu[ii]/scl[ii]))  
      
-    # Finalize problem statement and run
-    if solver=='SLSQP':
-        outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,\
-                                         iter=iter, epsilon = sense_step, acc  = tolerance)
-    elif solver == 'differential_evolution':
-        # Define constraints as a tuple of nonlinear constraints 
-        scaled_constraints = []
-        aliases            = problem.optimization_problem.aliases
-        for ii in range(0,len(con)):
-            de_constraint  = con[[ii]] 
-            def fun(x):
-                problem.evaluate(x)
-                constraint_val = help_fun.get_values(problem,de_constraint,aliases)
-                return np.atleast_1d(constraint_val)
+    # the batches of the optimization share one pool of workers
+    problem.start_workers()
+    try:
+    
+        # Finalize problem statement and run
+        if solver=='SLSQP':
+            outputs = sp.optimize.fmin_slsqp(wrapper,x,f_eqcons=problem.equality_constraint,f_ieqcons=problem.inequality_constraint,bounds=bnds,\
+                                             iter=iter, epsilon = sense_step, acc  = tolerance)
+        elif solver == 'differential_evolution':
+            # Define constraints as a tuple of nonlinear constraints 
+            scaled_constraints = []
+            for ii in range(0,len(con)):
+                de_constraint  = con[[ii]] 
+                def fun(x):
+                    problem.evaluate(x)
+                    constraint_val = problem.get_output_values(de_constraint)
+                    return np.atleast_1d(constraint_val)
             
-            bound  = help_fun.scale_const_bnds(con)
-            if con[ii][1]=='=':
-                print('Nonlinear constraints for scipy differential evoultion optimization has '
-                      'the general inequality form. Consider rewriting equality constraint as two '
-                      'separate inequality constraints')
+                bound  = help_fun.scale_const_bnds(con)
+                if con[ii][1]=='=':
+                    print('Nonlinear constraints for scipy differential evoultion optimization has '
+                          'the general inequality form. Consider rewriting equality constraint as two '
+                          'separate inequality constraints')
             
-            if con[ii][1]=='>':
-                nlc = NonlinearConstraint(fun,bound[ii], np.inf) 
+                if con[ii][1]=='>':
+                    nlc = NonlinearConstraint(fun,bound[ii], np.inf) 
                 
-            elif con[ii][1]=='<':
-                nlc = NonlinearConstraint(fun, -np.inf,bound[ii])
+                elif con[ii][1]=='<':
+                    nlc = NonlinearConstraint(fun, -np.inf,bound[ii])
                 
-            scaled_constraints.append(nlc) 
+                scaled_constraints.append(nlc) 
             
-        diff_evo_cons = tuple(scaled_constraints)    
+            diff_evo_cons = tuple(scaled_constraints)    
         
-        outputs = sp.optimize.differential_evolution(wrapper, bounds= de_bnds, strategy='best1bin', maxiter=1000, popsize = pop_size, \
-                                                     tol=0.01, mutation=(0.5, 1), recombination=0.7, seed=prob_seed, callback=None,\
-                                                     disp=False, polish=True, init='latinhypercube', atol=0, updating='immediate',\
-                                                     workers=1,constraints=diff_evo_cons)
+            outputs = sp.optimize.differential_evolution(wrapper, bounds= de_bnds, strategy='best1bin', maxiter=1000, popsize = pop_size, \
+                                                         tol=0.01, mutation=(0.5, 1), recombination=0.7, seed=prob_seed, callback=None,\
+                                                         disp=False, polish=True, init='latinhypercube', atol=0, updating='immediate',\
+                                                         workers=1,constraints=diff_evo_cons)
         
-    elif solver == 'particle_swarm_optimization':
-        outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
-                                              omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False)    
-    else:
-        outputs = sp.optimize.minimize(wrapper,x,method=solver)
+        elif solver == 'particle_swarm_optimization':
+            # with workers, each swarm is evaluated as one batch
+            if problem.number_of_workers > 1:
+                batch_wrapper = lambda X:SciPy_Batch(problem,X)
+            else:
+                batch_wrapper = None
+            outputs = particle_swarm_optimization(wrapper, lb, ub, f_ieqcons=problem.inequality_constraint, kwargs={}, swarmsize=pop_size ,\
+                                                  omega=0.5, phip=0.5, phig=0.5, maxiter=1000, minstep=1e-4, minfunc=1e-4, debug=False, f_batch=batch_wrapper)    
+        else:
+            outputs = sp.optimize.minimize(wrapper,x,method=solver)
+    
+    finally:
+        problem.stop_workers()
     
     return outputs
  
@@ -143,3 +154,29 @@ def SciPy_Problem(problem,x):
     
     return obj
 
+def SciPy_Batch(problem,X):
+    """ This wrapper runs the RCAIDE problem for a set of inputs and is called by the particle swarm solver.
+    
+        Assumptions:
+        None
+    
+        Source:
+        N/A
+    
+        Inputs:
+        problem   [nexus()]
+        X         [array]
+    
+        Outputs:
+        obj       [array]
+        con       [array]
+    
+        Properties Used:
+        None
+    """      
+    
+    batch = problem.evaluate_batch(X)
+    obj   = batch.objective
+    con   = batch.inequality_constraints
+    
+    return obj, con
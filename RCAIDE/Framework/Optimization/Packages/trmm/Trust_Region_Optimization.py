@@ -137,253 +137,259 @@ class Trust_Region_Optimization(Data):
         # Trust region specific code
         # ---------------------------
         
-        iterations = 0
-        max_iterations = self.trust_region_max_iterations
-        x = np.array(x,dtype='float')
-        tr.center = x
-        tr_center = x # trust region center
-        x_initial = x*1.      
-        
-        while iterations < max_iterations:
-            iterations += 1
+        # the finite differences of the optimization share one pool of workers
+        problem.start_workers()
+        try:
+        
+            iterations = 0
+            max_iterations = self.trust_region_max_iterations
+            x = np.array(x,dtype='float')
+            tr.center = x
+            tr_center = x # trust region center
+            x_initial = x*1.      
+        
+            while iterations < max_iterations:
+                iterations += 1
             
-            # History writing
-            f_out.write('Iteration ----- ' + str(iterations) + '\n')
-            f_out.write('x_center: ' + str(x.tolist()) + '\n')
-            f_out.write('tr size  : ' + str(tr.size) + '\n')   
+                # History writing
+                f_out.write('Iteration ----- ' + str(iterations) + '\n')
+                f_out.write('x_center: ' + str(x.tolist()) + '\n')
+                f_out.write('tr size  : ' + str(tr.size) + '\n')   
             
-            f    = [None]*self.fidelity_levels
-            df   = [None]*self.fidelity_levels
-            g    = [None]*self.fidelity_levels
-            dg   = [None]*self.fidelity_levels            
+                f    = [None]*self.fidelity_levels
+                df   = [None]*self.fidelity_levels
+                g    = [None]*self.fidelity_levels
+                dg   = [None]*self.fidelity_levels            
             
-            for level in self.evaluation_order:
-                problem.fidelity_level = level
-                res = self.evaluate_model(problem,x)
-                f[level-1]  = res[0]    # objective value
-                df[level-1] = res[1]    # objective derivate vector
-                g[level-1]  = res[2]    # constraints vector
-                dg[level-1] = res[3]    # constraints jacobian
-                # History writing
-                f_out.write('Level    : ' + str(level) + '\n')
-                f_out.write('f        : ' + str(res[0][0]) + '\n')
-                f_out.write('df       : ' + str(res[1].tolist()) + '\n')
-            # assumes high fidelity is last
-            f_center = f[-1][0]
+                for level in self.evaluation_order:
+                    problem.fidelity_level = level
+                    res = self.evaluate_model(problem,x)
+                    f[level-1]  = res[0]    # objective value
+                    df[level-1] = res[1]    # objective derivate vector
+                    g[level-1]  = res[2]    # constraints vector
+                    dg[level-1] = res[3]    # constraints jacobian
+                    # History writing
+                    f_out.write('Level    : ' + str(level) + '\n')
+                    f_out.write('f        : ' + str(res[0][0]) + '\n')
+                    f_out.write('df       : ' + str(res[1].tolist()) + '\n')
+                # assumes high fidelity is last
+                f_center = f[-1][0]
                 
-            # Calculate correction
-            corrections = self.calculate_correction(f,df,g,dg,tr)
+                # Calculate correction
+                corrections = self.calculate_correction(f,df,g,dg,tr)
             
-            # Calculate constraint violation
-            g_violation_hi_center = self.calculate_constraint_violation(g[-1],con_low_edge,con_up_edge)
+                # Calculate constraint violation
+                g_violation_hi_center = self.calculate_constraint_violation(g[-1],con_low_edge,con_up_edge)
             
-            # Subproblem
-            tr_size = tr.size
-            tr.lower_bound = np.max(np.vstack([x_low_bound,x-tr_size]),axis=0)
-            tr.upper_bound = np.min(np.vstack([x_up_bound,x+tr_size]),axis=0)      
+                # Subproblem
+                tr_size = tr.size
+                tr.lower_bound = np.max(np.vstack([x_low_bound,x-tr_size]),axis=0)
+                tr.upper_bound = np.min(np.vstack([x_up_bound,x+tr_size]),axis=0)      
             
-            # Set to base fidelity level for optimizing the corrected model
-            problem.fidelity_level = 1
+                # Set to base fidelity level for optimizing the corrected model
+                problem.fidelity_level = 1
             
-            if self.optimizer == 'SNOPT':
-                opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_corrected_model, corrections=corrections,tr=tr)
+                if self.optimizer == 'SNOPT':
+                    opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_corrected_model, corrections=corrections,tr=tr)
                 
-                for ii in range(len(obj)):
-                    opt_prob.addObj('f',f_center) 
-                for ii in range(0,len(inp)):
-                    vartype = 'c'
-                    opt_prob.addVar(nam[ii],vartype,lower=tr.lower_bound[ii],upper=tr.upper_bound[ii],value=x[ii])    
-                for ii in range(0,len(con)):
-                    if con[ii][1]=='<':
-                        opt_prob.addCon(name[ii], type='i', upper=con_up_edge[ii])  
-                    elif con[ii][1]=='>':
-                        opt_prob.addCon(name[ii], type='i', lower=con_low_edge[ii],upper=np.inf)
-                    elif con[ii][1]=='=':
-                        opt_prob.addCon(name[ii], type='e', equal=con_up_edge[ii])      
+                    for ii in range(len(obj)):
+                        opt_prob.addObj('f',f_center) 
+                    for ii in range(0,len(inp)):
+                        vartype = 'c'
+                        opt_prob.addVar(nam[ii],vartype,lower=tr.lower_bound[ii],upper=tr.upper_bound[ii],value=x[ii])    
+                    for ii in range(0,len(con)):
+                        if con[ii][1]=='<':
+                            opt_prob.addCon(name[ii], type='i', upper=con_up_edge[ii])  
+                        elif con[ii][1]=='>':
+                            opt_prob.addCon(name[ii], type='i', lower=con_low_edge[ii],upper=np.inf)
+                        elif con[ii][1]=='=':
+                            opt_prob.addCon(name[ii], type='e', equal=con_up_edge[ii])      
                         
                    
-                opt = pyOpt.pySNOPT.SNOPT()       
+                    opt = pyOpt.pySNOPT.SNOPT()       
                 
-                opt.setOption('Major iterations limit'     , self.optimizer_max_iterations)
-                opt.setOption('Major optimality tolerance' , self.optimizer_convergence_tolerance)
-                opt.setOption('Major feasibility tolerance', self.optimizer_constraint_tolerance)
-                opt.setOption('Function precision'         , self.optimizer_function_precision)
-                opt.setOption('Verify level'               , self.optimizer_verify_level)           
+                    opt.setOption('Major iterations limit'     , self.optimizer_max_iterations)
+                    opt.setOption('Major optimality tolerance' , self.optimizer_convergence_tolerance)
+                    opt.setOption('Major feasibility tolerance', self.optimizer_constraint_tolerance)
+                    opt.setOption('Function precision'         , self.optimizer_function_precision)
+                    opt.setOption('Verify level'               , self.optimizer_verify_level)           
                 
-                outputs = opt(opt_prob, sens_type='FD',problem=problem,corrections=corrections,tr=tr)
+                    outputs = opt(opt_prob, sens_type='FD',problem=problem,corrections=corrections,tr=tr)
                 
-                # output value of 13 indicates that the optimizer could not find an optimum
-                if outputs[2]['value'][0] == 13:
-                    feasible_flag = False
-                else:
-                    feasible_flag = True
-                fOpt_corr = outputs[0][0]
-                xOpt_corr = outputs[1]
-                gOpt_corr = np.zeros([1,len(con)])[0]  
-                for ii in range(len(con)):
-                    gOpt_corr[ii] = opt_prob._solutions[0]._constraints[ii].value  
+                    # output value of 13 indicates that the optimizer could not find an optimum
+                    if outputs[2]['value'][0] == 13:
+                        feasible_flag = False
+                    else:
+                        feasible_flag = True
+                    fOpt_corr = outputs[0][0]
+                    xOpt_corr = outputs[1]
+                    gOpt_corr = np.zeros([1,len(con)])[0]  
+                    for ii in range(len(con)):
+                        gOpt_corr[ii] = opt_prob._solutions[0]._constraints[ii].value  
                     
 
-            elif self.optimizer == 'SLSQP':
+                elif self.optimizer == 'SLSQP':
                 
-                bounds = []
-                for lb, ub in zip(tr.lower_bound, tr.upper_bound):
-                    bounds.append((lb,ub))
+                    bounds = []
+                    for lb, ub in zip(tr.lower_bound, tr.upper_bound):
+                        bounds.append((lb,ub))
                 
-                constraints = self.initialize_SLSQP_constraints(con,problem,corrections,tr)
-                # need corrections, tr
+                    constraints = self.initialize_SLSQP_constraints(con,problem,corrections,tr)
+                    # need corrections, tr
     
-                res = minimize(self.evaluate_corrected_model, x, constraints=constraints, \
-                               args=(problem,corrections,tr), bounds=bounds)
+                    res = minimize(self.evaluate_corrected_model, x, constraints=constraints, \
+                                   args=(problem,corrections,tr), bounds=bounds)
+                
+                    fOpt_corr = res['fun']
+                    xOpt_corr = res['x']
+                    gOpt_corr = problem.all_constraints(xOpt_corr)
                 
-                fOpt_corr = res['fun']
-                xOpt_corr = res['x']
-                gOpt_corr = problem.all_constraints(xOpt_corr)
+                    if res['success']:
+                        feasible_flag = True
+                    else:
+                        feasible_flag = False
                 
-                if res['success']:
-                    feasible_flag = True
                 else:
-                    feasible_flag = False
-                
-            else:
-                raise ValueError('Selected optimizer not implemented')
-            success_flag = feasible_flag            
+                    raise ValueError('Selected optimizer not implemented')
+                success_flag = feasible_flag            
         
-            f_out.write('fopt = ' + str(fOpt_corr)+'\n')
-            f_out.write('xopt = ' + str(xOpt_corr)+'\n')
-            f_out.write('gopt = ' + str(gOpt_corr)+'\n')
+                f_out.write('fopt = ' + str(fOpt_corr)+'\n')
+                f_out.write('xopt = ' + str(xOpt_corr)+'\n')
+                f_out.write('gopt = ' + str(gOpt_corr)+'\n')
             
             
-            # Constraint minization ------------------------------------------------------------------------
-            if feasible_flag == False:
-                print('Infeasible within trust region, attempting to minimize constraint')
+                # Constraint minization ------------------------------------------------------------------------
+                if feasible_flag == False:
+                    print('Infeasible within trust region, attempting to minimize constraint')
                 
-                if self.optimizer == 'SNOPT':
-                    opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_constraints, corrections=corrections,tr=tr,
-                                                  lb=con_low_edge,ub=con_up_edge)
-                    for ii in range(len(obj)):
-                        opt_prob.addObj('constraint violation',0.) 
-                    for ii in range(0,len(inp)):
-                        vartype = 'c'
-                        opt_prob.addVar(nam[ii],vartype,lower=tr.lower_bound[ii],upper=tr.upper_bound[ii],value=x[ii])           
-                    opt = pyOpt.pySNOPT.SNOPT()            
-                    opt.setOption('Major iterations limit'     , self.optimizer_max_iterations)
-                    opt.setOption('Major optimality tolerance' , self.optimizer_convergence_tolerance)
-                    opt.setOption('Major feasibility tolerance', self.optimizer_constraint_tolerance)
-                    opt.setOption('Function precision'         , self.optimizer_function_precision)
-                    opt.setOption('Verify level'               , self.optimizer_verify_level)                 
+                    if self.optimizer == 'SNOPT':
+                        opt_prob = pyOpt.Optimization('RCAIDE',self.evaluate_constraints, corrections=corrections,tr=tr,
+                                                      lb=con_low_edge,ub=con_up_edge)
+                        for ii in range(len(obj)):
+                            opt_prob.addObj('constraint violation',0.) 
+                        for ii in range(0,len(inp)):
+                            vartype = 'c'
+                            opt_prob.addVar(nam[ii],vartype,lower=tr.lower_bound[ii],upper=tr.upper_bound[ii],value=x[ii])           
+                        opt = pyOpt.pySNOPT.SNOPT()            
+                        opt.setOption('Major iterations limit'     , self.optimizer_max_iterations)
+                        opt.setOption('Major optimality tolerance' , self.optimizer_convergence_tolerance)
+                        opt.setOption('Major feasibility tolerance', self.optimizer_constraint_tolerance)
+                        opt.setOption('Function precision'         , self.optimizer_function_precision)
+                        opt.setOption('Verify level'               , self.optimizer_verify_level)                 
                    
-                    con_outputs = opt(opt_prob, sens_type='FD',problem=problem,corrections=corrections,tr=tr,
-                                      lb=con_low_edge,ub=con_up_edge)
-                    xOpt_corr = con_outputs[1]
-                    new_outputs = self.evaluate_corrected_model(x, problem=problem,corrections=corrections,tr=tr)
-        
-                    fOpt_corr = new_outputs[0][0]
-                    gOpt_corr = np.zeros([1,len(con)])[0]   
-                    for ii in range(len(con)):
-                        gOpt_corr[ii] = new_outputs[1][ii]
-                elif self.optimizer == 'SLSQP':
-                    bounds = []
-                    for lb, ub in zip(con_low_edge, con_up_edge):
-                        bounds.append((lb,ub)) 
+                        con_outputs = opt(opt_prob, sens_type='FD',problem=problem,corrections=corrections,tr=tr,
+                                          lb=con_low_edge,ub=con_up_edge)
+                        xOpt_corr = con_outputs[1]
+                        new_outputs = self.evaluate_corrected_model(x, problem=problem,corrections=corrections,tr=tr)
+        
+                        fOpt_corr = new_outputs[0][0]
+                        gOpt_corr = np.zeros([1,len(con)])[0]   
+                        for ii in range(len(con)):
+                            gOpt_corr[ii] = new_outputs[1][ii]
+                    elif self.optimizer == 'SLSQP':
+                        bounds = []
+                        for lb, ub in zip(con_low_edge, con_up_edge):
+                            bounds.append((lb,ub)) 
                         
-                    res = minimize(self.evaluate_constraints, x, \
-                                   args=(problem,corrections,tr,con_low_edge,con_up_edge), bounds=bounds, method='slsqp')                    
+                        res = minimize(self.evaluate_constraints, x, \
+                                       args=(problem,corrections,tr,con_low_edge,con_up_edge), bounds=bounds, method='slsqp')                    
                         
-                    xOpt_corr = res['x']
-                    new_outputs = self.evaluate_corrected_model(x, problem=problem,corrections=corrections,tr=tr,
-                                                                return_cons=True)
+                        xOpt_corr = res['x']
+                        new_outputs = self.evaluate_corrected_model(x, problem=problem,corrections=corrections,tr=tr,
+                                                                    return_cons=True)
                     
-                    fOpt_corr = new_outputs[0][0]
-                    gOpt_corr = np.zeros([1,len(con)])[0]   
-                    for ii in range(len(con)):
-                        gOpt_corr[ii] = new_outputs[1][ii]               
+                        fOpt_corr = new_outputs[0][0]
+                        gOpt_corr = np.zeros([1,len(con)])[0]   
+                        for ii in range(len(con)):
+                            gOpt_corr[ii] = new_outputs[1][ii]               
                         
-                else:
-                    raise ValueError('Selected optimizer not implemented')
+                    else:
+                        raise ValueError('Selected optimizer not implemented')
                 
-                # Constraint minization end ------------------------------------------------------------------------
+                    # Constraint minization end ------------------------------------------------------------------------
                 
 
-            print('fOpt_corr = ', fOpt_corr)
-            print('xOpt_corr = ', xOpt_corr)
-            print('gOpt_corr = ', gOpt_corr)
+                print('fOpt_corr = ', fOpt_corr)
+                print('xOpt_corr = ', xOpt_corr)
+                print('gOpt_corr = ', gOpt_corr)
             
-            # Evaluate high-fidelity at optimum
-            problem.fidelity_level = np.max(self.fidelity_levels)
-            fOpt_hi, gOpt_hi = self.evaluate_model(problem,xOpt_corr,der_flag=False)
-            fOpt_hi = fOpt_hi[0]
+                # Evaluate high-fidelity at optimum
+                problem.fidelity_level = np.max(self.fidelity_levels)
+                fOpt_hi, gOpt_hi = self.evaluate_model(problem,xOpt_corr,der_flag=False)
+                fOpt_hi = fOpt_hi[0]
         
-            g_violation_opt_corr = self.calculate_constraint_violation(gOpt_corr,con_low_edge,con_up_edge)
-            g_violation_opt_hi = self.calculate_constraint_violation(gOpt_hi,con_low_edge,con_up_edge)
+                g_violation_opt_corr = self.calculate_constraint_violation(gOpt_corr,con_low_edge,con_up_edge)
+                g_violation_opt_hi = self.calculate_constraint_violation(gOpt_hi,con_low_edge,con_up_edge)
             
-            # Calculate ratio
-            rho = self.accuracy_ratio(f_center,fOpt_hi, fOpt_corr, g_violation_hi_center, g_violation_opt_hi, 
-                                      g_violation_opt_corr,tr)  
+                # Calculate ratio
+                rho = self.accuracy_ratio(f_center,fOpt_hi, fOpt_corr, g_violation_hi_center, g_violation_opt_hi, 
+                                          g_violation_opt_corr,tr)  
             
-            # Acceptance Test
-            accepted = 0
-            if( fOpt_hi < f_center ):
-                print('Trust region update accepted since objective value is lower\n')
-                accepted = 1
-            elif( g_violation_opt_hi < g_violation_hi_center ):
-                print('Trust region update accepted since nonlinear constraint violation is lower\n')
-                accepted = 1
-            else:
-                print('Trust region update rejected (filter)\n')        
+                # Acceptance Test
+                accepted = 0
+                if( fOpt_hi < f_center ):
+                    print('Trust region update accepted since objective value is lower\n')
+                    accepted = 1
+                elif( g_violation_opt_hi < g_violation_hi_center ):
+                    print('Trust region update accepted since nonlinear constraint violation is lower\n')
+                    accepted = 1
+                else:
+                    print('Trust region update rejected (filter)\n')        
             
-            # Update Trust Region Size
-            print(tr)
-            tr_action = self.update_tr_size(rho,tr,accepted)  
+                # Update Trust Region Size
+                print(tr)
+                tr_action = self.update_tr_size(rho,tr,accepted)  
                 
-            # Terminate if trust region too small
-            if( tr.size < tr.minimum_size ):
-                print('Trust region too small')
-                f_out.write('Trust region too small')
-                f_out.close()
-                if print_output == False:
-                    sys.stdout = sys.__stdout__                  
-                return (fOpt_corr,xOpt_corr,'Trust region too small')
+                # Terminate if trust region too small
+                if( tr.size < tr.minimum_size ):
+                    print('Trust region too small')
+                    f_out.write('Trust region too small')
+                    f_out.close()
+                    if print_output == False:
+                        sys.stdout = sys.__stdout__                  
+                    return (fOpt_corr,xOpt_corr,'Trust region too small')
             
-            # Terminate if solution is infeasible, no change is detected, and trust region does not expand
-            if( success_flag == False and tr_action < 3 and\
-                np.sum(np.isclose(xOpt_corr,x,rtol=1e-15,atol=1e-14)) == len(x) ):
-                print('Solution infeasible, no improvement can be made')
-                f_out.write('Solution infeasible, no improvement can be made')
-                f_out.close()
-                if print_output == False:
-                    sys.stdout = sys.__stdout__                  
-                return (fOpt_corr,xOpt_corr,'Solution infeasible')      
+                # Terminate if solution is infeasible, no change is detected, and trust region does not expand
+                if( success_flag == False and tr_action < 3 and\
+                    np.sum(np.isclose(xOpt_corr,x,rtol=1e-15,atol=1e-14)) == len(x) ):
+                    print('Solution infeasible, no improvement can be made')
+                    f_out.write('Solution infeasible, no improvement can be made')
+                    f_out.close()
+                    if print_output == False:
+                        sys.stdout = sys.__stdout__                  
+                    return (fOpt_corr,xOpt_corr,'Solution infeasible')      
             
-            # History writing
-            f_out.write('x opt    : ' + str(xOpt_corr.tolist()) + '\n')
-            f_out.write('low obj  : ' + str(fOpt_corr)          + '\n')
-            f_out.write('hi  obj  : ' + str(fOpt_hi)            + '\n')
+                # History writing
+                f_out.write('x opt    : ' + str(xOpt_corr.tolist()) + '\n')
+                f_out.write('low obj  : ' + str(fOpt_corr)          + '\n')
+                f_out.write('hi  obj  : ' + str(fOpt_hi)            + '\n')
             
-            # Convergence check
-            if (accepted==1 and (np.abs(f_center-fOpt_hi) < self.convergence_tolerance)):
-                print('Hard convergence reached')
-                f_out.write('Hard convergence reached')
-                f_out.close()
-                if print_output == False:
-                    sys.stdout = sys.__stdout__                  
-                return (fOpt_corr,xOpt_corr,'convergence reached')            
+                # Convergence check
+                if (accepted==1 and (np.abs(f_center-fOpt_hi) < self.convergence_tolerance)):
+                    print('Hard convergence reached')
+                    f_out.write('Hard convergence reached')
+                    f_out.close()
+                    if print_output == False:
+                        sys.stdout = sys.__stdout__                  
+                    return (fOpt_corr,xOpt_corr,'convergence reached')            
             
-            # Update trust region center
-            if accepted == 1:
-                x = xOpt_corr*1.
-                tr.center = x*1.             
+                # Update trust region center
+                if accepted == 1:
+                    x = xOpt_corr*1.
+                    tr.center = x*1.             
             
-            print('Iteration number: ' + str(iterations))
-            print('x value: ' + str(x.tolist()))
-            print('Objective value: ' + str(fOpt_hi))
-        
-        f_out.write('Max iteration limit reached')
-        f_out.close()
-        print('Max iteration limit reached')
-        if print_output == False:
-            sys.stdout = sys.__stdout__          
-        return (fOpt_corr,xOpt_corr,'Max iteration limit reached')
+                print('Iteration number: ' + str(iterations))
+                print('x value: ' + str(x.tolist()))
+                print('Objective value: ' + str(fOpt_hi))
+        
+            f_out.write('Max iteration limit reached')
+            f_out.close()
+            print('Max iteration limit reached')
+            if print_output == False:
+                sys.stdout = sys.__stdout__          
+            return (fOpt_corr,xOpt_corr,'Max iteration limit reached')
+        finally:
+            problem.stop_workers()
             
         
     def evaluate_model(self,problem,x,der_flag=True):
@@ -1,6 +1,7 @@
 # RCAIDE/Library/Components/Energy/Networks/Distribution/Electrical_Bus.py 
 # 
 # Created:  Jul 2023, M. Clarke 
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -42,7 +43,11 @@ class Electrical_Bus(Component):
         
     identical_battery_modules : bool
         Flag indicating if all battery modules are identical (default: True)
-        
+
+    share_identical_battery_module_conditions : bool
+        Flag indicating if identical battery modules reference the results of
+        the first module instead of copies of them (default: True)
+
     active : bool
         Flag indicating if the bus is operational (default: True)
         
@@ -105,6 +110,7 @@ class Electrical_Bus(Component):
         self.avionics                              = RCAIDE.Library.Components.Systems.Avionics()
         self.payload                               = RCAIDE.Library.Components.Payloads.Payload()         
         self.identical_battery_modules             = True  
+        self.share_identical_battery_module_conditions = True # identical battery modules reference the arrays of the first module instead of deep copies
         self.active                                = True
         self.efficiency                            = 1.0
         self.voltage                               = 0.0 
@@ -11,6 +11,7 @@
 import RCAIDE
 from RCAIDE.Framework.Core          import Units,Data
 from .Generic_Battery_Module import  Generic_Battery_Module
+from RCAIDE.Library.Methods.Energy.Sources.Batteries.Common  import load_battery_data, load_raw_data_file
 from RCAIDE.Library.Methods.Energy.Sources.Batteries.Lithium_Ion_LFP  import * 
 
 # package imports 
@@ -141,8 +142,8 @@ class Lithium_Ion_LFP(Generic_Battery_Module):
         self.cell.radial_thermal_conductivity = 0.475                                                     # [J/kgK]  
         self.cell.axial_thermal_conductivity  = 37.6                                                      # [J/kgK]  
 
-        battery_raw_data                      = load_battery_results()                                                   
-        self.cell.discharge_performance_map   = create_discharge_performance_map(battery_raw_data)
+        battery_data                          = load_battery_data(self.cell.chemistry,load_battery_results,create_discharge_performance_map)                                                   
+        self.cell.discharge_performance_map   = battery_data.discharge_performance_map
 
         return                                     
 
@@ -174,6 +175,35 @@ class Lithium_Ion_LFP(Generic_Battery_Module):
                         
         return stored_results_flag, stored_battery_tag
     
+    def energy_calc_batch(self,state,bus,delta_t): 
+        """
+        Computes the state of the LFP battery cell at all control points of the segment at once
+        
+        Parameters
+        ----------
+        state : Data
+            Current system state
+        bus : Component
+            Connected electrical bus
+        delta_t : array
+            Time steps between control points [s]
+            
+        Returns
+        -------
+        stored_results_flag : bool
+            Flag indicating if results were stored
+        stored_battery_tag : str
+            Identifier for stored results
+
+        Notes
+        -----
+        Only valid for battery modules without a thermal management system on a bus of identical
+        battery modules that is not recharging, see Electric.evaluate.
+        """      
+        stored_results_flag, stored_battery_tag =  compute_lfp_cell_performance_batch(self,state,bus,delta_t) 
+                        
+        return stored_results_flag, stored_battery_tag
+    
     def reuse_stored_data(self,state,bus,coolant_lines, t_idx, delta_t,stored_results_flag, stored_battery_tag):
         """
         Reuses previously stored battery performance data
@@ -297,7 +327,7 @@ def load_battery_results():
     current_dir = os.path.dirname(os.path.abspath(__file__))
     full_path = os.path.join(current_dir, 'lfp_raw_data.res')
 
-    # Load the raw_data using RCAIDE.load()
-    raw_data = RCAIDE.load(full_path)
+    # Load the raw_data using RCAIDE.load() or its binary copy
+    raw_data = load_raw_data_file(full_path,RCAIDE.load)
 
     return raw_data
\ No newline at end of file
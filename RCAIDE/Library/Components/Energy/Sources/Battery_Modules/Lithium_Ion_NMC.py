@@ -10,6 +10,7 @@
 import RCAIDE
 from RCAIDE.Framework.Core                                            import Units , Data
 from .Generic_Battery_Module                                          import Generic_Battery_Module   
+from RCAIDE.Library.Methods.Energy.Sources.Batteries.Common  import load_battery_data, load_raw_data_file
 from RCAIDE.Library.Methods.Energy.Sources.Batteries.Lithium_Ion_NMC  import *
 # package imports 
 import numpy as np
@@ -167,8 +168,8 @@ class Lithium_Ion_NMC(Generic_Battery_Module):
         self.cell.axial_thermal_conductivity  = 32.2                                                                             # [J/kgK] # estimated
     
                                               
-        battery_raw_data                      = load_battery_results()                                                   
-        self.cell.discharge_performance_map   = create_discharge_performance_map(battery_raw_data)  
+        battery_data                          = load_battery_data(self.cell.chemistry,load_battery_results,create_discharge_performance_map)                                                   
+        self.cell.discharge_performance_map   = battery_data.discharge_performance_map  
 
         return  
     
@@ -226,6 +227,35 @@ class Lithium_Ion_NMC(Generic_Battery_Module):
         
         return stored_results_flag, stored_battery_tag
     
+    def energy_calc_batch(self,state,bus,delta_t): 
+        """
+        Computes the state of the NMC battery cell at all control points of the segment at once
+        
+        Parameters
+        ----------
+        state : Data
+            Current system state
+        bus : Component
+            Connected electrical bus
+        delta_t : array
+            Time steps between control points [s]
+            
+        Returns
+        -------
+        stored_results_flag : bool
+            Flag indicating if results were stored
+        stored_battery_tag : str
+            Identifier for stored results
+
+        Notes
+        -----
+        Only valid for battery modules without a thermal management system on a bus of identical
+        battery modules that is not recharging, see Electric.evaluate.
+        """      
+        stored_results_flag, stored_battery_tag =  compute_nmc_cell_performance_batch(self,state,bus,delta_t) 
+                        
+        return stored_results_flag, stored_battery_tag
+    
     def reuse_stored_data(self,state,bus,coolant_lines, t_idx, delta_t,stored_results_flag, stored_battery_tag):
         reuse_stored_nmc_cell_data(self,state,bus,coolant_lines, t_idx, delta_t,stored_results_flag, stored_battery_tag)
         return 
@@ -354,4 +384,4 @@ def load_battery_results():
     ospath    = os.path.abspath(__file__)
     separator = os.path.sep
     rel_path  = os.path.dirname(ospath) + separator     
-    return RCAIDE.load(rel_path+ 'NMC_Raw_Data.res')
\ No newline at end of file
+    return load_raw_data_file(rel_path+ 'NMC_Raw_Data.res',RCAIDE.load)
\ No newline at end of file
@@ -10,7 +10,7 @@
 # RCAIDE imports  
 from RCAIDE.Framework.Core import Data
 from .hess_smith           import hess_smith
-from .thwaites_method      import thwaites_method 
+from .thwaites_method      import thwaites_method, compact_surface 
 from .heads_method         import heads_method 
 from .aero_coeff           import aero_coeff
 from .chordwise_distribution import chordwise_distribution
@@ -541,11 +541,11 @@ def concatenate_surfaces(X_BOT,X_TOP,FUNC_BOT_SURF,FUNC_TOP_SURF,npanel,ncases,n
     Properties Used:
     N/A  
     '''  
-    FUNC = np.zeros((npanel,ncases,ncpts))  
-    
-    for case in range(ncases):
-        for cpt in range(ncpts):   
-            top_func          = FUNC_TOP_SURF[:,case,cpt][X_TOP[:,case,cpt].mask == False] 
-            bot_func          = FUNC_BOT_SURF[:,case,cpt][X_BOT[:,case,cpt].mask == False]                  
-            FUNC[:,case,cpt]  = np.concatenate([bot_func[::-1],top_func])
+    # the points of the bottom surface, from the trailing edge, followed by those of the top surface
+    bot_func, n_bot = compact_surface(np.ma.array(np.ma.getdata(FUNC_BOT_SURF),mask = np.ma.getmaskarray(X_BOT)))
+    top_func, _     = compact_surface(np.ma.array(np.ma.getdata(FUNC_TOP_SURF),mask = np.ma.getmaskarray(X_TOP)))
+    panel           = np.arange(npanel)[:,None,None]
+    bot_index       = np.clip(n_bot - 1 - panel,0,npanel-1)
+    top_index       = np.clip(panel - n_bot,0,npanel-1)
+    FUNC            = np.where(panel < n_bot,np.take_along_axis(bot_func,bot_index,axis = 0),np.take_along_axis(top_func,top_index,axis = 0))
     return FUNC
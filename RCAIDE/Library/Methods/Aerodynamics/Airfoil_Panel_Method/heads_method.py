@@ -8,6 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports    
 from RCAIDE.Framework.Core import Data 
+from .thwaites_method      import compact_surface, expand_surface
 
 # package imports  
 import numpy as np 
@@ -56,120 +57,63 @@ def heads_method(npanel,ncases,ncpts,NU,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFac
     Properties Used:
     N/A
     """    
-    # Initialize vectors 
-    X_H          = np.zeros((npanel,ncases,ncpts))
-    THETA_H      = np.zeros_like(X_H)
-    DELTA_STAR_H = np.zeros_like(X_H)
-    H_H          = np.zeros_like(X_H)
-    CF_H         = np.zeros_like(X_H) 
-    RE_THETA_H   = np.zeros_like(X_H)
-    RE_X_H       = np.zeros_like(X_H)
-    DELTA_H      = np.zeros_like(X_H)      
+    # move the turbulent points of each case and control point to the front of the arrays, in surface order.
+    # Cases and control points without a turbulent surface are marched but not stored 
+    x_i, n       = compact_surface(TURBULENT_COORD)
+    Ve_i, _      = compact_surface(np.ma.array(np.ma.getdata(VE_I),mask = np.ma.getmaskarray(TURBULENT_COORD)))
+    dVe_i, _     = compact_surface(np.ma.array(np.ma.getdata(DVE_I),mask = np.ma.getmaskarray(TURBULENT_COORD)))
+    turbulent    = TURBULENT_SURF != 0.0
+    surface      = (np.arange(npanel)[:,None,None] < n) & turbulent
+    x_i          = np.where(surface,x_i,1.0)
+    Ve_i         = np.where(surface,Ve_i,1.0)
+    dVe_i        = np.where(surface,dVe_i,0.0)
+    dx           = np.diff(x_i,axis = 0)
+    nu           = NU
     
-    for case in range(ncases):
-        for cpt in range(ncpts):  
-            # length of tubulent surface  
-            l = TURBULENT_SURF[case,cpt] 
-            if l == 0.0:
-                pass
-            else: 
-                def getcf(ind, nu, H, THETA):
-                    ReTheta = Ve_i[ind]*THETA/nu;
-                    cf_var = 0.246*(10**(-0.678*H))*(ReTheta**-0.268);
-                    return cf_var
-                
-                def getH(H1_var):
-                    if H1_var<3.3:
-                        H_var = 3.0
-                    elif H1_var < 5.39142:
-                        H_var = 0.6778 + 1.153793*(H1_var-3.3)**-0.32637;
-                    elif H1_var >= 5.39142:
-                        H_var = 1.1 + 0.8598636*(H1_var - 3.3)**-0.777;
-                    return H_var 
-             
-                # define RK4 slope function for Theta
-                def dTheta_by_dx(index, X, THETA, VETHETAH1):
-                    return 0.5*cf[index] - (THETA/Ve_i[index])*(2+H[index])*(dVe_i[index])
-                
-                # define RK4 slope function for VeThetaH1
-                def dVeThetaH1_by_dx(index, X, THETA, VETHETAH1):
-                    return Ve_i[index]*0.0306*(((VETHETAH1/(Ve_i[index]*THETA))-3)**-0.6169)
-                
-                x_i          = TURBULENT_COORD.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False] 
-                Ve_i         = VE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                dVe_i        = DVE_I.data[:,case,cpt][TURBULENT_COORD.mask[:,case,cpt] ==False]
-                Re_L         = RE_L[case,cpt]
-                n            = len(x_i)
-                dx           = np.diff(x_i)
-                nu           = NU[case,cpt]
-                
-                H            = np.zeros(n) 
-                H[0]         = ShapeFactor_0[case,cpt]
-                Theta        = np.zeros(n)
-                Theta[0]     = THETA_0[case,cpt]
-                H1           = np.zeros(n) 
-                H1[0]        = (DEL_0[case,cpt] - DELTA_STAR_0[case,cpt])/THETA_0[case,cpt]
-                if H1[0]<3.3:
-                    H1[0] = 3.417285
-                
-                cf           = np.zeros(n)
-                cf[0]        = CF_0[case,cpt] 
-                VeThetaH1    = np.zeros(n)
-                VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0]
-                
-                for i in range(1,n):
-                    # initialise the variable values at the current grid point using previous grid points (to define the error functions)
-                    H_er = H[i-1];  cf_er = cf[i-1];  H1_er = H1[i-1];  Theta_er = Theta[i-1];
-                    # assign previous grid point values of H and Cf to start RK4
-                    H[i] = H[i-1]; cf[i] = cf[i-1];
-                    
-                    #assume some error values
-                    erH = 0.2; erH1 = 0.2; erTheta = 0.2; ercf = 0.2;
-                    
-                    # iterate to get the variables at the grid point
-                    while abs(erH)>0.00001 or abs(erH1)>0.00001 or abs(erTheta)>0.00001 or abs(ercf)>0.00001:
-                        
-                        # get Theta and VeThetaH1
-                        Theta[i], VeThetaH1[i] = RK4(i-1, dx, x_i, Theta, VeThetaH1, dTheta_by_dx, dVeThetaH1_by_dx)
-                        if np.isnan(VeThetaH1[i]):
-                            VeThetaH1[i] = VeThetaH1[i-1]
-                       
-                        # get H1
-                        H1[i] = VeThetaH1[i]/(Ve_i[i]*Theta[i])
-                        
-                        # get H
-                        H[i] = getH(H1[i])
-                        
-                        # get skin friction
-                        cf[i] = getcf(i, nu, H[i], Theta[i])
-                        
-                        # define errors
-                        erH = (H[i]-H_er)/H[i];
-                        erH1 = (H1[i]-H1_er)/H1[i];
-                        erTheta = (Theta[i]-Theta_er)/Theta[i];
-                        ercf = (cf[i]-cf_er)/cf[i];
-                        
-                        # assign current iteration variable values to the Var_er
-                        H_er = H[i]
-                        H1_er = H1[i]
-                        Theta_er = Theta[i]
-                        cf_er = cf[i]
-                
-                
-                delta_star   = H*Theta
-                Re_theta     = Ve_i*Theta/nu
-                Re_x         = (Ve_i*x_i)/nu
-                delta        = (Theta*H1) + delta_star
-                
-                indices = np.where(TURBULENT_COORD.mask[:,case,cpt] == False)
-                np.put(X_H[:,case,cpt],indices,x_i )
-                np.put(THETA_H[:,case,cpt],indices,Theta)
-                np.put(DELTA_STAR_H[:,case,cpt],indices,delta_star)
-                np.put(H_H[:,case,cpt],indices,H)
-                np.put(CF_H[:,case,cpt],indices,cf)
-                np.put(RE_THETA_H[:,case,cpt],indices,Re_theta)
-                np.put(RE_X_H[:,case,cpt],indices,Re_x)
-                np.put(DELTA_H[:,case,cpt],indices,delta)
+    H            = np.zeros_like(x_i) 
+    H[0]         = ShapeFactor_0
+    Theta        = np.zeros_like(x_i)
+    Theta[0]     = THETA_0
+    H1           = np.zeros_like(x_i) 
+    H1[0]        = (DEL_0 - DELTA_STAR_0)/THETA_0
+    H1[0][H1[0]<3.3] = 3.417285
+    
+    cf           = np.zeros_like(x_i)
+    cf[0]        = CF_0 
+    VeThetaH1    = np.zeros_like(x_i)
+    VeThetaH1[0] = Ve_i[0]*Theta[0]*H1[0] 
+    
+    # march all cases and control points together. The RK4 slopes only depend on the previous point, so
+    # the values at each point are found in a single RK4 step 
+    with np.errstate(divide = 'ignore', invalid = 'ignore', over = 'ignore'):
+        for i in range(1,npanel):
+            # get Theta and VeThetaH1
+            Theta[i], VeThetaH1[i] = RK4(i-1, dx, Ve_i, dVe_i, H, cf, Theta, VeThetaH1)
+            VeThetaH1[i] = np.where(np.isnan(VeThetaH1[i]),VeThetaH1[i-1],VeThetaH1[i])
+            
+            # get H1
+            H1[i] = VeThetaH1[i]/(Ve_i[i]*Theta[i])
+            
+            # get H
+            H[i] = getH(H1[i])
+            
+            # get skin friction
+            cf[i] = getcf(Ve_i[i], nu, H[i], Theta[i])
+    
+    delta_star   = H*Theta
+    Re_theta     = Ve_i*Theta/nu
+    Re_x         = (Ve_i*x_i)/nu
+    delta        = (Theta*H1) + delta_star
+    
+    # Store results at the turbulent points 
+    X_H          = np.where(turbulent,expand_surface(x_i,TURBULENT_COORD),0.0)
+    THETA_H      = np.where(turbulent,expand_surface(Theta,TURBULENT_COORD),0.0)
+    DELTA_STAR_H = np.where(turbulent,expand_surface(delta_star,TURBULENT_COORD),0.0)
+    H_H          = np.where(turbulent,expand_surface(H,TURBULENT_COORD),0.0)
+    CF_H         = np.where(turbulent,expand_surface(cf,TURBULENT_COORD),0.0)
+    RE_THETA_H   = np.where(turbulent,expand_surface(Re_theta,TURBULENT_COORD),0.0)
+    RE_X_H       = np.where(turbulent,expand_surface(Re_x,TURBULENT_COORD),0.0)
+    DELTA_H      = np.where(turbulent,expand_surface(delta,TURBULENT_COORD),0.0)
 
     RESULTS = Data(
             X_H          = X_H,      
@@ -185,19 +129,84 @@ def heads_method(npanel,ncases,ncpts,NU,DEL_0,THETA_0,DELTA_STAR_0,CF_0,ShapeFac
     return  RESULTS
 
 
-def RK4(ind, dx, x, Theta_var, VeThetaH1_var, Theta_slope, VeThetaH1_slope):
-    k1 = Theta_slope(ind,  x[ind],  Theta_var[ind],  VeThetaH1_var[ind])
-    l1 = VeThetaH1_slope(ind,  x[ind],  Theta_var[ind],  VeThetaH1_var[ind])
+def getcf(Ve, nu, H, THETA):
+    """ Computes the skin friction coefficient, cf
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    Ve         - boundary layer velocity           [m/s]
+    nu         - kinematic viscosity               [m^2/s]
+    H          - shape factor                      [unitless]
+    THETA      - momentum thickness                [m]
+
+    Outputs:  
+    cf         - skin friction coefficient         [unitless]
+
+    Properties Used:
+    N/A 
+    """        
+    ReTheta = Ve*THETA/nu
+    cf_var  = 0.246*(10**(-0.678*H))*(ReTheta**-0.268)
+    return cf_var
+
+def getH(H1_var):
+    """ Computes the shape factor, H, from the shape factor H1
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    H1_var     - shape factor H1                   [unitless]
+
+    Outputs:  
+    H_var      - shape factor                      [unitless]
+
+    Properties Used:
+    N/A 
+    """        
+    H_var = np.full_like(H1_var,np.nan)
+    H_var[H1_var<3.3]  = 3.0
+    idx1               = (H1_var >= 3.3) & (H1_var < 5.39142)
+    H_var[idx1]        = 0.6778 + 1.153793*(H1_var[idx1]-3.3)**-0.32637
+    idx2               = H1_var >= 5.39142
+    H_var[idx2]        = 1.1 + 0.8598636*(H1_var[idx2] - 3.3)**-0.777
+    return H_var 
+
+def dTheta_by_dx(index, Ve_i, dVe_i, H, cf, THETA, VETHETAH1):
+    """ RK4 slope function for Theta
+    
+    :meta private:
+    """
+    return 0.5*cf[index] - (THETA/Ve_i[index])*(2+H[index])*(dVe_i[index])
+
+def dVeThetaH1_by_dx(index, Ve_i, dVe_i, H, cf, THETA, VETHETAH1):
+    """ RK4 slope function for VeThetaH1
+    
+    :meta private:
+    """
+    return Ve_i[index]*0.0306*(((VETHETAH1/(Ve_i[index]*THETA))-3)**-0.6169)
+
+def RK4(ind, dx, Ve_i, dVe_i, H, cf, Theta_var, VeThetaH1_var):
+    k1 = dTheta_by_dx(ind, Ve_i, dVe_i, H, cf,  Theta_var[ind],  VeThetaH1_var[ind])
+    l1 = dVeThetaH1_by_dx(ind, Ve_i, dVe_i, H, cf,  Theta_var[ind],  VeThetaH1_var[ind])
     
-    k2 = Theta_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k1*dx[ind]/2),  VeThetaH1_var[ind] + (l1*dx[ind]/2))
-    l2 = VeThetaH1_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k1*dx[ind]/2),  VeThetaH1_var[ind] + (l1*dx[ind]/2))
+    k2 = dTheta_by_dx(ind, Ve_i, dVe_i, H, cf,  Theta_var[ind] + (k1*dx[ind]/2),  VeThetaH1_var[ind] + (l1*dx[ind]/2))
+    l2 = dVeThetaH1_by_dx(ind, Ve_i, dVe_i, H, cf,  Theta_var[ind] + (k1*dx[ind]/2),  VeThetaH1_var[ind] + (l1*dx[ind]/2))
     
-    k3 = Theta_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k2*dx[ind]/2),  VeThetaH1_var[ind] + (l2*dx[ind]/2))
-    l3 = VeThetaH1_slope(ind,  x[ind] + (dx[ind]/2),  Theta_var[ind] + (k2*dx[ind]/2),  VeThetaH1_var[ind] + (l2*dx[ind]/2))
+    k3 = dTheta_by_dx(ind, Ve_i, dVe_i, H, cf,  Theta_var[ind] + (k2*dx[ind]/2),  VeThetaH1_var[ind] + (l2*dx[ind]/2))
+    l3 = dVeThetaH1_by_dx(ind, Ve_i, dVe_i, H, cf,  Theta_var[ind] + (k2*dx[ind]/2),  VeThetaH1_var[ind] + (l2*dx[ind]/2))
     
-    k4 = Theta_slope(ind,  x[ind] + dx[ind],  Theta_var[ind] + (k3*dx[ind]),  VeThetaH1_var[ind] + (l2*dx[ind]))
-    l4 = VeThetaH1_slope(ind,  x[ind] + dx[ind],  Theta_var[ind] + (k3*dx[ind]),  VeThetaH1_var[ind] + (l2*dx[ind]))
+    k4 = dTheta_by_dx(ind, Ve_i, dVe_i, H, cf,  Theta_var[ind] + (k3*dx[ind]),  VeThetaH1_var[ind] + (l2*dx[ind]))
+    l4 = dVeThetaH1_by_dx(ind, Ve_i, dVe_i, H, cf,  Theta_var[ind] + (k3*dx[ind]),  VeThetaH1_var[ind] + (l2*dx[ind]))
     
     Theta_new = Theta_var[ind] + ((dx[ind]/6)*(k1 + 2*k2 + 2*k3 + k4))
     VeThetaH1_new = VeThetaH1_var[ind] + ((dx[ind]/6)*(l1 + 2*l2 + 2*l3 + l4))
-    return Theta_new, VeThetaH1_new 
\ No newline at end of file
+    return Theta_new, VeThetaH1_new
@@ -14,7 +14,6 @@ from .velocity_distribution import velocity_distribution
 
 # pacakge imports  
 import numpy as np  
-from scipy.linalg import solve
  
 # ----------------------------------------------------------------------------------------------------------------------
 # hess_smith
@@ -64,14 +63,8 @@ def hess_smith(x_coord,y_coord,alpha,Re,npanel):
     b_2d[:-1,:,:] = st*np.cos(alpha_2d) - np.sin(alpha_2d)*ct
     b_2d[-1,:,:]  = -(ct[0,:,:]*np.cos(alpha_2d[-1,:,:]) + st[0,:,:]*np.sin(alpha_2d[-1,:,:]))-(ct[-1,:,:]*np.cos(alpha_2d[-1,:,:]) +st[-1,:,:]*np.sin(alpha_2d[-1,:,:]))
     
-    qg = np.zeros((npanel+1, ncases, ncpts))  
-    for i in range(ncases):
-        for j in range(ncpts):
-            A = ainfl[i, j, :, :]     
-            B = b_2d[:, i, j]        
-            
-
-            qg[:, i, j] = solve(A, B)
+    # solve the linear systems of all cases and control points together 
+    qg            = np.moveaxis(np.linalg.solve(ainfl, np.moveaxis(b_2d,0,-1)[:,:,:,None])[:,:,:,0],-1,0)  
     
     # compute the tangential velocity distribution at the midpoint of panels 
     vt            = velocity_distribution(qg,x_coord,y_coord,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts)
@@ -40,17 +40,6 @@ def infl_coeff(x,y,xbar,ybar,st,ct,npanel,ncases,ncpts):
     # This code has been written in an i,j style, where i is the panel where the source is located and j is the location where the effect is measured
     ainfl                = np.zeros((ncases,ncpts,npanel+1,npanel+1))    
     pi2inv               = 1 / (2*np.pi) 
-    r_ij                 = np.zeros((ncases,ncpts,npanel,npanel+1)) #(AOAs, REs, npanels, no. of nodes)
-    beta_ij              = np.zeros((ncases,ncpts,npanel,npanel)) 
-    st_i_j               = np.zeros((ncases,ncpts,npanel,npanel))   # sin(TH_i - TH_j)
-    ct_i_j               = np.zeros((ncases,ncpts,npanel,npanel))   # cos(TH_i - TH_j) 
-    ainfl[:,:,:-1,:-1] = pi2inv*((st_i_j*np.log(r_ij[:,:,:,1:]/r_ij[:,:,:,:-1])) +  (ct_i_j*beta_ij)) 
-    mat2               = ((ct_i_j*np.log(r_ij[:,:,:,1:]/r_ij[:,:,:,:-1])) - (st_i_j*beta_ij))
-    ainfl[:,:,:-1,-1]  = pi2inv*np.sum(mat2, axis=3) 
-    mat3               = (st_i_j*beta_ij) - (ct_i_j*np.log(r_ij[:,:,:,1:]/r_ij[:,:,:,:-1]))
-    ainfl[:,:,-1,:-1]  = pi2inv*np.sum(mat3, axis=2) 
-    mat4               = (st_i_j*np.log(r_ij[:,:,:,1:]/r_ij[:,:,:,:-1])) + (ct_i_j*beta_ij)
-    ainfl[:,:,-1,-1]   = np.sum(np.sum(mat4, axis=3), axis=2)
         
     #convert 1d matrices to 4d 
     x_2d                 = np.repeat(np.swapaxes(np.swapaxes(x,0, 2),0,1)[:,:,np.newaxis,:],npanel, axis = 2)
@@ -77,12 +66,14 @@ def infl_coeff(x,y,xbar,ybar,st,ct,npanel,ncases,ncpts):
     res                  = list(np.repeat(np.arange(ncpts),ncases*npanel))   
     betaij[aoas,res,diag_indices,diag_indices] = np.pi 
     
-    ainfl[:,:,:-1,:-1]   = pi2inv*(sti_minus_j*np.log(rij_plus_1/rij) + cti_minus_j*betaij)
-    mat_1                = np.sum(pi2inv*(cti_minus_j*np.log(rij_plus_1/rij)-sti_minus_j*betaij), axis = 3)
+    log_r_ratio          = np.log(rij_plus_1/rij)
+    
+    mat_3                = pi2inv*(sti_minus_j*log_r_ratio + cti_minus_j*betaij)
+    ainfl[:,:,:-1,:-1]   = mat_3
+    mat_1                = np.sum(pi2inv*(cti_minus_j*log_r_ratio-sti_minus_j*betaij), axis = 3)
     ainfl[:,:,:-1,-1]    = mat_1  
     
-    mat_2                = pi2inv*(sti_minus_j*betaij - cti_minus_j*np.log(rij_plus_1/rij))
-    mat_3                = pi2inv*(sti_minus_j*np.log(rij_plus_1/rij) + cti_minus_j*betaij)
+    mat_2                = pi2inv*(sti_minus_j*betaij - cti_minus_j*log_r_ratio)
     ainfl[:,:,-1,:-1]    = mat_2[:,:,0] + mat_2[:,:,-1]
     ainfl[:,:,-1,-1]     = np.sum(mat_3,axis = 3)[:,:,0] + np.sum(mat_3,axis = 3)[:,:,-1]   
     
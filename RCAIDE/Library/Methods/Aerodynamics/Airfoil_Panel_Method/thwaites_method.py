@@ -53,88 +53,68 @@ def thwaites_method(npanel,ncases,ncpts,NU,L,RE_L,X_I,VE_I, DVE_I,tol,THETA_0):
     Properties Used:
     N/A
     """ 
-    # Initialize vectors
-    X_T          = np.zeros((npanel,ncases,ncpts))
-    THETA_T      = np.zeros_like(X_T)
-    DELTA_STAR_T = np.zeros_like(X_T)
-    H_T          = np.zeros_like(X_T)
-    CF_T         = np.zeros_like(X_T)
-    RE_THETA_T   = np.zeros_like(X_T)
-    RE_X_T       = np.zeros_like(X_T)
-    DELTA_T      = np.zeros_like(X_T)  
-      
-    for case in range(ncases):
-        for cpt in range(ncpts):
-            
-            def dy_by_dx(index, X, Y):
-                return 0.45*nu*Ve_i[index]**5            
-            
-            l              = L[case,cpt]
-            theta_0        = THETA_0 
-            Re_L           = RE_L[case,cpt]
-            x_i            = X_I.data[:,case,cpt][X_I.mask[:,case,cpt] ==False]
-            Ve_i           = VE_I.data[:,case,cpt][VE_I.mask[:,case,cpt] ==False]
-            dVe_i          = DVE_I.data[:,case,cpt][DVE_I.mask[:,case,cpt] ==False]
-            nu             = NU[case,cpt]
-            n              = len(x_i)
-            dx_i           = np.diff(x_i)
-            theta2_Ve6     = np.zeros(n)
-            theta2_Ve6[0]  = (theta_0**2)*Ve_i[0]**6
-            
-            # determine (Theta**2)*(Ve**6)
-            for i in range(1,n):
-                theta2_Ve6[i] = RK4(i-1, dx_i, x_i, theta2_Ve6, dy_by_dx)
-            
-            # Compute momentum thickness
-            theta       = np.sqrt(theta2_Ve6/Ve_i**6)
-            
-            # find theta values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((theta[1:] - theta[:-1])/theta[:-1]) > tol)[0] 
-            if len(idx1)> 1:  
-                np.put(theta,idx1 + 1, theta[idx1])
-                
-            # Thwaites separation criteria 
-            lambda_val  = theta**2*dVe_i/nu 
-            
-            # Compute H 
-            H           = getH(lambda_val)
-            H[H<0]      = 1E-6   # H cannot be negative 
-            # find H values that do not converge and replace them with neighbor
-            idx1        = np.where(abs((H[1:] - H[:-1])/H[:-1]) > tol)[0]
-            if len(idx1)> 1: 
-                np.put(H,idx1 + 1, H[idx1]) 
-            
-            # Compute Reynolds numbers based on momentum thickness  
-            Re_theta    = Ve_i*theta/nu
-            
-            # Compute Reynolds numbers based on distance along airfoil
-            Re_x        = Ve_i*x_i/nu
-            
-            # Compute skin friction 
-            cf          = abs(getcf(lambda_val, Re_theta)) 
-            
-            # Compute displacement thickness
-            del_star    = H*theta   
-            
-            # Compute boundary layer thickness 
-            delta       = 5.2*x_i/np.sqrt(Re_x)
-            delta[0]    = 0   
-            
-            # Reynolds number at x=0 cannot be negative 
-            Re_x[0]     = 1E-5
-            
-            # Find where matrices are not masked 
-            indices = np.where(X_I.mask[:,case,cpt] == False)
-            
-            # Store results 
-            np.put(X_T[:,case,cpt],indices,x_i)
-            np.put(THETA_T[:,case,cpt],indices,theta)
-            np.put(DELTA_STAR_T[:,case,cpt],indices,del_star)
-            np.put(H_T[:,case,cpt],indices,H)
-            np.put(CF_T[:,case,cpt],indices ,cf)
-            np.put(RE_THETA_T[:,case,cpt],indices,Re_theta)
-            np.put(RE_X_T[:,case,cpt],indices,Re_x)
-            np.put(DELTA_T[:,case,cpt],indices,delta)
+    # move the points on the surface of each case and control point to the front of the arrays, in surface order  
+    x_i, n      = compact_surface(X_I)
+    Ve_i, _     = compact_surface(VE_I)
+    dVe_i, _    = compact_surface(DVE_I)
+    surface     = np.arange(npanel)[:,None,None] < n 
+    x_i         = np.where(surface,x_i,1.0)
+    Ve_i        = np.where(surface,Ve_i,1.0)
+    dVe_i       = np.where(surface,dVe_i,0.0)
+    nu          = NU 
+    
+    # determine (Theta**2)*(Ve**6) of all cases and control points together. The RK4 slope only depends on
+    # the start of each step, so the march is the cumulative sum of the RK4 increments 
+    dx_i           = np.diff(x_i,axis = 0)
+    slope          = 0.45*nu*Ve_i[:-1]**5
+    theta2_Ve6     = np.zeros_like(x_i)
+    theta2_Ve6[0]  = (THETA_0**2)*Ve_i[0]**6
+    theta2_Ve6[1:] = (dx_i/6)*(slope + 2*slope + 2*slope + slope)
+    theta2_Ve6     = np.cumsum(theta2_Ve6,axis = 0) 
+    
+    # Compute momentum thickness
+    theta       = np.sqrt(theta2_Ve6/Ve_i**6)
+    
+    # find theta values that do not converge and replace them with neighbor
+    theta       = replace_unconverged(theta,surface,tol)
+        
+    # Thwaites separation criteria 
+    lambda_val  = theta**2*dVe_i/nu 
+    
+    # Compute H 
+    H           = getH(lambda_val)
+    H[H<0]      = 1E-6   # H cannot be negative 
+    # find H values that do not converge and replace them with neighbor
+    H           = replace_unconverged(H,surface,tol)
+    
+    # Compute Reynolds numbers based on momentum thickness  
+    Re_theta    = Ve_i*theta/nu
+    
+    # Compute Reynolds numbers based on distance along airfoil
+    Re_x        = Ve_i*x_i/nu
+    
+    # Compute skin friction 
+    cf          = abs(getcf(lambda_val, Re_theta)) 
+    
+    # Compute displacement thickness
+    del_star    = H*theta   
+    
+    # Compute boundary layer thickness 
+    delta       = 5.2*x_i/np.sqrt(Re_x)
+    delta[0]    = 0   
+    
+    # Reynolds number at x=0 cannot be negative 
+    Re_x[0]     = 1E-5
+    
+    # Store results at the points on the surface 
+    X_T          = expand_surface(x_i,X_I)
+    THETA_T      = expand_surface(theta,X_I)
+    DELTA_STAR_T = expand_surface(del_star,X_I)
+    H_T          = expand_surface(H,X_I)
+    CF_T         = expand_surface(cf,X_I)
+    RE_THETA_T   = expand_surface(Re_theta,X_I)
+    RE_X_T       = expand_surface(Re_x,X_I)
+    DELTA_T      = expand_surface(delta,X_I)
     
     RESULTS = Data(
         X_T          = X_T,      
@@ -202,12 +182,84 @@ def getcf(lambda_val , Re_theta):
     return cf
 
 
-def RK4(ind, dx, x, Var, Slope):
-    m1 = Slope(ind,  x[ind],  Var[ind])
-    m2 = Slope(ind,  x[ind] + dx[ind]/2,  Var[ind] + m1*dx[ind]/2)
-    m3 = Slope(ind,  x[ind] + dx[ind]/2,  Var[ind] + m2*dx[ind]/2)
-    m4 = Slope(ind,  x[ind] + dx[ind],  Var[ind] + m3*dx[ind])
-    
-    change = (dx[ind]/6)*(m1 + 2*m2 + 2*m3 + m4)
-    return Var[ind] + change            
-            
+def compact_surface(VAR):
+    """ Moves the points of a masked variable that lie on the surface to the front of each case and 
+    control point, keeping their order
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    VAR         - masked variable of each panel, case and control point [multiple units]
+
+    Outputs:  
+    var         - variable with the points on the surface first         [multiple units]
+    n           - number of points on the surface                       [unitless]
+
+    Properties Used:
+    N/A
+    """       
+    mask  = np.ma.getmaskarray(VAR)
+    order = np.argsort(mask,axis = 0,kind = 'stable')
+    var   = np.take_along_axis(np.ma.getdata(VAR),order,axis = 0)
+    n     = np.sum(~mask,axis = 0)
+    return var, n
+
+def expand_surface(var,VAR):
+    """ Places the points of a variable computed by compact_surface back at their panels. Panels off the 
+    surface are zero
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    var         - variable with the points on the surface first         [multiple units]
+    VAR         - masked variable that was compacted                    [multiple units]
+
+    Outputs:  
+    VAR_new     - variable of each panel, case and control point        [multiple units]
+
+    Properties Used:
+    N/A
+    """       
+    mask            = np.ma.getmaskarray(VAR)
+    order           = np.argsort(mask,axis = 0,kind = 'stable')
+    n               = np.sum(~mask,axis = 0)
+    surface         = np.arange(len(mask))[:,None,None] < n 
+    VAR_new         = np.zeros(np.shape(mask))
+    np.put_along_axis(VAR_new,order,np.where(surface,var,0.0),axis = 0)
+    return VAR_new
+
+def replace_unconverged(var,surface,tol):
+    """ Replaces values that change by more than the tolerance between neighboring points on the surface 
+    with the value of the previous point, when more than one such point exists
+
+    Assumptions:
+    None
+
+    Source:
+    None
+
+    Inputs: 
+    var         - variable with the points on the surface first         [multiple units]
+    surface     - flags of the points on the surface                    [boolean]
+    tol         - boundary layer error correction tolerance             [unitless]
+
+    Outputs:  
+    var         - corrected variable                                    [multiple units]
+
+    Properties Used:
+    N/A
+    """       
+    with np.errstate(divide = 'ignore', invalid = 'ignore'):
+        unconverged = (abs((var[1:] - var[:-1])/var[:-1]) > tol) & surface[1:]
+    replace         = unconverged & (np.sum(unconverged,axis = 0) > 1)
+    var_new         = np.copy(var)
+    var_new[1:]     = np.where(replace,var[:-1],var[1:])
+    return var_new
@@ -67,10 +67,8 @@ def velocity_distribution(qg,x,y,xbar,ybar,st,ct,alpha_2d,npanel,ncases,ncpts):
     r_ratio              = rij_dot_rij_plus_1/rij/rij_plus_1
     r_ratio[r_ratio>1.0] = 1.0 # numerical noise     
     betaij               = np.real(anglesign*np.arccos(r_ratio))     
-    # betaij[aoas,res,diag_indices,diag_indices] = np.pi
-    for i in range(ncases):
-        for j in range(ncpts):
-            np.fill_diagonal(betaij[i,j,:,:], np.pi)   
+    diag_indices         = np.arange(npanel)
+    betaij[:,:,diag_indices,diag_indices] = np.pi
     
     # swap axes 
     sti_minus_j_2d  = np.swapaxes(np.swapaxes(sti_minus_j,0,2),1,3) 
@@ -8,7 +8,7 @@ from .train_AVL_surrogates      import train_AVL_surrogates
 from .create_avl_datastructures import translate_avl_wing, translate_avl_body , populate_wing_sections, populate_body_sections
 from .purge_files               import purge_files
 from .read_results              import read_results
-from .run_AVL_analysis          import run_AVL_analysis
+from .run_AVL_analysis          import run_AVL_analysis, run_AVL_batches
 from .translate_data            import translate_conditions_to_cases, translate_results_to_conditions
 from .write_geometry            import write_geometry
 from .write_mass_file           import write_mass_file
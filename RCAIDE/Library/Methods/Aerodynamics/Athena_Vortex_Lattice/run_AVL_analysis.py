@@ -7,9 +7,8 @@
 # ----------------------------------------------------------------------------------------------------------------------
 
 # RCAIDE imports
-from RCAIDE.Framework.Core                                                        import redirect
+from RCAIDE.Framework.Core                                                        import Data, redirect
 from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.read_results       import read_results
-from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.purge_files        import purge_files
 from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.write_geometry     import write_geometry
 from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.write_mass_file    import write_mass_file
 from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.write_run_cases    import write_run_cases
@@ -19,11 +18,11 @@ from RCAIDE.Library.Methods.Geometry.Planform.populate_control_sections
 from RCAIDE.Library.Components.Wings.Control_Surfaces                             import Aileron , Elevator , Slat , Flap , Rudder 
 
 # package imports 
-import sys
-import time
 import subprocess
+import tempfile
 import os
-from shutil import rmtree   
+from shutil import rmtree, copy2   
+from concurrent.futures import ThreadPoolExecutor
 
 # ----------------------------------------------------------------------------------------------------------------------
 # run_analysis
@@ -32,7 +31,8 @@ def run_AVL_analysis(aerodynamics,run_conditions):
     """Process vehicle to setup avl geometry, condititons, and configurations.
 
     Assumptions:
-    None
+    The batch is written and run in its own scratch directory inside the run folder, so
+    analyses sharing a run folder do not overwrite each other's files
 
     Source:
     N/A
@@ -57,7 +57,71 @@ def run_AVL_analysis(aerodynamics,run_conditions):
       deck_file
       cases
     """           
+    run_AVL_batches(aerodynamics,[run_conditions])
+        
+    return 
+
+def run_AVL_batches(aerodynamics,run_conditions_list):
+    """Runs one AVL batch for each set of conditions. The input files of all batches are written 
+    first, each batch in its own scratch directory, then up to aerodynamics.settings.number_of_workers
+    AVL processes run at once and the results of each batch are read and translated to its conditions. 
+
+    Assumptions:
+    The batches are numbered in the order of the conditions, as when they are run one at a time
+
+    Source:
+    N/A
+
+    Inputs:
+    aerodynamics          <RCAIDE data type> AVL analysis
+    run_conditions_list   <list>             aerodynamic conditions of each batch
+
+    Outputs:
+    None
+
+    Properties Used:
+    aerodynamics.settings.number_of_workers
+    """    
+    settings = aerodynamics.settings
+    workers  = settings.number_of_workers if 'number_of_workers' in settings.keys() else 1
+    batches  = [write_AVL_batch(aerodynamics,run_conditions) for run_conditions in run_conditions_list]
     
+    if settings.new_regression_results:
+        if workers > 1 and len(batches) > 1:
+            with ThreadPoolExecutor(max_workers = min(workers,len(batches))) as executor:
+                list(executor.map(lambda batch: call_avl(aerodynamics,batch), batches))
+        else:
+            for batch in batches:
+                call_avl(aerodynamics,batch)
+            
+    for batch, run_conditions in zip(batches,run_conditions_list):
+        read_AVL_batch(aerodynamics,batch,run_conditions) 
+        
+    if not settings.keep_files:
+        rmtree(os.path.abspath(settings.filenames.run_folder))
+        
+    return 
+
+def write_AVL_batch(aerodynamics,run_conditions):
+    """Translates the conditions of a batch to AVL cases and writes the geometry, mass, run case
+    and input deck files of the batch in a new scratch directory inside the run folder.
+
+    Assumptions:
+    None
+
+    Source:
+    N/A
+
+    Inputs:
+    aerodynamics     <RCAIDE data type> AVL analysis
+    run_conditions   <RCAIDE data type> aerodynamic conditions of the batch
+
+    Outputs:
+    batch            <RCAIDE data type> cases, input files and scratch directory of the batch
+
+    Properties Used:
+    N/A
+    """      
     # unpack
     trim_aircraft                    = aerodynamics.settings.trim_aircraft
     run_folder                       = os.path.abspath(aerodynamics.settings.filenames.run_folder)
@@ -70,7 +134,6 @@ def run_AVL_analysis(aerodynamics,run_conditions):
     dynamic_results_template_2       = aerodynamics.settings.filenames.dynamic_output_template_2    # 'system_matrix_{}.dat'
     batch_template                   = aerodynamics.settings.filenames.batch_template
     deck_template                    = aerodynamics.settings.filenames.deck_template 
-    print_output                     = aerodynamics.settings.print_output 
 
     # rename defaul avl aircraft tag
     aerodynamics.tag                         = 'avl_analysis_of_{}'.format(aerodynamics.vehicle.tag) 
@@ -125,78 +188,109 @@ def run_AVL_analysis(aerodynamics,run_conditions):
         case.eigen_result_filename_1    = dynamic_results_template_1.format(case.tag)     # 'eigen_mode_{}.dat'
         case.eigen_result_filename_2    = dynamic_results_template_2.format(case.tag)     # 'system_matrix_{}.dat'
     
-    # write the input files
-    with redirect.folder(run_folder,force=False):
+    # write the input files in the scratch directory of the batch
+    os.makedirs(run_folder,exist_ok=True)
+    batch            = Data()
+    batch.index      = batch_index
+    batch.cases      = cases
+    batch.batch_file = aerodynamics.current_status.batch_file
+    batch.deck_file  = aerodynamics.current_status.deck_file
+    batch.directory  = tempfile.mkdtemp(prefix='batch_{0:04d}_'.format(batch_index),dir=run_folder)
+    with redirect.folder(batch.directory,force=False):
         write_geometry(aerodynamics,run_script_path)
         write_mass_file(aerodynamics,run_conditions)
         write_run_cases(aerodynamics,trim_aircraft)
         write_input_deck(aerodynamics, trim_aircraft,control_surfaces)
+        
+    return batch
 
-        # RUN AVL! 
-        exit_status = call_avl(aerodynamics,print_output)
+def read_AVL_batch(aerodynamics,batch,run_conditions):
+    """Reads the results of a batch, translates them to the conditions of the batch and removes the
+    scratch directory of the batch. Without new regression results, the stored results in the run
+    folder are read instead of those of an AVL run.
+
+    Assumptions:
+    When the files of an AVL run are kept, the files of the batch are copied to the run folder. The
+    files that are not named after the batch or its cases (geometry, mass, log and error files) are
+    prefixed with the batch index
+
+    Source:
+    N/A
+
+    Inputs:
+    aerodynamics     <RCAIDE data type> AVL analysis
+    batch            <RCAIDE data type> output of write_AVL_batch
+    run_conditions   <RCAIDE data type> aerodynamic conditions of the batch
+
+    Outputs:
+    None
+
+    Properties Used:
+    N/A
+    """      
+    run_folder = os.path.abspath(aerodynamics.settings.filenames.run_folder)
+    if aerodynamics.settings.new_regression_results:
+        results_folder = batch.directory
+    else:
+        results_folder = run_folder
+        
+    aerodynamics.current_status.cases = batch.cases
+    with redirect.folder(results_folder,force=False):
         results_avl = read_results(aerodynamics)
         
     # translate results
-    translate_results_to_conditions(cases,run_conditions,results_avl) 
+    translate_results_to_conditions(batch.cases,run_conditions,results_avl) 
 
-    if not aerodynamics.settings.keep_files:
-        rmtree( run_folder )
+    if aerodynamics.settings.keep_files and aerodynamics.settings.new_regression_results:
+        batch_files = [batch.batch_file,batch.deck_file]
+        for case in batch.cases:
+            batch_files += [case.aero_result_filename_1,case.aero_result_filename_2,case.aero_result_filename_3,
+                            case.aero_result_filename_4,case.eigen_result_filename_1,case.eigen_result_filename_2]
+        for filename in os.listdir(batch.directory):
+            if filename in batch_files:
+                kept_filename = filename
+            else:
+                kept_filename = 'batch_{0:04d}_'.format(batch.index) + filename
+            copy2(os.path.join(batch.directory,filename),os.path.join(run_folder,kept_filename))
+    rmtree(batch.directory)
         
     return 
  
-def call_avl(avl_object,print_output):
-    """ This function calls the AVL executable and executes analyses
+def call_avl(avl_object,batch):
+    """ This function calls the AVL executable and executes analyses. The executable runs in the 
+    scratch directory of the batch, reading the input deck of the batch and writing its output
+    to the log and error files of the batch.
+    
     Assumptions:
-        None
+        The AVL executable is a path, or a list of a program and its arguments. A nonzero exit status
+        raises an error with the end of the error file of the batch
         
     Source:
         None
     Inputs:
         avl_object
+        batch
     Outputs:
         exit_status
     Properties Used:
         N/A
     """
-    print_output =  True 
-    new_regression_results = avl_object.settings.new_regression_results
-    if new_regression_results:
-        log_file = avl_object.settings.filenames.log_filename
-        err_file = avl_object.settings.filenames.err_filename
-        if isinstance(log_file,str):
-            purge_files(log_file)
-        if isinstance(err_file,str):
-            purge_files(err_file)
-        avl_call = avl_object.settings.filenames.avl_bin_name
-        geometry = avl_object.settings.filenames.features
-        in_deck  = avl_object.current_status.deck_file  
-    
-        with redirect.output(log_file,err_file):
+    avl_call = avl_object.settings.filenames.avl_bin_name
+    if isinstance(avl_call,str):
+        avl_call = [avl_call]
+    geometry = avl_object.settings.filenames.features
+    log_file = os.path.join(batch.directory,avl_object.settings.filenames.log_filename)
+    err_file = os.path.join(batch.directory,avl_object.settings.filenames.err_filename)
+    in_deck  = os.path.join(batch.directory,batch.deck_file)
     
-            ctime = time.ctime() # Current date and time stamp
+    with open(in_deck,'r') as commands, open(log_file,'w') as log, open(err_file,'w') as err: 
+        # Run AVL
+        avl_run     = subprocess.run(list(avl_call) + [geometry],stdin=commands,stdout=log,stderr=err,cwd=batch.directory)
+        exit_status = avl_run.returncode
     
-            with open(in_deck,'r') as commands: 
-                
-                # Initialize suppression of console window output
-                if print_output == False:
-                    devnull = open(os.devnull,'w')
-                    sys.stdout = devnull       
-                    
-                # Run AVL
-                avl_run = subprocess.Popen([avl_call,geometry],stdout=sys.stdout,stderr=sys.stderr,stdin=subprocess.PIPE)
-                for line in commands:
-                    avl_run.stdin.write(line.encode('utf-8'))
-                    avl_run.stdin.flush()
-                  
-                # Terminate suppression of console window output  
-                if print_output == False:
-                    sys.stdout = sys.__stdout__                    
-                    
-            avl_run.wait()
-    
-            exit_status = avl_run.returncode
-            ctime = time.ctime()
-    else: 
-        exit_status = 0        
+    if exit_status != 0:
+        with open(err_file,'r') as err:
+            err_tail = ''.join(err.readlines()[-20:])
+        raise RuntimeError('AVL exited with status %i in %s:\n%s' % (exit_status,batch.directory,err_tail))
+        
     return exit_status
-
@@ -7,7 +7,7 @@
 # RCAIDE imports
 import RCAIDE 
 from RCAIDE.Framework.Mission.Common                                             import Results  
-from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.run_AVL_analysis  import run_AVL_analysis  
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.run_AVL_analysis  import run_AVL_batches  
  
 # Package imports 
 import os
@@ -21,7 +21,8 @@ def train_AVL_surrogates(aerodynamics):
     """Call methods to run VLM for sample point evaluation. 
     
     Assumptions:
-        None
+        The batches of all Mach numbers are written first and run together, up to
+        aerodynamics.settings.number_of_workers AVL processes at once
         
     Source:
         None
@@ -60,6 +61,7 @@ def train_AVL_surrogates(aerodynamics):
         if aerodynamics.settings.new_regression_results:
             rmtree(run_folder)
 
+    run_conditions_list = []
     for i,_ in enumerate(Mach):
         # Set training conditions
         run_conditions = Results()
@@ -78,9 +80,12 @@ def train_AVL_surrogates(aerodynamics):
             run_conditions.aerodynamics.coefficients.lift.total= np.array([lift_coefficient]).T  
         run_conditions.static_stability.coefficients.pitch = np.ones_like(run_conditions.aerodynamics.angles.alpha)*pitch_rate_coefficient 
 
-        # Run Analysis at AoA[i] and Mach[i]
-        run_AVL_analysis(aerodynamics,run_conditions)
+        run_conditions_list.append(run_conditions)
+
+    # Run Analysis at AoA and each Mach
+    run_AVL_batches(aerodynamics,run_conditions_list)
  
+    for i,run_conditions in enumerate(run_conditions_list):
         CL[:,i]       = run_conditions.aerodynamics.coefficients.lift.total[:,0]
         CD[:,i]       = run_conditions.aerodynamics.coefficients.drag.induced.total[:,0]      
         e [:,i]       = run_conditions.aerodynamics.coefficients.drag.induced.efficiency_factor[:,0]   
@@ -11,11 +11,18 @@
 
 # package imports 
 import numpy as np 
+import hashlib
+from collections  import OrderedDict
+from scipy.linalg import lu_factor, lu_solve
 from RCAIDE.Framework.Core import Data
 from .compute_wing_induced_velocity      import compute_wing_induced_velocity
 from .generate_vortex_distribution       import generate_vortex_distribution 
 from .compute_RHS_matrix                 import compute_RHS_matrix 
 
+# influence matrix factorizations, keyed by vortex distribution and mach number, least recently used first
+influence_matrix_cache            = OrderedDict()
+influence_matrix_cache_statistics = Data(hits = 0, misses = 0, memory = 0)
+
 # ----------------------------------------------------------------------
 #  Vortex Lattice
 # ----------------------------------------------------------------------
@@ -92,6 +99,8 @@ def VLM(conditions,settings,geometry):
     settings.discretize_control_surfaces       [Boolean], set to True to generate control surface panels
     settings.use_VORLAX_matrix_calculation     [boolean]
     settings.floating_point_precision          [float16/32/64]
+    settings.cache_influence_matrices          [boolean], set to False to factorize the influence matrices on every call
+    settings.influence_matrix_cache_memory     [bytes], memory limit of the influence matrix cache
        
     conditions.aerodynamics.angles.alpha    [radians]
     conditions.aerodynamics.angles.beta   [radians]
@@ -188,6 +197,7 @@ def VLM(conditions,settings,geometry):
     
     if not VD.is_postprocessed:
         raise ValueError('postprocess_VD has not been called since the panels have been modified')
+    VD_hash = hash_vortex_distribution(VD)
     
     # Unpack vortex distribution
     n_cp         = VD.n_cp 
@@ -243,30 +253,21 @@ def VLM(conditions,settings,geometry):
     RHS     = rhs.RHS*1
     ONSET   = rhs.ONSET*1
 
-    # Build induced velocity matrix, C_mn
-    # This is not affected by AoA, so we can use unique mach numbers only
+    # Build induced velocity matrix, C_mn, and the Aerodynamic Influence Coefficient Matrix
+    # These are not affected by AoA, so we can use unique mach numbers only
     m_unique, inv = np.unique(mach,return_inverse=True)
-    m_unique      = np.atleast_2d(m_unique).T
-    C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_unique,compute_EW=True)
+    influence     = get_influence_matrices(VD,VD_hash,m_unique,delta,phi,settings)
+    s             = influence[0].s
+    RFLAG_small   = np.array([entry.RFLAG for entry in influence])
+    EW_small      = np.array([entry.EW    for entry in influence])
     
-    C_mn  = C_mn_small[inv,:,:,:]
     RFLAG = RFLAG_small[inv,:]
-    EW    = EW_small[inv,:,:]
 
     # Turn off sonic vortices when Mach>1
     RHS = RHS*RFLAG
-    
-    # Build Aerodynamic Influence Coefficient Matrix
-    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
-    if not use_VORLAX_induced_velocity:
-        A =   np.multiply(C_mn[:,:,:,0],np.atleast_3d(np.sin(delta)*np.cos(phi))) \
-            + np.multiply(C_mn[:,:,:,1],np.atleast_3d(np.cos(delta)*np.sin(phi))) \
-            - np.multiply(C_mn[:,:,:,2],np.atleast_3d(np.cos(phi)*np.cos(delta)))   # validated from book eqn 7.42 
-    else:
-        A = EW
 
     # Compute vortex strength
-    GAMMA  = np.linalg.solve(A,RHS)
+    GAMMA  = solve_vortex_strengths(influence,RHS,inv)
 
     # ---------------------------------------------------------------------------------------
     # STEP 11: Compute Pressure Coefficient
@@ -403,7 +404,7 @@ def VLM(conditions,settings,geometry):
     # ONLY PERFORMED FOR COSINE CHORDWISE SPACING (LAX = 0).    
     # ** TO DO ** Add cosine spacing (earlier in VLM) to properly capture the magnitude of these earlier.
     # Right now, this computation still happens with linear spacing, though its effects are underestimated.
-    CLE = compute_rotation_effects(VD, settings, EW, GAMMA, len_mach, X, CHORD, XLE, XBAR, 
+    CLE = compute_rotation_effects(VD, settings, EW_small[inv], GAMMA, len_mach, X, CHORD, XLE, XBAR, 
                                    rhs, COSINP, SINALF,COSCOS, PITCH, ROLL, YAW, STB, RNMAX)    
     
     # Leading edge suction multiplier. See documentation. This is a negative integer if used
@@ -605,3 +606,182 @@ def strip_cumsum(arr, chord_breaks, strip_lengths):
     offsets[:,0]  = 0
     offsets = np.repeat(offsets, strip_lengths, axis=1)
     return cumsum - offsets
+
+# ----------------------------------------------------------------------
+#  Influence matrices
+# ----------------------------------------------------------------------
+def get_influence_matrices(VD, VD_hash, m_unique, delta, phi, settings):
+    """ Returns the factorized aerodynamic influence coefficient matrix and the
+    induced velocity terms of each unique mach number. The influence matrices
+    only depend on the panels and the mach number, so their LU factorizations
+    are kept in a least recently used cache and later calls with the same
+    vortex distribution (e.g. surrogate training sweeps of the flight
+    conditions) only rebuild the right hand side and back-substitute.
+    
+    Assumptions:
+    None
+    
+    Source:
+    N/A
+    
+    Inputs:
+    VD                                      - vortex distribution                    [Unitless]
+    VD_hash                                 - hash of the vortex distribution        [Unitless]
+    m_unique                                - unique mach numbers                    [Unitless]
+    delta                                   - mean camber surface angles             [radians]
+    phi                                     - dihedral angles                        [radians]
+    settings.use_VORLAX_matrix_calculation  - use the VORLAX influence matrix        [Boolean]
+    settings.cache_influence_matrices       - keep the factorizations in the cache   [Boolean]
+    settings.influence_matrix_cache_memory  - memory limit of the cache              [bytes]
+    
+    Outputs:
+    influence                               - one entry per unique mach number       [Unitless]
+      .LU                                   - LU factorization of the AIC matrix     [Unitless]
+      .EW                                   - VORLAX induced velocity matrix         [Unitless]
+      .RFLAG                                - sonic vortex flags                     [Unitless]
+      .s                                    - panel semi-spans                       [m]
+    
+    Properties Used:
+    N/A
+    """
+    use_VORLAX_induced_velocity = settings.use_VORLAX_matrix_calculation
+    use_cache    = settings.cache_influence_matrices if ('cache_influence_matrices' in settings.keys()) else True
+    cache_memory = settings.influence_matrix_cache_memory if ('influence_matrix_cache_memory' in settings.keys()) else 2.5E8
+    
+    keys      = [(VD_hash,float(m),bool(use_VORLAX_induced_velocity)) for m in np.ravel(m_unique)]
+    influence = [None]*len(keys)
+    missing   = []
+    for i,key in enumerate(keys):
+        if use_cache and key in influence_matrix_cache:
+            influence_matrix_cache.move_to_end(key)
+            influence[i] = influence_matrix_cache[key]
+            influence_matrix_cache_statistics.hits += 1
+        else:
+            missing.append(i)
+            influence_matrix_cache_statistics.misses += 1
+    
+    if len(missing) > 0:
+        # Build induced velocity matrix, C_mn, for the missing mach numbers
+        m_missing = np.atleast_2d(np.ravel(m_unique)[missing]).T
+        C_mn_small, s, RFLAG_small, EW_small = compute_wing_induced_velocity(VD,m_missing,compute_EW=True)
+        
+        # Build Aerodynamic Influence Coefficient Matrix
+        if not use_VORLAX_induced_velocity:
+            A_small =   np.multiply(C_mn_small[:,:,:,0],np.atleast_3d(np.sin(delta[:1])*np.cos(phi[:1]))) \
+                      + np.multiply(C_mn_small[:,:,:,1],np.atleast_3d(np.cos(delta[:1])*np.sin(phi[:1]))) \
+                      - np.multiply(C_mn_small[:,:,:,2],np.atleast_3d(np.cos(phi[:1])*np.cos(delta[:1])))   # validated from book eqn 7.42 
+        else:
+            A_small = EW_small
+        
+        for j,i in enumerate(missing):
+            entry        = Data()
+            entry.LU     = lu_factor(A_small[j],check_finite=False)
+            entry.EW     = EW_small[j]
+            entry.RFLAG  = RFLAG_small[j]
+            entry.s      = s
+            influence[i] = entry
+            
+            if use_cache and keys[i] not in influence_matrix_cache:
+                entry.memory = entry.LU[0].nbytes + entry.LU[1].nbytes + entry.EW.nbytes + entry.RFLAG.nbytes + entry.s.nbytes
+                influence_matrix_cache[keys[i]]           = entry
+                influence_matrix_cache_statistics.memory += entry.memory
+    
+    # evict the least recently used factorizations
+    while influence_matrix_cache_statistics.memory > cache_memory and len(influence_matrix_cache) > 0:
+        _, evicted = influence_matrix_cache.popitem(last=False)
+        influence_matrix_cache_statistics.memory -= evicted.memory
+    
+    return influence
+
+def clear_influence_matrix_cache():
+    """ Removes all influence matrix factorizations from the cache
+    
+    Assumptions:
+    None
+    
+    Source:
+    N/A
+    
+    Inputs:
+    None
+    
+    Outputs:
+    None
+    
+    Properties Used:
+    N/A
+    """
+    influence_matrix_cache.clear()
+    influence_matrix_cache_statistics.hits   = 0
+    influence_matrix_cache_statistics.misses = 0
+    influence_matrix_cache_statistics.memory = 0
+    
+    return
+
+def hash_vortex_distribution(VD):
+    """ Computes a hash of the panels of a vortex distribution, equal vortex
+    distributions have equal influence matrices.
+    
+    Assumptions:
+    None
+    
+    Source:
+    N/A
+    
+    Inputs:
+    VD       - vortex distribution       [Unitless]
+    
+    Outputs:
+    VD_hash  - hash of the panels         [string]
+    
+    Properties Used:
+    N/A
+    """
+    VD_hash = hashlib.blake2b(digest_size=20)
+    for key in sorted(VD.keys()):
+        value = VD[key]
+        if isinstance(value,np.ndarray):
+            VD_hash.update(key.encode())
+            VD_hash.update(str((value.dtype.str,value.shape)).encode())
+            VD_hash.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value,(int,float,bool,np.number)):
+            VD_hash.update(key.encode())
+            VD_hash.update(repr(value).encode())
+    
+    return VD_hash.hexdigest()
+
+# ----------------------------------------------------------------------
+#  Vortex strengths
+# ----------------------------------------------------------------------
+def solve_vortex_strengths(influence, RHS, inv):
+    """ Solves for the vortex strengths of all control points. The influence
+    matrix only depends on the mach number, so control points with the same
+    mach number are solved together with a single factorization of their
+    influence matrix.
+    
+    Assumptions:
+    None
+    
+    Source:
+    N/A
+    
+    Inputs:
+    influence - factorized influence matrix of each unique mach number [Unitless]
+    RHS       - boundary conditions of each control point              [Unitless]
+    inv       - unique mach number index of each control point         [Unitless]
+    
+    Outputs:
+    GAMMA     - vortex strengths of each control point                 [Unitless]
+    
+    Properties Used:
+    N/A
+    """
+    GAMMA = None
+    for i in range(len(influence)):
+        rows          = np.where(inv == i)[0]
+        gamma         = lu_solve(influence[i].LU,RHS[rows].T,check_finite=False).T
+        if GAMMA is None:
+            GAMMA     = np.zeros(np.shape(RHS),dtype=gamma.dtype)
+        GAMMA[rows]   = gamma
+    
+    return GAMMA
@@ -0,0 +1,156 @@
+# RCAIDE/Library/Methods/Aerodynamics/Vortex_Lattice_Method/VLM_training_cache.py
+#
+# Created:  Oct 2026, RCAIDE Team
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import  Data, update_hash
+
+# package imports
+import numpy  as np
+import hashlib
+import os
+
+# settings that do not change the training data
+cache_independent_settings = ['number_of_training_workers','cache_influence_matrices','influence_matrix_cache_memory','cache_vortex_distributions',
+                              'vortex_distribution_cache_size','surrogate_cache_directory','vortex_distribution']
+
+# analysis attributes set by the training of the control surface surrogates
+training_flags = ['aileron_flag','elevator_flag','rudder_flag','flap_flag','slat_flag']
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  VLM training cache
+# ----------------------------------------------------------------------------------------------------------------------
+def hash_VLM_training_inputs(aerodynamics):
+    """Computes the key of the surrogate training data of a VLM analysis. The key is a hash of the
+    geometry seen by the VLM, the training grid and the settings, so any change of these inputs
+    results in a new key.
+
+    Assumptions:
+        The training data only depends on the wings, fuselages, booms, reference area and center of
+        gravity of the vehicle, the networks are included when the propeller wake is modeled
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                       [unitless]
+
+    Returns:
+        key                : hash of the training inputs        [string]
+    """
+    vehicle  = aerodynamics.vehicle
+    settings = aerodynamics.settings
+    training = aerodynamics.training
+
+    geometry                   = Data()
+    geometry.wings             = vehicle.wings
+    geometry.fuselages         = vehicle.fuselages
+    geometry.booms             = vehicle.booms
+    geometry.reference_area    = vehicle.reference_area
+    geometry.center_of_gravity = vehicle.mass_properties.center_of_gravity
+    if settings.propeller_wake_model:
+        geometry.networks      = vehicle.networks
+
+    training_inputs = Data()
+    for key,value in training.items():
+        if key not in ['subsonic','supersonic','transonic']:
+            training_inputs[key] = value
+
+    analysis_settings = Data()
+    for key,value in settings.items():
+        if key not in cache_independent_settings:
+            analysis_settings[key] = value
+
+    key_hash = hashlib.blake2b(digest_size=20)
+    key_hash.update(RCAIDE.__version__.encode())
+    for data in [geometry,training_inputs,analysis_settings]:
+        update_hash(key_hash,data,skip_keys=('vortex_distribution',))
+
+    return key_hash.hexdigest()
+
+def load_VLM_training_data(aerodynamics, key):
+    """Loads the surrogate training data of a VLM analysis from the surrogate cache directory.
+
+    Assumptions:
+        A missing or unreadable file is treated as a cache miss
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                             [unitless]
+        key                : hash of the training inputs              [string]
+
+    Returns:
+        loaded             : True if the training data was found      [boolean]
+    """
+    filename = training_data_filename(aerodynamics, key)
+    if not os.path.exists(filename + '.pkl'):
+        return False
+    try:
+        stored = RCAIDE.load(filename, pickle_format = True)
+    except Exception:
+        return False
+
+    training            = aerodynamics.training
+    training.subsonic   = stored.training.subsonic
+    training.supersonic = stored.training.supersonic
+    training.transonic  = stored.training.transonic
+    aerodynamics.reference_values = stored.reference_values
+    for flag in stored.flags.keys():
+        aerodynamics[flag] = stored.flags[flag]
+    aerodynamics.vehicle.vortex_distribution = stored.vortex_distribution
+
+    # the training leaves the control surfaces undeflected
+    for wing in aerodynamics.vehicle.wings:
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection = 0.0
+
+    return True
+
+def save_VLM_training_data(aerodynamics, key):
+    """Stores the surrogate training data of a VLM analysis in the surrogate cache directory. The file
+    is written under a temporary name and renamed, so concurrent runs never read a partial file.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                        [unitless]
+        key                : hash of the training inputs         [string]
+
+    Returns:
+        None
+    """
+    training                   = aerodynamics.training
+    stored                     = Data()
+    stored.training            = Data()
+    stored.training.subsonic   = training.subsonic
+    stored.training.supersonic = training.supersonic
+    stored.training.transonic  = training.transonic
+    stored.reference_values    = aerodynamics.reference_values
+    stored.flags               = Data()
+    for flag in training_flags:
+        if flag in aerodynamics.keys():
+            stored.flags[flag] = aerodynamics[flag]
+    stored.vortex_distribution = aerodynamics.vehicle.vortex_distribution
+
+    filename      = training_data_filename(aerodynamics, key)
+    temporary     = filename + '_' + str(os.getpid())
+    os.makedirs(os.path.dirname(filename), exist_ok = True)
+    RCAIDE.save(stored, temporary, pickle_format = True)
+    os.replace(temporary + '.pkl', filename + '.pkl')
+
+    return
+
+def training_data_filename(aerodynamics, key):
+    """ :meta private:"""
+    directory = os.path.abspath(os.path.expanduser(aerodynamics.settings.surrogate_cache_directory))
+    return os.path.join(directory, 'VLM_training_' + key)
@@ -13,9 +13,10 @@ from .compute_wing_induced_velocity           import compute_wing_induced_veloci
 from .deflect_control_surface                 import deflect_control_surfaces
 from .extract_wing_collocation_points         import extract_wing_collocation_points
 from .generate_VD_helpers                     import postprocess_VD, compute_panel_area, compute_unit_normal 
-from .generate_vortex_distribution            import generate_vortex_distribution
+from .generate_vortex_distribution            import generate_vortex_distribution, clear_vortex_distribution_cache
 from .make_VLM_wings                          import make_VLM_wings
 from .train_VLM_surrogates                    import train_VLM_surrogates
-from .VLM                                     import VLM
+from .VLM                                     import VLM, clear_influence_matrix_cache
+from .VLM_training_cache                      import hash_VLM_training_inputs, load_VLM_training_data, save_VLM_training_data
 from .evaluate_VLM                            import *  
 
@@ -8,6 +8,7 @@
 import RCAIDE 
 from RCAIDE.Framework.Core                                       import Units, Data, orientation_product 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method   import VLM
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.build_VLM_surrogates import coefficient_tags, derivative_variables
 from RCAIDE.Library.Methods.Utilities                            import Cubic_Spline_Blender  
 from RCAIDE.Library.Mission.Common.Update  import orientations
 from RCAIDE.Library.Mission.Common.Unpack_Unknowns import orientation
@@ -17,6 +18,16 @@ import numpy   as np
 from copy      import  deepcopy 
 import matplotlib.pyplot as plt
 
+# stability derivatives reported by evaluate_surrogate
+stability_derivative_tags = ['Clift_alpha','CX_alpha','CY_alpha','CZ_alpha','CL_alpha','CM_alpha','CN_alpha',
+                             'Clift_beta','CX_beta','CY_beta','CZ_beta','CL_beta','CM_beta','CN_beta',
+                             'Clift_p','Clift_q','Clift_r','CX_u','CX_v','CX_w','CY_u',
+                             'CY_v','CY_w','CZ_u','CZ_v','CZ_w','CL_u','CL_v',
+                             'CL_w','CM_u','CM_v','CM_w','CN_u','CN_v','CN_w',
+                             'CX_p','CX_q','CX_r','CY_p','CY_q','CY_r','CZ_p',
+                             'CZ_q','CZ_r','CL_p','CL_q','CL_r','CM_p','CM_q',
+                             'CM_r','CN_p','CN_q','CN_r']
+
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -86,9 +97,9 @@ def evaluate_surrogate(state,settings,vehicle):
 
     # Spline for Subsonic-to-Transonic-to-Supersonic Regimes
     sub_trans_spline = Cubic_Spline_Blender(hsub_min,hsub_max)
-    h_sub            = lambda M:sub_trans_spline.compute(M)          
+    h_sub            = sub_trans_spline.compute(Mach)
     sup_trans_spline = Cubic_Spline_Blender(hsup_max, hsup_min) 
-    h_sup            = lambda M:sup_trans_spline.compute(M)
+    h_sup            = sup_trans_spline.compute(Mach)
     
     u           = np.atleast_2d(conditions.freestream.u)
     v           = np.atleast_2d(conditions.freestream.v)
@@ -110,10 +121,7 @@ def evaluate_surrogate(state,settings,vehicle):
     pts_r       = np.hstack((r,Mach))
     
     # Alpha 
-    results_alpha = compute_coefficients(sub_sur.Clift_alpha,  sub_sur.Cdrag_alpha,  sub_sur.CX_alpha,  sub_sur.CY_alpha,  sub_sur.CZ_alpha,  sub_sur.CL_alpha,  sub_sur.CM_alpha,   sub_sur.CN_alpha,
-                                         trans_sur.Clift_alpha,trans_sur.Cdrag_alpha,trans_sur.CX_alpha,trans_sur.CY_alpha,trans_sur.CZ_alpha,trans_sur.CL_alpha,trans_sur.CM_alpha, trans_sur.CN_alpha,
-                                         sup_sur.Clift_alpha,  sup_sur.Cdrag_alpha,  sup_sur.CX_alpha,  sup_sur.CY_alpha,  sup_sur.CZ_alpha,  sup_sur.CL_alpha,  sup_sur.CM_alpha,   sup_sur.CN_alpha,
-                                         h_sub,h_sup,Mach, pts_alpha)        
+    results_alpha = compute_coefficients(sub_sur.fused.alpha,trans_sur.fused.alpha,sup_sur.fused.alpha,h_sub,h_sup,pts_alpha)        
 
     Clift_alpha             = results_alpha.Clift   
     Cdrag_alpha             = results_alpha.Cdrag   
@@ -133,10 +141,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_alpha[AoA==0.0]      = 0  
     
     # Beta 
-    results_beta  = compute_coefficients(sub_sur.Clift_beta,  sub_sur.Cdrag_beta,  sub_sur.CX_beta,  sub_sur.CY_beta,  sub_sur.CZ_beta,  sub_sur.CL_beta,  sub_sur.CM_beta,   sub_sur.CN_beta,
-                                         trans_sur.Clift_beta,trans_sur.Cdrag_beta,trans_sur.CX_beta,trans_sur.CY_beta,trans_sur.CZ_beta,trans_sur.CL_beta,trans_sur.CM_beta, trans_sur.CN_beta,
-                                         sup_sur.Clift_beta,  sup_sur.Cdrag_beta,  sup_sur.CX_beta,  sup_sur.CY_beta,  sup_sur.CZ_beta,  sup_sur.CL_beta,  sup_sur.CM_beta,   sup_sur.CN_beta,
-                                         h_sub,h_sup,Mach, pts_beta)
+    results_beta  = compute_coefficients(sub_sur.fused.beta,trans_sur.fused.beta,sup_sur.fused.beta,h_sub,h_sup,pts_beta)
      
     Clift_beta              = results_beta.Clift   
     Cdrag_beta              = results_beta.Cdrag 
@@ -156,10 +161,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_beta[Beta==0.0]      = 0
 
     # u  
-    results_u     =  compute_coefficients(sub_sur.Clift_u,  sub_sur.Cdrag_u,  sub_sur.CX_u,  sub_sur.CY_u,  sub_sur.CZ_u,  sub_sur.CL_u,  sub_sur.CM_u,   sub_sur.CN_u,
-                                          trans_sur.Clift_u,trans_sur.Cdrag_u,trans_sur.CX_u,trans_sur.CY_u,trans_sur.CZ_u,trans_sur.CL_u,trans_sur.CM_u, trans_sur.CN_u,
-                                          sup_sur.Clift_u,  sup_sur.Cdrag_u,  sup_sur.CX_u,  sup_sur.CY_u,  sup_sur.CZ_u,  sup_sur.CL_u,  sup_sur.CM_u,   sup_sur.CN_u,
-                                          h_sub,h_sup,Mach, pts_u)
+    results_u     =  compute_coefficients(sub_sur.fused.u,trans_sur.fused.u,sup_sur.fused.u,h_sub,h_sup,pts_u)
                   
     Clift_u           = results_u.Clift   
     Cdrag_u           = results_u.Cdrag   
@@ -179,10 +181,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_u[u==0.0]      = 0  
 
     # v  
-    results_v     =  compute_coefficients(sub_sur.Clift_v,  sub_sur.Cdrag_v,  sub_sur.CX_v,  sub_sur.CY_v,  sub_sur.CZ_v,  sub_sur.CL_v,  sub_sur.CM_v,   sub_sur.CN_v,
-                                          trans_sur.Clift_v,trans_sur.Cdrag_v,trans_sur.CX_v,trans_sur.CY_v,trans_sur.CZ_v,trans_sur.CL_v,trans_sur.CM_v, trans_sur.CN_v,
-                                          sup_sur.Clift_v,  sup_sur.Cdrag_v,  sup_sur.CX_v,  sup_sur.CY_v,  sup_sur.CZ_v,  sup_sur.CL_v,  sup_sur.CM_v,   sup_sur.CN_v,
-                                          h_sub,h_sup,Mach, pts_v)
+    results_v     =  compute_coefficients(sub_sur.fused.v,trans_sur.fused.v,sup_sur.fused.v,h_sub,h_sup,pts_v)
      
     Clift_v           = results_v.Clift   
     Cdrag_v           = results_v.Cdrag   
@@ -202,10 +201,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_v[v==0.0]      = 0
 
     # w  
-    results_w    =  compute_coefficients(sub_sur.Clift_w,  sub_sur.Cdrag_w,  sub_sur.CX_w,  sub_sur.CY_w,  sub_sur.CZ_w,  sub_sur.CL_w,  sub_sur.CM_w,   sub_sur.CN_w,
-                                         trans_sur.Clift_w,trans_sur.Cdrag_w,trans_sur.CX_w,trans_sur.CY_w,trans_sur.CZ_w,trans_sur.CL_w,trans_sur.CM_w, trans_sur.CN_w,
-                                         sup_sur.Clift_w,  sup_sur.Cdrag_w,  sup_sur.CX_w,  sup_sur.CY_w,  sup_sur.CZ_w,  sup_sur.CL_w,  sup_sur.CM_w,   sup_sur.CN_w,
-                                         h_sub,h_sup,Mach, pts_w)
+    results_w    =  compute_coefficients(sub_sur.fused.w,trans_sur.fused.w,sup_sur.fused.w,h_sub,h_sup,pts_w)
      
     Clift_w           = results_w.Clift   
     Cdrag_w           = results_w.Cdrag   
@@ -225,10 +221,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_w[w==0.0]      = 0
                         
     # p  
-    results_p    =  compute_coefficients(sub_sur.Clift_p,  sub_sur.Cdrag_p,  sub_sur.CX_p,  sub_sur.CY_p,  sub_sur.CZ_p,  sub_sur.CL_p,  sub_sur.CM_p,   sub_sur.CN_p,
-                                         trans_sur.Clift_p,trans_sur.Cdrag_p,trans_sur.CX_p,trans_sur.CY_p,trans_sur.CZ_p,trans_sur.CL_p,trans_sur.CM_p, trans_sur.CN_p,
-                                         sup_sur.Clift_p,  sup_sur.Cdrag_p,  sup_sur.CX_p,  sup_sur.CY_p,  sup_sur.CZ_p,  sup_sur.CL_p,  sup_sur.CM_p,   sup_sur.CN_p,
-                                         h_sub,h_sup,Mach, pts_p)
+    results_p    =  compute_coefficients(sub_sur.fused.p,trans_sur.fused.p,sup_sur.fused.p,h_sub,h_sup,pts_p)
      
     Clift_p           = results_p.Clift   
     Cdrag_p           = results_p.Cdrag   
@@ -248,10 +241,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_p[p==0.0]      = 0 
      
     # q  
-    results_q    =  compute_coefficients(sub_sur.Clift_q,  sub_sur.Cdrag_q,  sub_sur.CX_q,  sub_sur.CY_q,  sub_sur.CZ_q,  sub_sur.CL_q,  sub_sur.CM_q,   sub_sur.CN_q,
-                                         trans_sur.Clift_q,trans_sur.Cdrag_q,trans_sur.CX_q,trans_sur.CY_q,trans_sur.CZ_q,trans_sur.CL_q,trans_sur.CM_q, trans_sur.CN_q,
-                                         sup_sur.Clift_q,  sup_sur.Cdrag_q,  sup_sur.CX_q,  sup_sur.CY_q,  sup_sur.CZ_q,  sup_sur.CL_q,  sup_sur.CM_q,   sup_sur.CN_q,
-                                         h_sub,h_sup,Mach, pts_q)
+    results_q    =  compute_coefficients(sub_sur.fused.q,trans_sur.fused.q,sup_sur.fused.q,h_sub,h_sup,pts_q)
      
     Clift_q           = results_q.Clift   
     Cdrag_q           = results_q.Cdrag   
@@ -271,10 +261,7 @@ def evaluate_surrogate(state,settings,vehicle):
     CN_q[q==0.0]      = 0
     
     # r  
-    results_r    =  compute_coefficients(sub_sur.Clift_r,  sub_sur.Cdrag_r,  sub_sur.CX_r,  sub_sur.CY_r,  sub_sur.CZ_r,  sub_sur.CL_r,  sub_sur.CM_r,   sub_sur.CN_r,
-                                         trans_sur.Clift_r,trans_sur.Cdrag_r,trans_sur.CX_r,trans_sur.CY_r,trans_sur.CZ_r,trans_sur.CL_r,trans_sur.CM_r, trans_sur.CN_r,
-                                         sup_sur.Clift_r,  sup_sur.Cdrag_r,  sup_sur.CX_r,  sup_sur.CY_r,  sup_sur.CZ_r,  sup_sur.CL_r,  sup_sur.CM_r,   sup_sur.CN_r,
-                                         h_sub,h_sup,Mach, pts_r)
+    results_r    =  compute_coefficients(sub_sur.fused.r,trans_sur.fused.r,sup_sur.fused.r,h_sub,h_sup,pts_r)
      
     Clift_r           = results_r.Clift   
     Cdrag_r           = results_r.Cdrag   
@@ -319,10 +306,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.aileron_flag: 
         pts_delta_a     = np.hstack((delta_a,Mach))
         
-        results_delta_a =  compute_coefficients(sub_sur.Clift_delta_a,sub_sur.Cdrag_delta_a,sub_sur.CX_delta_a,sub_sur.CY_delta_a,sub_sur.CZ_delta_a,sub_sur.CL_delta_a,sub_sur.CM_delta_a, sub_sur.CN_delta_a,
-         trans_sur.Clift_delta_a,trans_sur.Cdrag_delta_a,trans_sur.CX_delta_a,trans_sur.CY_delta_a,trans_sur.CZ_delta_a,trans_sur.CL_delta_a,trans_sur.CM_delta_a, trans_sur.CN_delta_a,
-         sup_sur.Clift_delta_a,sup_sur.Cdrag_delta_a,sup_sur.CX_delta_a,sup_sur.CY_delta_a,sup_sur.CZ_delta_a,sup_sur.CL_delta_a,sup_sur.CM_delta_a, sup_sur.CN_delta_a,
-        h_sub,h_sup,Mach, pts_delta_a)
+        results_delta_a =  compute_coefficients(sub_sur.fused.delta_a,trans_sur.fused.delta_a,sup_sur.fused.delta_a,h_sub,h_sup,pts_delta_a)
          
         Clift_delta_a   = results_delta_a.Clift   
         Cdrag_delta_a   = results_delta_a.Cdrag   
@@ -362,10 +346,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.elevator_flag: 
         pts_delta_e     = np.hstack((delta_e,Mach))
 
-        results_delta_e =  compute_coefficients(sub_sur.Clift_delta_e,sub_sur.Cdrag_delta_e,sub_sur.CX_delta_e,sub_sur.CY_delta_e,sub_sur.CZ_delta_e,sub_sur.CL_delta_e,sub_sur.CM_delta_e, sub_sur.CN_delta_e,
-         trans_sur.Clift_delta_e,trans_sur.Cdrag_delta_e,trans_sur.CX_delta_e,trans_sur.CY_delta_e,trans_sur.CZ_delta_e,trans_sur.CL_delta_e,trans_sur.CM_delta_e, trans_sur.CN_delta_e,
-         sup_sur.Clift_delta_e,sup_sur.Cdrag_delta_e,sup_sur.CX_delta_e,sup_sur.CY_delta_e,sup_sur.CZ_delta_e,sup_sur.CL_delta_e,sup_sur.CM_delta_e, sup_sur.CN_delta_e,
-        h_sub,h_sup,Mach, pts_delta_e)
+        results_delta_e =  compute_coefficients(sub_sur.fused.delta_e,trans_sur.fused.delta_e,sup_sur.fused.delta_e,h_sub,h_sup,pts_delta_e)
          
         Clift_delta_e   = results_delta_e.Clift   
         Cdrag_delta_e   = results_delta_e.Cdrag   
@@ -405,10 +386,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.rudder_flag:  
         pts_delta_r    = np.hstack((delta_r,Mach))
         
-        results_delta_r =  compute_coefficients(sub_sur.Clift_delta_r,sub_sur.Cdrag_delta_r,sub_sur.CX_delta_r,sub_sur.CY_delta_r,sub_sur.CZ_delta_r,sub_sur.CL_delta_r,sub_sur.CM_delta_r, sub_sur.CN_delta_r,
-         trans_sur.Clift_delta_r,trans_sur.Cdrag_delta_r,trans_sur.CX_delta_r,trans_sur.CY_delta_r,trans_sur.CZ_delta_r,trans_sur.CL_delta_r,trans_sur.CM_delta_r, trans_sur.CN_delta_r,
-         sup_sur.Clift_delta_r,sup_sur.Cdrag_delta_r,sup_sur.CX_delta_r,sup_sur.CY_delta_r,sup_sur.CZ_delta_r,sup_sur.CL_delta_r,sup_sur.CM_delta_r, sup_sur.CN_delta_r,
-        h_sub,h_sup,Mach, pts_delta_r)
+        results_delta_r =  compute_coefficients(sub_sur.fused.delta_r,trans_sur.fused.delta_r,sup_sur.fused.delta_r,h_sub,h_sup,pts_delta_r)
          
         Clift_delta_r   = results_delta_r.Clift   
         Cdrag_delta_r   = results_delta_r.Cdrag   
@@ -448,10 +426,7 @@ def evaluate_surrogate(state,settings,vehicle):
     if aerodynamics.flap_flag:
         pts_delta_f    = np.hstack((delta_f,Mach))
         
-        results_delta_f =  compute_coefficients(sub_sur.Clift_delta_f,sub_sur.Cdrag_delta_f,sub_sur.CX_delta_f,sub_sur.CY_delta_f,sub_sur.CZ_delta_f,sub_sur.CL_delta_f,sub_sur.CM_delta_f, sub_sur.CN_delta_f,
-         trans_sur.Clift_delta_f,trans_sur.Cdrag_delta_f,trans_sur.CX_delta_f,trans_sur.CY_delta_f,trans_sur.CZ_delta_f,trans_sur.CL_delta_f,trans_sur.CM_delta_f, trans_sur.CN_delta_f,
-         sup_sur.Clift_delta_f,sup_sur.Cdrag_delta_f,sup_sur.CX_delta_f,sup_sur.CY_delta_f,sup_sur.CZ_delta_f,sup_sur.CL_delta_f,sup_sur.CM_delta_f, sup_sur.CN_delta_f,
-        h_sub,h_sup,Mach, pts_delta_f)
+        results_delta_f =  compute_coefficients(sub_sur.fused.delta_f,trans_sur.fused.delta_f,sup_sur.fused.delta_f,h_sub,h_sup,pts_delta_f)
          
         Clift_delta_f   = results_delta_f.Clift   
         Cdrag_delta_f   = results_delta_f.Cdrag   
@@ -492,10 +467,7 @@ def evaluate_surrogate(state,settings,vehicle):
     
         pts_delta_s    = np.hstack((delta_s,Mach)) 
         
-        results_delta_s =  compute_coefficients(sub_sur.Clift_delta_s,sub_sur.Cdrag_delta_s,sub_sur.CX_delta_s,sub_sur.CY_delta_s,sub_sur.CZ_delta_s,sub_sur.CL_delta_s,sub_sur.CM_delta_s, sub_sur.CN_delta_s,
-         trans_sur.Clift_delta_s,trans_sur.Cdrag_delta_s,trans_sur.CX_delta_s,trans_sur.CY_delta_s,trans_sur.CZ_delta_s,trans_sur.CL_delta_s,trans_sur.CM_delta_s, trans_sur.CN_delta_s,
-         sup_sur.Clift_delta_s,sup_sur.Cdrag_delta_s,sup_sur.CX_delta_s,sup_sur.CY_delta_s,sup_sur.CZ_delta_s,sup_sur.CL_delta_s,sup_sur.CM_delta_s, sup_sur.CN_delta_s,
-        h_sub,h_sup,Mach, pts_delta_s)
+        results_delta_s =  compute_coefficients(sub_sur.fused.delta_s,trans_sur.fused.delta_s,sup_sur.fused.delta_s,h_sub,h_sup,pts_delta_s)
          
         Clift_delta_s   = results_delta_s.Clift   
         Cdrag_delta_s   = results_delta_s.Cdrag   
@@ -533,63 +505,15 @@ def evaluate_surrogate(state,settings,vehicle):
         conditions.control_surfaces.slat.static_stability.coefficients.N             = CN_delta_s                     
      
     
-    conditions.static_stability.derivatives.Clift_alpha = compute_stability_derivative(sub_sur.dClift_dalpha ,trans_sur.dClift_dalpha ,sup_sur.dClift_dalpha ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_alpha    = compute_stability_derivative(sub_sur.dCX_dalpha    ,trans_sur.dCX_dalpha    ,sup_sur.dCX_dalpha    ,h_sub,h_sup,Mach)  
-    conditions.static_stability.derivatives.CY_alpha    = compute_stability_derivative(sub_sur.dCY_dalpha    ,trans_sur.dCY_dalpha    ,sup_sur.dCY_dalpha    ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_alpha    = compute_stability_derivative(sub_sur.dCZ_dalpha    ,trans_sur.dCZ_dalpha    ,sup_sur.dCZ_dalpha    ,h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CL_alpha    = compute_stability_derivative(sub_sur.dCL_dalpha    ,trans_sur.dCL_dalpha    ,sup_sur.dCL_dalpha    ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_alpha    = compute_stability_derivative(sub_sur.dCM_dalpha    ,trans_sur.dCM_dalpha    ,sup_sur.dCM_dalpha    ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_alpha    = compute_stability_derivative(sub_sur.dCN_dalpha    ,trans_sur.dCN_dalpha    ,sup_sur.dCN_dalpha    ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_beta  = compute_stability_derivative(sub_sur.dClift_dbeta  ,trans_sur.dClift_dbeta  ,sup_sur.dClift_dbeta  ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_beta     = compute_stability_derivative(sub_sur.dCX_dbeta     ,trans_sur.dCX_dbeta     ,sup_sur.dCX_dbeta     ,h_sub,h_sup,Mach)  
-    conditions.static_stability.derivatives.CY_beta     = compute_stability_derivative(sub_sur.dCY_dbeta     ,trans_sur.dCY_dbeta     ,sup_sur.dCY_dbeta     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_beta     = compute_stability_derivative(sub_sur.dCZ_dbeta     ,trans_sur.dCZ_dbeta     ,sup_sur.dCZ_dbeta     ,h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CL_beta     = compute_stability_derivative(sub_sur.dCL_dbeta     ,trans_sur.dCL_dbeta     ,sup_sur.dCL_dbeta     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_beta     = compute_stability_derivative(sub_sur.dCM_dbeta     ,trans_sur.dCM_dbeta     ,sup_sur.dCM_dbeta     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_beta     = compute_stability_derivative(sub_sur.dCN_dbeta     ,trans_sur.dCN_dbeta     ,sup_sur.dCN_dbeta     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_p     = compute_stability_derivative(sub_sur.dClift_dp     ,trans_sur.dClift_dp     ,sup_sur.dClift_dp     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_q     = compute_stability_derivative(sub_sur.dClift_dq     ,trans_sur.dClift_dq     ,sup_sur.dClift_dq     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.Clift_r     = compute_stability_derivative(sub_sur.dClift_dr     ,trans_sur.dClift_dr     ,sup_sur.dClift_dr     ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_u        = compute_stability_derivative(sub_sur.dCX_du        ,trans_sur.dCX_du        ,sup_sur.dCX_du        ,h_sub,h_sup,Mach)   
-    conditions.static_stability.derivatives.CX_v        = compute_stability_derivative(sub_sur.dCX_dv        ,trans_sur.dCX_dv        ,sup_sur.dCX_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_w        = compute_stability_derivative(sub_sur.dCX_dw        ,trans_sur.dCX_dw        ,sup_sur.dCX_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_u        = compute_stability_derivative(sub_sur.dCY_du        ,trans_sur.dCY_du        ,sup_sur.dCY_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_v        = compute_stability_derivative(sub_sur.dCY_dv        ,trans_sur.dCY_dv        ,sup_sur.dCY_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_w        = compute_stability_derivative(sub_sur.dCY_dw        ,trans_sur.dCY_dw        ,sup_sur.dCY_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_u        = compute_stability_derivative(sub_sur.dCZ_du        ,trans_sur.dCZ_du        ,sup_sur.dCZ_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_v        = compute_stability_derivative(sub_sur.dCZ_dv        ,trans_sur.dCZ_dv        ,sup_sur.dCZ_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_w        = compute_stability_derivative(sub_sur.dCZ_dw        ,trans_sur.dCZ_dw        ,sup_sur.dCZ_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_u        = compute_stability_derivative(sub_sur.dCL_du        ,trans_sur.dCL_du        ,sup_sur.dCL_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_v        = compute_stability_derivative(sub_sur.dCL_dv        ,trans_sur.dCL_dv        ,sup_sur.dCL_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_w        = compute_stability_derivative(sub_sur.dCL_dw        ,trans_sur.dCL_dw        ,sup_sur.dCL_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_u        = compute_stability_derivative(sub_sur.dCM_du        ,trans_sur.dCM_du        ,sup_sur.dCM_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_v        = compute_stability_derivative(sub_sur.dCM_dv        ,trans_sur.dCM_dv        ,sup_sur.dCM_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_w        = compute_stability_derivative(sub_sur.dCM_dw        ,trans_sur.dCM_dw        ,sup_sur.dCM_dw        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_u        = compute_stability_derivative(sub_sur.dCN_du        ,trans_sur.dCN_du        ,sup_sur.dCN_du        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_v        = compute_stability_derivative(sub_sur.dCN_dv        ,trans_sur.dCN_dv        ,sup_sur.dCN_dv        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_w        = compute_stability_derivative(sub_sur.dCN_dw        ,trans_sur.dCN_dw        ,sup_sur.dCN_dw        ,h_sub,h_sup,Mach) 
-    conditions.static_stability.derivatives.CX_p        = compute_stability_derivative(sub_sur.dCX_dp        ,trans_sur.dCX_dp        ,sup_sur.dCX_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_q        = compute_stability_derivative(sub_sur.dCX_dq        ,trans_sur.dCX_dq        ,sup_sur.dCX_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CX_r        = compute_stability_derivative(sub_sur.dCX_dr        ,trans_sur.dCX_dr        ,sup_sur.dCX_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_p        = compute_stability_derivative(sub_sur.dCY_dp        ,trans_sur.dCY_dp        ,sup_sur.dCY_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_q        = compute_stability_derivative(sub_sur.dCY_dq        ,trans_sur.dCY_dq        ,sup_sur.dCY_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CY_r        = compute_stability_derivative(sub_sur.dCY_dr        ,trans_sur.dCY_dr        ,sup_sur.dCY_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_p        = compute_stability_derivative(sub_sur.dCZ_dp        ,trans_sur.dCZ_dp        ,sup_sur.dCZ_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_q        = compute_stability_derivative(sub_sur.dCZ_dq        ,trans_sur.dCZ_dq        ,sup_sur.dCZ_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CZ_r        = compute_stability_derivative(sub_sur.dCZ_dr        ,trans_sur.dCZ_dr        ,sup_sur.dCZ_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_p        = compute_stability_derivative(sub_sur.dCL_dp        ,trans_sur.dCL_dp        ,sup_sur.dCL_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_q        = compute_stability_derivative(sub_sur.dCL_dq        ,trans_sur.dCL_dq        ,sup_sur.dCL_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CL_r        = compute_stability_derivative(sub_sur.dCL_dr        ,trans_sur.dCL_dr        ,sup_sur.dCL_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_p        = compute_stability_derivative(sub_sur.dCM_dp        ,trans_sur.dCM_dp        ,sup_sur.dCM_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_q        = compute_stability_derivative(sub_sur.dCM_dq        ,trans_sur.dCM_dq        ,sup_sur.dCM_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CM_r        = compute_stability_derivative(sub_sur.dCM_dr        ,trans_sur.dCM_dr        ,sup_sur.dCM_dr        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_p        = compute_stability_derivative(sub_sur.dCN_dp        ,trans_sur.dCN_dp        ,sup_sur.dCN_dp        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_q        = compute_stability_derivative(sub_sur.dCN_dq        ,trans_sur.dCN_dq        ,sup_sur.dCN_dq        ,h_sub,h_sup,Mach)
-    conditions.static_stability.derivatives.CN_r        = compute_stability_derivative(sub_sur.dCN_dr        ,trans_sur.dCN_dr        ,sup_sur.dCN_dr        ,h_sub,h_sup,Mach) 
-
-    for wing in vehicle.wings:   
-        inviscid_wing_lifts = compute_coefficient(sub_sur.Clift_wing_alpha[wing.tag],trans_sur.Clift_wing_alpha[wing.tag],sup_sur.Cdrag_wing_alpha[wing.tag] ,h_sub,h_sup,Mach,pts_alpha)
-        inviscid_wing_drags = compute_coefficient(sub_sur.Cdrag_wing_alpha[wing.tag],trans_sur.Cdrag_wing_alpha[wing.tag],sup_sur.Cdrag_wing_alpha[wing.tag] ,h_sub,h_sup,Mach,pts_alpha)
+    derivatives = compute_stability_derivatives(sub_sur.fused.derivatives,trans_sur.fused.derivatives,sup_sur.fused.derivatives,h_sub,h_sup,Mach)
+    for tag in stability_derivative_tags:
+        conditions.static_stability.derivatives[tag] = derivatives[tag]
+
+    n_wings    = len(vehicle.wings)
+    wing_coefs = compute_coefficient(sub_sur.fused.wings,trans_sur.fused.wings,sup_sur.fused.wings,h_sub,h_sup,pts_alpha)
+    for i,wing in enumerate(vehicle.wings):   
+        inviscid_wing_lifts = wing_coefs[:,[i]]
+        inviscid_wing_drags = wing_coefs[:,[n_wings + i]]
         # Pack 
         conditions.aerodynamics.coefficients.lift.induced.inviscid_wings[wing.tag]         =  inviscid_wing_lifts 
         conditions.aerodynamics.coefficients.lift.compressible_wings[wing.tag]     =  inviscid_wing_lifts 
@@ -647,81 +571,106 @@ def evaluate_no_surrogate(state,settings,base_vehicle):
             if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap: 
                 settings.flap_flag     = True    
     
-    for i in  range(len(Mach)): 
-        for wing in vehicle.wings: 
-            for control_surface in wing.control_surfaces:  
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:  
-                    if trim ==  True:
-                        control_surface.deflection = conditions.control_surfaces.aileron.deflection[i,0]
-                    else: 
-                        conditions.control_surfaces.aileron.deflection[i, 0] = control_surface.deflection
-                        
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator:    
-                    if trim ==  True: 
-                        control_surface.deflection = conditions.control_surfaces.elevator.deflection[i,0]
-                    else:   
-                        conditions.control_surfaces.elevator.deflection[i, 0] = control_surface.deflection
-                        
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder:    
-                    if trim ==  True: 
-                        control_surface.deflection = conditions.control_surfaces.rudder.deflection[i,0]
-                    else:   
-                        conditions.control_surfaces.rudder.deflection[i, 0] = control_surface.deflection
-                                            
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Slat:  
-                    conditions.control_surfaces.slat.deflection[i, 0] = control_surface.deflection
+    # control surface deflection of every control point 
+    deflected_surfaces = []
+    for wing in vehicle.wings: 
+        for control_surface in wing.control_surfaces:  
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:  
+                deflection = conditions.control_surfaces.aileron.deflection
+                if trim ==  False:
+                    deflection[:, 0] = control_surface.deflection
+                deflected_surfaces.append([control_surface,deflection[:,0]])
                     
-                if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap:   
-                    conditions.control_surfaces.flap.deflection[i, 0] = control_surface.deflection
-        
-        Clift,Cdrag,CX,CY,CZ,CL,CM,CN,S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref,Clift_wings,Cdrag_wings,AoA_wing_induced, Clift_spanwise,Cdrag_induced_spanwise,pressure_coefficient = call_VLM(conditions,settings,vehicle)
-        
-        # Dimensionalize the lift and drag for each wing 
-        for wing in vehicle.wings: 
-            conditions.aerodynamics.coefficients.lift.induced.inviscid_wings[wing.tag]         = Clift_wings[wing.tag]
-            conditions.aerodynamics.coefficients.lift.compressible_wings[wing.tag]     = Clift_wings[wing.tag]
-            conditions.aerodynamics.coefficients.drag.induced.inviscid_wings[wing.tag] = Cdrag_wings[wing.tag] 
-        conditions.aerodynamics.coefficients.lift.induced.spanwise     = Clift_spanwise
-        conditions.aerodynamics.coefficients.drag.induced.spanwise     = Cdrag_induced_spanwise
-        conditions.aerodynamics.coefficients.surface_pressure          = pressure_coefficient 
-        conditions.aerodynamics.coefficients.lift.total                = Clift
-        conditions.aerodynamics.coefficients.drag.induced.inviscid     = Cdrag
-        
-        for wing in  vehicle.wings: 
-            RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_wing(state,settings,wing)
-        for fuslage in vehicle.fuselages: 
-            RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_fuselage(state,settings,fuslage)
-        for boom in vehicle.booms: 
-            RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_fuselage(state,settings,boom)  
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_nacelle(state,settings,vehicle)
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_pylon(state,settings,vehicle) 
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_total(state,settings,vehicle)
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.induced_drag(state,settings,vehicle) 
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.cooling_drag(state,settings,vehicle)     
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.compressibility_drag(state,settings,vehicle)
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.miscellaneous_drag(state,settings,vehicle) 
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.spoiler_drag(state,settings,vehicle)
-        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.total_drag(state,settings,vehicle)  
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator:    
+                deflection = conditions.control_surfaces.elevator.deflection
+                if trim ==  False:
+                    deflection[:, 0] = control_surface.deflection
+                deflected_surfaces.append([control_surface,deflection[:,0]])
+                    
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder:    
+                deflection = conditions.control_surfaces.rudder.deflection
+                if trim ==  False:
+                    deflection[:, 0] = control_surface.deflection
+                deflected_surfaces.append([control_surface,deflection[:,0]])
+                                        
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Slat:  
+                conditions.control_surfaces.slat.deflection[:, 0] = control_surface.deflection
+                
+            if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Flap:   
+                conditions.control_surfaces.flap.deflection[:, 0] = control_surface.deflection
+
+    # group the control points by deflection state, each group is solved with one VLM call 
+    n_points = len(Mach)
+    if len(deflected_surfaces) > 0: 
+        deflection_states, groups = np.unique(np.array([d for _,d in deflected_surfaces]).T,axis=0,return_inverse=True)
+    else:
+        deflection_states = np.zeros((1,0))
+        groups            = np.zeros(n_points,dtype=int)
+    groups   = np.ravel(groups)
+    n_groups = len(deflection_states)
+
+    # the group of the last control point is solved last, leaving the vehicle at its deflections 
+    order = [g for g in range(n_groups) if g != groups[-1]] + [groups[-1]]
+    for g in order:
+        for (control_surface,_),deflection in zip(deflected_surfaces,deflection_states[g]):
+            control_surface.deflection = deflection
+        if n_groups == 1:
+            VLM_results = call_VLM(conditions,settings,vehicle)
+        else:
+            rows        = np.where(groups == g)[0]
+            group_results = call_VLM(select_control_points(conditions,rows,n_points),settings,vehicle)
+            if g == order[0]:
+                VLM_results = [None]*len(group_results)
+            VLM_results = [merge_control_points(merged,values,rows,n_points) for merged,values in zip(VLM_results,group_results)]
+            
+    Clift,Cdrag,CX,CY,CZ,CL,CM,CN,S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref,Clift_wings,Cdrag_wings,AoA_wing_induced, Clift_spanwise,Cdrag_induced_spanwise,pressure_coefficient = VLM_results
     
-        T_wind2inertial = conditions.frames.wind.transform_to_inertial 
-        Cdrag_visc      = state.conditions.aerodynamics.coefficients.drag.total
-        CX_visc         = orientation_product(T_wind2inertial,Cdrag_visc)[:,0][:,None]   
-      
-        no_beta   = np.all(conditions.aerodynamics.angles.beta == 0)
-        no_ail    = np.all(conditions.control_surfaces.aileron.deflection == 0) 
-        no_rud    = np.all(conditions.control_surfaces.rudder.deflection == 0) 
-        no_bank   = np.all(conditions.aerodynamics.angles.phi == 0)  
-        
-        if no_beta and no_ail and no_rud and no_bank:
-            CY = CY * 0
-        conditions.static_stability.coefficients.lift[i, 0]  = Clift[i, 0]
-        conditions.static_stability.coefficients.drag[i, 0]  = Cdrag_visc[i, 0] 
-        conditions.static_stability.coefficients.X[i, 0]     = CX[i, 0]
-        conditions.static_stability.coefficients.Y[i, 0]     = CY[i, 0]
-        conditions.static_stability.coefficients.Z[i, 0]     = CZ[i, 0]
-        conditions.static_stability.coefficients.L[i, 0]     = CL[i, 0]
-        conditions.static_stability.coefficients.M[i, 0]     = CM[i, 0] 
-        conditions.static_stability.coefficients.N[i, 0]     = CN[i, 0]     
+    # Dimensionalize the lift and drag for each wing 
+    for wing in vehicle.wings: 
+        conditions.aerodynamics.coefficients.lift.induced.inviscid_wings[wing.tag]         = Clift_wings[wing.tag]
+        conditions.aerodynamics.coefficients.lift.compressible_wings[wing.tag]     = Clift_wings[wing.tag]
+        conditions.aerodynamics.coefficients.drag.induced.inviscid_wings[wing.tag] = Cdrag_wings[wing.tag] 
+    conditions.aerodynamics.coefficients.lift.induced.spanwise     = Clift_spanwise
+    conditions.aerodynamics.coefficients.drag.induced.spanwise     = Cdrag_induced_spanwise
+    conditions.aerodynamics.coefficients.surface_pressure          = pressure_coefficient 
+    conditions.aerodynamics.coefficients.lift.total                = Clift
+    conditions.aerodynamics.coefficients.drag.induced.inviscid     = Cdrag
+    
+    for wing in  vehicle.wings: 
+        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_wing(state,settings,wing)
+    for fuslage in vehicle.fuselages: 
+        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_fuselage(state,settings,fuslage)
+    for boom in vehicle.booms: 
+        RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_fuselage(state,settings,boom)  
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_nacelle(state,settings,vehicle)
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_drag_pylon(state,settings,vehicle) 
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.parasite_total(state,settings,vehicle)
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.induced_drag(state,settings,vehicle) 
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.cooling_drag(state,settings,vehicle)     
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.compressibility_drag(state,settings,vehicle)
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.miscellaneous_drag(state,settings,vehicle) 
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.spoiler_drag(state,settings,vehicle)
+    RCAIDE.Library.Methods.Aerodynamics.Common.Drag.total_drag(state,settings,vehicle)  
+
+    T_wind2inertial = conditions.frames.wind.transform_to_inertial 
+    Cdrag_visc      = state.conditions.aerodynamics.coefficients.drag.total
+    CX_visc         = orientation_product(T_wind2inertial,Cdrag_visc)[:,0][:,None]   
+  
+    no_beta   = np.all(conditions.aerodynamics.angles.beta == 0)
+    no_ail    = np.all(conditions.control_surfaces.aileron.deflection == 0) 
+    no_rud    = np.all(conditions.control_surfaces.rudder.deflection == 0) 
+    no_bank   = np.all(conditions.aerodynamics.angles.phi == 0)  
+    
+    if no_beta and no_ail and no_rud and no_bank:
+        CY = CY * 0
+    conditions.static_stability.coefficients.lift[:, 0]  = Clift[:, 0]
+    conditions.static_stability.coefficients.drag[:, 0]  = Cdrag_visc[:, 0] 
+    conditions.static_stability.coefficients.X[:, 0]     = CX[:, 0]
+    conditions.static_stability.coefficients.Y[:, 0]     = CY[:, 0]
+    conditions.static_stability.coefficients.Z[:, 0]     = CZ[:, 0]
+    conditions.static_stability.coefficients.L[:, 0]     = CL[:, 0]
+    conditions.static_stability.coefficients.M[:, 0]     = CM[:, 0] 
+    conditions.static_stability.coefficients.N[:, 0]     = CN[:, 0]     
 
     # --------------------------------------------------------------------------------------------      
     # Unpack Pertubations 
@@ -1079,7 +1028,7 @@ def evaluate_no_surrogate(state,settings,base_vehicle):
             for control_surface in wing.control_surfaces:  
                 if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Aileron:  
                     vehicle.wings[wing.tag].control_surfaces.aileron.deflection =  delta_ctrl_surf   
-                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_,_, _, _= call_VLM(pertubation_conditions,settings,vehicle)    
+                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_,_= call_VLM(pertubation_conditions,settings,vehicle)    
                     vehicle.wings[wing.tag].control_surfaces.aileron.deflection = 0
         Clift_delta_a_prime   = Clift_res
         Cdrag_delta_a_prime   = Cdrag_res
@@ -1114,7 +1063,7 @@ def evaluate_no_surrogate(state,settings,base_vehicle):
             for control_surface in wing.control_surfaces:  
                 if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Elevator:  
                     vehicle.wings[wing.tag].control_surfaces.elevator.deflection =  delta_ctrl_surf   
-                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_,_, _, _= call_VLM(pertubation_conditions,settings,vehicle)    
+                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_,_= call_VLM(pertubation_conditions,settings,vehicle)    
                     vehicle.wings[wing.tag].control_surfaces.elevator.deflection = 0  
          
         Clift_delta_e_prime   = Clift_res
@@ -1151,7 +1100,7 @@ def evaluate_no_surrogate(state,settings,base_vehicle):
             for control_surface in wing.control_surfaces:  
                 if type(control_surface) == RCAIDE.Library.Components.Wings.Control_Surfaces.Rudder:  
                     vehicle.wings[wing.tag].control_surfaces.rudder.deflection =  delta_ctrl_surf   
-                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_,_, _, _= call_VLM(pertubation_conditions,settings,vehicle)    
+                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_,_= call_VLM(pertubation_conditions,settings,vehicle)    
                     vehicle.wings[wing.tag].control_surfaces.rudder.deflection = 0
                      
         Clift_delta_r_prime   = Clift_res
@@ -1268,72 +1217,78 @@ def evaluate_no_surrogate(state,settings,base_vehicle):
 
     return
 
-def compute_stability_derivative(sub_sur,trans_sur,sup_sur,h_sub,h_sup,Mach):
-    derivative = h_sub(Mach)*sub_sur(Mach) +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_sur(Mach)  + h_sup(Mach)*sup_sur(Mach) 
-    return derivative
+def compute_stability_derivatives(sub_sur,trans_sur,sup_sur,h_sub,h_sup,Mach):
+    """Evaluates the fused stability derivative surrogates of the three speed regimes and blends them.
 
-def compute_coefficients(sub_sur_Clift,sub_sur_Cdrag,sub_sur_CX,sub_sur_CY,sub_sur_CZ,sub_sur_CL,sub_sur_CM,sub_sur_CN,
-                         trans_sur_Clift,trans_sur_Cdrag,trans_sur_CX,trans_sur_CY,trans_sur_CZ,trans_sur_CL,trans_sur_CM,trans_sur_CN,
-                         sup_sur_Clift,sup_sur_Cdrag,sup_sur_CX,sup_sur_CY,sup_sur_CZ,sup_sur_CL,sup_sur_CM,sup_sur_CN,
-                         h_sub,h_sup,Mach, pts): 
- 
-     #  subsonic 
-    sub_Clift     = np.atleast_2d(sub_sur_Clift(pts)).T  
-    sub_Cdrag     = np.atleast_2d(sub_sur_Cdrag(pts)).T  
-    sub_CX        = np.atleast_2d(sub_sur_CX(pts)).T 
-    sub_CY        = np.atleast_2d(sub_sur_CY(pts)).T     
-    sub_CZ        = np.atleast_2d(sub_sur_CZ(pts)).T     
-    sub_CL        = np.atleast_2d(sub_sur_CL(pts)).T     
-    sub_CM        = np.atleast_2d(sub_sur_CM(pts)).T     
-    sub_CN        = np.atleast_2d(sub_sur_CN(pts)).T
-
-    # transonic   
-    trans_Clift   = np.atleast_2d(trans_sur_Clift(pts)).T  
-    trans_Cdrag   = np.atleast_2d(trans_sur_Cdrag(pts)).T  
-    trans_CX      = np.atleast_2d(trans_sur_CX(pts)).T 
-    trans_CY      = np.atleast_2d(trans_sur_CY(pts)).T     
-    trans_CZ      = np.atleast_2d(trans_sur_CZ(pts)).T     
-    trans_CL      = np.atleast_2d(trans_sur_CL(pts)).T     
-    trans_CM      = np.atleast_2d(trans_sur_CM(pts)).T     
-    trans_CN      = np.atleast_2d(trans_sur_CN(pts)).T
+    Assumptions:
+        None
 
-    # supersonic 
-    sup_Clift     = np.atleast_2d(sup_sur_Clift(pts)).T  
-    sup_Cdrag     = np.atleast_2d(sup_sur_Cdrag(pts)).T  
-    sup_CX        = np.atleast_2d(sup_sur_CX(pts)).T 
-    sup_CY        = np.atleast_2d(sup_sur_CY(pts)).T     
-    sup_CZ        = np.atleast_2d(sup_sur_CZ(pts)).T     
-    sup_CL        = np.atleast_2d(sup_sur_CL(pts)).T     
-    sup_CM        = np.atleast_2d(sup_sur_CM(pts)).T     
-    sup_CN        = np.atleast_2d(sup_sur_CN(pts)).T            
-
-    # apply 
-    results       = Data() 
-    results.Clift = h_sub(Mach)*sub_Clift + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_Clift  + h_sup(Mach)*sup_Clift
-    results.Cdrag = h_sub(Mach)*sub_Cdrag + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_Cdrag  + h_sup(Mach)*sup_Cdrag
-    results.CX    = h_sub(Mach)*sub_CX    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CX     + h_sup(Mach)*sup_CX   
-    results.CY    = h_sub(Mach)*sub_CY    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CY     + h_sup(Mach)*sup_CY   
-    results.CZ    = h_sub(Mach)*sub_CZ    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CZ     + h_sup(Mach)*sup_CZ   
-    results.CL    = h_sub(Mach)*sub_CL    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CL     + h_sup(Mach)*sup_CL   
-    results.CM    = h_sub(Mach)*sub_CM    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CM     + h_sup(Mach)*sup_CM   
-    results.CN    = h_sub(Mach)*sub_CN    + (1 - (h_sup(Mach) + h_sub(Mach)))*trans_CN     + h_sup(Mach)*sup_CN
+    Source:
+        None
+
+    Args:
+        sub_sur      : fused subsonic derivative surrogate     [unitless]
+        trans_sur    : fused transonic derivative surrogate    [unitless]
+        sup_sur      : fused supersonic derivative surrogate   [unitless]
+        h_sub        : subsonic blending weight                [unitless]
+        h_sup        : supersonic blending weight              [unitless]
+        Mach         : Mach number                             [unitless]
+
+    Returns:
+        derivatives  : stability derivatives, e.g. CM_alpha    [unitless]
+    """
+    values      = h_sub*sub_sur(Mach) +   (1 - (h_sup + h_sub))*trans_sur(Mach)  + h_sup*sup_sur(Mach)
+    derivatives = Data()
+    i           = 0
+    for coef in coefficient_tags:
+        for var in derivative_variables:
+            derivatives[coef + '_' + var] = values[i]
+            i += 1
+    return derivatives
+
+def compute_coefficients(sub_sur,trans_sur,sup_sur,h_sub,h_sup,pts):
+    """Evaluates the fused coefficient surrogates of the three speed regimes at the query points and
+    blends them. Each surrogate locates the cell of the points once for all coefficients.
+
+    Assumptions:
+        None
+
+    Source:
+        None
+
+    Args:
+        sub_sur      : fused subsonic surrogate                [unitless]
+        trans_sur    : fused transonic surrogate               [unitless]
+        sup_sur      : fused supersonic surrogate              [unitless]
+        h_sub        : subsonic blending weight                [unitless]
+        h_sup        : supersonic blending weight              [unitless]
+        pts          : perturbation variable and Mach number   [unitless]
+
+    Returns:
+        results      : Clift, Cdrag, CX, CY, CZ, CL, CM and CN [unitless]
+    """
+    values  = h_sub*sub_sur(pts) + (1 - (h_sup + h_sub))*trans_sur(pts)  + h_sup*sup_sur(pts)
+
+    results = Data()
+    for i,coef in enumerate(coefficient_tags):
+        results[coef] = values[:,[i]]
 
     return results
 
 
-def compute_coefficient(sub_sur_coef,trans_sur_coef, sup_sur_coef, h_sub,h_sup,Mach, pts): 
+def compute_coefficient(sub_sur_coef,trans_sur_coef, sup_sur_coef, h_sub,h_sup, pts): 
 
     #  subsonic 
-    sub_coef  = np.atleast_2d(sub_sur_coef(pts)).T     
+    sub_coef  = sub_sur_coef(pts)
 
     # transonic 
-    trans_coef  = np.atleast_2d(trans_sur_coef(pts)).T    
+    trans_coef  = trans_sur_coef(pts)
 
     # supersonic 
-    sup_coef  = np.atleast_2d(sub_sur_coef(pts)).T             
+    sup_coef  = sub_sur_coef(pts)
 
     # apply  
-    coef = h_sub(Mach)*sub_coef +   (1 - (h_sup(Mach) + h_sub(Mach)))*trans_coef  + h_sub(Mach)*sup_coef 
+    coef = h_sub*sub_coef +   (1 - (h_sup + h_sub))*trans_coef  + h_sub*sup_coef 
 
   
     return coef
@@ -1403,3 +1358,62 @@ def call_VLM(conditions,settings,vehicle):
         i+=1
 
     return Clift,Cdrag,CX,CY,CZ,CL,CM,CN, S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref, Clift_wings,Cdrag_wings,AoA_wing_induced,cl_y,cdi_y,CPi  
+
+def select_control_points(conditions,rows,n_points):
+    """Returns a copy of the conditions restricted to a subset of the control points. Arrays with one
+    row per control point are sliced, all other entries are shared with the original conditions.
+        
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args: 
+        conditions : flight conditions                   [unitless]
+        rows       : indices of the selected points      [unitless]
+        n_points   : number of control points            [unitless]
+        
+    Returns: 
+        selected   : conditions of the selected points   [unitless]
+    """
+    selected = Data()
+    for key,value in conditions.items():
+        if isinstance(value,dict):
+            selected[key] = select_control_points(value,rows,n_points)
+        elif isinstance(value,np.ndarray) and value.ndim > 0 and value.shape[0] == n_points:
+            selected[key] = value[rows]
+        else:
+            selected[key] = value
+    return selected
+
+def merge_control_points(merged,values,rows,n_points):
+    """Places the VLM outputs of a subset of the control points in the outputs of all control points
+        
+    Assumptions:
+        Outputs that are not arrays with one row per selected point are the same for all points
+        
+    Source:
+        None
+
+    Args: 
+        merged     : outputs of all control points, None before the first subset  [unitless]
+        values     : outputs of the selected points                                [unitless]
+        rows       : indices of the selected points                                [unitless]
+        n_points   : number of control points                                      [unitless]
+        
+    Returns: 
+        merged     : outputs of all control points                                 [unitless]
+    """
+    if isinstance(values,Data):
+        if merged is None:
+            merged = Data()
+        for key,value in values.items():
+            merged[key] = merge_control_points(merged.get(key),value,rows,n_points)
+    elif isinstance(values,np.ndarray) and values.ndim > 0 and values.shape[0] == len(rows):
+        if merged is None:
+            merged = np.zeros((n_points,) + values.shape[1:],dtype=values.dtype)
+        merged[rows] = values
+    else:
+        merged = values
+    return merged
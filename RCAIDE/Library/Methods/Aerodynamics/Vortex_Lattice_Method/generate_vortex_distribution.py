@@ -3,6 +3,7 @@
 # Created:  May 2018, M. Clarke
 # Modified: Apr 2020, M. Clarke
 #           Jun 2021, A. Blaufox
+#           Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------
 #  Imports
@@ -10,14 +11,31 @@
 
 # package imports 
 import numpy as np
+import hashlib
+import copy
+from collections import OrderedDict
 
-from RCAIDE.Framework.Core                                       import  Data
+from RCAIDE.Framework.Core                                       import  Data, update_hash
 from RCAIDE.Library.Components.Wings                             import All_Moving_Surface
 from RCAIDE.Library.Components.Fuselages                         import Fuselage 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.generate_VD_helpers      import postprocess_VD
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.make_VLM_wings           import make_VLM_wings 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.deflect_control_surface  import deflect_control_surface
 from RCAIDE.Library.Methods.Geometry.Airfoil                                            import import_airfoil_geometry
+
+# vortex distributions, keyed by the geometry and the discretization settings, least recently used first
+vortex_distribution_cache            = OrderedDict()
+vortex_distribution_cache_statistics = Data(hits = 0, updates = 0, misses = 0)
+
+# settings used by the panelization
+panelization_settings = ['number_of_spanwise_vortices','number_of_chordwise_vortices','wing_spanwise_vortices','wing_chordwise_vortices',
+                         'fuselage_spanwise_vortices','fuselage_chordwise_vortices','spanwise_cosine_spacing','model_fuselage',
+                         'floating_point_precision','discretize_control_surfaces']
+
+# panel coordinates moved by the deflection of a control surface, the last three are the panel corners of the full strips
+deflected_coordinates = ['XA1','XAC','XAH','XA2','YA1','YAH','YAC','YA2','ZA1','ZAH','ZAC','ZA2',
+                         'XB1','XBH','XBC','XB2','YB1','YBH','YBC','YB2','ZB1','ZBH','ZBC','ZB2',
+                         'XCH','XC','YCH','YC','ZCH','ZC','X','Y','Z']
  
 
 # ----------------------------------------------------------------------
@@ -74,6 +92,14 @@ def generate_vortex_distribution(geometry,settings):
     settings.wing_chordwise_vortices              - the number of vortices to be applied to only the wings
     settings.fuselage_spanwise_vortices           - the number of vortices to be applied to only the fuslages
     settings.fuselage_chordwise_vortices          - the number of vortices to be applied to only the fuselages 
+    
+    settings.cache_vortex_distributions           - keep the vortex distributions in a cache              [Boolean]
+    settings.vortex_distribution_cache_size       - number of geometries kept in the cache                [Unitless]
+    
+    The vortex distributions are kept in a least recently used cache keyed by the wings, fuselages and 
+    discretization settings. A later call with the same geometry returns a copy of the cached vortex 
+    distribution, and a call where only control surface deflections changed deflects the changed surfaces 
+    of the cached vortex distribution instead of repeating the panelization.
        
     Outputs:                                   
     VD - vehicle vortex distribution              [Unitless] 
@@ -126,6 +152,25 @@ def generate_vortex_distribution(geometry,settings):
         #everything is already set up to use separate discretization
         pass
     
+    use_cache  = settings.cache_vortex_distributions if ('cache_vortex_distributions' in settings.keys()) else True
+    cache_size = settings.vortex_distribution_cache_size if ('vortex_distribution_cache_size' in settings.keys()) else 16
+    if use_cache:
+        key         = hash_panelization_inputs(geometry, settings)
+        deflections = get_control_surface_deflections(geometry)
+        if key in vortex_distribution_cache:
+            vortex_distribution_cache.move_to_end(key)
+            entry = vortex_distribution_cache[key]
+            if deflections == entry.deflections:
+                vortex_distribution_cache_statistics.hits += 1
+            else:
+                update_control_surface_deflections(entry, deflections, settings)
+                vortex_distribution_cache_statistics.updates += 1
+                
+            VD = copy.deepcopy(entry.VD)
+            geometry.vortex_distribution = VD
+            return VD 
+        vortex_distribution_cache_statistics.misses += 1
+    
     # ---------------------------------------------------------------------------------------
     # STEP 1: Define empty vectors for coordinates of panes, control points and bound vortices
     # ---------------------------------------------------------------------------------------
@@ -232,6 +277,13 @@ def generate_vortex_distribution(geometry,settings):
         VD = generate_fuselage_and_nacelle_vortex_distribution(VD,fus,n_cw_fuse,n_sw_fuse,precision,model_fuselage)
 
 
+    # keep the undeflected panels and wings for later deflections of the surfaces
+    if use_cache:
+        undeflected_wings  = copy.deepcopy(VD.VLM_wings)
+        undeflected_panels = Data()
+        for name in deflected_coordinates:
+            undeflected_panels[name] = VD[name]*1.
+
     # ---------------------------------------------------------------------------------------
     # Deflect Control Surfaces
     # ---------------------------------------------------------------------------------------      
@@ -250,10 +302,161 @@ def generate_vortex_distribution(geometry,settings):
     # pack VD into geometry
     geometry.vortex_distribution = VD
     
+    if use_cache:
+        entry                    = Data()
+        entry.VD                 = copy.deepcopy(VD)
+        entry.deflections        = deflections
+        entry.undeflected_wings  = undeflected_wings
+        entry.undeflected_panels = undeflected_panels
+        vortex_distribution_cache[key] = entry
+        while len(vortex_distribution_cache) > max(cache_size,0):
+            vortex_distribution_cache.popitem(last=False)
+    
     if show_prints: print('finish discretization')     
     
     return VD 
 
+# ----------------------------------------------------------------------
+#  Vortex Distribution Cache
+# ----------------------------------------------------------------------
+def hash_panelization_inputs(geometry, settings):
+    """ Computes the key of the vortex distribution of a geometry. The key is a hash of the wings, 
+    fuselages and discretization settings without the control surface deflections, which are applied
+    to the cached panels by update_control_surface_deflections.
+    
+    Assumptions:
+    Airfoils are identified by their coordinate files
+    
+    Source:
+    N/A
+    
+    Inputs:
+    geometry.wings                                - wings of the vehicle                 [Unitless]
+    geometry.fuselages                            - fuselages of the vehicle             [Unitless]
+    settings                                      - discretization settings              [Unitless]
+    
+    Outputs:
+    key                                           - hash of the panelization inputs      [string]
+    
+    Properties Used:
+    N/A
+    """
+    discretization = Data()
+    for name in panelization_settings:
+        discretization[name] = settings[name] if (name in settings.keys()) else None
+    
+    key_hash = hashlib.blake2b(digest_size=20)
+    for data in [geometry.wings,geometry.fuselages,discretization]:
+        update_hash(key_hash,data,skip_keys=('vortex_distribution','deflection'))
+    
+    return key_hash.hexdigest()
+
+def get_control_surface_deflections(geometry):
+    """ Collects the deflections of the all-moving surfaces and control surfaces of a geometry
+    
+    Assumptions:
+    None
+    
+    Source:
+    N/A
+    
+    Inputs:
+    geometry.wings                                - wings of the vehicle                 [Unitless]
+    
+    Outputs:
+    deflections                                   - deflections keyed by the wing and    [radians]
+                                                    control surface tags
+    
+    Properties Used:
+    N/A
+    """
+    deflections = {}
+    for wing in geometry.wings:
+        if isinstance(wing, All_Moving_Surface):
+            deflections[(wing.tag,None)] = float(wing.deflection)
+        for cs in wing.control_surfaces:
+            deflections[(wing.tag,cs.tag)] = float(cs.deflection)
+    
+    return deflections
+
+def update_control_surface_deflections(entry, deflections, settings):
+    """ Deflects the surfaces of a cached vortex distribution whose deflection changed. The panels of 
+    these surfaces are reset to their undeflected positions and deflected from there, so the result is 
+    the same as a new panelization of the geometry.
+    
+    Assumptions:
+    The deflection of a surface only moves the panels of that surface
+    
+    Source:
+    N/A
+    
+    Inputs:
+    entry.VD                                      - cached vortex distribution           [Unitless]
+    entry.deflections                             - deflections of entry.VD              [radians]
+    entry.undeflected_wings                       - VLM wings before the deflection      [Unitless]
+    entry.undeflected_panels                      - panels before the deflection         [Unitless]
+    deflections                                   - new deflections                      [radians]
+    settings.floating_point_precision             - precision of the panels              [np.dtype]
+    
+    Outputs:
+    entry.VD                                      - deflected vortex distribution        [Unitless]
+    
+    Properties Used:
+    N/A
+    """
+    VD = entry.VD
+    for wing in entry.undeflected_wings:
+        if wing.is_a_control_surface:
+            source = (wing.wing_tag,wing.control_surface_tag)
+        elif issubclass(wing.wing_type, All_Moving_Surface):
+            source = (wing.tag,None)
+        else:
+            continue
+        if deflections[source] == entry.deflections[source]:
+            continue
+        
+        # reset the panels of the surface
+        for name in deflected_coordinates:
+            surface_ID = VD.surface_ID_full if name in ['X','Y','Z'] else VD.surface_ID
+            surface    = np.abs(surface_ID) == wing.surface_ID
+            VD[name][surface] = entry.undeflected_panels[name][surface]
+        
+        # deflect the surface from its undeflected position
+        deflected_wing            = copy.deepcopy(wing)
+        deflected_wing.deflection = deflections[source]
+        VD, deflected_wing        = deflect_control_surface(VD, deflected_wing)
+        VD.VLM_wings[wing.tag]    = deflected_wing
+        
+    entry.VD          = postprocess_VD(VD, settings)
+    entry.deflections = deflections
+    
+    return
+
+def clear_vortex_distribution_cache():
+    """ Removes all vortex distributions from the cache
+    
+    Assumptions:
+    None
+    
+    Source:
+    N/A
+    
+    Inputs:
+    None
+    
+    Outputs:
+    None
+    
+    Properties Used:
+    N/A
+    """
+    vortex_distribution_cache.clear()
+    vortex_distribution_cache_statistics.hits    = 0
+    vortex_distribution_cache_statistics.updates = 0
+    vortex_distribution_cache_statistics.misses  = 0
+    
+    return
+
 
 # ----------------------------------------------------------------------
 #  Discretize Wings
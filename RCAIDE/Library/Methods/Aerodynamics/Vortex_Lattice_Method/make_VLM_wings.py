@@ -432,6 +432,8 @@ def make_cs_wing_from_cs(cs, seg_a, seg_b, wing, cs_ID):
     cs_wing.is_a_control_surface  = True
     cs_wing.cs_ID                 = cs_ID
     cs_wing.name                  = wing.tag + '__' + seg_b.tag + '__' + cs.tag + '__cs_ID_{}'.format(cs_ID)
+    cs_wing.wing_tag              = wing.tag
+    cs_wing.control_surface_tag   = cs.tag
     cs_wing.is_slat               = (cs.cs_type==Slat)
     cs_wing.is_aileron            = (cs.cs_type==Aileron)
     cs_wing.pivot_edge            = 'TE' if cs_wing.is_slat else 'LE'
@@ -8,9 +8,14 @@
 import RCAIDE 
 from RCAIDE.Framework.Core import  Data 
 from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM import  VLM
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM_training_cache import  hash_VLM_training_inputs, load_VLM_training_data, save_VLM_training_data
 # package imports
 import numpy  as np
 from copy     import  deepcopy
+from concurrent.futures import ProcessPoolExecutor
+
+# vehicle and settings of a training worker process
+training_worker = Data()
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Vortex_Lattice
@@ -25,6 +30,8 @@ def train_VLM_surrogates(aerodynamics):
         r derivatives multiplied by -10, verified against literature and AVL 
         Rudder derivatives multiplied by -1, verified against literature  
         Aileron derivatives multiplied by -1, verified against literature
+        When a surrogate cache directory is set, stored training data with the same geometry,
+        training grid and settings is loaded instead of training
         
     Source:
         None
@@ -35,6 +42,13 @@ def train_VLM_surrogates(aerodynamics):
     Returns: 
         None    
     """
+    
+    # load the training data of an identical analysis from the surrogate cache 
+    cache_directory = aerodynamics.settings.surrogate_cache_directory if 'surrogate_cache_directory' in aerodynamics.settings.keys() else None
+    if cache_directory is not None: 
+        key = hash_VLM_training_inputs(aerodynamics)
+        if load_VLM_training_data(aerodynamics, key):
+            return
  
     Mach          = aerodynamics.training.Mach 
     training      = aerodynamics.training  
@@ -42,25 +56,277 @@ def train_VLM_surrogates(aerodynamics):
     sub_Mach      = Mach[:sub_len] 
     sup_Mach      = Mach[sub_len:] 
     
-    training.subsonic    =  train_model(aerodynamics, sub_Mach)  
-    training.supersonic  =  train_model(aerodynamics, sup_Mach)
+    # the VLM sweeps of both Mach ranges are independent and are solved together
+    cases                = Data()
+    cases.subsonic       = training_cases(aerodynamics, sub_Mach)
+    cases.supersonic     = training_cases(aerodynamics, sup_Mach)
+    solutions            = evaluate_training_cases(aerodynamics, cases)
+    
+    training.subsonic    =  train_model(aerodynamics, sub_Mach, solutions.subsonic)  
+    training.supersonic  =  train_model(aerodynamics, sup_Mach, solutions.supersonic)
     training.transonic   =  train_trasonic_model(aerodynamics, training.subsonic,training.supersonic,sub_Mach, sup_Mach) 
+    
+    if cache_directory is not None: 
+        save_VLM_training_data(aerodynamics, key)
     return 
     
-def train_model(aerodynamics, Mach): 
-    """Sub function that call methods to run VLM for sample point evaluation. 
+def training_cases(aerodynamics, Mach): 
+    """Sets up the flight conditions and control surface deflections of the VLM sample points of a
+    Mach range. Each case is an independent VLM solve. 
     
     Assumptions:
+        Flaps are sampled at the rudder deflections, as in train_model
+        
+    Source:
         None
+
+    Args:
+        aerodynamics       : VLM analysis                     [unitless] 
+        Mach               : Mach numbers of the range        [unitless] 
+        
+    Returns: 
+        cases              : conditions and deflection of each sample point, in the order of train_model [unitless] 
+    """    
+
+    vehicle        = aerodynamics.vehicle
+    training       = aerodynamics.training 
+    AoA            = training.angle_of_attack                  
+    Beta           = training.sideslip_angle
+    u              = training.u
+    v              = training.v
+    w              = training.w
+    pitch_rate     = training.pitch_rate
+    roll_rate      = training.roll_rate
+    yaw_rate       = training.yaw_rate  
+    len_Mach       = len(Mach)        
+    len_AoA        = len(AoA)  
+    len_Beta       = len(Beta)
+    len_u          = len(u)
+    len_v          = len(v)
+    len_w          = len(w)
+    len_q          = len(pitch_rate)
+    len_p          = len(roll_rate) 
+    len_r          = len(yaw_rate) 
+    cases          = Data()
+    
+    # Alpha
+    # Setup new array shapes for vectorization
+    # stakcing 9x9 matrices into one horizontal line(81)
+    AoAs       = np.atleast_2d(np.tile(AoA,len_Mach).T.flatten()).T
+    Machs      = np.atleast_2d(np.repeat(Mach,len_AoA)).T
+
+    # reset conditions
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*AoAs
+    cases.alpha = Data(conditions = conditions, deflection = None)
+
+    # Beta
+    Betas         = np.atleast_2d(np.tile(Beta,len_Mach).T.flatten()).T
+    Machs         = np.atleast_2d(np.repeat(Mach,len_Beta)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.expand_rows(rows= len(Machs))
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.ones_like(Machs)*Betas
+    cases.beta = Data(conditions = conditions, deflection = None)
+
+    # Velocity u
+    u_s     = np.atleast_2d(np.tile(u, len_Mach).T.flatten()).T
+    Machs   = np.atleast_2d(np.repeat(Mach,len_u)).T
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs)
+    conditions.freestream.mach_number               = Machs + Machs*u_s
+    cases.u = Data(conditions = conditions, deflection = None)
+
+    # Velocity v
+    v_s     = np.atleast_2d(np.tile(v, len_Mach).T.flatten()).T
+    Machs         = np.atleast_2d(np.repeat(Mach,len_v)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs)
+    conditions.aerodynamics.angles.beta             = np.arcsin(v_s)
+    cases.v = Data(conditions = conditions, deflection = None)
+
+    # Velocity w
+    w_s     = np.atleast_2d(np.tile(w, len_Mach).T.flatten()).T
+    Machs   = np.atleast_2d(np.repeat(Mach,len_w)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.arcsin(w_s)
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs)
+    cases.w = Data(conditions = conditions, deflection = None)
+
+    # Pitch Rate
+    q_s     = np.atleast_2d(np.tile(pitch_rate, len_Mach).T.flatten()).T
+    Machs   = np.atleast_2d(np.repeat(Mach,len_q)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs)
+    conditions.static_stability.pitch_rate          = np.ones_like(Machs)*q_s
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound
+    cases.q = Data(conditions = conditions, deflection = None)
+
+    # Roll Rate
+    p_s     = np.atleast_2d(np.tile(roll_rate, len_Mach).T.flatten()).T
+    Machs         = np.atleast_2d(np.repeat(Mach,len_p)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.freestream.mach_number               = Machs
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs)
+    conditions.static_stability.roll_rate           = np.ones_like(Machs)*p_s
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound
+    cases.p = Data(conditions = conditions, deflection = None)
+
+    # Yaw Rate
+    r_s     = np.atleast_2d(np.tile(yaw_rate, len_Mach).T.flatten()).T
+    Machs         = np.atleast_2d(np.repeat(Mach,len_r)).T
+
+    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs)
+    conditions.freestream.mach_number               = Machs
+    conditions.static_stability.yaw_rate            = np.ones_like(Machs)*r_s
+    conditions.freestream.velocity                  = Machs * 343 # speed of sound
+    cases.r = Data(conditions = conditions, deflection = None)
+
+
+    # Control surfaces, one case per deflection
+    Control_Surfaces = RCAIDE.Library.Components.Wings.Control_Surfaces
+    for wing in vehicle.wings: 
+        for control_surface in wing.control_surfaces:
+            control_surface.deflection  =  0.0
+            if type(control_surface) == Control_Surfaces.Aileron:  
+                deflections = training.aileron_deflection
+            elif type(control_surface) == Control_Surfaces.Elevator:  
+                deflections = training.elevator_deflection
+            elif type(control_surface) == Control_Surfaces.Rudder:   
+                deflections = training.rudder_deflection
+            elif type(control_surface) == Control_Surfaces.Slat:  
+                deflections = training.slat_deflection
+            elif type(control_surface) == Control_Surfaces.Flap: 
+                deflections = training.rudder_deflection
+            else:
+                continue 
+            for i in range(len(deflections)):
+                Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
+                conditions                                      = RCAIDE.Framework.Mission.Common.Results()
+                conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
+                conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
+                conditions.freestream.mach_number               = Machs   
+                deflection                                      = Data()
+                deflection.wing                                 = wing.tag
+                deflection.control_surface                      = control_surface.tag
+                deflection.value                                = deflections[i]
+                cases[wing.tag + '_' + control_surface.tag + '_' + str(i)] = Data(conditions = conditions, deflection = deflection)
+    
+    return cases
+
+def evaluate_training_cases(aerodynamics, cases): 
+    """Runs the VLM for the training cases of all Mach ranges. With more than one training worker the
+    cases are distributed over a pool of processes, each holding a copy of the vehicle. The solutions
+    are identical to the serial evaluation. 
+    
+    Assumptions:
+        The vehicle and the settings can be pickled
         
     Source:
         None
 
     Args:
-        aerodynamics       : VLM analysis          [unitless] 
+        aerodynamics       : VLM analysis                                         [unitless] 
+        cases              : training cases of each Mach range                    [unitless] 
         
     Returns: 
-        None    
+        solutions          : outputs of call_VLM of each case of each Mach range  [unitless] 
+    """     
+    vehicle   = aerodynamics.vehicle
+    settings  = aerodynamics.settings
+    workers   = settings.number_of_training_workers if 'number_of_training_workers' in settings.keys() else 1
+    case_list = [case for mach_range in cases.values() for case in mach_range.values()]
+    
+    if workers > 1 and len(case_list) > 1: 
+        # the last case is solved in this process while the pool solves the others, which leaves the
+        # vehicle with the vortex distribution of the last case as in the serial evaluation
+        with ProcessPoolExecutor(max_workers = min(workers,len(case_list) - 1), initializer = initialize_training_worker, initargs = (settings, vehicle)) as executor:
+            pool_outputs = executor.map(evaluate_training_case, case_list[:-1])
+            last_output  = evaluate_training_case(case_list[-1], settings, vehicle)
+            outputs      = list(pool_outputs) + [last_output]
+    else:
+        outputs = [evaluate_training_case(case, settings, vehicle) for case in case_list]
+        
+    solutions = Data()
+    i         = 0
+    for range_tag, mach_range in cases.items():
+        solutions[range_tag] = Data()
+        for tag in mach_range.keys():
+            solutions[range_tag][tag] = outputs[i]
+            i += 1 
+    
+    return solutions
+
+def evaluate_training_case(case, settings = None, vehicle = None):
+    """Runs the VLM for one training case. The control surface of the case is deflected during the
+    solve and reset afterwards. 
+    
+    Assumptions:
+        Without a vehicle, the vehicle and settings of the training worker process are used
+        
+    Source:
+        None
+
+    Args:
+        case               : conditions and deflection of the case     [unitless] 
+        settings           : VLM analysis settings                     [unitless] 
+        vehicle            : vehicle configuration                     [unitless] 
+        
+    Returns: 
+        solution           : outputs of call_VLM                       [unitless] 
+    """     
+    if vehicle is None:
+        settings = training_worker.settings
+        vehicle  = training_worker.vehicle
+        
+    deflection = case.deflection
+    if deflection is not None: 
+        vehicle.wings[deflection.wing].control_surfaces[deflection.control_surface].deflection = deflection.value
+    solution = call_VLM(case.conditions,settings,vehicle)
+    if deflection is not None: 
+        vehicle.wings[deflection.wing].control_surfaces[deflection.control_surface].deflection = 0
+        
+    return solution
+
+def initialize_training_worker(settings, vehicle): 
+    """ :meta private:"""
+    training_worker.settings = settings
+    training_worker.vehicle  = vehicle
+    return 
+    
+def train_model(aerodynamics, Mach, solutions): 
+    """Sub function that assembles the training data of a Mach range from the VLM solutions of
+    its sample points. 
+    
+    Assumptions:
+        None
+        
+    Source:
+        None
+
+    Args:
+        aerodynamics       : VLM analysis                                    [unitless] 
+        Mach               : Mach numbers of the range                       [unitless] 
+        solutions          : VLM solutions of the cases of training_cases    [unitless] 
+        
+    Returns: 
+        training           : training data of the Mach range                 [unitless] 
     """    
 
     vehicle        = aerodynamics.vehicle
@@ -114,18 +380,8 @@ def train_model(aerodynamics, Mach):
     # --------------------------------------------------------------------------------------------------------------
     # Alpha
     # --------------------------------------------------------------------------------------------------------------
-    
-    # Setup new array shapes for vectorization 
-    # stakcing 9x9 matrices into one horizontal line(81)  
-    AoAs       = np.atleast_2d(np.tile(AoA,len_Mach).T.flatten()).T 
-    Machs      = np.atleast_2d(np.repeat(Mach,len_AoA)).T        
-    
-    # reset conditions  
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-    conditions.freestream.mach_number               = Machs
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs)*AoAs 
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res, S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref, Clift_wing_res, Cdrag_wing_res,_,_,_, _= call_VLM(conditions,settings,vehicle)
+
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res, S_ref,b_ref,c_ref,X_ref,Y_ref ,Z_ref, Clift_wing_res, Cdrag_wing_res,_,_,_, _ = solutions.alpha
     
     Clift_alpha   = np.reshape(Clift_res,(len_Mach,len_AoA)).T 
     Cdrag_alpha   = np.reshape(Cdrag_res,(len_Mach,len_AoA)).T 
@@ -164,16 +420,8 @@ def train_model(aerodynamics, Mach):
     # --------------------------------------------------------------------------------------------------------------
     # Beta 
     # --------------------------------------------------------------------------------------------------------------
-    Betas         = np.atleast_2d(np.tile(Beta,len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_Beta)).T        
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-    conditions.expand_rows(rows= len(Machs))
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.ones_like(Machs)*Betas   
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions.beta
     
     Clift_beta =    np.reshape(Clift_res,(len_Mach,len_Beta)).T - Clift_alpha_0
     Cdrag_beta =    np.reshape(Cdrag_res,(len_Mach,len_Beta)).T - Cdrag_alpha_0                                
@@ -187,14 +435,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------      
     # Velocity u 
     # -------------------------------------------------------
-    u_s     = np.atleast_2d(np.tile(u, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_u)).T                   
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.freestream.mach_number               = Machs + Machs*u_s 
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
+
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions.u
     
     Clift_u     = np.reshape(Clift_res,(len_Mach,len_u)).T - Clift_alpha_0
     Cdrag_u     = np.reshape(Cdrag_res,(len_Mach,len_u)).T - Cdrag_alpha_0
@@ -208,16 +450,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Velocity v 
     # -------------------------------------------------------
-    v_s     = np.atleast_2d(np.tile(v, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_v)).T    
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
-    conditions.freestream.mach_number               = Machs
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.aerodynamics.angles.beta             = np.arcsin(v_s)       
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions.v
     
     Clift_v     = np.reshape(Clift_res,(len_Mach,len_v)).T - Clift_alpha_0
     Cdrag_v     = np.reshape(Cdrag_res,(len_Mach,len_v)).T - Cdrag_alpha_0
@@ -231,15 +465,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Velocity w 
     # -------------------------------------------------------
-    w_s     = np.atleast_2d(np.tile(w, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_w)).T
-     
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results()  
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.arcsin(w_s)
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
+
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions.w
     
     Clift_w     = np.reshape(Clift_res,(len_Mach,len_w)).T - Clift_alpha_0
     Cdrag_w     = np.reshape(Cdrag_res,(len_Mach,len_w)).T - Cdrag_alpha_0
@@ -253,17 +480,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Pitch Rate 
     # -------------------------------------------------------
-    q_s     = np.atleast_2d(np.tile(pitch_rate, len_Mach).T.flatten()).T 
-    Machs   = np.atleast_2d(np.repeat(Mach,len_q)).T
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.freestream.mach_number               = Machs 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.static_stability.pitch_rate          = np.ones_like(Machs)*q_s     
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound   
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions.q
     
     Clift_q     = np.reshape(Clift_res,(len_Mach,len_q)).T - Clift_alpha_0
     Cdrag_q     = np.reshape(Cdrag_res,(len_Mach,len_q)).T - Cdrag_alpha_0
@@ -277,17 +495,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Roll  Rate 
     # -------------------------------------------------------    
-    p_s     = np.atleast_2d(np.tile(roll_rate, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_p)).T
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.freestream.mach_number               = Machs  
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12 
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.static_stability.roll_rate           = np.ones_like(Machs)*p_s 
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound           
-        
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)  
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions.p
         
     Clift_p     = -10*(np.reshape(Clift_res,(len_Mach,len_p)).T - Clift_alpha_0)
     Cdrag_p     = -10*(np.reshape(Cdrag_res,(len_Mach,len_p)).T - Cdrag_alpha_0)
@@ -301,17 +510,8 @@ def train_model(aerodynamics, Mach):
     # -------------------------------------------------------               
     # Yaw Rate 
     # -------------------------------------------------------        
-    r_s     = np.atleast_2d(np.tile(yaw_rate, len_Mach).T.flatten()).T 
-    Machs         = np.atleast_2d(np.repeat(Mach,len_r)).T
 
-    conditions                                      = RCAIDE.Framework.Mission.Common.Results() 
-    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-    conditions.freestream.mach_number               = Machs 
-    conditions.static_stability.yaw_rate            = np.ones_like(Machs)*r_s
-    conditions.freestream.velocity                  = Machs * 343 # speed of sound  
-    
-    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
+    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions.r
     
     Clift_r     = 10*(np.reshape(Clift_res,(len_Mach,len_r)).T - Clift_alpha_0)
     Cdrag_r     = 10*(np.reshape(Cdrag_res,(len_Mach,len_r)).T - Cdrag_alpha_0)
@@ -495,14 +695,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_a         = np.zeros((len_d_a,len_Mach))
                 
                 for a_i in range(len_d_a):    
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs    
-                    vehicle.wings[wing.tag].control_surfaces.aileron.deflection =  delta_a[a_i]
-                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
-                    vehicle.wings[wing.tag].control_surfaces.aileron.deflection = 0
+                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions[wing.tag + '_' + control_surface.tag + '_' + str(a_i)]
                     
                     Clift_d_a[a_i,:] =  -(Clift_res[:,0]  - Clift_alpha_0[0,:])
                     Cdrag_d_a[a_i,:] =  -(Cdrag_res[:,0]  - Cdrag_alpha_0[0,:])                              
@@ -546,14 +739,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_e         = np.zeros((len_d_e,len_Mach))
  
                 for e_i in range(len_d_e): 
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs     
-                    vehicle.wings[wing.tag].control_surfaces.elevator.deflection =  delta_e[e_i]
-                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
-                    vehicle.wings[wing.tag].control_surfaces.elevator.deflection = 0 
+                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions[wing.tag + '_' + control_surface.tag + '_' + str(e_i)]
                     Clift_d_e[e_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                     Cdrag_d_e[e_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                     CX_d_e[e_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -595,14 +781,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_r         = np.zeros((len_d_r,len_Mach))
               
                 for r_i in range(len_d_r): 
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs    
-                    vehicle.wings[wing.tag].control_surfaces.rudder.deflection =  delta_r[r_i]
-                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
-                    vehicle.wings[wing.tag].control_surfaces.rudder.deflection = 0 
+                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions[wing.tag + '_' + control_surface.tag + '_' + str(r_i)]
                     Clift_d_r[r_i,:] =   -(Clift_res[:,0]  - Clift_alpha_0[0,:])
                     Cdrag_d_r[r_i,:] =   -(Cdrag_res[:,0]  - Cdrag_alpha_0[0,:])                            
                     CX_d_r[r_i,:]    =   -(CX_res[:,0]   - CX_alpha_0[0,:])   
@@ -643,14 +822,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_f         = np.zeros((len_d_f,len_Mach))
                 
                 for f_i in range(len_d_f): 
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs    
-                    vehicle.wings[wing.tag].control_surfaces.flap.deflection = delta_f[f_i]
-                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
-                    vehicle.wings[wing.tag].control_surfaces.flap.deflection = 0   
+                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions[wing.tag + '_' + control_surface.tag + '_' + str(f_i)]
                     Clift_d_f[f_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                     Cdrag_d_f[f_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                     CX_d_f[f_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -691,14 +863,7 @@ def train_model(aerodynamics, Mach):
                 CN_d_s         = np.zeros((len_d_s,len_Mach))
        
                 for s_i in range(len_d_s):
-                    Machs                                           = np.atleast_2d(np.repeat(Mach,1)).T         
-                    conditions                                      = RCAIDE.Framework.Mission.Common.Results()
-                    conditions.aerodynamics.angles.alpha            = np.ones_like(Machs) *1E-12
-                    conditions.aerodynamics.angles.beta             = np.zeros_like(Machs) 
-                    conditions.freestream.mach_number               = Machs     
-                    vehicle.wings[wing.tag].control_surfaces.slat.deflection = delta_s[s_i]
-                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _= call_VLM(conditions,settings,vehicle)
-                    vehicle.wings[wing.tag].control_surfaces.slat.deflection = 0 
+                    Clift_res,Cdrag_res,CX_res,CY_res,CZ_res,CL_res,CM_res,CN_res ,_,_,_,_,_,_,_,_,_,_,_, _ = solutions[wing.tag + '_' + control_surface.tag + '_' + str(s_i)]
                     Clift_d_s[s_i,:] = Clift_res[:,0]  - Clift_alpha_0[0,:]
                     Cdrag_d_s[s_i,:] = Cdrag_res[:,0]  - Cdrag_alpha_0[0,:]                                
                     CX_d_s[s_i,:]    = CX_res[:,0]   - CX_alpha_0[0,:]   
@@ -231,7 +231,7 @@ def combustor_model(ct, kinetics_model,oxidizer_model,high_fidelity_kin_mech, di
        
     for PSR_i in range(N_PZ):     
         f_PZ_1                            = (1 / (np.sqrt(2 * np.pi) * sigma_phi)) * np.exp((-(phi_PSR[PSR_i] - phi_sign) ** 2) / (2 * sigma_phi ** 2)) * Delta_phi # [-]       Fraction of mass flow entering the PSR at the PSR equivalence ratio                                                                                       
-        Fuel_list.append(ct.Solution(rel_path+kinetics_model) )                     # [-]       Import surrogate fuel kinematic mechanism
+        Fuel_list.append(solution_without_transport(ct,rel_path+kinetics_model))    # [-]       Import surrogate fuel kinematic mechanism
         Fuel_list[PSR_i].TP               = T_stag_0, P_stag_0                      # [-]       Set the fuel temperature and pressure
         Fuel_list[PSR_i].set_equivalence_ratio(phi_PSR[PSR_i], fuel=dict_fuel, oxidizer=dict_oxy) # [-]       Set the euivalence ratio inside the PSR
         Fuel_list[PSR_i].equilibrate('HP')                                          # [-]       Fix the specific enthalpy and pressure 
@@ -298,7 +298,7 @@ def combustor_model(ct, kinetics_model,oxidizer_model,high_fidelity_kin_mech, di
     total_mass_flow = np.sum(np.array(mass_flow_rates))                             # [kg/s]    Total mass flow entering the first mixer  
 
     for _ in  range(N_SZ): 
-        Air                   = ct.Solution(rel_path+oxidizer_model)                # [-]       Import air kinematic mechanism           
+        Air                   = solution_without_transport(ct,rel_path+oxidizer_model)  # [-]       Import air kinematic mechanism           
         Air.TPX               = T_stag_0, P_stag_0, dict_oxy                        # [-]       Set the air temperature, pressure and mole fractions
         rho_air               = Air.density                                         # [kg/m**3] Fuel density
         res_air               = ct.Reservoir(Air)                                   # [-]       Create a resevoir for the air upstream of the mixer
@@ -328,4 +328,33 @@ def combustor_model(ct, kinetics_model,oxidizer_model,high_fidelity_kin_mech, di
     m_dot_input_combustor   = m_dot_fuel + m_dot_air                                # [kg/s]    Total mass flow rate entering a single combustor (air + fuel)
     Emission_Index          = Fuel_list[0].Y * (m_dot_input_combustor)/m_dot_fuel   # [-]       Computation of the Emission Index   
 
-    return (Fuel_list[0], Emission_Index)  
\ No newline at end of file
+    return (Fuel_list[0], Emission_Index)
+
+def solution_without_transport(ct, mechanism_file):
+    """
+    Creates a Cantera solution of a kinetics mechanism for one reactor of the network.
+
+    Parameters
+    ----------
+    ct : module
+        Cantera module
+    mechanism_file : str
+        Path of the kinetics mechanism file [-]
+
+    Returns
+    -------
+    solution : cantera.Solution
+        New solution of the mechanism, in the initial state of the mechanism file
+
+    Notes
+    -----
+    The solution is built without a transport model, which the reactor network does not use and
+    whose fitting dominates the time to create a solution of a large mechanism. The species,
+    reactions and states are identical to those of a solution with the transport model of the file.
+    The file is parsed by Cantera, which keeps its parsed contents for the lifetime of the process.
+    Solutions built from cached species and reaction objects are not used, their element order
+    differs from the file and changes the emission indices at the 1e-8 level.
+    """
+    solution = ct.Solution(mechanism_file, transport_model = None)
+    
+    return solution
@@ -8,10 +8,18 @@
 
 # RCAIDE imports
 import RCAIDE 
+from RCAIDE.Framework.Core import Data, update_hash
 from RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.evaluate_cantera import evaluate_cantera 
 
 # package imports    
 import numpy    as np  
+import hashlib
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+# combustor of a training worker process
+CRN_training_worker = Data()
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Train Cantera Model 
@@ -73,10 +81,17 @@ def train_CRN_EI_surrogates(emissions):
     * numpy
     * Cantera 
 
+    With more than one training worker in emissions.settings.number_of_training_workers, the grid
+    points are distributed over a pool of processes. When emissions.settings.training_checkpoint_file
+    is set, the emission indices of the finished grid points are stored in that file every
+    emissions.settings.training_checkpoint_interval seconds and when the training ends or is interrupted,
+    and a training with the same combustor and grid only evaluates the points missing from it.
+
     **Major Assumptions**
 
     * Operating points form a regular grid
     * All combinations of input parameters are valid
+    * The combustor can be pickled
 
     **Theory**
     Training data is generated by:
@@ -137,19 +152,42 @@ def train_CRN_EI_surrogates(emissions):
         emissions.no_combustor = True
         return 
     
-    for p_i in range(len_P):
-        for t_i in range(len_T):
-            for mdot_i in  range(len_mdot):
-                for far_i in  range(len_far):
-                    
-                    # Call cantera 
-                    results = evaluate_cantera(combustor,T[t_i],P[p_i],mdot[mdot_i],FAR[far_i]) 
-                    
-                    EI_CO2[p_i, t_i, mdot_i,far_i] = results.EI_CO2
-                    EI_CO [p_i, t_i, mdot_i,far_i] = results.EI_CO 
-                    EI_H2O[p_i, t_i, mdot_i,far_i] = results.EI_H2O
-                    EI_NO [p_i, t_i, mdot_i,far_i] = results.EI_NO 
-                    EI_NO2[p_i, t_i, mdot_i,far_i] = results.EI_NO2
+    settings        = emissions.settings
+    workers         = settings.number_of_training_workers if 'number_of_training_workers' in settings.keys() else 1
+    checkpoint_file = settings.training_checkpoint_file if 'training_checkpoint_file' in settings.keys() else None
+    interval        = settings.training_checkpoint_interval if 'training_checkpoint_interval' in settings.keys() else 60.
+    
+    # grid points, in the order of the nested loops over P, T, mdot and FAR
+    points = [(p_i, t_i, mdot_i, far_i) for p_i in range(len_P) for t_i in range(len_T) for mdot_i in range(len_mdot) for far_i in range(len_far)]
+    
+    # emission indices of the grid points finished by an earlier training
+    key      = hash_CRN_training_inputs(combustor, P, T, mdot, FAR)
+    finished = load_CRN_training_checkpoint(checkpoint_file, key)
+    
+    conditions = [(point, (T[point[1]], P[point[0]], mdot[point[2]], FAR[point[3]])) for point in points if point not in finished] 
+    last_save  = time.time()
+    try:
+        if workers > 1 and len(conditions) > 1:
+            with ProcessPoolExecutor(max_workers = min(workers,len(conditions)), initializer = initialize_CRN_training_worker, initargs = (combustor,)) as executor:
+                futures = {executor.submit(evaluate_CRN_training_point, condition): point for point, condition in conditions}
+                for future in as_completed(futures):
+                    finished[futures[future]] = future.result()
+                    if time.time() - last_save >= interval:
+                        save_CRN_training_checkpoint(checkpoint_file, key, finished)
+                        last_save = time.time()
+        else:
+            for point, condition in conditions: 
+                finished[point] = evaluate_CRN_training_point(condition, combustor)
+                if time.time() - last_save >= interval:
+                    save_CRN_training_checkpoint(checkpoint_file, key, finished)
+                    last_save = time.time()
+    finally:
+        # the points finished since the last save are kept when the training ends or is interrupted
+        if len(conditions) > 0:
+            save_CRN_training_checkpoint(checkpoint_file, key, finished)
+    
+    for point in points: 
+        EI_CO2[point], EI_CO[point], EI_H2O[point], EI_NO[point], EI_NO2[point] = finished[point]
     
     emissions.training.EI_CO2 = EI_CO2
     emissions.training.EI_CO =  EI_CO
@@ -157,4 +195,115 @@ def train_CRN_EI_surrogates(emissions):
     emissions.training.EI_NO =  EI_NO
     emissions.training.EI_NO2 = EI_NO2
     
-    return 
\ No newline at end of file
+    return
+
+def evaluate_CRN_training_point(condition, combustor = None):
+    """
+    Evaluates the emission indices of one grid point of the surrogate training.
+
+    Parameters
+    ----------
+    condition : tuple
+        Temperature [K], pressure [Pa], air mass flow rate [kg/s] and fuel-to-air ratio [-] of the grid point
+    combustor : Data, optional
+        Combustor of the engine. Without a combustor, the combustor of the training worker process is used
+
+    Returns
+    -------
+    EI : list
+        CO2, CO, H2O, NO and NO2 emission indices of the grid point [kg/kg_fuel]
+    """
+    if combustor is None:
+        combustor = CRN_training_worker.combustor
+        
+    T, P, mdot, FAR = condition
+    results = evaluate_cantera(combustor,T,P,mdot,FAR) 
+    
+    return [results.EI_CO2, results.EI_CO, results.EI_H2O, results.EI_NO, results.EI_NO2]
+
+def initialize_CRN_training_worker(combustor): 
+    """ :meta private:"""
+    CRN_training_worker.combustor = combustor
+    return
+
+def hash_CRN_training_inputs(combustor, P, T, mdot, FAR):
+    """
+    Computes the key of a surrogate training checkpoint, a hash of the combustor and of the training grid.
+
+    Parameters
+    ----------
+    combustor : Data
+        Combustor of the engine
+    P, T, mdot, FAR : ndarray
+        Pressure [Pa], temperature [K], air mass flow rate [kg/s] and fuel-to-air ratio [-] of the grid
+
+    Returns
+    -------
+    key : str
+        Hash of the training inputs
+    """
+    key_hash = hashlib.blake2b(digest_size=20)
+    key_hash.update(RCAIDE.__version__.encode())
+    for data in [combustor, P, T, mdot, FAR]:
+        update_hash(key_hash, data)
+        
+    return key_hash.hexdigest()
+
+def load_CRN_training_checkpoint(checkpoint_file, key):
+    """
+    Loads the emission indices of the finished grid points of a surrogate training checkpoint.
+
+    Parameters
+    ----------
+    checkpoint_file : str or None
+        Path of the checkpoint file, without the .pkl extension. None disables the checkpoint
+    key : str
+        Hash of the training inputs
+
+    Returns
+    -------
+    finished : dict
+        Emission indices of the finished grid points, keyed by the grid indices of the point. A missing or
+        unreadable checkpoint, or a checkpoint of other training inputs, results in an empty dict
+    """
+    if checkpoint_file is None or not os.path.exists(checkpoint_file + '.pkl'):
+        return {}
+    try:
+        checkpoint = RCAIDE.load(checkpoint_file, pickle_format = True)
+    except Exception:
+        return {}
+    if checkpoint.key != key:
+        return {}
+    
+    return dict(checkpoint.finished)
+
+def save_CRN_training_checkpoint(checkpoint_file, key, finished):
+    """
+    Stores the emission indices of the finished grid points of a surrogate training. The file is written
+    under a temporary name and renamed, so an interrupted training never leaves a partial checkpoint.
+
+    Parameters
+    ----------
+    checkpoint_file : str or None
+        Path of the checkpoint file, without the .pkl extension. None disables the checkpoint
+    key : str
+        Hash of the training inputs
+    finished : dict
+        Emission indices of the finished grid points, keyed by the grid indices of the point
+
+    Returns
+    -------
+    None
+    """
+    if checkpoint_file is None:
+        return 
+    
+    checkpoint          = Data()
+    checkpoint.key      = key
+    checkpoint.finished = finished
+    
+    temporary = checkpoint_file + '_' + str(os.getpid())
+    RCAIDE.save(checkpoint, temporary, pickle_format = True)
+    os.replace(temporary + '.pkl', checkpoint_file + '.pkl')
+    
+    return
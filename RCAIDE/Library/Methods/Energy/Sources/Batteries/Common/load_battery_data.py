@@ -0,0 +1,229 @@
+# RCAIDE/Methods/Energy/Sources/Battery/Common/load_battery_data.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core import Data, DataOrdered
+
+# package imports
+import numpy as np
+import json
+import os
+from scipy.interpolate  import RegularGridInterpolator, NearestNDInterpolator
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Shared interpolators
+# ----------------------------------------------------------------------------------------------------------------------
+class Shared_RegularGridInterpolator(RegularGridInterpolator):
+    """ A read-only RegularGridInterpolator shared by all battery modules of a chemistry. Copies of a
+        battery module refer to the same interpolator.
+    """
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self,memo):
+        return self
+
+class Shared_NearestNDInterpolator(NearestNDInterpolator):
+    """ A read-only NearestNDInterpolator shared by all battery modules of a chemistry. Copies of a
+        battery module refer to the same interpolator.
+    """
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self,memo):
+        return self
+
+shared_interpolators = {RegularGridInterpolator : Shared_RegularGridInterpolator,
+                        NearestNDInterpolator   : Shared_NearestNDInterpolator}
+
+# process-wide battery data, keyed by chemistry
+battery_data_cache = {}
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  load_battery_data
+# ----------------------------------------------------------------------------------------------------------------------
+def load_battery_data(chemistry,load_raw_data,create_discharge_performance_map):
+    """Returns the raw data and the discharge performance map of a battery chemistry. Both are built
+    the first time a chemistry is requested and shared by every battery module afterwards, so new
+    battery modules and copies of battery modules do not parse the raw data again.
+
+    Assumptions:
+    The shared data is read-only: its arrays are not writeable and the interpolators are not copied
+    with the battery modules
+
+    Source:
+    N/A
+
+    Inputs:
+    chemistry                          - tag of the cell chemistry                 [string]
+    load_raw_data                      - function returning the raw data           [function]
+    create_discharge_performance_map   - function building the performance map     [function]
+                                         from the raw data
+
+    Outputs:
+    battery_data.
+      raw_data                         - raw data of the chemistry                 [Data]
+      discharge_performance_map        - interpolator(s) of the cell voltage       [Data or interpolator]
+    """
+
+    if chemistry not in battery_data_cache:
+        raw_data     = make_read_only(load_raw_data())
+        battery_data = Data()
+        battery_data.raw_data                  = raw_data
+        battery_data.discharge_performance_map = make_read_only(create_discharge_performance_map(raw_data))
+        battery_data_cache[chemistry]          = battery_data
+
+    return battery_data_cache[chemistry]
+
+def clear_battery_data_cache():
+    """Removes all shared battery data, the next request of a chemistry rebuilds it.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    None
+
+    Outputs:
+    None
+    """
+    battery_data_cache.clear()
+
+    return
+
+def make_read_only(data):
+    """Makes the arrays of a battery data structure non-writeable and converts its interpolators into
+    shared interpolators.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    data  - raw data or performance map          [Data, array or interpolator]
+
+    Outputs:
+    data  - read-only data                       [Data, array or interpolator]
+    """
+    if isinstance(data,dict):
+        for key,value in data.items():
+            data[key] = make_read_only(value)
+    elif isinstance(data,np.ndarray):
+        data.flags.writeable = False
+    elif type(data) in shared_interpolators:
+        data.__class__ = shared_interpolators[type(data)]
+        for value in vars(data).values():
+            if isinstance(value,np.ndarray):
+                value.flags.writeable = False
+    return data
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Binary raw data
+# ----------------------------------------------------------------------------------------------------------------------
+def save_battery_raw_data(raw_data,filename):
+    """Saves raw battery data in the binary .npz format. All numbers are stored in one array next to
+    the nested structure of the data, so load_battery_raw_data returns the same Data and DataOrdered
+    containers with a single read.
+
+    Assumptions:
+    The leaves of the raw data are numbers or numeric arrays
+
+    Source:
+    N/A
+
+    Inputs:
+    raw_data  - raw data of a battery chemistry  [Data]
+    filename  - path of the .npz file            [string]
+
+    Outputs:
+    None
+    """
+    arrays    = []
+    structure = flatten_raw_data(raw_data,arrays,[0])
+    values    = np.hstack([np.ravel(array).astype(float) for array in arrays]) if arrays else np.zeros(0)
+    np.savez(filename,values=values,structure=json.dumps(structure))
+
+    return
+
+def load_battery_raw_data(filename):
+    """Loads raw battery data saved with save_battery_raw_data
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    filename  - path of the .npz file            [string]
+
+    Outputs:
+    raw_data  - raw data of a battery chemistry  [Data]
+    """
+    with np.load(filename) as npz:
+        structure = json.loads(str(npz['structure']))
+        values    = npz['values']
+
+    return unflatten_raw_data(structure,values)
+
+def load_raw_data_file(res_filename,load_function):
+    """Loads raw battery data from the binary copy of a results file when it is present and newer
+    than the results file, otherwise with load_function.
+
+    Assumptions:
+    The binary copy has the name of the results file with a .npz extension
+
+    Source:
+    N/A
+
+    Inputs:
+    res_filename   - path of the results file                 [string]
+    load_function  - function loading the results file        [function]
+
+    Outputs:
+    raw_data       - raw data of a battery chemistry          [Data]
+    """
+    npz_filename = os.path.splitext(res_filename)[0] + '.npz'
+    if os.path.exists(npz_filename) and os.path.getmtime(npz_filename) >= os.path.getmtime(res_filename):
+        return load_battery_raw_data(npz_filename)
+
+    return load_function(res_filename)
+
+def flatten_raw_data(data,arrays,size):
+    """ :meta private:"""
+    if isinstance(data,dict):
+        return [type(data).__name__,[[key,flatten_raw_data(value,arrays,size)] for key,value in data.items()]]
+    array    = np.asarray(data)
+    start    = size[0]
+    size[0] += array.size
+    arrays.append(array)
+    return {'start':start,'shape':array.shape,'dtype':array.dtype.str}
+
+def unflatten_raw_data(structure,values):
+    """ :meta private:"""
+    if isinstance(structure,dict):
+        shape = tuple(structure['shape'])
+        start = structure['start']
+        array = values[start:start + int(np.prod(shape))].astype(np.dtype(structure['dtype'])).reshape(shape)
+        if array.ndim == 0:
+            return array.item()
+        return array
+    kind,items = structure
+    if kind == 'DataOrdered':
+        data = DataOrdered()
+    elif kind == 'Data':
+        data = Data()
+    else:
+        data = {}
+    for key,value in items:
+        data[key] = unflatten_raw_data(value,values)
+    return data
@@ -2,11 +2,13 @@
 # 
 # 
 # Created: Nov 2024, S. Shekar
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 from RCAIDE.Framework.Core import Units
+from RCAIDE.Framework.Mission.Common import share_conditions
 import numpy as np  
 from copy import deepcopy
 
@@ -37,8 +39,6 @@ def compute_lfp_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     # ---------------------------------------------------------------------------------    
     # battery cell properties
     # --------------------------------------------------------------------------------- 
-    electrode_area            = battery_module.cell.electrode_area 
-    As_cell                   = battery_module.cell.surface_area
     cell_mass                 = battery_module.cell.mass    
     Cp                        = battery_module.cell.specific_heat_capacity       
     battery_module_data       = battery_module.cell.discharge_performance_map
@@ -121,11 +121,7 @@ def compute_lfp_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     # Compute battery_module cell temperature 
     # ---------------------------------------------------------------------------------
     # Determine temperature increase         
-    sigma                 =  130  
-    i_cell                = I_cell[t_idx]/electrode_area # current intensity (A/m²)
-    q_dot_entropy         = (4.6810 * SOC_cell[t_idx]**4 + (-8.3729) * SOC_cell[t_idx]**3 + 3.7197 * SOC_cell[t_idx]**2 + 0.4356 * SOC_cell[t_idx]+ (-0.3027)) # Obtained from curve fitting the dUdt curve  
-    q_dot_joule           = (i_cell**2)/(sigma)          
-    Q_heat_cell[t_idx]    = (q_dot_joule + q_dot_entropy)*As_cell 
+    Q_heat_cell[t_idx]    = compute_lfp_cell_heat_generation(battery_module,SOC_cell[t_idx],I_cell[t_idx])
     Q_heat_module[t_idx]  = Q_heat_cell[t_idx]*n_total  
     V_ul_cell[t_idx]      = compute_lfp_cell_state(battery_module,battery_module_data,SOC_cell[t_idx],T_cell[t_idx],abs(I_cell[t_idx])) 
  
@@ -167,6 +163,181 @@ def compute_lfp_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     stored_battery_tag     = battery_module.tag  
         
     return stored_results_flag, stored_battery_tag
+def compute_lfp_cell_performance_batch(battery_module,state,bus,delta_t): 
+    """
+       Computes the performance of a lithium iron phosphate (LFP) battery_module cell at all control
+       points of a segment at once. This is the batched form of compute_lfp_cell_performance for
+       battery_modules without a thermal management system. Only the temperature, energy and state of
+       charge are marched from one control point to the next, every other quantity is computed for all
+       control points with array operations and a single look-up of the discharge performance map. The
+       charge throughput is a cumulative sum of the cell current.
+    
+       Assumptions: 
+        - All battery_module modules exhibit the same thermal behavior.
+        - The cell temperature is assumed to be the temperature of the entire module.
+        - The battery_module is thermally insulated (no thermal management system).
+        - All battery_modules on the bus are identical and the bus is not recharging.
+       
+       Source:
+       N/A
+       
+       Inputs:
+         battery_module       - battery_module                      [unitless]
+         state                - state of the segment                [unitless]
+         bus                  - electrical bus                      [unitless]
+         delta_t              - time steps between control points   [seconds]
+       
+       Outputs:
+         stored_results_flag  - flag indicating results were stored [boolean]
+         stored_battery_tag   - tag of the battery_module           [string]
+    """ 
+    # ---------------------------------------------------------------------------------    
+    # battery cell properties
+    # --------------------------------------------------------------------------------- 
+    cell_mass                 = battery_module.cell.mass    
+    Cp                        = battery_module.cell.specific_heat_capacity       
+    battery_module_data       = battery_module.cell.discharge_performance_map
+    
+    # ---------------------------------------------------------------------------------
+    # Compute Bus electrical properties 
+    # ---------------------------------------------------------------------------------    
+    bus_conditions              = state.conditions.energy[bus.tag]
+    bus_config                  = bus.battery_module_electric_configuration
+    E_bus                       = bus_conditions.energy
+    P_bus                       = bus_conditions.power_draw
+    I_bus                       = bus_conditions.current_draw
+    
+    # ---------------------------------------------------------------------------------
+    # Compute battery_module Conditions
+    # -------------------------------------------------------------------------    
+    battery_module_conditions = state.conditions.energy[bus.tag].battery_modules[battery_module.tag]  
+   
+    E_module_max       = battery_module.maximum_energy * battery_module_conditions.cell.capacity_fade_factor
+  
+    P_module           = battery_module_conditions.power
+    P_cell             = battery_module_conditions.cell.power
+    
+    Q_heat_module      = battery_module_conditions.heat_energy_generated
+    Q_heat_cell        = battery_module_conditions.cell.heat_energy_generated
+    
+    V_ul_module        = battery_module_conditions.voltage_under_load
+    V_ul_cell          = battery_module_conditions.cell.voltage_under_load
+    
+    I_module           = battery_module_conditions.current 
+    I_cell             = battery_module_conditions.cell.current
+    
+    T_module           = battery_module_conditions.temperature                 
+    T_cell             = battery_module_conditions.cell.temperature
+    
+    SOC_cell           = battery_module_conditions.cell.state_of_charge  
+    SOC_module         = battery_module_conditions.state_of_charge
+    E_cell             = battery_module_conditions.cell.energy   
+    E_module           = battery_module_conditions.energy
+    Q_cell             = battery_module_conditions.cell.charge_throughput              
+    DOD_cell           = battery_module_conditions.cell.depth_of_discharge
+    
+    # ---------------------------------------------------------------------------------
+    # Compute battery_module electrical properties 
+    # -------------------------------------------------------------------------    
+    n_series          = battery_module.electrical_configuration.series
+    n_parallel        = battery_module.electrical_configuration.parallel 
+    n_total           = n_series * n_parallel
+    no_modules        = bus.number_of_battery_modules
+    n_bus_modules     = len(bus.battery_modules)
+    n_cpts            = state.numerics.number_of_control_points
+
+    # ---------------------------------------------------------------------------------------------------
+    # Current at all control points 
+    # ---------------------------------------------------------------------------------------------------
+    if bus_config == 'Series':
+        I_module[:]      = I_bus
+    elif bus_config  == 'Parallel':
+        I_module[:]      = I_bus / bus.number_of_battery_modules
+
+    I_cell[:] = I_module / n_parallel   
+
+    # ---------------------------------------------------------------------------------------------------     
+    # March the temperature, energy and state of charge through the control points  
+    # --------------------------------------------------------------------------------------------------- 
+    T          = T_cell[:,0]
+    SOC        = SOC_cell[:,0]
+    I          = I_cell[:,0]
+    P          = P_bus[:,0]/no_modules
+    E          = np.zeros(n_cpts)
+    E[0]       = E_bus[0,0]/no_modules
+    E_cap      = float(np.float32(E_module_max))
+    for t_idx in range(n_cpts-1):
+        Q_heat       = compute_lfp_cell_heat_generation(battery_module,SOC[t_idx],I[t_idx])
+        
+        # Considers a thermally insulated system and the heat piles on in the system
+        T[t_idx+1]   = T[t_idx] + Q_heat/(cell_mass*Cp)*delta_t[t_idx]
+        
+        # Compute state of charge of the battery_module
+        E_next       = float(np.float32(E[t_idx] - (P[t_idx] - abs(Q_heat*n_total))*delta_t[t_idx]))
+        if E_next > E_module_max:
+            E_next = E_cap 
+        SOC_next     = E_next/E_module_max
+        if SOC_next > 1:
+            SOC_next = 1.
+        elif SOC_next < 0:
+            SOC_next = 0.
+        SOC[t_idx+1] = SOC_next
+        E[t_idx+1]   = sum([E_next]*n_bus_modules)/no_modules
+
+    # ---------------------------------------------------------------------------------
+    # Compute battery_module cell performance at all control points  
+    # ---------------------------------------------------------------------------------
+    Q_heat_cell[:]             = compute_lfp_cell_heat_generation(battery_module,SOC_cell,I_cell)
+    Q_heat_module[:]           = Q_heat_cell*n_total  
+    V_ul_cell[:]               = compute_lfp_cell_state(battery_module,battery_module_data,SOC_cell,T_cell,abs(I_cell)) 
+ 
+    # Effective Power flowing through battery_module 
+    P_module[:]                = P_bus /no_modules  - np.abs(Q_heat_module) 
+
+    # store remaining variables  
+    V_ul_module[:]             = V_ul_cell*n_series  
+    T_module[:]                = T_cell   # Assume the cell temperature is the temperature of the module
+    P_cell[:]                  = P_module/n_total 
+    E_module[:,0]              = E 
+    E_cell[:]                  = E_module/n_total  
+    DOD_cell[1:]               = 1 - SOC_cell[1:]  
+    SOC_module[1:]             = SOC_cell[1:]
+    
+    # Determine new charge throughput (the amount of charge gone through the battery)
+    Q_cell[:,0]                = np.cumsum(np.hstack((Q_cell[0,0],abs(I_cell[:-1,0])*delta_t/Units.hr)))
+        
+    stored_results_flag     = True
+    stored_battery_tag      = battery_module.tag  
+        
+    return stored_results_flag, stored_battery_tag
+
+def compute_lfp_cell_heat_generation(battery_module,SOC,I):
+    """Computes the heat generated by an LFP cell from the joule heating and the entropy change
+    of the cell. Works on floats and arrays alike.
+     
+    Assumtions: 
+    N/A
+    
+    Source:  
+    N/A 
+     
+    Inputs:
+        battery_module - battery_module                     [unitless]
+        SOC            - state of charge of cell            [unitless]
+        I              - battery_module cell current        [Amperes]
+    
+    Outputs:  
+        Q_heat         - heat generated by the cell         [Watts] 
+        
+    """ 
+    sigma                 =  130  
+    i_cell                = I/battery_module.cell.electrode_area # current intensity (A/m²)
+    q_dot_entropy         = (4.6810 * SOC**4 + (-8.3729) * SOC**3 + 3.7197 * SOC**2 + 0.4356 * SOC+ (-0.3027)) # Obtained from curve fitting the dUdt curve  
+    q_dot_joule           = (i_cell**2)/(sigma)          
+    Q_heat                = (q_dot_joule + q_dot_entropy)*battery_module.cell.surface_area 
+    
+    return Q_heat
+
 def reuse_stored_lfp_cell_data(battery_module,state,bus,coolant_lines, t_idx, delta_t,stored_results_flag, stored_battery_tag):
     '''Reuses results from one propulsor for identical batteries
     
@@ -185,7 +356,8 @@ def reuse_stored_lfp_cell_data(battery_module,state,bus,coolant_lines, t_idx, de
     N.A.        
     '''
    
-    state.conditions.energy[bus.tag].battery_modules[battery_module.tag] = deepcopy(state.conditions.energy[bus.tag].battery_modules[stored_battery_tag])      
+    copy_conditions                                                      = share_conditions if bus.share_identical_battery_module_conditions else deepcopy
+    state.conditions.energy[bus.tag].battery_modules[battery_module.tag] = copy_conditions(state.conditions.energy[bus.tag].battery_modules[stored_battery_tag])      
     return
 
 
@@ -7,5 +7,5 @@
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
-from .compute_nmc_cell_performance   import compute_nmc_cell_performance, reuse_stored_nmc_cell_data
+from .compute_nmc_cell_performance   import compute_nmc_cell_performance, compute_nmc_cell_performance_batch, reuse_stored_nmc_cell_data
 from .update_nmc_cell_age            import update_nmc_cell_age
\ No newline at end of file
@@ -3,11 +3,13 @@
 # 
 # Created:  Feb 2024, M. Clarke
 # Modified: Sep 2024, S. Shekar
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
 # ----------------------------------------------------------------------------------------------------------------------
 from RCAIDE.Framework.Core                       import Units 
+from RCAIDE.Framework.Mission.Common             import share_conditions
 import numpy as np
 from copy import  deepcopy
  
@@ -108,8 +110,6 @@ def compute_nmc_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     # ---------------------------------------------------------------------------------    
     # battery cell properties
     # --------------------------------------------------------------------------------- 
-    electrode_area            = battery_module.cell.electrode_area 
-    As_cell                   = battery_module.cell.surface_area
     cell_mass                 = battery_module.cell.mass    
     Cp                        = battery_module.cell.specific_heat_capacity       
     battery_module_data       = battery_module.cell.discharge_performance_map
@@ -197,16 +197,7 @@ def compute_nmc_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     R_0_cell[t_idx][R_0_cell[t_idx]<0]  = 0. 
 
     # Determine temperature increase         
-    sigma                 = 139 # Electrical conductivity
-    n                     = 1
-    F                     = 96485 # C/mol Faraday constant    
-    delta_S               = -496.66*(SOC_cell[t_idx])**6 +  1729.4*(SOC_cell[t_idx])**5 + -2278 *(SOC_cell[t_idx])**4 +  1382.2 *(SOC_cell[t_idx])**3 + \
-                            -380.47*(SOC_cell[t_idx])**2 +  46.508*(SOC_cell[t_idx])  + -10.692  
-
-    i_cell                = I_cell[t_idx]/electrode_area # current intensity
-    q_dot_entropy         = -(T_cell[t_idx])*delta_S*i_cell/(n*F)       
-    q_dot_joule           = (i_cell**2)*(battery_module_conditions.cell.resistance_growth_factor)/(sigma)          
-    Q_heat_cell[t_idx]    = (q_dot_joule + q_dot_entropy)*As_cell 
+    Q_heat_cell[t_idx]    = compute_nmc_cell_heat_generation(battery_module,SOC_cell[t_idx],T_cell[t_idx],I_cell[t_idx],battery_module_conditions.cell.resistance_growth_factor)
     Q_heat_module[t_idx]  = Q_heat_cell[t_idx]*n_total  
 
     V_ul_cell[t_idx]      = compute_nmc_cell_state(battery_module_data,SOC_cell[t_idx],T_cell[t_idx],abs(I_cell[t_idx])) 
@@ -256,6 +247,222 @@ def compute_nmc_cell_performance(battery_module,state,bus,coolant_lines,t_idx, d
     return stored_results_flag, stored_battery_module_tag
 
 
+def compute_nmc_cell_performance_batch(battery_module,state,bus,delta_t):
+    """
+    Compute the performance of a lithium-nickel-manganese-cobalt-oxide (NMC) battery_module cell
+    at all control points of a segment at once.
+
+    This is the batched form of compute_nmc_cell_performance for battery_modules without a thermal
+    management system. Only the temperature, energy and state of charge are marched from one control
+    point to the next, every other quantity (currents, internal resistance, heat generation, voltages,
+    powers) is computed for all control points with array operations and a single look-up of the
+    discharge performance map. The charge throughput is a cumulative sum of the cell current.
+
+    Parameters
+    ----------
+    battery_module : battery_module
+        The battery_module object containing cell properties and configuration.
+    state : MissionState
+        The current state of the mission.
+    bus : ElectricBus
+        The electric bus to which the battery_module is connected.
+    delta_t : array
+        Time step sizes between control points.
+
+    Returns
+    -------
+    tuple
+        A tuple containing:
+        - stored_results_flag (bool): Flag indicating if results were stored.
+        - stored_battery_module_tag (str): Tag of the battery_module for which results were stored.
+
+    Notes
+    -----
+    The bus energy is marched together with the battery_module energy assuming all battery_modules on
+    the bus are identical, the bus conditions are computed afterwards with compute_bus_conditions.
+
+    Assumptions
+    -----------
+    - All battery_module modules exhibit the same thermal behavior.
+    - The cell temperature is assumed to be the temperature of the entire module.
+    - The battery_module is thermally insulated (no thermal management system).
+    - The bus is not recharging.
+    """
+
+    # ---------------------------------------------------------------------------------    
+    # battery cell properties
+    # --------------------------------------------------------------------------------- 
+    cell_mass                 = battery_module.cell.mass    
+    Cp                        = battery_module.cell.specific_heat_capacity       
+    battery_module_data       = battery_module.cell.discharge_performance_map
+    
+    # ---------------------------------------------------------------------------------
+    # Compute Bus electrical properties 
+    # ---------------------------------------------------------------------------------    
+    bus_conditions              = state.conditions.energy[bus.tag]
+    bus_config                  = bus.battery_module_electric_configuration
+    E_bus                       = bus_conditions.energy
+    P_bus                       = bus_conditions.power_draw
+    I_bus                       = bus_conditions.current_draw
+    
+    # ---------------------------------------------------------------------------------
+    # Compute battery_module Conditions
+    # -------------------------------------------------------------------------    
+    battery_module_conditions = state.conditions.energy[bus.tag].battery_modules[battery_module.tag]  
+   
+    E_module_max       = battery_module.maximum_energy * battery_module_conditions.cell.capacity_fade_factor
+    
+    V_oc_module        = battery_module_conditions.voltage_open_circuit
+    V_oc_cell          = battery_module_conditions.cell.voltage_open_circuit   
+  
+    P_module           = battery_module_conditions.power
+    P_cell             = battery_module_conditions.cell.power
+    
+    R_0_module         = battery_module_conditions.internal_resistance
+    R_0_cell           = battery_module_conditions.cell.internal_resistance
+    
+    Q_heat_module      = battery_module_conditions.heat_energy_generated
+    Q_heat_cell        = battery_module_conditions.cell.heat_energy_generated
+    
+    V_ul_module        = battery_module_conditions.voltage_under_load
+    V_ul_cell          = battery_module_conditions.cell.voltage_under_load
+    
+    I_module           = battery_module_conditions.current 
+    I_cell             = battery_module_conditions.cell.current
+    
+    T_module           = battery_module_conditions.temperature                 
+    T_cell             = battery_module_conditions.cell.temperature
+    
+    SOC_cell           = battery_module_conditions.cell.state_of_charge  
+    SOC_module         = battery_module_conditions.state_of_charge
+    E_cell             = battery_module_conditions.cell.energy   
+    E_module           = battery_module_conditions.energy
+    Q_cell             = battery_module_conditions.cell.charge_throughput              
+    DOD_cell           = battery_module_conditions.cell.depth_of_discharge
+    
+    # ---------------------------------------------------------------------------------
+    # Compute battery_module electrical properties 
+    # -------------------------------------------------------------------------    
+    n_series          = battery_module.electrical_configuration.series
+    n_parallel        = battery_module.electrical_configuration.parallel 
+    n_total           = n_series*n_parallel 
+    no_modules        = bus.number_of_battery_modules
+    n_bus_modules     = len(bus.battery_modules)
+    n_cpts            = state.numerics.number_of_control_points
+    growth_factor     = battery_module_conditions.cell.resistance_growth_factor
+
+    # ---------------------------------------------------------------------------------------------------
+    # Current at all control points 
+    # ---------------------------------------------------------------------------------------------------
+    if bus_config == 'Series':
+        I_module[:]      = I_bus
+    elif bus_config  == 'Parallel':
+        I_module[:]      = I_bus / bus.number_of_battery_modules
+
+    I_cell[:] = I_module / n_parallel   
+
+    # ---------------------------------------------------------------------------------------------------     
+    # March the temperature, energy and state of charge through the control points  
+    # --------------------------------------------------------------------------------------------------- 
+    T          = T_cell[:,0]
+    SOC        = SOC_cell[:,0]
+    I          = I_cell[:,0]
+    P          = P_bus[:,0]/no_modules
+    E          = np.zeros(n_cpts)
+    E[0]       = E_bus[0,0]/no_modules
+    E_cap      = float(np.float32(E_module_max))
+    for t_idx in range(n_cpts-1):
+        Q_heat       = compute_nmc_cell_heat_generation(battery_module,SOC[t_idx],T[t_idx],I[t_idx],growth_factor)
+        
+        # temperature limits of the discharge performance map
+        T_t          = T[t_idx]
+        if np.isnan(T_t):
+            T_t = 302.65
+        T_t          = min(max(T_t,272.65),322.65)
+        
+        # Considers a thermally insulated system and the heat piles on in the system
+        T[t_idx+1]   = T_t + Q_heat/(cell_mass*Cp)*delta_t[t_idx]
+        
+        # Compute state of charge of the battery_module
+        E_next       = E[t_idx] - (P[t_idx] - abs(Q_heat*n_total))*delta_t[t_idx]
+        if E_next > E_module_max:
+            E_next = E_cap 
+        SOC_next     = E_next/E_module_max
+        if SOC_next > 1:
+            SOC_next = 1.
+        elif SOC_next < 0:
+            SOC_next = 0.
+        SOC[t_idx+1] = SOC_next
+        E[t_idx+1]   = sum([E_next]*n_bus_modules)/no_modules
+
+    # ---------------------------------------------------------------------------------
+    # Compute battery_module cell performance at all control points  
+    # ---------------------------------------------------------------------------------
+    R_0_cell[:]                = (0.01483*(SOC_cell**2) - 0.02518*SOC_cell + 0.1036) *growth_factor  
+    R_0_cell[R_0_cell<0]       = 0. 
+    Q_heat_cell[:]             = compute_nmc_cell_heat_generation(battery_module,SOC_cell,T_cell,I_cell,growth_factor)
+    Q_heat_module[:]           = Q_heat_cell*n_total  
+
+    V_ul_cell[:]               = compute_nmc_cell_state(battery_module_data,SOC_cell,T_cell,abs(I_cell)) 
+    V_oc_cell[:]               = V_ul_cell + (abs(I_cell) * R_0_cell)              
+
+    # Effective Power flowing through battery_module 
+    P_module[:]                = P_bus /no_modules  - np.abs(Q_heat_module) 
+
+    # store remaining variables 
+    V_oc_module[:]             = V_oc_cell*n_series 
+    V_ul_module[:]             = V_ul_cell*n_series  
+    T_module[:]                = T_cell   # Assume the cell temperature is the temperature of the module
+    P_cell[:]                  = P_module/n_total 
+    E_module[:,0]              = E 
+    E_cell[:]                  = E_module/n_total  
+    DOD_cell[1:]               = 1 - SOC_cell[1:]  
+    SOC_module[1:]             = SOC_cell[1:]
+
+    # Determine new charge throughput (the amount of charge gone through the battery_module)
+    Q_cell[:,0]                = np.cumsum(np.hstack((Q_cell[0,0],abs(I_cell[:-1,0])*delta_t/Units.hr)))
+        
+    stored_results_flag        = True
+    stored_battery_module_tag  = battery_module.tag  
+        
+    return stored_results_flag, stored_battery_module_tag
+
+def compute_nmc_cell_heat_generation(battery_module,SOC,T,I,resistance_growth_factor):
+    """Computes the heat generated by an NMC cell from the joule heating and the entropy change
+    of the cell. Works on floats and arrays alike.
+     
+    Assumtions: 
+    N/A
+    
+    Source:  
+    Jeon, Dong Hyup, and Seung Man Baek. "Thermal modeling of cylindrical lithium ion 
+    battery_module during discharge cycle." Energy Conversion and Management 52.8-9 (2011): 
+    2973-2981.
+     
+    Inputs:
+        battery_module           - battery_module                     [unitless]
+        SOC                      - state of charge of cell            [unitless]
+        T                        - battery_module cell temperature    [Kelvin]
+        I                        - battery_module cell current        [Amperes]
+        resistance_growth_factor - resistance growth factor of cell   [unitless]
+    
+    Outputs:  
+        Q_heat                   - heat generated by the cell         [Watts] 
+        
+    """ 
+    sigma                 = 139 # Electrical conductivity
+    n                     = 1
+    F                     = 96485 # C/mol Faraday constant    
+    delta_S               = -496.66*(SOC)**6 +  1729.4*(SOC)**5 + -2278 *(SOC)**4 +  1382.2 *(SOC)**3 + \
+                            -380.47*(SOC)**2 +  46.508*(SOC)  + -10.692  
+
+    i_cell                = I/battery_module.cell.electrode_area # current intensity
+    q_dot_entropy         = -(T)*delta_S*i_cell/(n*F)       
+    q_dot_joule           = (i_cell**2)*(resistance_growth_factor)/(sigma)          
+    Q_heat                = (q_dot_joule + q_dot_entropy)*battery_module.cell.surface_area 
+    
+    return Q_heat
+
 def reuse_stored_nmc_cell_data(battery_module,state,bus,coolant_lines, t_idx, delta_t,stored_results_flag, stored_battery_module_tag):
     '''Reuses results from one propulsor for identical batteries
     
@@ -274,7 +481,8 @@ def reuse_stored_nmc_cell_data(battery_module,state,bus,coolant_lines, t_idx, de
     N.A.        
     '''
    
-    state.conditions.energy[bus.tag].battery_modules[battery_module.tag] = deepcopy(state.conditions.energy[bus.tag].battery_modules[stored_battery_module_tag])
+    copy_conditions                                                      = share_conditions if bus.share_identical_battery_module_conditions else deepcopy
+    state.conditions.energy[bus.tag].battery_modules[battery_module.tag] = copy_conditions(state.conditions.energy[bus.tag].battery_modules[stored_battery_module_tag])
     
         
     return
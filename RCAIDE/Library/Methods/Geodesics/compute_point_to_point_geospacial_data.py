@@ -8,7 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------  
 import RCAIDE
 from RCAIDE.Framework.Core import Units 
-from scipy.interpolate import griddata
+from RCAIDE.Library.Methods.Geodesics.load_topography import load_topography, compute_topography_elevation
 import numpy as np
 
 # ----------------------------------------------------------------------
@@ -43,10 +43,9 @@ def compute_point_to_point_geospacial_data(settings):
     destination_coordinates = np.asarray(settings.aircraft_destination_coordinates)
     
     # extract data from file 
-    data  = np.loadtxt(settings.topography_file)
-    Long  = data[:,0]
-    Lat   = data[:,1]
-    Elev  = data[:,2] 
+    topography = load_topography(settings.topography_file)
+    Long       = topography.longitude
+    Lat        = topography.latitude
 
     x_min_coord = np.min(Lat)
     y_min_coord = np.min(Long)
@@ -74,8 +73,8 @@ def compute_point_to_point_geospacial_data(settings):
     origin_coordinates[lat_flag]  = origin_coordinates[lat_flag] + 360 
     long_flag            = np.where(destination_coordinates<0)[0]
     destination_coordinates[long_flag] = destination_coordinates[long_flag] + 360 
-    z0                   = griddata((Lat,Long), Elev, (np.array([origin_coordinates[0]]),np.array([origin_coordinates[1]])), method='nearest')[0]
-    z1                   = griddata((Lat,Long), Elev, (np.array([destination_coordinates[0]]),np.array([destination_coordinates[1]])), method='nearest')[0] 
+    z0                   = compute_topography_elevation(topography, np.array([origin_coordinates[0]]),np.array([origin_coordinates[1]]), method='nearest')[0]
+    z1                   = compute_topography_elevation(topography, np.array([destination_coordinates[0]]),np.array([destination_coordinates[1]]), method='nearest')[0] 
     dep_loc              = np.array([x0,y0,z0])
     des_loc              = np.array([x1,y1,z1])
     
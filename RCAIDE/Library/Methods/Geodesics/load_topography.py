@@ -0,0 +1,117 @@
+# RCAIDE/Library/Methods/Geodesics/load_topography.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+from RCAIDE.Framework.Core import Data
+from scipy.interpolate import LinearNDInterpolator, NearestNDInterpolator
+import numpy as np
+import os
+
+# parsed topography files, keyed by the path, modification time and size of the file
+topography_cache = {}
+
+# ----------------------------------------------------------------------
+#  Load Topography
+# ---------------------------------------------------------------------
+def load_topography(topography_file):
+    """Parses a topography file and keeps it in a cache so that later segments and analyses with the same
+    file reuse the parsed points and the elevation interpolators built on them.
+
+    Assumptions:
+        topography_file is a text file obtained from https://topex.ucsd.edu/cgi-bin/get_data.cgi
+        A file that is modified on disk is parsed again
+
+    Source:
+        N/A
+
+    Inputs:
+        topography_file      - file of longitude, latitude and elevation points          [-]
+
+    Outputs:
+        topography.
+            longitude        - longitude of the points                                   [degrees]
+            latitude         - latitude of the points                                    [degrees]
+            elevation        - elevation of the points                                   [meters]
+            points           - latitude and longitude of the points                      [degrees]
+            interpolators    - elevation interpolators built by compute_topography_elevation [-]
+
+    Properties Used:
+        N/A
+    """
+    path = os.path.abspath(topography_file)
+    stat = os.stat(path)
+    key  = (path, stat.st_mtime_ns, stat.st_size)
+
+    if key not in topography_cache:
+        data                     = np.loadtxt(path)
+        topography               = Data()
+        topography.longitude     = data[:,0]
+        topography.latitude      = data[:,1]
+        topography.elevation     = data[:,2]
+        topography.points        = np.column_stack((topography.latitude,topography.longitude))
+        topography.interpolators = Data()
+
+        # drop older versions of the same file
+        for old_key in [k for k in topography_cache.keys() if k[0] == path]:
+            del topography_cache[old_key]
+        topography_cache[key] = topography
+
+    return topography_cache[key]
+
+def compute_topography_elevation(topography, latitude, longitude, method = 'linear'):
+    """Interpolates the elevation of a topography. The linear interpolation uses a Delaunay triangulation
+    and the nearest interpolation a KD-tree of the topography points, both built once per topography. The
+    values are the same as scipy.interpolate.griddata on the topography points.
+
+    Assumptions:
+        Points outside of the topography have a linear elevation of nan
+
+    Source:
+        N/A
+
+    Inputs:
+        topography           - output of load_topography                                 [-]
+        latitude             - latitude of the evaluation points                         [degrees]
+        longitude            - longitude of the evaluation points                        [degrees]
+        method               - 'linear' or 'nearest'                                     [-]
+
+    Outputs:
+        elevation            - elevation of the evaluation points                        [meters]
+
+    Properties Used:
+        N/A
+    """
+    if method not in topography.interpolators:
+        if method == 'linear':
+            topography.interpolators[method] = LinearNDInterpolator(topography.points, topography.elevation)
+        elif method == 'nearest':
+            topography.interpolators[method] = NearestNDInterpolator(topography.points, topography.elevation)
+        else:
+            raise ValueError('Unknown topography interpolation method ' + str(method))
+
+    return topography.interpolators[method]((latitude, longitude))
+
+def clear_topography_cache():
+    """ Removes all parsed topography files from the cache
+
+    Assumptions:
+        None
+
+    Source:
+        N/A
+
+    Inputs:
+        None
+
+    Outputs:
+        None
+
+    Properties Used:
+        N/A
+    """
+    topography_cache.clear()
+    return
@@ -18,4 +18,5 @@ from .compute_noise_source_coordinates                   import compute_rotor_po
 from .generate_zero_elevation_microphone_locations       import generate_zero_elevation_microphone_locations
 from .generate_terrain_microphone_locations              import generate_terrain_microphone_locations
 from .generate_hemisphere_microphone_locations           import generate_hemisphere_microphone_locations
-from .compute_relative_noise_evaluation_locations        import compute_relative_noise_evaluation_locations 
\ No newline at end of file
+from .compute_relative_noise_evaluation_locations        import compute_relative_noise_evaluation_locations 
+from .compute_microphone_chunks                          import compute_microphone_chunks
\ No newline at end of file
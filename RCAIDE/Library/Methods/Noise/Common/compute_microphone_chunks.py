@@ -0,0 +1,36 @@
+# RCAIDE/Methods/Noise/Common/compute_microphone_chunks.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  compute_microphone_chunks
+# ----------------------------------------------------------------------------------------------------------------------
+def compute_microphone_chunks(n_mic, bytes_per_microphone, memory):
+    """This splits the microphones of a noise evaluation into consecutive blocks so that the arrays
+    of one block do not exceed a memory budget.
+
+    Assumptions:
+        At least one microphone is evaluated per block
+
+    Source:
+        N/A
+
+    Inputs:
+        n_mic                - number of microphones                                  [unitless]
+        bytes_per_microphone - memory of the arrays of one microphone                 [bytes]
+        memory               - memory budget of a block, None evaluates all at once   [bytes]
+
+    Outputs:
+        chunks               - slices of the microphones of each block                [unitless]
+
+    Properties Used:
+        N/A
+    """
+    if memory is None:
+        return [slice(0,n_mic)]
+
+    n_chunk = int(max(1,min(n_mic,memory // max(bytes_per_microphone,1))))
+    chunks  = [slice(i,min(i + n_chunk,n_mic)) for i in range(0,n_mic,n_chunk)]
+
+    return chunks
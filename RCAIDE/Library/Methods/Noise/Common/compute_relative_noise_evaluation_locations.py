@@ -50,22 +50,18 @@ def compute_relative_noise_evaluation_locations(settings,microphone_locations, s
     noise_pos[:,2]    = np.interp(noise_time,time,pos[:,2])
     
     num_gm_mic        = len(microphone_locations)  
-    RML               = np.zeros((N,num_gm_mic,3)) 
-    PHI               = np.zeros((N,num_gm_mic))
-    THETA             = np.zeros((N,num_gm_mic)) 
     
-    for cpt in range(N):  
-        relative_locations         = np.zeros((num_gm_mic,3))
-        relative_locations[:,0]    = microphone_locations[:,0] - (settings.aircraft_origin_location[0] + noise_pos[cpt,0])    
-        relative_locations[:,1]    = microphone_locations[:,1] - (settings.aircraft_origin_location[1] + noise_pos[cpt,1]) 
-        if MSL_altitude:
-            relative_locations[:,2]    = -(noise_pos[cpt,2])  - microphone_locations[:,2] 
-        else:
-            relative_locations[:,2]    = -(noise_pos[cpt,2])
-            
-        RML[cpt,:,:]   = relative_locations 
-        PHI[cpt,:]     =  np.arctan2(np.sqrt(np.square(relative_locations[:, 0]) + np.square(relative_locations[:, 1])),  relative_locations[:, 2])  
-        THETA[cpt,:]   =  np.arctan2(relative_locations[:, 1], relative_locations[:, 0]) 
+    # relative locations of all microphones at all noise times [noise time, microphone, dimension]
+    RML               = np.zeros((N,num_gm_mic,3)) 
+    RML[:,:,0]        = microphone_locations[None,:,0] - (settings.aircraft_origin_location[0] + noise_pos[:,0,None])    
+    RML[:,:,1]        = microphone_locations[None,:,1] - (settings.aircraft_origin_location[1] + noise_pos[:,1,None]) 
+    if MSL_altitude:
+        RML[:,:,2]    = -(noise_pos[:,2,None])  - microphone_locations[None,:,2] 
+    else:
+        RML[:,:,2]    = -(noise_pos[:,2,None])
+        
+    PHI               =  np.arctan2(np.sqrt(np.square(RML[:,:,0]) + np.square(RML[:,:,1])),  RML[:,:,2])  
+    THETA             =  np.arctan2(RML[:,:,1], RML[:,:,0]) 
     
     return noise_time,noise_pos,RML,PHI,THETA,num_gm_mic 
  
\ No newline at end of file
@@ -20,6 +20,7 @@ from RCAIDE.Library.Methods.Noise.Metrics  import A_weighting_metric
 from RCAIDE.Library.Methods.Noise.Common   import noise_tone_correction
 from RCAIDE.Library.Methods.Noise.Common   import atmospheric_attenuation
 from RCAIDE.Library.Methods.Noise.Common   import SPL_arithmetic 
+from RCAIDE.Library.Methods.Noise.Common   import compute_microphone_chunks
 
 # python imports 
 import numpy as np
@@ -130,124 +131,82 @@ def airframe_noise(microphone_locations,segment,config,settings):
 
     # Geometric information from the source to observer position  
     distance_vector     = np.linalg.norm(microphone_locations,axis = 1)
-    thetas              = np.tile(np.arctan2(microphone_locations[:, 1], microphone_locations[:, 0])[None,:],(n_cpts,1)) 
-    phis                = np.tile(np.arctan2(np.sqrt(np.square(microphone_locations[:, 0]) + np.square(microphone_locations[:, 1])),  microphone_locations[:, 2])[None,:],(n_cpts,1))  
+    thetas              = np.arctan2(microphone_locations[:, 1], microphone_locations[:, 0])
+    phis                = np.arctan2(np.sqrt(np.square(microphone_locations[:, 0]) + np.square(microphone_locations[:, 1])),  microphone_locations[:, 2])
     viscosity           = segment.conditions.freestream.dynamic_viscosity[:,0]*Units.ft*Units.ft  
     M                   = segment.conditions.freestream.mach_number
-     
-    SPL_wing_history              = np.zeros((n_cpts,n_mic,num_f))
-    SPLht_history                 = np.zeros((n_cpts,n_mic,num_f))
-    SPLvt_history                 = np.zeros((n_cpts,n_mic,num_f))
-    SPL_flap_history              = np.zeros((n_cpts,n_mic,num_f))
-    SPL_slat_history              = np.zeros((n_cpts,n_mic,num_f))
-    SPL_main_landing_gear_history = np.zeros((n_cpts,n_mic,num_f))
-    SPL_nose_landing_gear_history = np.zeros((n_cpts,n_mic,num_f))
-    SPL_total_history             = np.zeros((n_cpts,n_mic,num_f)) 
-    SPLt_dBA_history              = np.zeros((n_cpts,n_mic,num_f))  
-    SPLt_dBA_max                  = np.zeros((n_cpts,n_mic))    
     
-    # START LOOP FOR EACH POSITION OF AIRCRAFT   
-    for i in range(n_cpts):
-        for j in range(n_mic): 
-            
-            # Emission angle
-            theta = thetas[i,j]
-            phi   = phis[i,j]
-            
-            # Distance from airplane to observer, evaluated at retarded time
-            distance = distance_vector[j]    
-           
-            # Atmospheric attenuation
-            delta_atmo=atmospheric_attenuation(np.array([distance]),frequency)[:,0]
+    # control points are along the first axis, microphones along the second and frequencies along the third 
+    velocity            = velocity[:,0,None,None] 
+    viscosity           = viscosity[:,None,None]
+    M                   = M[:,:,None]
     
-            # Call each noise source model
-            SPL_wing = clean_wing_noise(Sw,bw,0,1,velocity[i,0],viscosity[i],M[i],phi,theta,distance,frequency) - delta_atmo    #Wing Noise
-            SPLht    = clean_wing_noise(Sht,bht,0,1,velocity[i,0],viscosity[i],M[i],phi,theta,distance,frequency)  -delta_atmo    #Horizontal Tail Noise
-            SPLvt    = clean_wing_noise(Svt,bvt,0,0,velocity[i,0],viscosity[i],M[i],phi,theta,distance,frequency)  -delta_atmo    #Vertical Tail Noise
-     
-            SPL_slat = leading_edge_slat_noise(SPL_wing,Sw,bw,velocity[i,0],viscosity[i],M[i],phi,theta,distance,frequency) -delta_atmo        #Slat leading edge
-     
-            if (deltaf==0):
-                SPL_flap = np.zeros(num_f)
-            else:
-                SPL_flap = trailing_edge_flap_noise(Sf,cf,deltaf,slots,velocity[i,0],M[i],phi,theta,distance,frequency) - delta_atmo #Trailing Edge Flaps Noise
+    # Atmospheric attenuation
+    delta_atmo          = atmospheric_attenuation(distance_vector,frequency)[:,0]
      
-            if gear_extended == False:  
-                SPL_main_landing_gear = np.zeros(num_f)
-                SPL_nose_landing_gear = np.zeros(num_f)
-            else:
-                SPL_main_landing_gear = landing_gear_noise(Dp,Hp,main_wheels,M[i],velocity[i,0],phi,theta,distance,frequency)  - delta_atmo     #Main Landing Gear Noise
-                SPL_nose_landing_gear = landing_gear_noise(Dn,Hn,nose_wheels,M[i],velocity[i,0],phi,theta,distance,frequency)  - delta_atmo     #Nose Landing Gear Noise
-            if main_units>1: # Incoherent summation of each main landing gear unit
-                SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1) 
-     
-            # Total Airframe Noise
-            SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
-                 10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
-                
-            SPL_total_history[i,j,:]             = SPL_total 
-            SPL_wing_history[i,j,:]              = SPL_wing 
-            SPLvt_history[i,j,:]                 = SPLvt 
-            SPLht_history[i,j,:]                 = SPLht 
-            SPL_flap_history[i,j,:]              = SPL_flap 
-            SPL_slat_history[i,j,:]              = SPL_slat 
-            SPL_nose_landing_gear_history[i,j,:] = SPL_nose_landing_gear 
-            SPL_main_landing_gear_history[i,j,:] = SPL_main_landing_gear  
-            
-            # Calculation of dBA based on the sound pressure time history 
-            SPLt_dBA_history[i,j,:] = A_weighting_metric(SPL_total,frequency)
-            SPLt_dBA_max[i,j]       = np.max(A_weighting_metric(SPL_total,frequency))    
-              
-    # Calculation of the Perceived Noise Level EPNL based on the sound time history 
-    PNL_total             = PNL_noise_metric(SPL_total_history)
-    PNL_wing              = PNL_noise_metric(SPL_wing_history)
-    PNL_ht                = PNL_noise_metric(SPLht_history)
-    PNL_vt                = PNL_noise_metric(SPLvt_history)
-    PNL_nose_landing_gear = PNL_noise_metric(SPL_nose_landing_gear_history)
-    PNL_main_landing_gear = PNL_noise_metric(SPL_main_landing_gear_history)
-    PNL_slat              = PNL_noise_metric(SPL_slat_history)
-    PNL_flap              = PNL_noise_metric(SPL_flap_history)
-     
-    # Calculation of the tones corrections on the SPL for each component and total
-    tone_correction_total             = noise_tone_correction(SPL_total_history) 
-    tone_correction_wing              = noise_tone_correction(SPL_wing_history)
-    tone_correction_ht                = noise_tone_correction(SPLht_history)
-    tone_correction_vt                = noise_tone_correction(SPLvt_history)
-    tone_correction_flap              = noise_tone_correction(SPL_flap_history)
-    tone_correction_slat              = noise_tone_correction(SPL_slat_history)
-    tone_correction_nose_landing_gear = noise_tone_correction(SPL_nose_landing_gear_history)
-    tone_correction_main_landing_gear = noise_tone_correction(SPL_main_landing_gear_history)
-    
-    # Calculation of the PLNT for each component and total
-    PNLT_total             = PNL_total+tone_correction_total
-    PNLT_wing              = PNL_wing+tone_correction_wing
-    PNLT_ht                = PNL_ht+tone_correction_ht
-    PNLT_vt                = PNL_vt+tone_correction_vt
-    PNLT_nose_landing_gear = PNL_nose_landing_gear+tone_correction_nose_landing_gear
-    PNLT_main_landing_gear = PNL_main_landing_gear+tone_correction_main_landing_gear
-    PNLT_slat              = PNL_slat+tone_correction_slat
-    PNLT_flap              = PNL_flap+tone_correction_flap
+    SPL_total_history   = np.zeros((n_cpts,n_mic,num_f)) 
+    SPLt_dBA_history    = np.zeros((n_cpts,n_mic,num_f))  
+    EPNL                = Data()
+    for source in ['total','wing','ht','vt','nose_landing_gear','main_landing_gear','slat','flap']:
+        EPNL[source]    = np.zeros(n_mic)
     
-    #Calculation of the EPNL for each component and total
-    EPNL_total             = EPNL_noise_metric(PNLT_total)
-    EPNL_wing              = EPNL_noise_metric(PNLT_wing)
-    EPNL_ht                = EPNL_noise_metric(PNLT_ht)
-    EPNL_vt                = EPNL_noise_metric(PNLT_vt)    
-    EPNL_nose_landing_gear = EPNL_noise_metric(PNLT_nose_landing_gear)
-    EPNL_main_landing_gear = EPNL_noise_metric(PNLT_main_landing_gear)
-    EPNL_slat              = EPNL_noise_metric(PNLT_slat)
-    EPNL_flap              = EPNL_noise_metric(PNLT_flap) 
+    # evaluate blocks of microphones, each block holds about 40 arrays of size (control points, frequencies) per microphone 
+    for mics in compute_microphone_chunks(n_mic, 40*n_cpts*num_f*8, settings.microphone_chunk_memory):
+        
+        # Emission angle
+        theta = thetas[None,mics,None]
+        phi   = phis[None,mics,None]
+        
+        # Distance from airplane to observer, evaluated at retarded time
+        distance = distance_vector[None,mics,None]
+        atmo     = delta_atmo[None,mics,None]
+        
+        # Call each noise source model
+        SPL_wing = clean_wing_noise(Sw,bw,0,1,velocity,viscosity,M,phi,theta,distance,frequency) - atmo    #Wing Noise
+        SPLht    = clean_wing_noise(Sht,bht,0,1,velocity,viscosity,M,phi,theta,distance,frequency)  -atmo    #Horizontal Tail Noise
+        SPLvt    = clean_wing_noise(Svt,bvt,0,0,velocity,viscosity,M,phi,theta,distance,frequency)  -atmo    #Vertical Tail Noise
+ 
+        SPL_slat = leading_edge_slat_noise(SPL_wing,Sw,bw,velocity,viscosity,M,phi,theta,distance,frequency) -atmo        #Slat leading edge
+ 
+        if (deltaf==0):
+            SPL_flap = np.zeros_like(SPL_wing)
+        else:
+            SPL_flap = trailing_edge_flap_noise(Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,frequency) - atmo #Trailing Edge Flaps Noise
+ 
+        if gear_extended == False:  
+            SPL_main_landing_gear = np.zeros_like(SPL_wing)
+            SPL_nose_landing_gear = np.zeros_like(SPL_wing)
+        else:
+            SPL_main_landing_gear = landing_gear_noise(Dp,Hp,main_wheels,M,velocity,phi,theta,distance,frequency)  - atmo     #Main Landing Gear Noise
+            SPL_nose_landing_gear = landing_gear_noise(Dn,Hn,nose_wheels,M,velocity,phi,theta,distance,frequency)  - atmo     #Nose Landing Gear Noise
+        if main_units>1: # Incoherent summation of each main landing gear unit
+            SPL_main_landing_gear = SPL_main_landing_gear+3*(main_units-1) 
+ 
+        # Total Airframe Noise
+        SPL_total = 10.*np.log10(10.0**(0.1*SPL_wing)+10.0**(0.1*SPLht)+10**(0.1*SPL_flap)+ \
+             10.0**(0.1*SPL_slat)+10.0**(0.1*SPL_main_landing_gear)+10.0**(0.1*SPL_nose_landing_gear))
+            
+        SPL_total_history[:,mics,:] = SPL_total  
+        
+        # Calculation of dBA based on the sound pressure time history 
+        SPLt_dBA_history[:,mics,:] = A_weighting_metric(SPL_total,frequency)
+          
+        # Calculation of the Perceived Noise Level with tone correction (PNLT) and of the EPNL for each component and total
+        for source, SPL_source in [('total',SPL_total),('wing',SPL_wing),('ht',SPLht),('vt',SPLvt),('nose_landing_gear',SPL_nose_landing_gear),
+                                   ('main_landing_gear',SPL_main_landing_gear),('slat',SPL_slat),('flap',SPL_flap)]:
+            PNLT                = PNL_noise_metric(SPL_source) + noise_tone_correction(SPL_source)
+            EPNL[source][mics]  = EPNL_noise_metric(PNLT)
     
     # Pack Airframe Noise 
     airframe_noise                        = Data()
-    airframe_noise.EPNL_total             = EPNL_total
-    airframe_noise.EPNL_wing              = EPNL_wing              
-    airframe_noise.EPNL_ht                = EPNL_ht                
-    airframe_noise.EPNL_vt                = EPNL_vt                
-    airframe_noise.EPNL_nose_landing_gear = EPNL_nose_landing_gear 
-    airframe_noise.EPNL_main_landing_gear = EPNL_main_landing_gear 
-    airframe_noise.EPNL_slat              = EPNL_slat              
-    airframe_noise.EPNL_flap              = EPNL_flap    
+    airframe_noise.EPNL_total             = EPNL.total
+    airframe_noise.EPNL_wing              = EPNL.wing              
+    airframe_noise.EPNL_ht                = EPNL.ht                
+    airframe_noise.EPNL_vt                = EPNL.vt                
+    airframe_noise.EPNL_nose_landing_gear = EPNL.nose_landing_gear 
+    airframe_noise.EPNL_main_landing_gear = EPNL.main_landing_gear 
+    airframe_noise.EPNL_slat              = EPNL.slat              
+    airframe_noise.EPNL_flap              = EPNL.flap    
     airframe_noise.SPL                    = SPL_arithmetic(SPL_total_history, sum_axis= 2)
     airframe_noise.SPL_1_3_spectrum       = SPL_total_history
     airframe_noise.SPL_dBA                = SPL_arithmetic(np.atleast_2d(SPLt_dBA_history), sum_axis= 2) 
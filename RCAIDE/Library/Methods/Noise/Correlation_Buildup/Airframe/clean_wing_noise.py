@@ -59,15 +59,15 @@ def clean_wing_noise(S,b,ND,IsHorz,velocity,viscosity,M,phi,theta,distance,frequ
         DIR = np.sin(phi)
 
 
-    if DIR==0:
-        SPL = np.zeros(24)
-    else:
-
+    # microphones in the plane of the surface do not receive noise
+    with np.errstate(divide='ignore',invalid='ignore'):
         fmax  = 0.1*(velocity/Units.ft)/(delta*(1-M*np.cos(theta))) 
 
         OASPL = 50*np.log10((velocity/Units.kts)/100.0)+10*np.log10(delta*b/(distance**2.0))+8*ND+ \
             20*np.log10(DIR*np.sin(theta)*np.cos(theta/2.0))+104.3
 
         SPL   = OASPL+10.0*np.log10(0.613*(frequency/fmax)**4*((frequency/fmax)**1.5+0.5)**(-4))-0.03*np.abs(((frequency/fmax)-1))**1.5
+        
+    SPL = np.where(DIR==0, 0., SPL)
 
     return SPL
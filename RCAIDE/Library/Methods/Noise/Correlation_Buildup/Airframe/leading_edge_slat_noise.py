@@ -41,7 +41,7 @@ def leading_edge_slat_noise(SPL_wing,Sw,bw,velocity,viscosity,M,phi,theta,distan
     #Process
     SPLslat1   = SPL_wing+3.0
     SPLslat2   = clean_wing_noise(0.15*Sw,bw,1,1,velocity,viscosity,M,phi,theta,distance,frequency)
-    peakfactor = 3+max(SPL_wing)-max(SPLslat2)
+    peakfactor = 3+np.max(SPL_wing,axis=-1,keepdims=True)-np.max(SPLslat2,axis=-1,keepdims=True)
     SPLslat2   = SPLslat2+peakfactor
 
     SPL        = 10.*np.log10(10.0**(0.1*SPLslat1)+10.0**(0.1*SPLslat2))
@@ -40,34 +40,17 @@ def trailing_edge_flap_noise(Sf,cf,deltaf,slots,velocity,M,phi,theta,distance,fr
     """
 
     # Process
-    G      = np.zeros(24)
-
     test   = frequency*cf/(velocity/Units.ft*(1-M*np.cos(theta)))
+    G      = np.zeros(np.shape(test))
 
-    if (slots==1 or slots==2):
-        for i in range (0,24):
-            if (test[i]<2):
-                G[i] = 99+10*np.log10(test[i])
-            elif (test[i]<20):
-                G[i] = 103.82-6*np.log10(test[i])
-            else:
-                G[i] = 135.04-30*np.log10(test[i])
-
-    elif slots==3:
-        for i in range(0,24):
-            if(test[i]<2):
-                G[i] = 99+10*np.log10(test[i])
-            elif (test[i]<75):
-                G[i] = 102.61-2*np.log10(test[i])
-            else:
-                G[i] = 158.11-30*np.log10(test[i])
-
-    G = np.transpose(G)
+    with np.errstate(divide='ignore',invalid='ignore'):
+        if (slots==1 or slots==2):
+            G = np.where(test<2, 99+10*np.log10(test), np.where(test<20, 103.82-6*np.log10(test), 135.04-30*np.log10(test)))
+    
+        elif slots==3:
+            G = np.where(test<2, 99+10*np.log10(test), np.where(test<75, 102.61-2*np.log10(test), 158.11-30*np.log10(test)))
     
-    if theta+deltaf>=np.pi:
-        directivity = 0.0
-    else:     
-        directivity = 20.0*np.log10(np.sin(theta)* (np.cos(phi))**2 * np.sin(theta+deltaf))
+        directivity = np.where(theta+deltaf>=np.pi, 0.0, 20.0*np.log10(np.sin(theta)* (np.cos(phi))**2 * np.sin(theta+deltaf)))
 
     SPL = G+10*np.log10(Sf*(np.sin(deltaf))**2/(distance**2))+ \
         60*np.log10((velocity/Units.kts)/100.0)+directivity
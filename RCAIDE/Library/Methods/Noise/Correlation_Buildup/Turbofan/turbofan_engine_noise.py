@@ -20,13 +20,13 @@ from .secondary_noise_component import secondary_noise_component
 from RCAIDE.Library.Methods.Noise.Common  import noise_tone_correction
 from RCAIDE.Library.Methods.Noise.Common  import atmospheric_attenuation 
 from RCAIDE.Library.Methods.Noise.Common  import SPL_arithmetic
+from RCAIDE.Library.Methods.Noise.Common  import compute_microphone_chunks
 from RCAIDE.Library.Methods.Noise.Metrics import PNL_noise_metric
 from RCAIDE.Library.Methods.Noise.Metrics import EPNL_noise_metric
 from RCAIDE.Library.Methods.Noise.Metrics import A_weighting_metric  
 
 # Python package imports   
 import numpy as np   
-from copy import deepcopy
 
 # ----------------------------------------------------------------------------------------------------------------------     
 #  turbofan engine noise 
@@ -121,200 +121,174 @@ def turbofan_engine_noise(microphone_locations,turbofan,aeroacoustic_data,segmen
     Area_primary   = np.pi*(Diameter_primary/2)**2 
     Area_secondary =  np.pi*(Diameter_secondary/2)**2   
    
-    # Defining each array before the main loop  
-    theta_P                = np.tile(np.arctan2(microphone_locations[:, 1], microphone_locations[:, 0])[None,:],(n_cpts,1))  
-    theta_S                = deepcopy(theta_P)
-    theta_M                = deepcopy(theta_P)
-    EX_p                   = np.zeros((n_cpts,n_mic,num_f)) 
-    EX_s                   = np.zeros((n_cpts,n_mic,num_f)) 
-    EX_m                   = np.zeros((n_cpts,n_mic,num_f))  
-    SPL_p                  = np.zeros((n_cpts,n_mic,num_f)) 
-    SPL_s                  = np.zeros((n_cpts,n_mic,num_f)) 
-    SPL_m                  = np.zeros((n_cpts,n_mic,num_f)) 
+    # Emission angles of the jet components 
+    theta_P = np.arctan2(microphone_locations[:, 1], microphone_locations[:, 0])
+    theta_S = theta_P
+    theta_M = theta_P
+    
+    # Primary and Secondary jets
+    Cpp = R_gas/(1-1/gamma_primary)
+    Cp  = R_gas/(1-1/gamma)
+    
+    # control points are along the first axis, microphones along the second and frequencies along the third 
+    Velocity_primary      = np.reshape(Velocity_primary,(n_cpts,1,1))
+    Velocity_secondary    = np.reshape(Velocity_secondary,(n_cpts,1,1))
+    Temperature_primary   = Temperature_primary[:,None,None]
+    Temperature_secondary = Temperature_secondary[:,None,None]
+    Pressure_primary      = Pressure_primary[:,None,None]
+    Pressure_secondary    = Pressure_secondary[:,None,None]
+    Velocity_aircraft     = Velocity_aircraft[:,None,None]
+    sound_ambient         = sound_ambient[:,None,None]
+    density_ambient       = density_ambient[:,None,None]
+    pressure_amb          = pressure_amb[:,None,None]
+
+    density_primary   = Pressure_primary/(R_gas*Temperature_primary-(0.5*R_gas*Velocity_primary**2/Cpp))
+    density_secondary = Pressure_secondary/(R_gas*Temperature_secondary-(0.5*R_gas*Velocity_secondary**2/Cp))
+
+    mass_flow_primary   = Area_primary*Velocity_primary*density_primary
+    mass_flow_secondary = Area_secondary*Velocity_secondary*density_secondary
+
+    #Mach number of the external flow - based on the aircraft velocity
+    Mach_aircraft[:,0] = Velocity_aircraft[:,0,0]/sound_ambient[:,0,0]
+    Mach               = Mach_aircraft[:,:,None]
+
+    #Calculation Procedure for the Mixed Jet Flow Parameters
+    Velocity_mixed = (mass_flow_primary*Velocity_primary+mass_flow_secondary*Velocity_secondary)/ \
+        (mass_flow_primary+mass_flow_secondary)
+    Temperature_mixed =(mass_flow_primary*Temperature_primary+mass_flow_secondary*Temperature_secondary)/ \
+        (mass_flow_primary+mass_flow_secondary)
+    density_mixed = pressure_amb/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
+    Area_mixed = Area_primary*density_primary*Velocity_primary*(1+(mass_flow_secondary/mass_flow_primary))/ \
+        (density_mixed*Velocity_mixed)
+    Diameter_mixed = (4*Area_mixed/np.pi)**0.5
+
+    XBPR = mass_flow_secondary/mass_flow_primary - 5.5
+    XBPR = np.where(XBPR<0, 0, np.where(XBPR>4, 4, XBPR))
+
+    #Auxiliary parameter defined as DVPS
+    DVPS = np.abs((Velocity_primary - (Velocity_secondary*Area_secondary+Velocity_aircraft*Area_primary)/\
+                   (Area_secondary+Area_primary)))
+    DVPS = np.where(DVPS<0.3, 0.3, DVPS)
+
+    # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
+    Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
+    Str_s = frequency*Diameter_mixed/(Velocity_secondary-Velocity_aircraft) #Secondary jet
+    Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft) #Mixed jet
+
+    #Calculation of the Excitation adjustment parameter 
+    excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
+    
+    SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
+    SX[excitation_Strouhal > 0.25] = 0.0 
+    SX[excitation_Strouhal < 0.5]  = 0.0 
+
+    # Effectiveness
+    exps = np.exp(-SX)
+
+    #Spectral Shape Factor
+    exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
+
+    #Fan Duct Lenght Factor
+    exd = np.exp(0.6-(EXA)**0.5)
+
+    #Excitation source location factor (zk)
+    zk = 1-0.4*(exd)*(exps)     
+
+    #Acoustic excitation adjustment (EX)
+    EX_p = +5*exd*exps   #primary component - no frequency dependance
+    EX_s = 2*sound_ambient/(Velocity_secondary*(zk)) #secondary component - no frequency dependance    
+
+    #Noise attenuation due to Ambient Pressure
+    dspl_ambient_pressure = 20*np.log10(pressure_amb/pressure_isa)
+
+    #Noise attenuation due to Density Gradientes
+    dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient))
+    dspl_density_s = 20*np.log10((density_secondary+density_ambient)/(2*density_ambient))
+    dspl_density_m = 20*np.log10((density_mixed+density_ambient)/(2*density_ambient))
+
+    # Noise attenuation due to Geometric Near-Field 
+    dspl_geometric_p = 0.0
+    dspl_geometric_s = 0.0
+    dspl_geometric_m = 0.0 
+
+    # Noise attenuation due to Acoustic Near-Field 
+    dspl_acoustic_p = 0.0 
+    dspl_acoustic_s = 0.0 
+    dspl_acoustic_m = 0.0  
+    
+    # Atmospheric attenuation
+    delta_atmo = atmospheric_attenuation(distance_microphone,frequency)
+    
     SPL                    = np.zeros((n_cpts,n_mic))
     SPL_dBA                = np.zeros((n_cpts,n_mic))
-    SPL_1_3_spectrum       = np.zeros((n_cpts,n_mic,num_f))
-    SPL_primary_spectrum   = np.zeros((n_cpts,n_mic,num_f))
-    SPL_secondary_spectrum = np.zeros((n_cpts,n_mic,num_f))
-    SPL_mixed_specturm     = np.zeros((n_cpts,n_mic,num_f)) 
     SPL_1_3_spectrum_dBA   = np.zeros((n_cpts,n_mic,num_f)) 
+    EPNL_total             = np.zeros(n_mic)
+    EPNL_primary           = np.zeros(n_mic)
+    EPNL_secondary         = np.zeros(n_mic)
+    EPNL_mixed             = np.zeros(n_mic)
 
-    # Start loop for each position of aircraft 
-    for i in range(n_cpts):
-        for j in range(n_mic): 
+    # evaluate blocks of microphones, each block holds about 40 arrays of size (control points, frequencies) per microphone 
+    for mics in compute_microphone_chunks(n_mic, 40*n_cpts*num_f*8, settings.microphone_chunk_memory):
         
-            EX_p    = np.zeros(num_f)
-            EX_s    = np.zeros(num_f)
-            EX_m    = np.zeros(num_f) 
-            theta_p = abs(theta_P[i,j])
-            theta_s = abs(theta_S[i,j])
-            theta_m = abs(theta_M[i,j])
+        theta_p = np.abs(theta_P[None,mics,None])
+        theta_s = np.abs(theta_S[None,mics,None])
+        theta_m = np.abs(theta_M[None,mics,None])
+        
+        # Loop for the frequency array range 
+        exc = np.where(theta_m>1.4, (sound_ambient/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4)), sound_ambient/Velocity_mixed)
+
+        #Acoustic excitation adjustment (EX)
+        EX_m = exd*exs*exc   # mixed component - dependant of the frequency
+
+        distance_primary   = distance_microphone[None,mics,None] 
+        distance_secondary = distance_microphone[None,mics,None] 
+        distance_mixed     = distance_microphone[None,mics,None]
+
+        #Noise attenuation due to Spherical divergence
+        dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
+        dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
+        dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
  
-            # Primary and Secondary jets
-            Cpp = R_gas/(1-1/gamma_primary)
-            Cp  = R_gas/(1-1/gamma)
-    
-            density_primary   = Pressure_primary[i]/(R_gas*Temperature_primary[i]-(0.5*R_gas*Velocity_primary[i]**2/Cpp))
-            density_secondary = Pressure_secondary[i]/(R_gas*Temperature_secondary[i]-(0.5*R_gas*Velocity_secondary[i]**2/Cp))
-    
-            mass_flow_primary   = Area_primary*Velocity_primary[i]*density_primary
-            mass_flow_secondary = Area_secondary*Velocity_secondary[i]*density_secondary
-    
-            #Mach number of the external flow - based on the aircraft velocity
-            Mach_aircraft[i] = Velocity_aircraft[i]/sound_ambient[i]
-    
-            #Calculation Procedure for the Mixed Jet Flow Parameters
-            Velocity_mixed = (mass_flow_primary*Velocity_primary[i]+mass_flow_secondary*Velocity_secondary[i])/ \
-                (mass_flow_primary+mass_flow_secondary)
-            Temperature_mixed =(mass_flow_primary*Temperature_primary[i]+mass_flow_secondary*Temperature_secondary[i])/ \
-                (mass_flow_primary+mass_flow_secondary)
-            density_mixed = pressure_amb[i]/(R_gas*Temperature_mixed-(0.5*R_gas*Velocity_mixed**2/Cp))
-            Area_mixed = Area_primary*density_primary*Velocity_primary[i]*(1+(mass_flow_secondary/mass_flow_primary))/ \
-                (density_mixed*Velocity_mixed)
-            Diameter_mixed = (4*Area_mixed/np.pi)**0.5
-     
-    
-            XBPR = mass_flow_secondary/mass_flow_primary - 5.5
-            if XBPR<0:
-                XBPR=0
-            elif XBPR>4:
-                XBPR=4
-    
-            #Auxiliary parameter defined as DVPS
-            DVPS = np.abs((Velocity_primary[i] - (Velocity_secondary[i]*Area_secondary+Velocity_aircraft[i]*Area_primary)/\
-                           (Area_secondary+Area_primary)))
-            if DVPS<0.3:
-                DVPS=0.3
-    
-            # Calculation of the Strouhal number for each jet component (p-primary, s-secondary, m-mixed)
-            Str_p = frequency*Diameter_primary/(DVPS)  #Primary jet
-            Str_s = frequency*Diameter_mixed/(Velocity_secondary[i]-Velocity_aircraft[i]) #Secondary jet
-            Str_m = frequency*Diameter_mixed/(Velocity_mixed-Velocity_aircraft[i]) #Mixed jet
-    
-            #Calculation of the Excitation adjustment parameter 
-            excitation_Strouhal = (N1/60)*(Diameter_mixed/Velocity_mixed)
-            
-            SX = 50*(excitation_Strouhal-0.25)*(excitation_Strouhal-0.5)
-            SX[excitation_Strouhal > 0.25] = 0.0 
-            SX[excitation_Strouhal < 0.5]  = 0.0 
-    
-            # Effectiveness
-            exps = np.exp(-SX)
-    
-            #Spectral Shape Factor
-            exs = 5*exps*np.exp(-(np.log10(Str_m/(2*excitation_Strouhal+0.00001)))**2)
-    
-            #Fan Duct Lenght Factor
-            exd = np.exp(0.6-(EXA)**0.5)
-    
-            #Excitation source location factor (zk)
-            zk = 1-0.4*(exd)*(exps)     
-    
-            # Loop for the frequency array range 
-            exc = sound_ambient[i]/Velocity_mixed 
-            if theta_m>1.4:
-                exc  = (sound_ambient[i]/Velocity_mixed)*(1-(1.8/np.pi)*(theta_m-1.4))
+        dspl_attenuation_p = -delta_atmo[None,mics,:] 
+        dspl_attenuation_s = -delta_atmo[None,mics,:] 
+        dspl_attenuation_m = -delta_atmo[None,mics,:]  
 
-            #Acoustic excitation adjustment (EX)
-            EX_m = exd*exs*exc   # mixed component - dependant of the frequency
-    
-            EX_p = +5*exd*exps   #primary component - no frequency dependance
-            EX_s = 2*sound_ambient[i]/(Velocity_secondary[i]*(zk)) #secondary component - no frequency dependance    
-    
-            distance_primary   = distance_microphone[j] 
-            distance_secondary = distance_microphone[j] 
-            distance_mixed     = distance_microphone[j]
-    
-            #Noise attenuation due to Ambient Pressure
-            dspl_ambient_pressure = 20*np.log10(pressure_amb[i]/pressure_isa)
-    
-            #Noise attenuation due to Density Gradientes
-            dspl_density_p = 20*np.log10((density_primary+density_secondary)/(2*density_ambient[i]))
-            dspl_density_s = 20*np.log10((density_secondary+density_ambient[i])/(2*density_ambient[i]))
-            dspl_density_m = 20*np.log10((density_mixed+density_ambient[i])/(2*density_ambient[i]))
-    
-            #Noise attenuation due to Spherical divergence
-            dspl_spherical_p = 20*np.log10(Diameter_primary/distance_primary)
-            dspl_spherical_s = 20*np.log10(Diameter_mixed/distance_secondary)
-            dspl_spherical_m = 20*np.log10(Diameter_mixed/distance_mixed)
-    
-            # Noise attenuation due to Geometric Near-Field 
-            dspl_geometric_p = 0.0
-            dspl_geometric_s = 0.0
-            dspl_geometric_m = 0.0 
-            
-    
-            # Noise attenuation due to Acoustic Near-Field 
-            dspl_acoustic_p = 0.0 
-            dspl_acoustic_s = 0.0 
-            dspl_acoustic_m = 0.0  
-     
-            # Atmospheric attenuation
-            delta_atmo = atmospheric_attenuation(np.array([distance_primary]),frequency)[0,:]
-    
-            dspl_attenuation_p = -delta_atmo 
-            dspl_attenuation_s = -delta_atmo 
-            dspl_attenuation_m = -delta_atmo  
-    
-            # Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
-            DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
-            DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
-            DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
-    
-    
-            # Calculation of interference effects on jet noise
-            ATK_m   = angle_of_attack_effect(AOA,Mach_aircraft[i],theta_m)
-            INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
-            Plug    = external_plug_effect(Velocity_primary[i],Velocity_secondary[i], Velocity_mixed, Diameter_primary,Diameter_secondary,
-                                           Diameter_mixed, Plug_diameter, sound_ambient[i], theta_p,theta_s,theta_m)
-    
-            GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient[i],theta_m,engine_height,Diameter_mixed,frequency)
-    
-            # Calculation of the sound pressure level for each jet component
-            SPL_p = primary_noise_component(Velocity_primary[i],Temperature_primary[i],R_gas,theta_p,DVPS,sound_ambient[i],
-                                            Velocity_secondary[i],Velocity_aircraft[i],Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug.PG_p
-    
-            SPL_s = secondary_noise_component(Velocity_primary[i],theta_s,sound_ambient[i],Velocity_secondary[i],
-                                              Velocity_aircraft[i],Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
-    
-            SPL_m = mixed_noise_component(Velocity_primary[i],theta_m,sound_ambient[i],Velocity_secondary[i],
-                                          Velocity_aircraft[i],Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug.PG_m + ATK_m + GPROX_m
-    
-            # Sum of the Total Noise
-            SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
-    
-            # Store SPL history      
-            SPL_1_3_spectrum[i,j,:]       = SPL_total 
-            SPL[i,j]                      = SPL_arithmetic(np.atleast_2d(SPL_total),sum_axis=1 )
-            SPL_primary_spectrum[i,j,:]   = SPL_p 
-            SPL_secondary_spectrum[i,j,:] = SPL_s 
-            SPL_mixed_specturm[i,j,:]     = SPL_m  
-            SPL_1_3_spectrum_dBA[i,j,:]   = A_weighting_metric(SPL_total,frequency)
-            SPL_dBA[i,j]                  = SPL_arithmetic(np.atleast_2d(A_weighting_metric(SPL_total,frequency)),sum_axis=1) 
-
-    # Calculation of the Perceived Noise Level EPNL based on the sound time history
-    PNL_total               =  PNL_noise_metric(SPL_1_3_spectrum)    
-    PNL_primary             =  PNL_noise_metric(SPL_primary_spectrum)  
-    PNL_secondary           =  PNL_noise_metric(SPL_secondary_spectrum)  
-    PNL_mixed               =  PNL_noise_metric(SPL_mixed_specturm)  
-
-    # Calculation of the tones corrections on the SPL for each component and total
-    tone_correction_total     = noise_tone_correction(SPL_1_3_spectrum) 
-    tone_correction_primary   = noise_tone_correction(SPL_primary_spectrum) 
-    tone_correction_secondary = noise_tone_correction(SPL_secondary_spectrum) 
-    tone_correction_mixed     = noise_tone_correction(SPL_mixed_specturm) 
-
-    # Calculation of the PLNT for each component and total
-    PNLT_total     = PNL_total+tone_correction_total
-    PNLT_primary   = PNL_primary+tone_correction_primary
-    PNLT_secondary = PNL_secondary+tone_correction_secondary
-    PNLT_mixed     = PNL_mixed+tone_correction_mixed
-
-    # Calculation of the EPNL for each component and total
-    EPNL_total     = EPNL_noise_metric(PNLT_total)
-    EPNL_primary   = EPNL_noise_metric(PNLT_primary)
-    EPNL_secondary = EPNL_noise_metric(PNLT_secondary)
-    EPNL_mixed     = EPNL_noise_metric(PNLT_mixed) 
+        # Calculation of the total noise attenuation (p-primary, s-secondary, m-mixed components)
+        DSPL_p = dspl_ambient_pressure+dspl_density_p+dspl_geometric_p+dspl_acoustic_p+dspl_attenuation_p+dspl_spherical_p
+        DSPL_s = dspl_ambient_pressure+dspl_density_s+dspl_geometric_s+dspl_acoustic_s+dspl_attenuation_s+dspl_spherical_s
+        DSPL_m = dspl_ambient_pressure+dspl_density_m+dspl_geometric_m+dspl_acoustic_m+dspl_attenuation_m+dspl_spherical_m
+
+        # Calculation of interference effects on jet noise
+        ATK_m   = angle_of_attack_effect(AOA,Mach,theta_m)
+        INST_s  = jet_installation_effect(Xe,Ye,Ce,theta_s,Diameter_mixed)
+        Plug    = external_plug_effect(Velocity_primary,Velocity_secondary, Velocity_mixed, Diameter_primary,Diameter_secondary,
+                                       Diameter_mixed, Plug_diameter, sound_ambient, theta_p,theta_s,theta_m)
+
+        GPROX_m = ground_proximity_effect(Velocity_mixed,sound_ambient,theta_m,engine_height,Diameter_mixed,frequency)
+
+        # Calculation of the sound pressure level for each jet component
+        SPL_p = primary_noise_component(Velocity_primary,Temperature_primary,R_gas,theta_p,DVPS,sound_ambient,
+                                        Velocity_secondary,Velocity_aircraft,Area_primary,Area_secondary,DSPL_p,EX_p,Str_p) + Plug.PG_p
+
+        SPL_s = secondary_noise_component(Velocity_primary,theta_s,sound_ambient,Velocity_secondary,
+                                          Velocity_aircraft,Area_primary,Area_secondary,DSPL_s,EX_s,Str_s) + Plug.PG_s + INST_s
+
+        SPL_m = mixed_noise_component(Velocity_primary,theta_m,sound_ambient,Velocity_secondary,
+                                      Velocity_aircraft,Area_primary,Area_secondary,DSPL_m,EX_m,Str_m,Velocity_mixed,XBPR) + Plug.PG_m + ATK_m + GPROX_m
+
+        # Sum of the Total Noise
+        SPL_total = 10 * np.log10(10**(0.1*SPL_p)+10**(0.1*SPL_s)+10**(0.1*SPL_m))
+
+        # Store SPL history      
+        SPL[:,mics]                     = SPL_arithmetic(SPL_total,sum_axis=2)
+        SPL_1_3_spectrum_dBA[:,mics,:]  = A_weighting_metric(SPL_total,frequency)
+        SPL_dBA[:,mics]                 = SPL_arithmetic(SPL_1_3_spectrum_dBA[:,mics,:],sum_axis=2) 
+
+        # Calculation of the Perceived Noise Level with tone correction (PNLT) and of the EPNL for each component and total
+        EPNL_total[mics]     = EPNL_noise_metric(PNL_noise_metric(SPL_total) + noise_tone_correction(SPL_total))
+        EPNL_primary[mics]   = EPNL_noise_metric(PNL_noise_metric(SPL_p) + noise_tone_correction(SPL_p))
+        EPNL_secondary[mics] = EPNL_noise_metric(PNL_noise_metric(SPL_s) + noise_tone_correction(SPL_s))
+        EPNL_mixed[mics]     = EPNL_noise_metric(PNL_noise_metric(SPL_m) + noise_tone_correction(SPL_m))
 
     # Open output file to print the result     
     
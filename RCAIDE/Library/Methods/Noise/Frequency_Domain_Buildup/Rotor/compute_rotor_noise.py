@@ -24,6 +24,9 @@ from RCAIDE.Library.Methods.Aerodynamics.Airfoil_Panel_Method.airfoil_analysis
 import numpy as np    
 from RCAIDE.Framework.Core import interp2d 
 
+# vehicle, conditions and settings of a noise worker process
+noise_worker = Data()
+
 # ----------------------------------------------------------------------------------------------------------------------    
 #  Rotor Noise 
 # ----------------------------------------------------------------------------------------------------------------------    
@@ -63,17 +66,171 @@ def compute_rotor_noise(microphone_locations,propulsor,rotor,segment,settings, r
     '''
  
     # unpack 
-    conditions           = segment.state.conditions
+    conditions           = segment.state.conditions 
+    num_cpt              = conditions._size
+
+    # compute position vector from point source (or should it be origin) at rotor hub to microphones 
+    coordinates   = compute_rotor_point_source_coordinates(propulsor,rotor,conditions,microphone_locations,settings)        
+
+    control_points = [compute_rotor_noise_control_point(propulsor,rotor,conditions,coordinates,settings,cpt,rotor_index,previous_rotor_tag,identical_propulsors) for cpt in range(num_cpt)]
+    
+    # A-weighted
+    conditions.noise[propulsor.tag][rotor.tag] = assemble_rotor_noise(control_points,microphone_locations,settings)
+    return rotor.tag
+
+def compute_rotor_noise_control_point(propulsor,rotor,conditions,coordinates,settings,cpt, rotor_index = 0, previous_rotor_tag = None, identical_propulsors=True):
+    ''' This computes the harmonic and broadband noise of a rotor at one control point. The control points
+    of a rotor are independent of each other and can be evaluated in any order. 
+        
+    Assumptions:
+    None
+
+    Source:
+    None
+    
+    Inputs:
+        propulsor               - propulsor of the rotor                              [None]
+        rotor                   - data structure of rotor                             [None]
+        conditions              - flight conditions of the segment                    [None] 
+        coordinates             - rotor point source coordinates                      [None]
+        settings                - accoustic settings                                  [None]
+        cpt                     - control point                                       [None]
+                               
+    Outputs:
+        Noise.    
+            f                               - blade passing frequencies                        [Hz]
+            SPL_prop_harmonic_bpf_spectrum  - blade passing frequency spectrum of harmonic SPL [dB]
+            SPL_prop_harmonic_1_3_spectrum  - 1/3 octave band spectrum of harmonic SPL         [dB]
+            SPL_prop_broadband_1_3_spectrum - 1/3 octave band spectrum of broadband SPL        [dB]
+            SPL_total_1_3_spectrum          - 1/3 octave band spectrum of total SPL            [dB]
+     
+    Properties Used:
+        N/A   
+    '''
+    
+    # unpack 
     propulsor_conditions = conditions.energy[propulsor.tag]
     harmonics_blade      = settings.harmonics
     harmonics_load       = np.linspace(0,5,6).astype(int)  
+    Noise                = Data()  
+    
+    # ----------------------------------------------------------------------------------
+    # Harmonic Noise
+    # ---------------------------------------------------------------------------------- 
+    # harmonic noise with planar load distribution
+    if settings.fidelity == 'plane_source': 
+        aeroacoustic_data = propulsor_conditions[rotor.tag]       
+        Re                = aeroacoustic_data.disc_reynolds_number
+        AOA_sec           = aeroacoustic_data.disc_effective_angle_of_attack  
+        a_loc             = rotor.airfoil_polar_stations
+        num_az            = aeroacoustic_data.number_azimuthal_stations     
+        airfoils          = rotor.airfoils         
+        for jj,airfoil in enumerate(airfoils):
+            airfoil_points      = airfoil.number_of_points 
+        chord_coord             = int(np.floor(airfoil_points/2))       
+            
+        if (identical_propulsors == False) and rotor_index !=0: 
+            prev_aeroacoustic_data                   = propulsor_conditions[previous_rotor_tag]                 
+            prev_aeroacoustic_data                   = propulsor_conditions[rotor.tag]  
+            aeroacoustic_data.disc_lift_distribution = prev_aeroacoustic_data.disc_lift_distribution
+            aeroacoustic_data.disc_drag_distribution = prev_aeroacoustic_data.disc_lift_distribution
+            aeroacoustic_data.disc_lift_coefficient  = prev_aeroacoustic_data.disc_lift_coefficient 
+            aeroacoustic_data.disc_drag_coefficient  = prev_aeroacoustic_data.disc_drag_coefficient  
+            aeroacoustic_data.blade_upper_surface    = prev_aeroacoustic_data.blade_upper_surface
+            aeroacoustic_data.blade_lower_surface    = prev_aeroacoustic_data.blade_lower_surface
+        else: 
+            # Lift and Drag - coefficients and distributions 
+            fL      = np.tile(np.zeros_like(Re)[:,:,:,None],(1,1,1,chord_coord))
+            fD      = np.zeros_like(fL)
+            CL      = np.zeros_like(Re)
+            CD      = np.zeros_like(Re) 
+            y_up    = np.zeros_like(fL)
+            y_low   = np.zeros_like(fL)
+                              
+            for jj,airfoil in enumerate(airfoils):    
+                locs                  = np.where(np.array(a_loc) == jj ) 
+                alpha_azi             = np.atleast_2d(AOA_sec[cpt,locs,:].flatten())
+                Re_azi                = np.atleast_2d(Re[cpt,locs,:].flatten())      
+                pd                    = airfoil.polars 
+                if settings.use_plane_loading_surrogate: 
+                    fL[cpt,locs,:,:]      = pd.lift_distribution_func((alpha_azi,Re_azi)).reshape(1,len(a_loc), num_az,chord_coord) 
+                    fD[cpt,locs,:,:]      = pd.drag_distribution_func((alpha_azi,Re_azi)).reshape(1,len(a_loc), num_az,chord_coord)  
+                    cl_invisc             = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
+                    cd_visc               = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)   
+                    CL[cpt,locs,:]        = cl_invisc.reshape(1, len(a_loc), num_az) 
+                    CD[cpt,locs,:]        = cd_visc.reshape(1, len(a_loc), num_az)                             
+                
+                else : 
+                    airfoil_geometry      = import_airfoil_geometry(airfoil.coordinate_file,airfoil_points)
+                    airfoil_properties    = airfoil_analysis(airfoil_geometry,alpha_azi,Re_azi)
+                    fL[cpt,locs,:,:]      = airfoil_properties.fL.reshape(chord_coord, len(a_loc), num_az,1).swapaxes(0, 3)
+                    fD[cpt,locs,:,:]      = airfoil_properties.fD.reshape(chord_coord, len(a_loc), num_az,1).swapaxes(0, 3)
+                    CL[cpt,locs,:]        = airfoil_properties.cl_invisc.reshape(1, len(a_loc), num_az) 
+                    CD[cpt,locs,:]        = airfoil_properties.cd_visc.reshape(1, len(a_loc), num_az) 
+                    
+                y_up[cpt,locs,:,:]    = airfoil.geometry.y_upper_surface
+                y_low[cpt,locs,:,:]   = airfoil.geometry.y_lower_surface
+                    
+            aeroacoustic_data.disc_lift_distribution = fL
+            aeroacoustic_data.disc_drag_distribution = fD
+            aeroacoustic_data.disc_lift_coefficient  = CL
+            aeroacoustic_data.disc_drag_coefficient  = CD 
+            aeroacoustic_data.blade_upper_surface    = y_up
+            aeroacoustic_data.blade_lower_surface    = y_low                        
+                    
+        harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt)
+    elif settings.fidelity == 'line_source': 
+        harmonic_noise_line(harmonics_blade,harmonics_load,conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt)
+    else:
+        harmonic_noise_point(harmonics_blade,harmonics_load,conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt) 
+
+    # ----------------------------------------------------------------------------------    
+    # Broadband Noise
+    # ---------------------------------------------------------------------------------- 
+    broadband_noise(conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt)  
+
+    # ----------------------------------------------------------------------------------    
+    # Atmospheric attenuation 
+    # ----------------------------------------------------------------------------------
+    delta_atmo = atmospheric_attenuation(np.linalg.norm(coordinates.X_r[:,0,0,0,:],axis=1),settings.center_frequencies)
+
+    # ----------------------------------------------------------------------------------    
+    # Combine Harmonic (periodic/tonal) and Broadband Noise
+    # ----------------------------------------------------------------------------------
+    num_mic      = len(coordinates.X_hub[0,:,0,0])
+    SPL_total_1_3_spectrum      = 10*np.log10( 10**(Noise.SPL_prop_harmonic_1_3_spectrum/10) + 10**(Noise.SPL_prop_broadband_1_3_spectrum/10)) - np.tile(delta_atmo[cpt,None,:],(1,num_mic,1))  
+    SPL_total_1_3_spectrum[np.isnan(SPL_total_1_3_spectrum)] = 0 
+    
+    return Data(f                               = Noise.f,
+                SPL_prop_harmonic_bpf_spectrum  = Noise.SPL_prop_harmonic_bpf_spectrum,
+                SPL_prop_harmonic_1_3_spectrum  = Noise.SPL_prop_harmonic_1_3_spectrum,
+                SPL_prop_broadband_1_3_spectrum = Noise.SPL_prop_broadband_1_3_spectrum,
+                SPL_total_1_3_spectrum          = SPL_total_1_3_spectrum)
+
+def assemble_rotor_noise(control_points,microphone_locations,settings):
+    ''' This stores the noise of the control points of a rotor, in control point order, in one data structure. 
+        
+    Assumptions:
+    None
+
+    Source:
+    None
+    
+    Inputs:
+        control_points          - outputs of compute_rotor_noise_control_point        [None]
+        microphone_locations    - microphone locations                                [m]
+        settings                - accoustic settings                                  [None]
+                               
+    Outputs:
+        Results                 - see compute_rotor_noise                             [None]
+     
+    Properties Used:
+        N/A   
+    '''
     num_mic              = len(microphone_locations[:,0]) 
-    num_cpt              = conditions._size
+    num_cpt              = len(control_points)
     num_f                = len(settings.center_frequencies)
-      
-    # create data structures for computation
-    Noise   = Data()  
-    Results = Data()
+    Results              = Data()
 
     Results.SPL                                           = np.zeros((num_cpt,num_mic))
     Results.SPL_dBA                                       = np.zeros_like(Results.SPL)
@@ -91,100 +248,8 @@ def compute_rotor_noise(microphone_locations,propulsor,rotor,segment,settings, r
     Results.SPL_broadband_1_3_spectrum                    = np.zeros_like(Results.SPL_1_3_spectrum)
     Results.SPL_broadband_1_3_spectrum_dBA                = np.zeros_like(Results.SPL_1_3_spectrum)
 
-    # compute position vector from point source (or should it be origin) at rotor hub to microphones 
-    coordinates   = compute_rotor_point_source_coordinates(propulsor,rotor,conditions,microphone_locations,settings)        
-
-    for cpt in range(num_cpt): 
-        # ----------------------------------------------------------------------------------
-        # Harmonic Noise
-        # ---------------------------------------------------------------------------------- 
-        # harmonic noise with planar load distribution
-        if settings.fidelity == 'plane_source': 
-            aeroacoustic_data = propulsor_conditions[rotor.tag]       
-            Re                = aeroacoustic_data.disc_reynolds_number
-            AOA_sec           = aeroacoustic_data.disc_effective_angle_of_attack  
-            a_loc             = rotor.airfoil_polar_stations
-            num_az            = aeroacoustic_data.number_azimuthal_stations     
-            airfoils          = rotor.airfoils         
-            for jj,airfoil in enumerate(airfoils):
-                airfoil_points      = airfoil.number_of_points 
-            chord_coord             = int(np.floor(airfoil_points/2))       
-                
-            if (identical_propulsors == False) and rotor_index !=0: 
-                prev_aeroacoustic_data                   = propulsor_conditions[previous_rotor_tag]                 
-                prev_aeroacoustic_data                   = propulsor_conditions[rotor.tag]  
-                aeroacoustic_data.disc_lift_distribution = prev_aeroacoustic_data.disc_lift_distribution
-                aeroacoustic_data.disc_drag_distribution = prev_aeroacoustic_data.disc_lift_distribution
-                aeroacoustic_data.disc_lift_coefficient  = prev_aeroacoustic_data.disc_lift_coefficient 
-                aeroacoustic_data.disc_drag_coefficient  = prev_aeroacoustic_data.disc_drag_coefficient  
-                aeroacoustic_data.blade_upper_surface    = prev_aeroacoustic_data.blade_upper_surface
-                aeroacoustic_data.blade_lower_surface    = prev_aeroacoustic_data.blade_lower_surface
-            else: 
-                # Lift and Drag - coefficients and distributions 
-                fL      = np.tile(np.zeros_like(Re)[:,:,:,None],(1,1,1,chord_coord))
-                fD      = np.zeros_like(fL)
-                CL      = np.zeros_like(Re)
-                CD      = np.zeros_like(Re) 
-                y_up    = np.zeros_like(fL)
-                y_low   = np.zeros_like(fL)
-                                  
-                for jj,airfoil in enumerate(airfoils):    
-                    locs                  = np.where(np.array(a_loc) == jj ) 
-                    alpha_azi             = np.atleast_2d(AOA_sec[cpt,locs,:].flatten())
-                    Re_azi                = np.atleast_2d(Re[cpt,locs,:].flatten())      
-                    pd                    = airfoil.polars 
-                    if settings.use_plane_loading_surrogate: 
-                        fL[cpt,locs,:,:]      = pd.lift_distribution_func((alpha_azi,Re_azi)).reshape(1,len(a_loc), num_az,chord_coord) 
-                        fD[cpt,locs,:,:]      = pd.drag_distribution_func((alpha_azi,Re_azi)).reshape(1,len(a_loc), num_az,chord_coord)  
-                        cl_invisc             = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.lift_coefficients)
-                        cd_visc               = interp2d(Re_azi,alpha_azi,pd.reynolds_numbers, pd.angle_of_attacks, pd.drag_coefficients)   
-                        CL[cpt,locs,:]        = cl_invisc.reshape(1, len(a_loc), num_az) 
-                        CD[cpt,locs,:]        = cd_visc.reshape(1, len(a_loc), num_az)                             
-                    
-                    else : 
-                        airfoil_geometry      = import_airfoil_geometry(airfoil.coordinate_file,airfoil_points)
-                        airfoil_properties    = airfoil_analysis(airfoil_geometry,alpha_azi,Re_azi)
-                        fL[cpt,locs,:,:]      = airfoil_properties.fL.reshape(chord_coord, len(a_loc), num_az,1).swapaxes(0, 3)
-                        fD[cpt,locs,:,:]      = airfoil_properties.fD.reshape(chord_coord, len(a_loc), num_az,1).swapaxes(0, 3)
-                        CL[cpt,locs,:]        = airfoil_properties.cl_invisc.reshape(1, len(a_loc), num_az) 
-                        CD[cpt,locs,:]        = airfoil_properties.cd_visc.reshape(1, len(a_loc), num_az) 
-                        
-                    y_up[cpt,locs,:,:]    = airfoil.geometry.y_upper_surface
-                    y_low[cpt,locs,:,:]   = airfoil.geometry.y_lower_surface
-                        
-                aeroacoustic_data.disc_lift_distribution = fL
-                aeroacoustic_data.disc_drag_distribution = fD
-                aeroacoustic_data.disc_lift_coefficient  = CL
-                aeroacoustic_data.disc_drag_coefficient  = CD 
-                aeroacoustic_data.blade_upper_surface    = y_up
-                aeroacoustic_data.blade_lower_surface    = y_low                        
-                        
-            harmonic_noise_plane(harmonics_blade,harmonics_load,conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt)
-        elif settings.fidelity == 'line_source': 
-            harmonic_noise_line(harmonics_blade,harmonics_load,conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt)
-        else:
-            harmonic_noise_point(harmonics_blade,harmonics_load,conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt) 
-    
-        # ----------------------------------------------------------------------------------    
-        # Broadband Noise
-        # ---------------------------------------------------------------------------------- 
-        broadband_noise(conditions,propulsor_conditions,coordinates,rotor,settings,Noise,cpt)  
-    
-        # ----------------------------------------------------------------------------------    
-        # Atmospheric attenuation 
-        # ----------------------------------------------------------------------------------
-        delta_atmo = atmospheric_attenuation(np.linalg.norm(coordinates.X_r[:,0,0,0,:],axis=1),settings.center_frequencies)
-    
-        # ----------------------------------------------------------------------------------    
-        # Combine Harmonic (periodic/tonal) and Broadband Noise
-        # ----------------------------------------------------------------------------------
-        num_mic      = len(coordinates.X_hub[0,:,0,0])
-        SPL_total_1_3_spectrum      = 10*np.log10( 10**(Noise.SPL_prop_harmonic_1_3_spectrum/10) + 10**(Noise.SPL_prop_broadband_1_3_spectrum/10)) - np.tile(delta_atmo[cpt,None,:],(1,num_mic,1))  
-        SPL_total_1_3_spectrum[np.isnan(SPL_total_1_3_spectrum)] = 0 
-    
-        # ----------------------------------------------------------------------------------
-        # Summation of spectra from propellers into one SPL and store results
-        # ----------------------------------------------------------------------------------
+    for cpt, Noise in enumerate(control_points):
+        SPL_total_1_3_spectrum = Noise.SPL_total_1_3_spectrum 
         Results.SPL[cpt,:]                                 = SPL_arithmetic(SPL_total_1_3_spectrum[0], sum_axis=1) 
         Results.SPL_dBA[cpt,:]                             = SPL_arithmetic(A_weighting_metric(SPL_total_1_3_spectrum[0],settings.center_frequencies), sum_axis=1) 
         Results.SPL_harmonic[cpt,:]                        = SPL_arithmetic(Noise.SPL_prop_harmonic_1_3_spectrum[0], sum_axis=1)
@@ -203,6 +268,43 @@ def compute_rotor_noise(microphone_locations,propulsor,rotor,segment,settings, r
         Results.SPL_broadband_1_3_spectrum[cpt,:,:]        = Noise.SPL_prop_broadband_1_3_spectrum 
         Results.SPL_broadband_1_3_spectrum_dBA[cpt,:,:]    = A_weighting_metric(Results.SPL_broadband_1_3_spectrum[cpt,:,:],settings.center_frequencies) 
     
-    # A-weighted
-    conditions.noise[propulsor.tag][rotor.tag] = Results 
-    return rotor.tag 
+    return Results
+
+def evaluate_rotor_noise_control_point(unit):
+    """Computes the noise of one rotor at one control point in a noise worker process. The rotor point 
+    source coordinates are computed once per rotor in each worker. 
+    
+    Assumptions:
+        The worker was set up with initialize_noise_worker
+        
+    Source:
+        None
+
+    Args:
+        unit.
+            keys               : keys of the network, propulsor and rotor in the vehicle  [unitless] 
+            control_point      : index of the control point                               [unitless] 
+            rotor_index        : index of the rotor in the noise evaluation               [unitless] 
+            previous_rotor_tag : tag of the previously evaluated rotor                    [unitless] 
+        
+    Returns: 
+        Noise                  : outputs of compute_rotor_noise_control_point             [unitless] 
+    """     
+    network   = noise_worker.vehicle.networks[unit.keys[0]]
+    propulsor = network.propulsors[unit.keys[1]]
+    rotor     = propulsor[unit.keys[2]]
+    tag       = propulsor.tag + '_' + rotor.tag
+    if tag not in noise_worker.coordinates: 
+        noise_worker.coordinates[tag] = compute_rotor_point_source_coordinates(propulsor,rotor,noise_worker.conditions,noise_worker.microphone_locations,noise_worker.settings) 
+    
+    return compute_rotor_noise_control_point(propulsor,rotor,noise_worker.conditions,noise_worker.coordinates[tag],noise_worker.settings,unit.control_point,
+                                             unit.rotor_index,unit.previous_rotor_tag,network.identical_propulsors)
+
+def initialize_noise_worker(vehicle,conditions,microphone_locations,settings): 
+    """ :meta private:"""
+    noise_worker.vehicle              = vehicle
+    noise_worker.conditions           = conditions
+    noise_worker.microphone_locations = microphone_locations
+    noise_worker.settings             = settings
+    noise_worker.coordinates          = Data()
+    return
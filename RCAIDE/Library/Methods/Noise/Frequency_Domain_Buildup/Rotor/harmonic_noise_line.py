@@ -8,7 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE
 from RCAIDE.Framework.Core                                 import orientation_product, orientation_transpose      
-from RCAIDE.Library.Methods.Noise.Common                         import convert_to_third_octave_band 
+from RCAIDE.Library.Methods.Noise.Common                         import convert_to_third_octave_band, compute_microphone_chunks 
 
 # Python Package imports  
 import numpy as np
@@ -85,52 +85,53 @@ def harmonic_noise_line(harmonics_blade,harmonics_load,conditions,propulsor_cond
     commanded_thrust_vector = np.atleast_2d(propulsor_conditions.commanded_thrust_vector_angle[cpt])
     for jj,airfoil in enumerate(airfoils):
         airfoil_points = airfoil.number_of_points
-        y_u_6          = np.tile(airfoil.geometry.y_upper_surface[None,None,None,None,None,:],(num_cpt,num_mic,num_sec,num_h_b,num_h_l,1))
-        y_l_6          = np.tile(airfoil.geometry.y_lower_surface[None,None,None,None,None,:],(num_cpt,num_mic,num_sec,num_h_b,num_h_l,1))
+        y_u_6          = airfoil.geometry.y_upper_surface[None,None,None,None,None,:]
+        y_l_6          = airfoil.geometry.y_lower_surface[None,None,None,None,None,:]
     chord_coord             = int(np.floor(airfoil_points/2))
     
     # ----------------------------------------------------------------------------------
     # Rotational Noise  Thickness and Loading Noise
     # ----------------------------------------------------------------------------------  
-    # [control point, microphones, rotors, radial distribution, blade harmonics, load harmonics]  
+    # [control point, microphones, radial distribution, blade harmonics, load harmonics, chordwise coordinate] 
+    # arrays are broadcast along the dimensions they do not vary in 
     
     # freestream density and speed of sound
-    a_3            = np.tile(freestream.speed_of_sound[cpt][:,None,None],(1,num_mic,num_h_b))
-    rho_3          = np.tile(freestream.density[cpt][:,None,None],(1,num_mic,num_h_b))
+    a_3            = freestream.speed_of_sound[cpt][:,None,None]
+    rho_3          = freestream.density[cpt][:,None,None]
     
     B              = rotor.number_of_blades
     
     # blade harmonics
-    m_3            = np.tile(harmonics_blade[None,None,:],(num_cpt,num_mic,1))
-    m_4            = np.tile(harmonics_blade[None,None,:,None],(num_cpt,num_mic,1,num_h_l))
-    m_5            = np.tile(harmonics_blade[None,None,None,:,None],(num_cpt,num_mic,num_sec,1,num_h_l))
-    m_6            = np.tile(harmonics_blade[None,None,None,:,None,None],(num_cpt,num_mic,num_sec,1,num_h_l,chord_coord))
+    m_3            = harmonics_blade[None,None,:]
+    m_4            = harmonics_blade[None,None,:,None]
+    m_5            = harmonics_blade[None,None,None,:,None]
+    m_6            = harmonics_blade[None,None,None,:,None,None]
     
     # loading harmonics
-    k_4            = np.tile(harmonics_load[None,None,None,:],(num_cpt,num_mic,num_h_b,1))
-    k_5            = np.tile(harmonics_load[None,None,None,None,:],(num_cpt,num_mic,num_sec,num_h_b,1))                                                                                        
-    k_6            = np.tile(harmonics_load[None,None,None,None,:,None],(num_cpt,num_mic,num_sec,num_h_b,1,chord_coord))
+    k_4            = harmonics_load[None,None,None,:]
+    k_5            = harmonics_load[None,None,None,None,:]
+    k_6            = harmonics_load[None,None,None,None,:,None]
     
     # reference atmospheric pressure
     p_ref          = 2E-5
         
     # net angle of inclination of propeller axis wrt inertial axis
-    alpha_4        = np.tile((angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None],(1,num_mic,num_h_b,num_h_l))
-    alpha_5        = np.tile((angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None],(1,num_mic,num_sec,num_h_b,num_h_l))
-    alpha_6        = np.tile((angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None,None],(1,num_mic,num_sec,num_h_b,num_h_l,chord_coord))
+    alpha_4        = (angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None]
+    alpha_5        = (angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None]
+    alpha_6        = (angle_of_attack + np.arccos(body2thrust[0,0]))[:,:,None,None,None,None]
     
     # rotor angular speed
-    omega_3        = np.tile(aeroacoustic_data.omega[cpt][:,None,None],(1,num_mic,num_h_b))
+    omega_3        = aeroacoustic_data.omega[cpt][:,None,None]
     
     R              = rotor.radius_distribution
     
     # Non-dimensional radius distribution
-    z_5            = np.tile((R/R[-1])[None,None,:,None,None],(num_cpt,num_mic,1,num_h_b,num_h_l))
-    z_6            = np.tile((R/R[-1])[None,None,:,None,None,None],(num_cpt,num_mic,1,num_h_b,num_h_l,chord_coord))
+    z_5            = (R/R[-1])[None,None,:,None,None]
+    z_6            = (R/R[-1])[None,None,:,None,None,None]
     
     # Radial chord distribution
-    c_5            = np.tile(rotor.chord_distribution[None,None,:,None,None],(num_cpt,num_mic,1,num_h_b,num_h_l))
-    c_6            = np.tile(rotor.chord_distribution[None,None,:,None,None,None],(num_cpt,num_mic,1,num_h_b,num_h_l,chord_coord))
+    c_5            = rotor.chord_distribution[None,None,:,None,None]
+    c_6            = rotor.chord_distribution[None,None,:,None,None,None]
     
     # chord to diameter ratio
     R_tip          = rotor.tip_radius
@@ -140,52 +141,27 @@ def harmonic_noise_line(harmonics_blade,harmonics_load,conditions,propulsor_cond
     
     # maximum thickness to chord ratio
     t_b            = rotor.thickness_to_chord
-    t_b_5          = np.tile(t_b[None,None,:,None,None],(num_cpt,num_mic,1,num_h_b,num_h_l))
+    t_b_5          = t_b[None,None,:,None,None]
     
     # chordwise thickness distribution normalized wrt chord
     
     H_6            = (y_u_6 - y_l_6)/c_6
     
     # Rotorcraft speed and mach number
-    V_3            = np.tile(np.linalg.norm(velocity_vector, axis=1) [:,None,None],(1,num_mic,num_h_b))
+    V_3            = np.linalg.norm(velocity_vector, axis=1) [:,None,None]
     M_3            = V_3/a_3
-    M_5            = np.tile(M_3[:,:,None,:,None],(1,1,num_sec,1,num_h_l))
-    M_6            = np.tile(M_3[:,:,None,:,None,None],(1,1,num_sec,1,num_h_l,chord_coord))
+    M_5            = M_3[:,:,None,:,None]
+    M_6            = M_3[:,:,None,:,None,None]
     
     # Rotor tip speed and mach number
     V_tip          = R_tip*omega_3                                                        
     M_t_3          = V_tip/a_3
-    M_t_5          = np.tile(M_t_3[:,:,None,:,None],(1,1,num_sec,1,num_h_l))
-    M_t_6          = np.tile(M_t_3[:,:,None,:,None,None],(1,1,num_sec,1,num_h_l,chord_coord))
+    M_t_5          = M_t_3[:,:,None,:,None]
+    M_t_6          = M_t_3[:,:,None,:,None,None]
     
     # Section relative mach number
     M_r_5          = np.sqrt(M_5**2 + (z_5**2)*(M_t_5**2))
     
-    # retarded theta
-    theta_r        = coordinates.theta_hub_r[cpt,:,0,0]
-    theta_r_3      = np.tile(theta_r[None,:,None],(1,1,num_h_b))
-    theta_r_4      = np.tile(theta_r[None,:,None,None],(1,1,num_h_b,num_h_l))
-    theta_r_5      = np.tile(theta_r[None,:,None,None,None],(1,1,num_sec,num_h_b,num_h_l))
-    theta_r_6      = np.tile(theta_r[None,:,None,None,None,None],(1,1,num_sec,num_h_b,num_h_l,chord_coord))
-    
-    # retarded distance to source
-    Y              = np.sqrt(coordinates.X_hub[cpt,:,0,0,1]**2 +  coordinates.X_hub[cpt,:,0,0,2] **2)
-    Y_3            = np.tile(Y[None,:,None],(1,1,num_h_b))
-    r_3            = Y_3/np.sin(theta_r_3)
-    
-    # phase angles
-    phi_0_vec      = np.tile(phi_0[:,None,None,None],(num_cpt,num_mic,num_h_b,num_h_l))
-    phi_4          = np.tile(coordinates.phi_hub_r[cpt,:,0,0,None,None],(1,1,num_h_b,num_h_l)) + phi_0_vec
-    phi_5          = np.tile(phi_4[:,:,None,:,:],(1,1,num_sec,1,1))
-    phi_6          = np.tile(phi_4[:,:,None,:,:,None],(1,1,num_sec,1,1,chord_coord))
-    
-    # total angle between propeller axis and r vector
-    theta_r_prime_4 = np.arccos(np.cos(theta_r_4)*np.cos(alpha_4) + np.sin(theta_r_4)*np.sin(phi_4)*np.sin(alpha_4))
-    theta_r_prime_5 = np.arccos(np.cos(theta_r_5)*np.cos(alpha_5) + np.sin(theta_r_5)*np.sin(phi_5)*np.sin(alpha_5))
-    theta_r_prime_6 = np.arccos(np.cos(theta_r_6)*np.cos(alpha_6) + np.sin(theta_r_6)*np.sin(phi_6)*np.sin(alpha_6))
-    
-    phi_prime_4    = np.arccos((np.sin(theta_r_4)*np.cos(phi_4))/np.sin(theta_r_prime_4))
-    
     # Velocity in the rotor frame
     T_body2inertial = conditions.frames.body.transform_to_inertial
     T_inertial2body = orientation_transpose(T_body2inertial)
@@ -194,21 +170,18 @@ def harmonic_noise_line(harmonics_blade,harmonics_load,conditions,propulsor_cond
     T_body2thrust   = orientation_transpose(body2thrust)
     V_thrust        = orientation_product(T_body2thrust,V_body)
     V_thrust_perp   = np.atleast_2d(V_thrust[cpt,0,None])
-    V_thrust_perp_3 = np.tile(V_thrust_perp[:,:,None],(1,num_mic,num_h_b))
+    V_thrust_perp_3 = V_thrust_perp[:,:,None]
     M_thrust_3      = V_thrust_perp_3/a_3
-    M_thrust_5      = np.tile(M_thrust_3[:,:,None,:,None],(1,1,num_sec,1,num_h_l))
+    M_thrust_5      = M_thrust_3[:,:,None,:,None]
     
     # helicoid angle
     zeta_5          = np.arctan(M_thrust_5/(z_5*M_t_5))
-    zeta_6          = np.tile(zeta_5[:,:,:,:,:,None],(1,1,1,1,1,chord_coord))
+    zeta_6          = zeta_5[:,:,:,:,:,None]
     
     # wavenumbers
     k_m_3          = m_3*B*omega_3/a_3
-    k_m_bar        = k_m_3/(1 - M_3*np.cos(theta_r_3))
-    k_x_hat_5      = 2*B_D_5*(((m_5*B-k_5)*np.cos(zeta_5))/z_5 + (m_5*B*M_t_5*np.cos(theta_r_prime_5)*np.sin(zeta_5))/(1-M_5*np.cos(theta_r_5)))
-    k_x_hat_6      = 2*B_D_6*(((m_6*B-k_6)*np.cos(zeta_6))/z_6 + (m_6*B*M_t_6*np.cos(theta_r_prime_6)*np.sin(zeta_6))/(1-M_6*np.cos(theta_r_6)))
     
-    Noise.f          = B*omega_3*m_3/(2*np.pi)
+    Noise.f          = np.tile(B*omega_3*m_3/(2*np.pi),(1,num_mic,1))
     
     # Frequency domain loading modes
     F_x            = (1/R_tip)*aeroacoustic_data.disc_thrust_distribution[cpt][None,:,:]
@@ -216,38 +189,74 @@ def harmonic_noise_line(harmonics_blade,harmonics_load,conditions,propulsor_cond
     F_phi          = (1/R_tip)*(1/R_temp)*aeroacoustic_data.disc_torque_distribution[cpt][None,:,:]
     F_xk           = sp.fft.rfft(F_x, axis=2)
     F_phik         = sp.fft.rfft(F_phi, axis=2)
-    F_xk_5         = np.tile(F_xk[:,None,:,None,0:num_h_l],(1,num_mic,1,num_h_b,1))
-    F_phik_5       = np.tile(F_phik[:,None,:,None,0:num_h_l],(1,num_mic,1,num_h_b,1))
+    F_xk_5         = F_xk[:,None,:,None,0:num_h_l]
+    F_phik_5       = F_phik[:,None,:,None,0:num_h_l]
     X_edge         = np.linspace(-0.5,0.5,chord_coord+1)
     X              = 0.5*(X_edge[0:-1] + X_edge[1:])
-    X_6            = np.tile(X[None,None,None,None,None,:],(num_cpt,num_mic,num_sec,num_h_b,num_h_l,1))
-    exp_term_6     = np.exp(1j*k_x_hat_6*X_6)
-    
-    # FREQUENCY DOMAIN PRESSURE TERM FOR LOADING
-    J_mBk_5        = jv(m_5*B-k_5, (m_5*B*z_5*M_t_5*np.sin(theta_r_prime_5))/(1-M_5*np.cos(theta_r_5)))
-    Term1_5        = ((m_5*B*z_5*M_t_5*np.cos(theta_r_prime_5))/(1-M_5*np.cos(theta_r_5)))*F_xk_5
-    Term2_5        = -(m_5*B-k_5)*F_phik_5
-    Integrand_5    = (1/z_5)*(Term1_5 + Term2_5)*J_mBk_5
-    Summand_4      = np.trapz(Integrand_5, x=z_5[0,0,:,0,0], axis=2)*np.exp(1j*(m_4*B-k_4)*(phi_prime_4-(np.pi/2)))
-    Summation_3    = np.sum(Summand_4, axis=3)
-    P_Lm           = (1j*B*np.exp(1j*k_m_3*r_3)*Summation_3)/(4*np.pi*r_3*(1-M_3*np.cos(theta_r_3))) 
-    
-    # frequency domain source function for drag and lift
-    psi_V_5        = np.trapz(H_6*exp_term_6, x=X, axis=5)
-    
-    # FREQUENCY DOMAIN PRESSURE TERM FOR THICKNESS
-    V_Integrand_5  = (M_r_5**2)*(k_x_hat_5**2)*t_b_5*psi_V_5*J_mBk_5
-    V_Summand_4    = np.trapz(V_Integrand_5, x=z_5[0,0,:,0,0], axis=2)*np.exp(1j*m_4*B*(phi_prime_4-(np.pi/2)))
-    
-    # we take a single dimension along the 4th axis because we only want the loading mode corresponding to k=0
-    V_Summation_3  = V_Summand_4[:,:,:,0]
-    P_Vm           = (-rho_3*(a_3**2)*B*np.exp(1j*k_m_3*r_3)*V_Summation_3)/(4*np.pi*(r_3/R_tip)*(1-M_3*np.cos(theta_r_3)))
-
-    # SOUND PRESSURE LEVELS
-    P_Lm_abs       = np.abs(P_Lm)
-    P_Vm_abs       = np.abs(P_Vm)
-    Noise.SPL_prop_harmonic_bpf_spectrum     = 20*np.log10((abs(P_Lm_abs + P_Vm_abs))/p_ref)  
-    Noise.SPL_prop_harmonic_1_3_spectrum     = convert_to_third_octave_band(Noise.SPL_prop_harmonic_bpf_spectrum,Noise.f,settings)          
+    X_6            = X[None,None,None,None,None,:]
+    
+    Noise.SPL_prop_harmonic_bpf_spectrum = np.zeros((num_cpt,num_mic,num_h_b))
+    Noise.SPL_prop_harmonic_1_3_spectrum = np.zeros((num_cpt,num_mic,len(settings.center_frequencies)))
+    
+    # evaluate blocks of microphones, each block holds about 6 complex arrays of size 
+    # (radial distribution, blade harmonics, load harmonics, chordwise coordinate) per microphone 
+    for mics in compute_microphone_chunks(num_mic, 6*num_sec*num_h_b*num_h_l*chord_coord*16, settings.microphone_chunk_memory): 
+        
+        # retarded theta
+        theta_r        = coordinates.theta_hub_r[cpt,mics,0,0]
+        theta_r_3      = theta_r[None,:,None]
+        theta_r_4      = theta_r[None,:,None,None]
+        theta_r_5      = theta_r[None,:,None,None,None]
+        theta_r_6      = theta_r[None,:,None,None,None,None]
+        
+        # retarded distance to source
+        Y              = np.sqrt(coordinates.X_hub[cpt,mics,0,0,1]**2 +  coordinates.X_hub[cpt,mics,0,0,2] **2)
+        Y_3            = Y[None,:,None]
+        r_3            = Y_3/np.sin(theta_r_3)
+        
+        # phase angles
+        phi_0_vec      = phi_0[:,None,None,None]
+        phi_4          = coordinates.phi_hub_r[cpt,mics,0,0][None,:,None,None] + phi_0_vec
+        phi_5          = phi_4[:,:,None,:,:]
+        phi_6          = phi_4[:,:,None,:,:,None]
+        
+        # total angle between propeller axis and r vector
+        theta_r_prime_4 = np.arccos(np.cos(theta_r_4)*np.cos(alpha_4) + np.sin(theta_r_4)*np.sin(phi_4)*np.sin(alpha_4))
+        theta_r_prime_5 = np.arccos(np.cos(theta_r_5)*np.cos(alpha_5) + np.sin(theta_r_5)*np.sin(phi_5)*np.sin(alpha_5))
+        theta_r_prime_6 = np.arccos(np.cos(theta_r_6)*np.cos(alpha_6) + np.sin(theta_r_6)*np.sin(phi_6)*np.sin(alpha_6))
+        
+        phi_prime_4    = np.arccos((np.sin(theta_r_4)*np.cos(phi_4))/np.sin(theta_r_prime_4))
+        
+        # wavenumbers
+        k_x_hat_5      = 2*B_D_5*(((m_5*B-k_5)*np.cos(zeta_5))/z_5 + (m_5*B*M_t_5*np.cos(theta_r_prime_5)*np.sin(zeta_5))/(1-M_5*np.cos(theta_r_5)))
+        k_x_hat_6      = 2*B_D_6*(((m_6*B-k_6)*np.cos(zeta_6))/z_6 + (m_6*B*M_t_6*np.cos(theta_r_prime_6)*np.sin(zeta_6))/(1-M_6*np.cos(theta_r_6)))
+        exp_term_6     = np.exp(1j*k_x_hat_6*X_6)
+        
+        # FREQUENCY DOMAIN PRESSURE TERM FOR LOADING
+        J_mBk_5        = jv(m_5*B-k_5, (m_5*B*z_5*M_t_5*np.sin(theta_r_prime_5))/(1-M_5*np.cos(theta_r_5)))
+        Term1_5        = ((m_5*B*z_5*M_t_5*np.cos(theta_r_prime_5))/(1-M_5*np.cos(theta_r_5)))*F_xk_5
+        Term2_5        = -(m_5*B-k_5)*F_phik_5
+        Integrand_5    = (1/z_5)*(Term1_5 + Term2_5)*J_mBk_5
+        Summand_4      = np.trapz(Integrand_5, x=z_5[0,0,:,0,0], axis=2)*np.exp(1j*(m_4*B-k_4)*(phi_prime_4-(np.pi/2)))
+        Summation_3    = np.sum(Summand_4, axis=3)
+        P_Lm           = (1j*B*np.exp(1j*k_m_3*r_3)*Summation_3)/(4*np.pi*r_3*(1-M_3*np.cos(theta_r_3))) 
+        
+        # frequency domain source function for drag and lift
+        psi_V_5        = np.trapz(H_6*exp_term_6, x=X, axis=5)
+        
+        # FREQUENCY DOMAIN PRESSURE TERM FOR THICKNESS
+        V_Integrand_5  = (M_r_5**2)*(k_x_hat_5**2)*t_b_5*psi_V_5*J_mBk_5
+        V_Summand_4    = np.trapz(V_Integrand_5, x=z_5[0,0,:,0,0], axis=2)*np.exp(1j*m_4*B*(phi_prime_4-(np.pi/2)))
+        
+        # we take a single dimension along the 4th axis because we only want the loading mode corresponding to k=0
+        V_Summation_3  = V_Summand_4[:,:,:,0]
+        P_Vm           = (-rho_3*(a_3**2)*B*np.exp(1j*k_m_3*r_3)*V_Summation_3)/(4*np.pi*(r_3/R_tip)*(1-M_3*np.cos(theta_r_3)))
+    
+        # SOUND PRESSURE LEVELS
+        P_Lm_abs       = np.abs(P_Lm)
+        P_Vm_abs       = np.abs(P_Vm)
+        Noise.SPL_prop_harmonic_bpf_spectrum[:,mics]   = 20*np.log10((abs(P_Lm_abs + P_Vm_abs))/p_ref)  
+        Noise.SPL_prop_harmonic_1_3_spectrum[:,mics]   = convert_to_third_octave_band(Noise.SPL_prop_harmonic_bpf_spectrum[:,mics],Noise.f[:,mics],settings)          
     Noise.SPL_prop_harmonic_1_3_spectrum[np.isinf(Noise.SPL_prop_harmonic_1_3_spectrum)]         = 0     
     
-    return 
\ No newline at end of file
+    return  
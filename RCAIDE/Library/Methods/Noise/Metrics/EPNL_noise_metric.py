@@ -24,46 +24,36 @@ def EPNL_noise_metric(PNLT):
         N/A
 
     Inputs:
-        PNLT - Perceived Noise Level with Tone Correction  [PNLdB]
+        PNLT - Perceived Noise Level with Tone Correction, time along the first axis  [PNLdB]
      
      Outputs:
-        EPNL - Effective Perceived Noise Level             [EPNdB]
+        EPNL - Effective Perceived Noise Level of each microphone                   [EPNdB]
      
     Properties Used:
         N/A  
     """           
     # Maximum PNLT on the time history data    
-    n_mic    = len(PNLT[0,:])
     PNLT_max = np.max(PNLT,axis=0)
     
     # Calculates the number of discrete points on the trajectory
     nsteps   = len(PNLT)    
-    EPNL     = np.zeros(n_mic)
-    for j in range(n_mic):
-        # Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
-        i = 0
-        while PNLT[i][j]<=(PNLT_max[j]-10) and i<=nsteps:
-            i = i+1
-        t1 = i #t1 is the first time interval
-        i  = i+1
+    steps    = np.arange(nsteps)[:,None]
     
-        # Correction for PNLTM-10 when it falls outside the limit of the data
-        if PNLT[nsteps-1][j]>=(PNLT_max[j]-10):
-            t2=nsteps-2
-        else:
-            while i<=nsteps and PNLT[i][j]>=(PNLT_max[j]-10):
-                i = i+1
-            t2 = i-1 #t2 is the last time interval 
+    # Finding the time duration for the noise history where PNL is higher than the maximum PNLT - 10 dB
+    t1 = np.argmax(PNLT>(PNLT_max-10),axis=0) #t1 is the first time interval 
+    
+    # Correction for PNLTM-10 when it falls outside the limit of the data
+    t2 = np.argmax((steps>t1) & ~(PNLT>=(PNLT_max-10)),axis=0) - 1 #t2 is the last time interval 
+    t2 = np.where(PNLT[nsteps-1]>=(PNLT_max-10), nsteps-2, t2)
+    
+    # Calculates the integral of the PNLT which between t1 and t2 points, an interval starting at -1 includes the last point
+    sumation = np.sum(np.where((steps>=t1-1) & (steps<=t2), 10**(PNLT/10), 0),axis=0)
+    sumation = sumation + np.where(t1==0, 10**(PNLT[-1]/10), 0)
         
-        # Calculates the integral of the PNLT which between t1 and t2 points
-        sumation = 0
-        for i in range (t1-1,t2+1):
-            sumation = 10**(PNLT[i][j]/10)+sumation
-            
-        # Duration Correction calculation
-        duration_correction = 10*np.log10(sumation)-PNLT_max[j]-13
-                    
-        # Final EPNL calculation
-        EPNL[j] = PNLT_max[j]+duration_correction
+    # Duration Correction calculation
+    duration_correction = 10*np.log10(sumation)-PNLT_max-13
+                
+    # Final EPNL calculation
+    EPNL = PNLT_max+duration_correction
     
-    return EPNL   
\ No newline at end of file
+    return EPNL
\ No newline at end of file
@@ -23,10 +23,10 @@ def PNL_noise_metric(SPL):
         None
  
     Inputs:
-        SPL - Sound Pressure Level in 1/3 octave band  [dB]
+        SPL - Sound Pressure Level in 1/3 octave band, bands along the last axis  [dB]
    
     Outputs:
-        PNL - Perceived Noise Level                    [dB]
+        PNL - Perceived Noise Level of each spectrum                              [dB]
    
     Properties Used:
         N/A    
@@ -34,7 +34,7 @@ def PNL_noise_metric(SPL):
    
 
     #Definition of the noisinees matrix for each octave band
-    noy =  [[1, 50, 91, 64, 52, 49, 55, 0.043478, 0.030103, 0.07952, 0.058098],
+    noy =  np.array([[1, 50, 91, 64, 52, 49, 55, 0.043478, 0.030103, 0.07952, 0.058098],
             [2,	63, 85.9, 60, 51, 44, 51, 0.04057, 0.030103, 0.06816, 0.058098],
             [3,	80, 87.3, 56, 49, 39,	46,	0.036831, 0.030103, 0.06816, 0.052288],
             [4,	100, 	79.9,	53,	47,	34,	42,	0.036831, 0.030103, 0.05964, 0.047534],
@@ -57,44 +57,29 @@ def PNL_noise_metric(SPL):
             [21, 5000, 9999999,	30,	30,	6,	15,	0.02996, 0, 0.053013, 0.034859],
             [22, 6300, 9999999, 31,	31,	10,	17,	0.02996, 0, 0.06816, 0.037349],
             [23, 8000, 44.3, 37, 34, 17, 23, 0.042285, 0.02996, 0.07952, 0.037349],
-            [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]]
+            [24, 10000, 50.7, 41, 37, 21, 29, 0.042285,	0.02996, 0.05964, 0.043573]])
 
     
-    # Defining the necessary arrays for the calculation
-    n_cpts  = len(SPL[:,0,0])
-    n_mic   = len(SPL[0,:,0])
-    SPL_noy = np.zeros((n_cpts,n_mic,24))
-    PNL     = np.zeros((n_cpts,n_mic))
-    
     #-------------------------------------------
     # STEP 1 - Convert SPL to Perceived Noisiness
     #-------------------------------------------  
-    for k in range(n_mic):
-        for j in range(n_cpts):
-            for i in range(24):
-                if SPL[j][k][i]>=noy[1][2]:
-                    SPL_noy[j][k][i] = 10**(noy[i][8]*(SPL[j][k][i]-noy[i][4]))
-                    
-                if SPL[j][k][i]>=noy[i][3] and SPL[j][k][i]<noy[i][2]:
-                    SPL_noy[j][k][i] = 10**(noy[i][7]*(SPL[j][k][i]-noy[i][3]))
-                    
-                if SPL[j][k][i]>=noy[i][6] and SPL[j][k][i]<noy[i][3]:
-                    SPL_noy[j][k][i] = 0.3*(10**(noy[i][10]*(SPL[j][k][i]-noy[i][6])))
-                    
-                if SPL[j][k][i]>=noy[i][5] and SPL[j][k][i]<noy[i][6]:
-                    SPL_noy[j][k][i] = 0.1*(10**(noy[i][9]*(SPL[j][k][i]-noy[i][5])))
-                
-            #-------------------------------------------  
-            # STEP 2 - Combine perceived noiseness values  
-            #-------------------------------------------
-            max_noy = np.max(SPL_noy[j][k][:])            
-            Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy[j][k][:])
-            
-            #-----------------------------------------------------------------
-            # STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
-            #------------------------------------------------------------------    
-            if Perceived_noisinees==0:
-                Perceived_noisinees = 0.0625
-            PNL[j,k] = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
+    # the bands of SPL are along the last axis, all spectra are converted at once 
+    SPL_noy = np.zeros(SPL.shape)
+    SPL_noy = np.where(SPL>=noy[1,2], 10**(noy[:,8]*(SPL-noy[:,4])), SPL_noy)
+    SPL_noy = np.where((SPL>=noy[:,3]) & (SPL<noy[:,2]), 10**(noy[:,7]*(SPL-noy[:,3])), SPL_noy)
+    SPL_noy = np.where((SPL>=noy[:,6]) & (SPL<noy[:,3]), 0.3*(10**(noy[:,10]*(SPL-noy[:,6]))), SPL_noy)
+    SPL_noy = np.where((SPL>=noy[:,5]) & (SPL<noy[:,6]), 0.1*(10**(noy[:,9]*(SPL-noy[:,5]))), SPL_noy)
+        
+    #-------------------------------------------  
+    # STEP 2 - Combine perceived noiseness values  
+    #-------------------------------------------
+    max_noy             = np.max(SPL_noy,axis=-1)            
+    Perceived_noisinees = 0.85*max_noy+0.15*np.sum(SPL_noy,axis=-1)
+    
+    #-----------------------------------------------------------------
+    # STEP 3 - Convert Perceived Noiseness into Perceived Noise Level
+    #------------------------------------------------------------------    
+    Perceived_noisinees = np.where(Perceived_noisinees==0, 0.0625, Perceived_noisinees)
+    PNL = 40+(10/np.log10(2))*np.log10(Perceived_noisinees)
         
     return PNL
\ No newline at end of file
@@ -15,11 +15,15 @@ from RCAIDE.Library.Plots.Common import set_axes, plot_style
 # Pacakge imports 
 import numpy as np
 from matplotlib import pyplot as plt
+from concurrent.futures import ProcessPoolExecutor
+
+# mission of a payload range worker process
+payload_range_worker = Data()
  
 # ----------------------------------------------------------------------
 #  Calculate vehicle Payload Range Diagram
 # ----------------------------------------------------------------------  
-def compute_payload_range_diagram(vehicle,assigned_propulsors,weights_analysis,aerodynamics_analysis,cruise_airspeed = 515*Units.mph, cruise_altitude= 35000*Units.feet,max_range_guess = 1000*Units.nmi, reserves=0., plot_diagram = True, fuel_name=None):  
+def compute_payload_range_diagram(vehicle,assigned_propulsors,weights_analysis,aerodynamics_analysis,cruise_airspeed = 515*Units.mph, cruise_altitude= 35000*Units.feet,max_range_guess = 1000*Units.nmi, reserves=0., plot_diagram = True, fuel_name=None, number_of_workers = 1, warm_start = False, secant_update = False):  
     """Calculates and plots the payload range diagram for an aircraft by modifying the cruise segment and weights of the aicraft .
 
         Sources:
@@ -33,6 +37,9 @@ def compute_payload_range_diagram(vehicle,assigned_propulsors,weights_analysis,a
             mission             data structure for mission                   [-] 
             cruise_segment_tag  string of cruise segment                     [string]
             reserves            reserve fuel                                 [unitless] 
+            number_of_workers   processes evaluating the diagram points      [unitless]
+            warm_start          start each solve from the last converged unknowns [boolean]
+            secant_update       update the cruise distance with secant steps [boolean]
             
         Outputs: 
             payload_range       data structure of payload range properties   [m/s]
@@ -53,7 +60,7 @@ def compute_payload_range_diagram(vehicle,assigned_propulsors,weights_analysis,a
             # create mission instances (for multiple types of missions)
             missions = missions_setup(mission) 
             cruise_segment_tag = 'cruise'
-            payload_range  =  conventional_payload_range_diagram(vehicle, missions.base_mission,cruise_segment_tag,reserves,plot_diagram,fuel_name) 
+            payload_range  =  conventional_payload_range_diagram(vehicle, missions.base_mission,cruise_segment_tag,reserves,plot_diagram,fuel_name,number_of_workers,warm_start,secant_update) 
         elif type(network) == RCAIDE.Framework.Networks.Electric:
             electric_aircraft =  True
              
@@ -66,7 +73,7 @@ def compute_payload_range_diagram(vehicle,assigned_propulsors,weights_analysis,a
             payload_range  =  electric_payload_range_diagram(vehicle,missions.base_mission,cruise_segment_tag,plot_diagram)
     return payload_range 
              
-def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,reserves,plot_diagram, fuel_name): 
+def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,reserves,plot_diagram, fuel_name, number_of_workers = 1, warm_start = False, secant_update = False): 
     """Calculates and plots the payload range diagram for a fuel-bases aircraft by modifying the
     cruise segment range and weights of the aicraft .
 
@@ -74,13 +81,18 @@ def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,reserv
         N/A
 
         Assumptions:
-        None 
+        With more than one worker, the points are evaluated on a pool of processes, each holding a
+        copy of the mission. The warm start and secant update converge to the same fuel tolerance
+        as the default iteration in fewer mission evaluations.
 
         Inputs:
             vehicle             data structure for aircraft                  [-]
             mission             data structure for mission                   [-] 
             cruise_segment_tag  string of cruise segment                     [string]
             reserves            reserve fuel                                 [unitless] 
+            number_of_workers   processes evaluating the diagram points      [unitless]
+            warm_start          start each solve from the last converged unknowns [boolean]
+            secant_update       update the cruise distance with secant steps [boolean]
             
         Outputs: 
             payload_range       data structure of payload range properties   [m/s]
@@ -121,58 +133,20 @@ def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,reserv
     FUEL    = [ min(TOW[1] - OEW - MaxPLD,MaxFuel) , MaxFuel                , MaxFuel       ]
     PLD     = [ MaxPLD                             , min(MTOW - MaxFuel - OEW, MaxPLD)   , 0.   ]
     
-    # allocating Range array
-    R       = [0,0,0]
-
-    # loop for each point of Payload Range Diagram
-    for i in range(len(TOW)):
-        ##    for i in [2]: 
-        # Define takeoff weight
-        mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW[i]
-
-        # Evaluate mission with current TOW
-        results = mission.evaluate()
-        segment = results.segments[cruise_segment_tag]
-
-        # Distance convergency in order to have total fuel equal to target fuel
-        #
-        # User don't have the option of run a mission for a given fuel. So, we
-        # have to iterate distance in order to have total fuel equal to target fuel
-        #
-
-        maxIter = 10    # maximum iteration limit
-        tol     = 1.    # fuel convergency tolerance
-        err     = 9999. # error to be minimized
-        iter    = 0     # iteration count
-
-        while abs(err) > tol and iter < maxIter:
-            iter = iter + 1
-
-            # Current total fuel burned in mission
-            TotalFuel  = TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0]
-
-            # Difference between burned fuel and target fuel
-            missingFuel = FUEL[i] - TotalFuel - reserves
-
-            # Current distance and fuel consuption in the cruise segment
-            CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
-            CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
-            # Current specific range (m/kg)
-            CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
-
-            # Estimated distance that will result in total fuel burn = target fuel
-            DeltaDist  =  CruiseSR *  missingFuel
-            mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
-
-            # running mission with new distance
-            results = mission.evaluate()
-            segment = results.segments[cruise_segment_tag]
-
-            # Difference between burned fuel and target fuel
-            err = ( TOW[i] - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL[i] + reserves 
-
-        # Allocating resulting range in ouput array.
-        R[i] =  results.segments[-1].conditions.frames.inertial.position_vector[-1,0]   
+    # evaluate each point of the Payload Range Diagram
+    points  = [Data(takeoff_weight = TOW[i], fuel = FUEL[i]) for i in range(len(TOW))]
+    guesses = [Data({tag: control.initial_guess_values for tag,control in segment.assigned_control_variables.items()}) for segment in mission.segments]
+    
+    if number_of_workers > 1 and len(points) > 1:
+        with ProcessPoolExecutor(max_workers = min(number_of_workers,len(points)), initializer = initialize_payload_range_worker, initargs = (mission,cruise_segment_tag,reserves,warm_start,secant_update)) as executor:
+            R = list(executor.map(compute_payload_range_point, points))
+    else:
+        R = [compute_payload_range_point(point,mission,cruise_segment_tag,reserves,warm_start,secant_update) for point in points]
+        
+    # restore the initial guesses of the mission replaced by the warm start
+    for segment, guess in zip(mission.segments,guesses):
+        for tag,control in segment.assigned_control_variables.items():
+            control.initial_guess_values = guess[tag]
 
     # Inserting point (0,0) in output arrays
     R.insert(0,0)
@@ -212,6 +186,143 @@ def conventional_payload_range_diagram(vehicle,mission,cruise_segment_tag,reserv
 
     return payload_range 
  
+def compute_payload_range_point(point, mission = None, cruise_segment_tag = None, reserves = 0., warm_start = False, secant_update = False):
+    """Computes the range of one point of the payload range diagram by iterating the cruise segment
+    distance until the fuel burned in the mission equals the fuel of the point.
+
+        Sources:
+        N/A
+
+        Assumptions:
+        Without a mission, the mission of the payload range worker process is used
+
+        Inputs:
+            point               data structure of the point                  [-]
+              .takeoff_weight   takeoff weight                               [kg]
+              .fuel             fuel                                         [kg]
+            mission             data structure for mission                   [-] 
+            cruise_segment_tag  string of cruise segment                     [string]
+            reserves            reserve fuel                                 [kg] 
+            warm_start          start each solve from the last converged unknowns [boolean]
+            secant_update       update the cruise distance with secant steps [boolean]
+            
+        Outputs: 
+            range               range of the point                           [m]
+    """ 
+    if mission is None:
+        mission            = payload_range_worker.mission
+        cruise_segment_tag = payload_range_worker.cruise_segment_tag
+        reserves           = payload_range_worker.reserves
+        warm_start         = payload_range_worker.warm_start
+        secant_update      = payload_range_worker.secant_update
+        
+    TOW  = point.takeoff_weight
+    FUEL = point.fuel
+    
+    # Define takeoff weight
+    mission.segments[0].analyses.weights.vehicle.mass_properties.takeoff = TOW
+
+    # Evaluate mission with current TOW
+    results = mission.evaluate()
+    segment = results.segments[cruise_segment_tag]
+    if warm_start:
+        set_initial_guess_values(mission)
+
+    # Distance convergency in order to have total fuel equal to target fuel
+    #
+    # User don't have the option of run a mission for a given fuel. So, we
+    # have to iterate distance in order to have total fuel equal to target fuel
+    #
+
+    maxIter = 10    # maximum iteration limit
+    tol     = 1.    # fuel convergency tolerance
+    err     = 9999. # error to be minimized
+    iter    = 0     # iteration count
+    
+    # cruise distance and total fuel of the previous iteration for the secant update
+    LastDist = None
+    LastFuel = None
+
+    while abs(err) > tol and iter < maxIter:
+        iter = iter + 1
+
+        # Current total fuel burned in mission
+        TotalFuel  = TOW - results.segments[-1].conditions.weights.total_mass[-1,0]
+
+        # Difference between burned fuel and target fuel
+        missingFuel = FUEL - TotalFuel - reserves
+
+        # Current distance and fuel consuption in the cruise segment
+        CruiseDist = np.diff( segment.conditions.frames.inertial.position_vector[[0,-1],0] )[0]        # Distance [m]
+        CruiseFuel = segment.conditions.weights.total_mass[0,0] - segment.conditions.weights.total_mass[-1,0]    # [kg]
+        # Current specific range (m/kg)
+        CruiseSR    = CruiseDist / CruiseFuel        # [m/kg]
+        
+        # Secant specific range between the last two iterations, which accounts for the change in fuel burn with distance
+        if secant_update and LastDist is not None and TotalFuel != LastFuel:
+            CruiseSR = (CruiseDist - LastDist) / (TotalFuel - LastFuel)   # [m/kg]
+        LastDist = CruiseDist
+        LastFuel = TotalFuel
+
+        # Estimated distance that will result in total fuel burn = target fuel
+        DeltaDist  =  CruiseSR *  missingFuel
+        mission.segments[cruise_segment_tag].distance = (CruiseDist + DeltaDist)
+
+        # running mission with new distance
+        results = mission.evaluate()
+        segment = results.segments[cruise_segment_tag]
+        if warm_start:
+            set_initial_guess_values(mission)
+
+        # Difference between burned fuel and target fuel
+        err = ( TOW - results.segments[-1].conditions.weights.total_mass[-1,0] ) - FUEL + reserves 
+
+    return results.segments[-1].conditions.frames.inertial.position_vector[-1,0]   
+
+def set_initial_guess_values(mission):
+    """Sets the initial guesses of the active controls of each converged segment to its converged
+    unknowns, so that the next evaluation of the mission starts from the last solution.
+
+        Sources:
+        N/A
+
+        Assumptions:
+        Segments that did not converge keep their initial guesses
+
+        Inputs:
+            mission             data structure for mission                   [-] 
+            
+        Outputs: 
+            None
+    """ 
+    for segment in mission.segments:
+        if not segment.state.numerics.converged:
+            continue
+        unknowns = segment.state.unknowns
+        ctrls    = segment.assigned_control_variables
+        for tag in ['body_angle','bank_angle','wind_angle','velocity','acceleration','elapsed_time']:
+            if ctrls[tag].active and tag in unknowns:
+                ctrls[tag].initial_guess_values = [[np.copy(unknowns[tag])]]
+        for tag, prefix, assigned in [('throttle','throttle_','assigned_propulsors'),
+                                      ('elevator_deflection','elevator_','assigned_surfaces'),
+                                      ('rudder_deflection','rudder_','assigned_surfaces'),
+                                      ('flap_deflection','flap_','assigned_surfaces'),
+                                      ('slat_deflection','slat_','assigned_surfaces'),
+                                      ('aileron_deflection','aileron_','assigned_surfaces'),
+                                      ('thrust_vector_angle','thrust_vector_','assigned_propulsors')]:
+            if ctrls[tag].active and (prefix + '0') in unknowns:
+                ctrls[tag].initial_guess_values = [[np.copy(unknowns[prefix + str(i)])] for i in range(len(ctrls[tag][assigned]))]
+    return 
+
+def initialize_payload_range_worker(mission, cruise_segment_tag, reserves, warm_start, secant_update): 
+    """ :meta private:"""
+    payload_range_worker.mission            = mission
+    payload_range_worker.cruise_segment_tag = cruise_segment_tag
+    payload_range_worker.reserves           = reserves
+    payload_range_worker.warm_start         = warm_start
+    payload_range_worker.secant_update      = secant_update
+    return 
+ 
 def electric_payload_range_diagram(vehicle,mission,cruise_segment_tag,plot_diagram):
     """Calculates and plots the payload range diagram for an electric aircraft by modifying the
     cruise segment distance and payload weight of the aicraft .
@@ -2,7 +2,7 @@
 # fidelity_zero_wake_convergence.py
 #
 # Created:  Feb 2022, R. Erhard
-# Modified: 
+# Modified: Oct 2026, RCAIDE Team
 
 from RCAIDE.Library.Methods.Aerodynamics.Common.Lift.BET_calculations import compute_airfoil_aerodynamics,compute_inflow_and_tip_loss
 import numpy as np
@@ -49,10 +49,22 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     else:
         PSI    = np.ones((ctrl_pts,Nr))
 
-    PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
-    
-    if ier!=1:
-        print("Rotor BEVW did not converge to a solution (Stall)")
+    inflow_solver = wake.inflow_solver
+    if inflow_solver == 'fsolve':
+        PSI_final,infodict,ier,msg = sp.optimize.fsolve(iteration,PSI,args=(wake_inputs,rotor),xtol=rotor.sol_tolerance,full_output = 1,band=(1,0))
+        
+        # fsolve only reports the convergence of the whole solve
+        converged                  = np.full(np.shape(PSI),ier==1)
+        if ier!=1:
+            print("Rotor BEVW did not converge to a solution (Stall)")
+    elif inflow_solver == 'newton':
+        PSI_final,converged        = newton_inflow_solve(PSI.flatten(),wake_inputs,rotor,rotor.sol_tolerance)
+        converged                  = np.reshape(converged,np.shape(PSI))
+        if not np.all(converged):
+            print("Rotor BEVW did not converge to a solution (Stall) at " + str(np.size(converged) - np.count_nonzero(converged)) + " of " + str(np.size(converged)) + " stations")
+    else:
+        raise ValueError('unknown inflow solver "%s", must be "fsolve" or "newton"' % inflow_solver)
+    wake_inputs.converged = converged
     
     # Calculate the velocities given PSI
     va, vt = va_vt(PSI_final, wake_inputs, rotor)
@@ -60,6 +72,73 @@ def fidelity_zero_wake_convergence(wake,rotor,wake_inputs):
     
     return va, vt
 
+## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
+def newton_inflow_solve(PSI,wake_inputs,rotor,tolerance,maximum_iterations=100,maximum_step=0.2):
+    """
+    Solves the BEVW residual for the inflow angle of every blade station. The residual of a station only
+    depends on the inflow angle of that station, so the Jacobian is diagonal and a Newton iteration is
+    applied element-wise to all stations at once. The derivative of each station is found by a forward
+    difference, the steps are limited and halved for the stations where they do not reduce the residual.
+    Stations stop iterating once converged, or once no step reduces their residual (stall).
+
+    Assumptions:
+    The residuals of the stations are decoupled. Where the residual of a station has several roots (near
+    stall), the iteration settles on the first root below the initial guess, which may differ from the
+    root found by fsolve
+
+    Source:
+    N/A
+
+    Inputs:
+       PSI                        initial inflow angles, flattened                [rad]
+       wake_inputs                inputs of the BEVW iteration                    [-]
+       rotor                      rotor                                           [-]
+       tolerance                  relative tolerance on the inflow angle          [-]
+       maximum_iterations         maximum number of Newton iterations             [-]
+       maximum_step               maximum change of an inflow angle per iteration [rad]
+
+    Outputs:
+       PSI                        inflow angles, flattened                        [rad]
+       converged                  convergence of each station, flattened          [-]
+
+    """
+    PSI       = np.array(PSI,dtype=float)
+    R         = iteration(PSI,wake_inputs,rotor)
+    converged = np.zeros(np.size(PSI),dtype=bool)
+    stalled   = np.zeros(np.size(PSI),dtype=bool)
+    
+    for i in range(maximum_iterations):
+        active          = ~(converged | stalled)
+        
+        # element-wise derivative of the residual
+        h               = np.sqrt(np.finfo(float).eps)*np.maximum(np.abs(PSI),1.)
+        dR_dpsi         = (iteration(PSI + h*active,wake_inputs,rotor) - R)/h
+        
+        # limited Newton step
+        with np.errstate(divide='ignore',invalid='ignore'):
+            step        = -R/dR_dpsi
+        step[~np.isfinite(step)] = 0.
+        step            = np.clip(step,-maximum_step,maximum_step)*active
+        small           = np.abs(step) <= tolerance*(np.abs(PSI) + tolerance)
+        
+        # halve the steps that increase the residual 
+        for j in range(10):
+            PSI_new     = PSI + step
+            R_new       = iteration(PSI_new,wake_inputs,rotor)
+            worse       = ~(np.abs(R_new) <= np.abs(R)) & active
+            if not np.any(worse):
+                break
+            step[worse] = 0.5*step[worse]
+        
+        # stations where no step reduces the residual have no solution nearby 
+        PSI             = np.where(worse,PSI,PSI_new)
+        R               = np.where(worse,R,R_new)
+        converged       = converged | (small & active)
+        stalled         = stalled | (worse & ~small)
+        if np.all(converged | stalled):
+            break 
+    
+    return PSI, converged
 
 ## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
 def iteration(PSI, wake_inputs, rotor):
@@ -190,95 +269,3 @@ def va_vt(PSI, wake_inputs, rotor):
     vt           = Ut - Wt
 
     return va, vt
-
-## @defgroup Methods-Propulsion-Rotor_Wake-Fidelity_Zero
-def compute_dR_dpsi(PSI,wake_inputs,rotor):
-    """
-    Computes the analytical derivative for the BEVW iteration.
-
-    Assumptions:
-    N/A
-
-    Source:
-    N/A
-
-    Inputs:
-       B                          number of rotor blades                          [-]
-       beta                       blade twist distribution                        [-]
-       r                          radius distribution                             [m]
-       R                          tip radius                                      [m]
-       Wt                         tangential velocity                             [m/s]
-       Wa                         axial velocity                                  [m/s]
-       U                          total velocity                                  [m/s]
-       Ut                         tangential velocity                             [m/s]
-       Ua                         axial velocity                                  [m/s]
-       cos_psi                    cosine of the inflow angle PSI                  [-]
-       sin_psi                    sine of the inflow angle PSI                    [-]
-       piece                      output of a step in tip loss calculation        [-]
-
-    Outputs:
-       dR_dpsi                    derivative of residual wrt inflow angle         [-]
-
-    """
-    # Unpack inputs to rotor wake fidelity zero
-    U               = wake_inputs.velocity_total
-    Ua              = wake_inputs.velocity_axial
-    Ut              = wake_inputs.velocity_tangential
-    beta            = wake_inputs.twist_distribution
-    r               = wake_inputs.radius_distribution
-    ctrl_pts        = wake_inputs.ctrl_pts
-    Nr              = wake_inputs.Nr
-    Na              = wake_inputs.Na    
-
-    # Unpack rotor data        
-    R        = rotor.tip_radius
-    B        = rotor.number_of_blades      
-    
-    # Reshape PSI because the solver gives it flat
-    if wake_inputs.use_2d_analysis:
-        PSI    = np.reshape(PSI,(ctrl_pts,Nr,Na))
-    else:
-        PSI    = np.reshape(PSI,(ctrl_pts,Nr))    
-    
-    
-    # An analytical derivative for dR_dpsi used in the Newton iteration for the BEVW
-    # This was solved symbolically in Matlab and exported
-    # compute velocities
-    sin_psi      = np.sin(PSI)
-    cos_psi      = np.cos(PSI)
-    Wa           = 0.5*Ua + 0.5*U*sin_psi
-    Wt           = 0.5*Ut + 0.5*U*cos_psi
-    
-    lamdaw, F, piece = compute_inflow_and_tip_loss(r,R,Wa,Wt,B)
-    
-    pi          = np.pi
-    pi2         = np.pi**2
-    BB          = B*B
-    BBB         = BB*B
-    f_wt_2      = 4*Wt*Wt
-    f_wa_2      = 4*Wa*Wa
-    arccos_piece = np.arccos(piece)
-    Ucospsi     = U*cos_psi
-    Usinpsi     = U*sin_psi
-    Utcospsi    = Ut*cos_psi
-    Uasinpsi    = Ua*sin_psi
-    UapUsinpsi  = (Ua + Usinpsi)
-    utpUcospsi  = (Ut + Ucospsi)
-    utpUcospsi2 = utpUcospsi*utpUcospsi
-    UapUsinpsi2 = UapUsinpsi*UapUsinpsi
-    dR_dpsi     = ((4.*U*r*arccos_piece*sin_psi*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5))/B -
-                   (pi*U*(Ua*cos_psi - Ut*sin_psi)*(beta - np.arctan((Wa+Wa)/(Wt+Wt))))/(2.*(f_wt_2 + f_wa_2)**(0.5))
-                   + (pi*U*(f_wt_2 +f_wa_2)**(0.5)*(U + Utcospsi  +  Uasinpsi))/(2.*(f_wa_2/(f_wt_2) + 1.)*utpUcospsi2)
-                   - (4.*U*piece*((16.*UapUsinpsi2)/(BB*pi2*f_wt_2) + 1.)**(0.5)*(R - r)*(Ut/2. -
-                    (Ucospsi)/2.)*(U + Utcospsi + Uasinpsi ))/(f_wa_2*(1. - np.exp(-(B*(Wt+Wt)*(R -
-                    r))/(r*(Wa+Wa))))**(0.5)) + (128.*U*r*arccos_piece*(Wa+Wa)*(Ut/2. - (Ucospsi)/2.)*(U +
-                    Utcospsi  + Uasinpsi ))/(BBB*pi2*utpUcospsi*utpUcospsi2*((16.*f_wa_2)/(BB*pi2*f_wt_2) + 1.)**(0.5)))
-
-    dR_dpsi[np.isnan(dR_dpsi)] = 0.1
-    
-    # This needs to be made into a jacobian
-    dR_dpsi = dR_dpsi.flatten()
-    L       = np.size(PSI)
-    jac     = np.eye(L)*dR_dpsi
-    
-    return jac
\ No newline at end of file
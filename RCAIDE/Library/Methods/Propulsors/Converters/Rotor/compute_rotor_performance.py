@@ -2,6 +2,7 @@
 # (c) Copyright 2023 Aerospace Research Community LLC
 # 
 # Created:  Jul 2024, RCAIDE Team 
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -74,6 +75,7 @@ def compute_rotor_performance(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]
        torque_coefficient                [-]
        power                             [W]
        power_coefficient                 [-]
+       inflow_converged                  [-]
 
     Properties Used:
     rotor.
@@ -481,6 +483,7 @@ def compute_rotor_performance(propulsor,state,center_of_gravity= [[0.0, 0.0,0.0]
                 torque_coefficient                = Cq,
                 power_coefficient                 = Cp, 
                 converged_inflow_ratio            = lamdaw, 
+                inflow_converged                  = wake_inputs.converged,
                 blade_H_distribution              = rotor_drag_distribution,
                 rotor_drag                        = rotor_drag,
                 rotor_drag_coefficient            = Crd,
@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -10,6 +11,7 @@
 from RCAIDE.Library.Methods.Propulsors.Modulators.Electronic_Speed_Controller.compute_esc_performance  import * 
 from RCAIDE.Library.Methods.Propulsors.Converters.DC_Motor.compute_motor_performance                   import *
 from RCAIDE.Library.Methods.Propulsors.Converters.Ducted_Fan.compute_ducted_fan_performance            import * 
+from RCAIDE.Framework.Mission.Common                                                                   import share_conditions
 
 # pacakge imports  
 import numpy as np 
@@ -128,9 +130,10 @@ def reuse_stored_electric_ducted_fan_data(propulsor,state,network,stored_propuls
     ducted_fan_0               = network.propulsors[stored_propulsor_tag].ducted_fan 
     esc_0                      = network.propulsors[stored_propulsor_tag].electronic_speed_controller
     
-    conditions.energy[propulsor.tag][motor.tag]        = deepcopy(conditions.energy[stored_propulsor_tag][motor_0.tag])
-    conditions.energy[propulsor.tag][ducted_fan.tag]   = deepcopy(conditions.energy[stored_propulsor_tag][ducted_fan_0.tag])
-    conditions.energy[propulsor.tag][esc.tag]          = deepcopy(conditions.energy[stored_propulsor_tag][esc_0.tag])
+    copy_conditions                                    = share_conditions if network.share_identical_propulsor_conditions else deepcopy
+    conditions.energy[propulsor.tag][motor.tag]        = copy_conditions(conditions.energy[stored_propulsor_tag][motor_0.tag])
+    conditions.energy[propulsor.tag][ducted_fan.tag]   = copy_conditions(conditions.energy[stored_propulsor_tag][ducted_fan_0.tag])
+    conditions.energy[propulsor.tag][esc.tag]          = copy_conditions(conditions.energy[stored_propulsor_tag][esc_0.tag])
   
     thrust                  = conditions.energy[propulsor.tag][ducted_fan.tag].thrust 
     power                   = conditions.energy[propulsor.tag][esc.tag].power 
@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -10,6 +11,7 @@
 from RCAIDE.Framework.Core import Units  
 from RCAIDE.Library.Methods.Propulsors.Converters.Engine import compute_power_from_throttle
 from RCAIDE.Library.Methods.Propulsors.Converters.Rotor.compute_rotor_performance import  compute_rotor_performance
+from RCAIDE.Framework.Mission.Common                                              import share_conditions
 
 # pacakge imports  
 from copy import deepcopy
@@ -112,8 +114,9 @@ def reuse_stored_ice_data(propulsor,state,network,stored_propulsor_tag,center_of
     engine_0     = network.propulsors[stored_propulsor_tag].engine
     propeller_0  = network.propulsors[stored_propulsor_tag].propeller  
     
-    conditions.energy[propulsor.tag][engine.tag]        = deepcopy(conditions.energy[stored_propulsor_tag][engine_0.tag])
-    conditions.energy[propulsor.tag][propeller.tag]     = deepcopy(conditions.energy[stored_propulsor_tag][propeller_0.tag])
+    copy_conditions                                     = share_conditions if network.share_identical_propulsor_conditions else deepcopy
+    conditions.energy[propulsor.tag][engine.tag]        = copy_conditions(conditions.energy[stored_propulsor_tag][engine_0.tag])
+    conditions.energy[propulsor.tag][propeller.tag]     = copy_conditions(conditions.energy[stored_propulsor_tag][propeller_0.tag])
   
     thrust                  = conditions.energy[propulsor.tag][propeller.tag].thrust 
     power                   = conditions.energy[propulsor.tag][propeller.tag].power 
@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Jul 2024, RCAIDE Team
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -16,6 +17,7 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Turbine            import comp
 from RCAIDE.Library.Methods.Propulsors.Converters.Expansion_Nozzle   import compute_expansion_nozzle_performance 
 from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import compute_compression_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Turbofan_Propulsor            import compute_thrust
+from RCAIDE.Framework.Mission.Common                                 import share_conditions
 
 import  numpy as  np
 from copy import  deepcopy
@@ -286,8 +288,9 @@ def reuse_stored_turbofan_data(turbofan,state,network,stored_propulsor_tag,cente
     N.A.        
     ''' 
     conditions                                      = state.conditions  
-    conditions.energy[turbofan.tag]  = deepcopy(conditions.energy[stored_propulsor_tag])
-    conditions.noise[turbofan.tag]   = deepcopy(conditions.noise[stored_propulsor_tag])
+    copy_conditions                  = share_conditions if network.share_identical_propulsor_conditions else deepcopy
+    conditions.energy[turbofan.tag]  = copy_conditions(conditions.energy[stored_propulsor_tag])
+    conditions.noise[turbofan.tag]   = copy_conditions(conditions.noise[stored_propulsor_tag])
     
     # compute moment  
     moment_vector      = 0*state.ones_row(3)
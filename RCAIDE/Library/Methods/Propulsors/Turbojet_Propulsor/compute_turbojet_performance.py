@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -15,6 +16,7 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Turbine            import comp
 from RCAIDE.Library.Methods.Propulsors.Converters.Supersonic_Nozzle  import compute_supersonic_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import compute_compression_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Turbojet_Propulsor            import compute_thrust
+from RCAIDE.Framework.Mission.Common                                 import share_conditions
 
 # python imports 
 import  numpy as  np 
@@ -257,8 +259,9 @@ def reuse_stored_turbojet_data(turbojet,state,network,stored_propulsor_tag,cente
     N.A.        
     ''' 
     conditions                              = state.conditions  
-    conditions.energy[turbojet.tag]  =deepcopy(conditions.energy[stored_propulsor_tag])
-    conditions.noise[turbojet.tag]   =deepcopy(conditions.noise[stored_propulsor_tag])
+    copy_conditions = share_conditions if network.share_identical_propulsor_conditions else deepcopy
+    conditions.energy[turbojet.tag]  =copy_conditions(conditions.energy[stored_propulsor_tag])
+    conditions.noise[turbojet.tag]   =copy_conditions(conditions.noise[stored_propulsor_tag])
     
     # compute moment  
     moment_vector      = 0*state.ones_row(3)
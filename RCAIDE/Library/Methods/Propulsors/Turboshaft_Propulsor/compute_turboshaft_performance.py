@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -15,6 +16,7 @@ from RCAIDE.Library.Methods.Propulsors.Converters.Turbine            import comp
 from RCAIDE.Library.Methods.Propulsors.Converters.Expansion_Nozzle   import compute_expansion_nozzle_performance 
 from RCAIDE.Library.Methods.Propulsors.Converters.Compression_Nozzle import compute_compression_nozzle_performance
 from RCAIDE.Library.Methods.Propulsors.Turboshaft_Propulsor          import compute_power
+from RCAIDE.Framework.Mission.Common                                 import share_conditions
  
 # python imports 
 from copy import deepcopy 
@@ -206,8 +208,9 @@ def reuse_stored_turboshaft_data(turboshaft,state,network,stored_propulsor_tag,c
     N.A.        
     ''' 
     conditions                         = state.conditions   
-    conditions.energy[turboshaft.tag]  = deepcopy(conditions.energy[stored_propulsor_tag])
-    conditions.noise[turboshaft.tag]   = deepcopy(conditions.noise[stored_propulsor_tag])
+    copy_conditions                    = share_conditions if network.share_identical_propulsor_conditions else deepcopy
+    conditions.energy[turboshaft.tag]  = copy_conditions(conditions.energy[stored_propulsor_tag])
+    conditions.noise[turboshaft.tag]   = copy_conditions(conditions.noise[stored_propulsor_tag])
       
     power    = conditions.energy[turboshaft.tag].power    
     moment   = 0*state.ones_row(3)
@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Apr 2024, M. Clarke
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -111,8 +112,7 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
             SSD.CZ_alpha_dot =  a_t * dEpsilon_dalpha *  (l_t /u0) *  (S_t / S) 
             SSD.CM_alpha_dot =  -a_t * V_H * dEpsilon_dalpha*  (l_t /u0)        
                         
-        for i in range(num_cases): 
-            CLon[i,:,:] = np.eye(4)        
+        CLon[:,:,:] = np.eye(4)        
         Cw         = m * g / (qDyn0 * S_ref)  
         Xu         = rho * u0 * S_ref * Cw * np.sin(theta0) + 0.5 * rho * u0 * S_ref * SSD.CX_u  
         Xw         = 0.5 * rho * u0 * S_ref * SSD.CX_alpha     
@@ -167,45 +167,38 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
         if np.any(np.isnan(ALon)):
             pass
         else:
-            for i_long in range(num_cases):
-                D  , V = np.linalg.eig(ALon[i_long,:,:]) # State order: u, w, q, theta
-                LonModes[i_long,:] = D
-                
-                # Find phugoid
-                phugoidInd                    = np.argmax(D)  
-                phugoidFreqHz[i_long]         = abs(D[phugoidInd]) / (2 * np.pi)
-                phugoidDamping[i_long]        = np.sqrt(1/ (1 + ( D[phugoidInd].imag/ D[phugoidInd].real )**2 ))  
-                phugoidTimeDoubleHalf[i_long] = np.log(2) / abs(2 * np.pi * phugoidFreqHz[i_long] * phugoidDamping[i_long])
-                
-                # Find short period
-                shortPeriodInd                    = np.argmin(D)  
-                shortPeriodFreqHz[i_long]         = abs(D[shortPeriodInd]) / (2 * np.pi)
-                shortPeriodDamping[i_long]        = np.sqrt(1/ (1 + (D[shortPeriodInd].imag/D[shortPeriodInd].real)**2 ))  
-                shortPeriodTimeDoubleHalf[i_long] = np.log(2) / abs(2 * np.pi * shortPeriodFreqHz[i_long] * shortPeriodDamping[i_long]) 
+            # State order: u, w, q, theta
+            LonModes[:,:], solved = compute_eigenvalues(ALon) 
+            cases                 = np.arange(num_cases)
+            
+            # Find phugoid
+            phugoid                             = LonModes[cases,np.argmax(LonModes,axis=1)][:,None]
+            phugoidFreqHz[solved]               = (abs(phugoid) / (2 * np.pi))[solved]
+            phugoidDamping[solved]              = np.sqrt(1/ (1 + ( phugoid.imag/ phugoid.real )**2 ))[solved]
+            phugoidTimeDoubleHalf[solved]       = (np.log(2) / abs(2 * np.pi * phugoidFreqHz * phugoidDamping))[solved]
+            
+            # Find short period
+            shortPeriod                         = LonModes[cases,np.argmin(LonModes,axis=1)][:,None]
+            shortPeriodFreqHz[solved]           = (abs(shortPeriod) / (2 * np.pi))[solved]
+            shortPeriodDamping[solved]          = np.sqrt(1/ (1 + (shortPeriod.imag/shortPeriod.real)**2 ))[solved]
+            shortPeriodTimeDoubleHalf[solved]   = (np.log(2) / abs(2 * np.pi * shortPeriodFreqHz * shortPeriodDamping))[solved]
         
         ## Build lateral EOM A Matrix (stability axis)
         ALat = np.zeros((num_cases,4,4))
         BLat = np.zeros((num_cases,4,1))
         CLat = np.zeros((num_cases,4,4))
-        for c_i1 in range(num_cases): 
-            CLat[c_i1,:,:] = np.eye(4) 
+        CLat[:,:,:] = np.eye(4) 
         DLat = np.zeros((num_cases,4,1))
         
         # Need to compute Ixx, Izz, and Ixz as a function of alpha
-        Ixp  = np.zeros((num_cases,1))
-        Izp  = np.zeros((num_cases,1))
-        Ixzp = np.zeros((num_cases,1))
-        
-        for c_i2 in range(num_cases): 
-            R       = np.array( [[np.cos(AoA[c_i2][0]) ,  - np.sin(AoA[c_i2][0]) ], [ np.sin( AoA[c_i2][0]) , np.cos(AoA[i][0])]])
-            modI    = np.array([[moments_of_inertia[0][0],moments_of_inertia[0][2]],[moments_of_inertia[2][0],moments_of_inertia[2][2]]] ) 
-            INew    = R * modI  * np.transpose(R)
-            IxxStab =  INew[0,0]
-            IxzStab = -INew[0,1]
-            IzzStab =  INew[1,1]
-            Ixp[c_i2]  = (IxxStab * IzzStab - IxzStab**2) / IzzStab
-            Izp[c_i2]  = (IxxStab * IzzStab - IxzStab**2) / IxxStab
-            Ixzp[c_i2] = IxzStab / (IxxStab * IzzStab - IxzStab**2) 
+        cos_AoA = np.cos(AoA)
+        sin_AoA = np.sin(AoA)
+        IxxStab =  cos_AoA * moments_of_inertia[0][0] * cos_AoA
+        IxzStab = -(-sin_AoA * moments_of_inertia[0][2] * sin_AoA)
+        IzzStab =  cos_AoA * moments_of_inertia[2][2] * cos_AoA
+        Ixp     = (IxxStab * IzzStab - IxzStab**2) / IzzStab
+        Izp     = (IxxStab * IzzStab - IxzStab**2) / IxxStab
+        Ixzp    = IxzStab / (IxxStab * IzzStab - IxzStab**2) 
             
         Yv = 0.5 * rho * u0 * S_ref * SSD.CY_beta 
         Yr = 0.25 * rho * u0 * b_ref * S_ref * SSD.CY_r
@@ -262,35 +255,37 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
         spiralDamping               = np.zeros((num_cases,1))
         dutchRoll_mode_real         = np.zeros((num_cases,1))
         
-        for i_lat in range(num_cases):
-            try: 
-                D  , V = np.linalg.eig(ALat[i_lat,:,:]) # State order: u, w, q, theta
-                LatModes[i_lat,:] = D  
-                
-                real_parts = LatModes[i_lat,:].real
-                unique_elements, counts = np.unique(real_parts, return_counts=True)
-                idx = np.where(counts==2)[0]
-    
-                dutchRollFreqHz[i_lat]         = abs(D[idx]) / (2 * np.pi)
-                dutchRollDamping[i_lat]        = np.sqrt(1/ (1 + ( D[idx].imag/ D[idx].real )**2 ))  
-                dutchRollTimeDoubleHalf[i_lat] = np.log(2) / abs(2 * np.pi * dutchRollFreqHz[i_lat] * dutchRollDamping[i_lat])
-                dutchRoll_mode_real[i_lat]     = D[idx].real / (2 * np.pi)
-                
-                dutch_roll_idx                 = np.where( unique_elements[idx] == D.real )[0]
-                
-                remaining_modes                    = np.delete(D, dutch_roll_idx)
-                rollInd                            = np.argmin(remaining_modes) 
-                rollSubsistenceFreqHz[i_lat]       = abs(remaining_modes[rollInd]) / 2 / np.pi
-                rollSubsistenceDamping[i_lat]      = - np.sign(remaining_modes[rollInd].real)
-                rollSubsistenceTimeConstant[i_lat] = 1 / (2 * np.pi * rollSubsistenceFreqHz[i_lat] * rollSubsistenceDamping[i_lat])
-                
-                # Find spiral mode 
-                sprial_mode                 = np.delete(remaining_modes,rollInd)             
-                spiralFreqHz[i_lat]         = abs(sprial_mode) / 2 / np.pi
-                spiralDamping[i_lat]        = - np.sign(sprial_mode.real)
-                spiralTimeDoubleHalf[i_lat] = np.log(2) / abs(2 * np.pi * spiralFreqHz[i_lat] * spiralDamping[i_lat])
-            except:
-                pass 
+        # State order: v, p, r, phi
+        LatModes[:,:], solved = compute_eigenvalues(ALat)
+        
+        # the dutch roll is the complex pair, the cases without a single pair of equal real parts are not classified
+        real_parts  = np.sort(LatModes.real,axis=1)
+        equal_real  = real_parts[:,1:] == real_parts[:,:-1]
+        classified  = solved & (np.sum(equal_real,axis=1) == 1)
+        LatModes_c  = LatModes[classified]
+        pair_real   = real_parts[classified,np.argmax(equal_real[classified],axis=1)][:,None]
+        dutch_roll  = LatModes_c.real == pair_real
+        cases       = np.arange(len(LatModes_c))
+        dutchRoll   = LatModes_c[cases,np.argmax(dutch_roll,axis=1)][:,None]
+        
+        dutchRollFreqHz[classified]         = abs(dutchRoll) / (2 * np.pi)
+        dutchRollDamping[classified]        = np.sqrt(1/ (1 + ( dutchRoll.imag/ dutchRoll.real )**2 ))  
+        dutchRollTimeDoubleHalf[classified] = np.log(2) / abs(2 * np.pi * dutchRollFreqHz[classified] * dutchRollDamping[classified])
+        dutchRoll_mode_real[classified]     = dutchRoll.real / (2 * np.pi)
+        
+        # Find roll mode
+        remaining_modes                         = LatModes_c[~dutch_roll].reshape(-1,2)
+        rollInd                                 = np.argmin(remaining_modes,axis=1)
+        roll_mode                               = remaining_modes[cases,rollInd][:,None]
+        rollSubsistenceFreqHz[classified]       = abs(roll_mode) / 2 / np.pi
+        rollSubsistenceDamping[classified]      = - np.sign(roll_mode.real)
+        rollSubsistenceTimeConstant[classified] = 1 / (2 * np.pi * rollSubsistenceFreqHz[classified] * rollSubsistenceDamping[classified])
+        
+        # Find spiral mode 
+        sprial_mode                         = remaining_modes[cases,1 - rollInd][:,None]
+        spiralFreqHz[classified]            = abs(sprial_mode) / 2 / np.pi
+        spiralDamping[classified]           = - np.sign(sprial_mode.real)
+        spiralTimeDoubleHalf[classified]    = np.log(2) / abs(2 * np.pi * spiralFreqHz[classified] * spiralDamping[classified])
         
         # Inertial coupling susceptibility
         # See Etkin & Reid pg. 118 
@@ -321,4 +316,39 @@ def compute_dynamic_flight_modes(state,settings,aircraft):
         DS.LatModes.spiralTimeDoubleHalf          = spiralTimeDoubleHalf 
         DS.LatModes.spiralDamping                 = spiralDamping
     
-    return 
+    return
+
+def compute_eigenvalues(A):
+    """Computes the eigenvalues of a stack of state matrices with one batched call.
+
+    Assumptions:
+       The eigenvalues of matrices with non-finite entries, or of a matrix the eigenvalue
+       solver does not converge for, are set to zero
+
+    Source:
+       N/A
+
+    Inputs:
+       A            state matrices of the cases                 [unitless]
+
+    Outputs:
+       modes        eigenvalues of the cases                    [unitless]
+       solved       cases the eigenvalues are computed for      [boolean]
+
+    Properties Used:
+       N/A
+     """
+    
+    num_cases = len(A)
+    modes     = np.zeros((num_cases,A.shape[1]),dtype=complex)
+    solved    = np.all(np.isfinite(A),axis=(1,2))
+    try:
+        modes[solved] = np.linalg.eig(A[solved])[0]
+    except np.linalg.LinAlgError:
+        for i in np.where(solved)[0]:
+            try:
+                modes[i] = np.linalg.eig(A[i])[0]
+            except np.linalg.LinAlgError:
+                solved[i] = False 
+    
+    return modes, solved 
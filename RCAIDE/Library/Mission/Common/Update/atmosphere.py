@@ -2,19 +2,36 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke 
+# Modified: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core import Data
+
+# package imports
+import numpy as np
+from copy import deepcopy
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  Update Atmosphere
 # ----------------------------------------------------------------------------------------------------------------------
 def atmosphere(segment):
-    """ Computes conditions of the atmosphere at given altitudes
+    """ Computes conditions of the atmosphere at given altitudes. When state.numerics.memoize_atmosphere is
+        True, the atmosphere of the last call is reused while the altitudes and temperature deviation of the
+        segment are unchanged, e.g. on every iteration of a constant altitude segment.
     
         Assumptions:
-        N/A
+        The atmosphere analysis is not modified during the evaluation of a segment. The memo holds its own
+        copy of the atmosphere data, so that changes to the conditions do not reach it.
         
         Inputs:
             state.conditions:
                 freestream.altitude             [meters]
+            state.numerics:
+                memoize_atmosphere              [Boolean]
+                atmosphere_memo                 [Data]
             segment.analyses.atmoshere          [Function]
             
         Outputs:
@@ -40,7 +57,20 @@ def atmosphere(segment):
     atmosphere            = segment.analyses.atmosphere
     
     # compute
-    atmosphere_data = atmosphere.compute_values(h,temperature_deviation)
+    numerics = segment.state.numerics
+    memo     = numerics.atmosphere_memo
+    if numerics.memoize_atmosphere and memo is not None and memo.atmosphere is atmosphere \
+       and np.array_equal(memo.altitude,h) and np.array_equal(memo.temperature_deviation,temperature_deviation):
+        atmosphere_data = deepcopy(memo.atmosphere_data)
+    else:
+        atmosphere_data = atmosphere.compute_values(h,temperature_deviation)
+        if numerics.memoize_atmosphere:
+            memo                       = Data()
+            memo.atmosphere            = atmosphere
+            memo.altitude              = np.array(h)
+            memo.temperature_deviation = np.array(temperature_deviation)
+            memo.atmosphere_data       = deepcopy(atmosphere_data)
+            numerics.atmosphere_memo   = memo
     
     # pack
     conditions.freestream.pressure               = atmosphere_data.pressure
@@ -2,6 +2,7 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke  
+# Modified: Oct 2026, RCAIDE Team
 
 # ----------------------------------------------------------------------------------------------------------------------
 #  IMPORT
@@ -11,6 +12,10 @@ import scipy.optimize
 import numpy as np
 import  sys
 
+# RCAIDE imports
+from RCAIDE.Framework.Core import Packing_Layout
+from .jacobian import build_jacobian_function
+
 # ----------------------------------------------------------------------------------------------------------------------
 # converge root
 # ---------------------------------------------------------------------------------------------------------------------- 
@@ -27,6 +32,7 @@ def converge_root(segment):
     segment                            [Data]
     segment.settings.root_finder       [Data]
     state.numerics.tolerance_solution  [Unitless]
+    state.numerics.solver_jacobian     [string or function]
 
     Outputs:
     state.unknowns                     [Any]
@@ -36,20 +42,30 @@ def converge_root(segment):
     N/A
     """       
     
-    unknowns = segment.state.unknowns.pack_array()
+    # map the unknowns and residuals to their packed vectors once for the whole solve
+    segment.state.numerics.unknowns_layout  = Packing_Layout(segment.state.unknowns)
+    segment.state.numerics.residuals_layout = Packing_Layout(segment.state.residuals)
+    
+    unknowns = segment.state.numerics.unknowns_layout.pack().copy()
     
     try:
         root_finder = segment.settings.root_finder
     except AttributeError:
         root_finder = scipy.optimize.fsolve 
     
+    jacobian = build_jacobian_function(segment,iterate)
+    options  = {}
+    if jacobian is not None:
+        options['fprime'] = jacobian
+    
     unknowns,infodict,ier,msg = root_finder( iterate,
                                          unknowns,
                                          args = segment,
                                          xtol = segment.state.numerics.tolerance_solution,
                                          maxfev = segment.state.numerics.max_evaluations,
                                          epsfcn = segment.state.numerics.step_size,
-                                         full_output = 1)
+                                         full_output = 1,
+                                         **options)
     
     if ier!=1:
         print("Segment did not converge. Segment Tag: " + segment.tag)
@@ -77,6 +93,8 @@ def iterate(unknowns, segment):
 
     Inputs:
     state.unknowns                [Data]
+    state.numerics.unknowns_layout  [Packing_Layout]
+    state.numerics.residuals_layout [Packing_Layout]
     segment.process.iterate       [Data]
 
     Outputs:
@@ -85,13 +103,22 @@ def iterate(unknowns, segment):
     Properties Used:
     N/A
     """       
+    numerics = segment.state.numerics
     if isinstance(unknowns,np.ndarray):
-        segment.state.unknowns.unpack_array(unknowns)
+        if numerics.unknowns_layout is not None:
+            numerics.unknowns_layout.unpack(unknowns)
+        else:
+            segment.state.unknowns.unpack_array(unknowns)
     else:
-        segment.state.unknowns = unknowns
+        segment.state.unknowns   = unknowns
+        numerics.unknowns_layout = None
         
     segment.process.iterate(segment)
     
-    residuals = segment.state.residuals.pack_array()
+    # the packed vector is reused between iterations, the root finder gets its own copy
+    if numerics.residuals_layout is not None:
+        residuals = numerics.residuals_layout.pack().copy()
+    else:
+        residuals = segment.state.residuals.pack_array()
         
     return residuals 
\ No newline at end of file
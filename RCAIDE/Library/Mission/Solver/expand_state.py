@@ -2,13 +2,22 @@
 # 
 # 
 # Created:  Jul 2023, M. Clarke   
+# Modified: Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Mission.Common import compile_conditions
 
 # ----------------------------------------------------------------------------------------------------------------------
 # Expand State
 # ----------------------------------------------------------------------------------------------------------------------  
 def expand_state(segment):
     
-    """Makes all vectors in the state the same size.
+    """Makes all vectors in the state the same size. If state.numerics.compiled_conditions is True, the
+    conditions are then switched to their fast attribute access form. The atmosphere of an earlier evaluation
+    of the segment is discarded.
 
     Assumptions:
     N/A
@@ -18,6 +27,7 @@ def expand_state(segment):
 
     Inputs:
     state.numerics.number_of_control_points  [Unitless]
+    state.numerics.compiled_conditions       [Boolean]
 
     Outputs:
     N/A
@@ -29,6 +39,11 @@ def expand_state(segment):
     n_points = segment.state.numerics.number_of_control_points
     
     segment.state.expand_rows(n_points)
+    segment.state.numerics.atmosphere_memo = None
+    
+    if segment.state.numerics.compiled_conditions:
+        segment.state.conditions = compile_conditions(segment.state.conditions)
+        segment.conditions       = segment.state.conditions
     
     return
     
\ No newline at end of file
@@ -0,0 +1,276 @@
+# RCAIDE/Library/Missions/Solver/jacobian.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+from RCAIDE.Framework.Core        import Data
+from RCAIDE.Framework.Core.Arrays import atleast_2d_col, array_type, matrix_type
+
+# Package imports
+import numpy as np
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  Colored Finite Difference Jacobian
+# ----------------------------------------------------------------------------------------------------------------------
+def build_jacobian_function(segment,iterate):
+    """Returns the Jacobian function handed to the root finder based on the setting
+    segment.state.numerics.solver_jacobian:
+
+        "none"         - no Jacobian is supplied, the root finder uses its own dense finite differencing
+        "colored"      - colored (grouped) finite differences over the sparsity pattern of the segment, the
+                         pattern is probed with a dense finite difference Jacobian the first time and kept
+                         in segment.state.numerics.jacobian_sparsity for the later solves of the segment
+        callable       - user supplied function with signature jacobian(unknowns,segment) returning
+                         the [n_residuals x n_unknowns] Jacobian
+
+    Assumptions:
+    N/A
+
+    Source:
+    Curtis, A. R., Powell, M. J. D., and Reid, J. K., "On the Estimation of Sparse Jacobian Matrices",
+    IMA Journal of Applied Mathematics, 1974.
+
+    Inputs:
+    segment                                [Data]
+    segment.state.numerics.solver_jacobian [string or function]
+    iterate                                [function]
+
+    Outputs:
+    jacobian                               [function or None]
+
+    Properties Used:
+    N/A
+    """
+    solver_jacobian = segment.state.numerics.solver_jacobian
+
+    if callable(solver_jacobian):
+        return solver_jacobian
+    elif solver_jacobian in (None,'none'):
+        return None
+    elif solver_jacobian == 'colored':
+        numerics  = segment.state.numerics
+        x_points  = control_point_indices(segment.state.unknowns,numerics.number_of_control_points)
+        R_points  = control_point_indices(segment.state.residuals,numerics.number_of_control_points)
+        shape     = (len(R_points),len(x_points))
+        if numerics.jacobian_sparsity is not None and np.shape(numerics.jacobian_sparsity) != shape:
+            numerics.jacobian_sparsity = None
+
+        # scipy's fsolve calls the Jacobian at the initial point to check its shape before solving,
+        # the Jacobian of the last point is kept so that the solve does not compute it again
+        last = Data(unknowns = None, J = None, groups = None)
+
+        def jacobian(unknowns,segment):
+            if last.unknowns is not None and np.array_equal(last.unknowns,unknowns):
+                return last.J.copy()
+            if numerics.jacobian_sparsity is None:
+                last.J                     = colored_finite_difference(unknowns,segment,iterate,np.ones(shape,dtype=bool),np.arange(shape[1]))
+                numerics.jacobian_sparsity = jacobian_sparsity(last.J,x_points,R_points)
+            else:
+                if last.groups is None:
+                    last.groups = group_columns(numerics.jacobian_sparsity)
+                last.J = colored_finite_difference(unknowns,segment,iterate,numerics.jacobian_sparsity,last.groups)
+            last.unknowns = np.array(unknowns,dtype=float)
+            return last.J.copy()
+        return jacobian
+    else:
+        raise ValueError('unknown solver jacobian "%s", must be "none", "colored" or a function' % solver_jacobian)
+
+def colored_finite_difference(unknowns,segment,iterate,sparsity,groups):
+    """Computes the Jacobian of the segment residuals by forward differences, perturbing all
+    structurally independent unknowns of a group at once. The cost of a Jacobian is therefore
+    (number of groups) calls to iterate rather than (number of unknowns), the residuals at the
+    unperturbed point are taken from the last evaluation of the root finder when it was made there.
+
+    Assumptions:
+    Entries outside of the sparsity pattern are zero. The segment is left at the last perturbed
+    state, the root finder evaluates the residuals at its next point before using the state.
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                        [array]
+    segment                         [Data]
+    segment.state.numerics.step_size[Unitless]
+    iterate                         [function]
+    sparsity                        [boolean array, n_residuals x n_unknowns]
+    groups                          [int array, n_unknowns]
+
+    Outputs:
+    J                               [array, n_residuals x n_unknowns]
+
+    Properties Used:
+    N/A
+    """
+    epsfcn = segment.state.numerics.step_size
+    if epsfcn is None:
+        epsfcn = 0.
+    eps  = np.sqrt(max(epsfcn,np.finfo(float).eps))
+    h    = eps*np.abs(unknowns)
+    h[h == 0.] = eps
+
+    x0   = np.array(unknowns,dtype=float)
+    R0   = last_residuals(x0,segment)
+    if R0 is None:
+        R0 = iterate(x0,segment)
+    J    = np.zeros(sparsity.shape)
+
+    for group in range(np.max(groups)+1):
+        cols      = np.where(groups == group)[0]
+        x         = x0.copy()
+        x[cols]  += h[cols]
+        dR        = iterate(x,segment) - R0
+        for col in cols:
+            rows         = sparsity[:,col]
+            J[rows,col]  = dR[rows]/h[col]
+
+    return J
+
+def last_residuals(unknowns,segment):
+    """Returns the residuals of the last call to iterate when it was made with the same unknowns,
+    None otherwise. The packing layouts of the solve hold the last unpacked unknowns and packed residuals.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    unknowns                                [array]
+    segment.state.numerics.unknowns_layout  [Packing_Layout]
+    segment.state.numerics.residuals_layout [Packing_Layout]
+
+    Outputs:
+    residuals                               [array or None]
+
+    Properties Used:
+    N/A
+    """
+    numerics = segment.state.numerics
+    if numerics.unknowns_layout is None or numerics.residuals_layout is None:
+        return None
+    if not np.array_equal(numerics.unknowns_layout.vector,unknowns):
+        return None
+
+    return numerics.residuals_layout.pack().copy()
+
+def jacobian_sparsity(J,x_points,R_points,tolerance = 1e-8):
+    """Builds the sparsity pattern of the segment Jacobian from a dense finite difference Jacobian.
+    The integration of the fuel burn or battery energy couples the unknowns to the residuals of every
+    later control point, but most of these entries are many orders of magnitude below the largest entry
+    of their residual. Entries smaller than the tolerance times the largest entry of their residual are
+    left out of the pattern. The unknowns and residuals at the same control point, and the entries not
+    associated to a single control point (e.g. elapsed time or final value errors), are always kept.
+
+    Assumptions:
+    The entries that are small at the probed point remain small during the solve, the root finder
+    only uses the Jacobian for its steps and converges on the residuals
+
+    Source:
+    N/A
+
+    Inputs:
+    J           [array, n_residuals x n_unknowns]
+    x_points    [int array, n_unknowns]
+    R_points    [int array, n_residuals]
+    tolerance   [Unitless]
+
+    Outputs:
+    sparsity    [boolean array, n_residuals x n_unknowns]
+
+    Properties Used:
+    N/A
+    """
+    scale    = np.max(np.abs(J),axis=1,keepdims=True)
+    sparsity = np.abs(J) > tolerance*scale
+    sparsity = sparsity | (R_points[:,None] == x_points[None,:])
+    sparsity = sparsity | (R_points[:,None] == -1) | (x_points[None,:] == -1)
+
+    return sparsity
+
+def control_point_indices(data,n_cpts):
+    """Returns the control point index of every entry of data.pack_array(), -1 when an entry is not
+    associated to a single control point. Follows the packing order of Data.pack_array.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    data      [Data]
+    n_cpts    [Unitless]
+
+    Outputs:
+    indices   [int array]
+
+    Properties Used:
+    N/A
+    """
+    valid_types = ( int, float, array_type, matrix_type )
+    indices     = []
+
+    def do_index(D):
+        for v in D.values():
+            try:
+                rank = v.ndim
+            except:
+                rank = 0
+            if isinstance(v,dict):
+                do_index(v)
+                continue
+            elif not isinstance(v,valid_types): continue
+            elif rank > 2: continue
+            rows,cols = atleast_2d_col(v).shape
+            if rows == n_cpts:
+                indices.append(np.tile(np.arange(rows),cols))
+            else:
+                indices.append(-np.ones(rows*cols,dtype=int))
+
+    do_index(data)
+
+    if indices:
+        return np.hstack(indices)
+    return np.array([],dtype=int)
+
+def group_columns(sparsity):
+    """Greedy coloring of the Jacobian columns, two columns share a group when they have no
+    nonzero row in common.
+
+    Assumptions:
+    N/A
+
+    Source:
+    N/A
+
+    Inputs:
+    sparsity  [boolean array, n_residuals x n_unknowns]
+
+    Outputs:
+    groups    [int array, n_unknowns]
+
+    Properties Used:
+    N/A
+    """
+    n_rows,n_cols = sparsity.shape
+    groups        = -np.ones(n_cols,dtype=int)
+    occupied      = []
+
+    for col in range(n_cols):
+        rows = sparsity[:,col]
+        for group,used in enumerate(occupied):
+            if not np.any(used & rows):
+                groups[col]  = group
+                used        |= rows
+                break
+        else:
+            groups[col] = len(occupied)
+            occupied.append(rows.copy())
+
+    return groups
@@ -11,12 +11,15 @@
 import RCAIDE
 from RCAIDE.Framework.Core import Units ,  Data
 from RCAIDE.Library.Plots             import *       
+from RCAIDE.Library.Methods.Aerodynamics.Athena_Vortex_Lattice.run_AVL_analysis import call_avl
 
 # python imports 
 import numpy as np
 import pylab as plt 
 import sys
 import os
+import shutil
+import tempfile
 
 sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
 from Navion    import vehicle_setup, configs_setup 
@@ -41,6 +44,12 @@ def main():
     keep_regression_files  = True 
     folder_name            = '_surrogate'
     AVL_Surrogate_Mission(use_surrogate,trim_aircraft,keep_regression_files,new_regression_results,folder_name)    
+    
+    # run the surrogate training batches concurrently with a stand-in executable replaying the stored AVL outputs
+    AVL_Concurrent_Surrogate_Mission()
+    
+    # a failed AVL run raises an error with the end of its error file
+    AVL_Failure_Test()
  
     return 
     
@@ -78,6 +87,60 @@ def AVL_Surrogate_Mission(use_surrogate,trim_aircraft,keep_regression_files,new_
     return
 
 
+def AVL_Concurrent_Surrogate_Mission():
+    # vehicle data
+    vehicle  = vehicle_setup()  
+    
+    # Set up vehicle configs
+    configs  = configs_setup(vehicle)
+
+    # create analyses
+    folder_name = '_concurrent'
+    analyses    = analyses_setup(configs,True,False,False,True,folder_name)
+    for analysis in analyses.values():
+        for avl_analysis in [analysis.aerodynamics,analysis.stability]:
+            avl_analysis.settings.filenames.avl_bin_name = [sys.executable,os.path.join(os.path.dirname(os.path.abspath(__file__)),'avl_stand_in.py')]
+            avl_analysis.settings.number_of_workers      = 3
+
+    # mission analyses 
+    mission = AVL_Surrogate_mission_setup(analyses)
+    
+    # create mission instances (for multiple types of missions)
+    missions = missions_setup(mission) 
+     
+    # mission analysis 
+    results = missions.base_mission.evaluate()   
+ 
+    # the replayed outputs must give the stored surrogate results, without leaving files behind
+    cruise_CL        = results.segments.cruise.conditions.aerodynamics.coefficients.lift.total[2][0] 
+    cruise_CL_thruth = 0.46795223576170475
+    print('Concurrent AVL CL error: ',np.abs(cruise_CL - cruise_CL_thruth))
+    assert(np.abs(cruise_CL - cruise_CL_thruth)<1e-3)
+    assert(not os.path.exists('avl_files' + folder_name))
+         
+    return
+
+
+def AVL_Failure_Test():
+    avl                                 = RCAIDE.Framework.Analyses.Aerodynamics.Athena_Vortex_Lattice()
+    avl.settings.filenames.avl_bin_name = [sys.executable,'-c','import sys; sys.stderr.write("stand-in failure"); sys.exit(3)']
+    avl.settings.filenames.features     = 'base.avl'
+    batch                               = Data()
+    batch.directory                     = tempfile.mkdtemp()
+    batch.deck_file                     = 'commands_0001.deck'
+    open(os.path.join(batch.directory,batch.deck_file),'w').close()
+    
+    try:
+        call_avl(avl,batch)
+        error_message = ''
+    except RuntimeError as error:
+        error_message = str(error)
+    shutil.rmtree(batch.directory)
+    print('AVL failure: ',error_message)
+    assert('stand-in failure' in error_message)
+    
+    return
+
 def AVL_Single_Point_Trim_Mission(use_surrogate,trim_aircraft,keep_regression_files,new_regression_results,folder_name):
     # vehicle data
     vehicle  = vehicle_setup()   
@@ -10,7 +10,8 @@
 # ----------------------------------------------------------------------
 import RCAIDE
 from RCAIDE.Framework.Core                                              import Data, Units
-from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method          import VLM
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method          import VLM, clear_influence_matrix_cache, select_control_points, merge_control_points
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method          import generate_vortex_distribution, clear_vortex_distribution_cache
 from RCAIDE.Library.Plots                                               import * 
 from RCAIDE.load import load 
 from RCAIDE.save import save  
@@ -76,6 +77,136 @@ def main():
         
         max_err = np.max(np.abs(errors))
         assert max_err < 1e-6 , 'Failed at {} test'.format(key)
+
+    control_point_groups_test(conditions, settings)
+    
+    no_surrogate_control_point_groups_test()
+    
+    influence_matrix_cache_test(settings)
+    
+    vortex_distribution_cache_test(settings)
+    
+    return
+
+def control_point_groups_test(conditions, settings):
+    """ Solves subsets of the control points separately, as done for groups of control points
+        with the same deflections, and checks that the merged outputs match a single solve
+    """
+    geometry  = get_deflected_b737(10 * Units.degrees)
+    full      = VLM(conditions, settings, geometry)
+    n_points  = len(conditions.freestream.mach_number)
+    
+    keys      = ['CL','CDi','CM','CL_wing','cl_y','CP']
+    merged    = None
+    for rows in [np.array([0,2]), np.array([1])]:
+        data   = VLM(select_control_points(conditions, rows, n_points), settings, geometry)
+        subset = Data()
+        for key in keys:
+            subset[key] = data[key]
+        merged = merge_control_points(merged, subset, rows, n_points)
+    
+    for key in keys:
+        errors  = (merged[key] - full[key])/np.maximum(np.abs(full[key]),1e-6)
+        print('control point groups, errors in {}: {}'.format(key, np.max(np.abs(errors))))
+        assert np.max(np.abs(errors)) < 1e-6 , 'Failed at control point groups {} test'.format(key)
+    
+    return
+
+def no_surrogate_control_point_groups_test():
+    """ Evaluates the VLM analysis without surrogates at control points with different control surface
+        deflections, and checks that the grouped solve matches a solve of every control point on its own
+    """
+    alpha    = np.array([1.  ,2.  ,4.  ,2. ]) * Units.degrees
+    mach     = np.array([0.3 ,0.3 ,0.4 ,0.3])
+    elevator = np.array([0.  ,5.  ,0.  ,5. ]) * Units.degrees
+    aileron  = np.array([0.  ,0.  ,2.  ,0. ]) * Units.degrees
+    
+    aerodynamics = get_no_surrogate_aerodynamics()
+    grouped      = get_no_surrogate_state(aerodynamics, alpha, mach, elevator, aileron)
+    aerodynamics.evaluate(grouped)
+    
+    # CY is zeroed for the whole state when no control point has a lateral input, it is not compared 
+    keys = ['lift','drag','X','Z','L','M','N']
+    for i in range(len(alpha)):
+        rows         = slice(i,i+1)
+        aerodynamics = get_no_surrogate_aerodynamics()
+        single       = get_no_surrogate_state(aerodynamics, alpha[rows], mach[rows], elevator[rows], aileron[rows])
+        aerodynamics.evaluate(single)
+        
+        for key in keys:
+            errors = (grouped.conditions.static_stability.coefficients[key][i] - single.conditions.static_stability.coefficients[key][0])
+            print('no surrogate control point groups, point {}, difference in {}: {}'.format(i, key, np.max(np.abs(errors))))
+            assert np.max(np.abs(errors)) < 1e-12 , 'Failed at no surrogate control point groups {} test'.format(key)
+        assert np.abs(grouped.conditions.aerodynamics.coefficients.lift.total[i,0] - single.conditions.aerodynamics.coefficients.lift.total[0,0]) < 1e-12
+    
+    return
+
+def influence_matrix_cache_test(settings):
+    """ Checks that factorized influence matrices are reused for the same geometry and mach number
+        and that cached and uncached solutions are the same
+    """
+    VLM_module = sys.modules['RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.VLM']
+    clear_influence_matrix_cache()
+    statistics = VLM_module.influence_matrix_cache_statistics
+    geometry   = get_deflected_b737(10 * Units.degrees)
+    
+    # first call factorizes the matrix of mach 0.4
+    conditions = get_conditions()
+    VLM(conditions, settings, geometry)
+    assert statistics.misses == 1 and statistics.hits == 0
+    
+    # mach 0.4 is reused, mach 0.3 is added
+    conditions.freestream.mach_number[0,0] = 0.3
+    conditions.freestream.velocity[0,0]   *= 0.3/0.4
+    conditions.aerodynamics.angles.alpha  += 1. * Units.degrees
+    cached = VLM(conditions, settings, geometry)
+    assert statistics.misses == 2 and statistics.hits == 1
+    
+    settings.cache_influence_matrices = False
+    uncached = VLM(conditions, settings, geometry)
+    settings.cache_influence_matrices = True
+    assert statistics.misses == 4 and statistics.hits == 1
+    
+    for key in ['CL','CDi','CM','CP']:
+        print('influence matrix cache, difference in {}: {}'.format(key, np.max(np.abs(cached[key] - uncached[key]))))
+        assert np.all(cached[key] == uncached[key]) , 'Failed at influence matrix cache {} test'.format(key)
+    
+    # the memory limit evicts the least recently used factorizations
+    settings.influence_matrix_cache_memory = 0
+    VLM(conditions, settings, geometry)
+    settings.influence_matrix_cache_memory = 2.5E8
+    assert len(VLM_module.influence_matrix_cache) == 0 and statistics.memory == 0
+    
+    return
+
+def vortex_distribution_cache_test(settings):
+    """ Checks that the panels of a geometry are reused, that a change of a control surface deflection
+        only deflects the cached panels, and that both match a new panelization of the geometry
+    """
+    generate_module = sys.modules['RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method.generate_vortex_distribution']
+    clear_vortex_distribution_cache()
+    statistics = generate_module.vortex_distribution_cache_statistics
+    
+    cases = [(10 * Units.degrees, Data(hits = 0, updates = 0, misses = 1)),
+             (10 * Units.degrees, Data(hits = 1, updates = 0, misses = 1)),
+             (20 * Units.degrees, Data(hits = 1, updates = 1, misses = 1))]
+    for deflection, counts in cases:
+        geometry = get_deflected_b737(deflection)
+        cached   = generate_vortex_distribution(geometry, settings)
+        assert statistics.hits == counts.hits and statistics.updates == counts.updates and statistics.misses == counts.misses
+        
+        settings.cache_vortex_distributions = False
+        uncached = generate_vortex_distribution(get_deflected_b737(deflection), settings)
+        settings.cache_vortex_distributions = True
+        
+        for key in ['XA1','YB2','ZC','X','normals','panel_areas','SLOPE','chord_lengths']:
+            assert np.all(cached[key] == uncached[key]) , 'Failed at vortex distribution cache {} test'.format(key)
+    
+    # a new geometry is panelized again
+    geometry = get_deflected_b737(20 * Units.degrees)
+    geometry.wings.main_wing.spans.projected *= 1.01
+    generate_vortex_distribution(geometry, settings)
+    assert statistics.misses == 2
     
     return
 
@@ -97,6 +228,47 @@ def get_deflected_b737(deflection):
  
     return vehicle
 
+def get_no_surrogate_aerodynamics():
+    aerodynamics                                       = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                               = b737_setup()
+    aerodynamics.settings.use_surrogate                = False
+    aerodynamics.settings.trim_aircraft                = True
+    aerodynamics.settings.number_of_spanwise_vortices  = 7
+    aerodynamics.settings.number_of_chordwise_vortices = 4
+    aerodynamics.initialize()
+    
+    return aerodynamics
+
+def get_no_surrogate_state(aerodynamics, alpha, mach, elevator, aileron):
+    ctrl_pts   = len(alpha)
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmo_data  = atmosphere.compute_values(0.)
+    ones       = np.ones((ctrl_pts,1))
+    
+    state                                               = RCAIDE.Framework.Mission.Common.State()
+    state.conditions                                    = RCAIDE.Framework.Mission.Common.Results()
+    conditions                                          = state.conditions 
+    conditions.freestream.density                       = atmo_data.density * ones
+    conditions.freestream.dynamic_viscosity             = atmo_data.dynamic_viscosity * ones
+    conditions.freestream.temperature                   = atmo_data.temperature * ones
+    conditions.freestream.pressure                      = atmo_data.pressure * ones
+    conditions.freestream.speed_of_sound                = atmo_data.speed_of_sound * ones
+    conditions.aerodynamics.angles.alpha                = np.atleast_2d(alpha).T
+    conditions.expand_rows(ctrl_pts)
+    conditions.freestream.mach_number                   = np.atleast_2d(mach).T
+    conditions.freestream.velocity                      = conditions.freestream.mach_number * conditions.freestream.speed_of_sound
+    conditions.freestream.reynolds_number               = conditions.freestream.density * conditions.freestream.velocity / conditions.freestream.dynamic_viscosity
+    conditions.frames.inertial.velocity_vector[:,0]     = conditions.freestream.velocity[:,0]
+    conditions.frames.wind.transform_to_inertial        = np.repeat(np.eye(3)[None,:,:],ctrl_pts,axis=0)
+    conditions.frames.body.transform_to_inertial        = np.repeat(np.eye(3)[None,:,:],ctrl_pts,axis=0)
+    conditions.control_surfaces.elevator.deflection[:,0] = elevator
+    conditions.control_surfaces.aileron.deflection[:,0]  = aileron
+    
+    state.analyses              = Data()
+    state.analyses.aerodynamics = aerodynamics 
+    
+    return state
+
 def get_conditions():
     machs      = np.array([0.4  ,0.4  ,0.4  ,])
     altitudes  = np.array([5000 ,5000 ,5000 ,])  *Units.ft
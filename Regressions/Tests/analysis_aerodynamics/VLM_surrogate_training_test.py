@@ -0,0 +1,155 @@
+# Regression/scripts/Tests/analysis_aerodynamics/VLM_surrogate_training_test.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Data
+from RCAIDE.Library.Methods.Aerodynamics.Vortex_Lattice_Method import train_VLM_surrogates, build_VLM_surrogates, hash_VLM_training_inputs
+
+# python imports
+import numpy as np
+from scipy.interpolate import RegularGridInterpolator, interp1d
+import tempfile
+import time
+import shutil
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+from Navion import vehicle_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+
+    # train the surrogates of the same vehicle in one process and with a pool of training workers
+    training = Data()
+    vortex_distributions = Data()
+    for workers in [1,2]:
+        aerodynamics = aerodynamics_setup(workers)
+        train_VLM_surrogates(aerodynamics)
+        training['workers_' + str(workers)]             = aerodynamics.training
+        vortex_distributions['workers_' + str(workers)] = aerodynamics.vehicle.vortex_distribution
+
+    # the training data and the vortex distribution left on the vehicle are identical
+    compare_training_data(training.workers_1,training.workers_2)
+    assert(np.array_equal(vortex_distributions.workers_1.XC,vortex_distributions.workers_2.XC))
+    assert(np.array_equal(vortex_distributions.workers_1.wing_areas,vortex_distributions.workers_2.wing_areas))
+
+    # stored training data
+    surrogate_cache_test(training.workers_1)
+
+    # fused surrogates
+    build_VLM_surrogates(aerodynamics)
+    fused_surrogate_test(aerodynamics)
+
+    return
+
+def surrogate_cache_test(trained):
+    """ Trains the surrogates with a surrogate cache directory, an identical analysis then loads the
+        training data instead of training
+    """
+    cache_directory = tempfile.mkdtemp()
+    try:
+        aerodynamics = aerodynamics_setup(1)
+        aerodynamics.settings.surrogate_cache_directory = cache_directory
+        key          = hash_VLM_training_inputs(aerodynamics)
+        train_VLM_surrogates(aerodynamics)
+        assert(len(os.listdir(cache_directory)) == 1)
+
+        # the number of training workers does not change the key
+        stored_aerodynamics = aerodynamics_setup(2)
+        stored_aerodynamics.settings.surrogate_cache_directory = cache_directory
+        assert(hash_VLM_training_inputs(stored_aerodynamics) == key)
+        train_VLM_surrogates(stored_aerodynamics)
+        build_VLM_surrogates(stored_aerodynamics)
+        compare_training_data(trained,stored_aerodynamics.training)
+        assert(stored_aerodynamics.reference_values.S_ref == aerodynamics.reference_values.S_ref)
+        assert(stored_aerodynamics.elevator_flag)
+
+        # a change of the geometry or of the training grid changes the key
+        changed_aerodynamics = aerodynamics_setup(1)
+        changed_aerodynamics.vehicle.wings.main_wing.spans.projected *= 1.01
+        assert(hash_VLM_training_inputs(changed_aerodynamics) != key)
+        changed_aerodynamics = aerodynamics_setup(1)
+        changed_aerodynamics.training.angle_of_attack[-1] *= 1.01
+        assert(hash_VLM_training_inputs(changed_aerodynamics) != key)
+    finally:
+        shutil.rmtree(cache_directory)
+
+    return
+
+def fused_surrogate_test(aerodynamics):
+    """ Checks that the fused surrogates return the coefficients of single coefficient interpolators of the
+        training data, and that querying them is faster than querying the single coefficient interpolators
+    """
+    n_points   = 16
+    n_calls    = 20
+    Mach       = np.linspace(0.1,2.0,n_points)
+    grids      = Data(alpha = 'angle_of_attack',beta = 'sideslip_angle',u = 'u',v = 'v',w = 'w',p = 'roll_rate',q = 'pitch_rate',r = 'yaw_rate',
+                      delta_a = 'aileron_deflection',delta_e = 'elevator_deflection',delta_r = 'rudder_deflection',delta_f = 'flap_deflection',delta_s = 'slat_deflection')
+    controls   = Data(delta_a = 'aileron',delta_e = 'elevator',delta_r = 'rudder',delta_f = 'flap',delta_s = 'slat')
+    variables  = ['alpha','beta','u','v','w','p','q','r'] + [var for var,control in controls.items() if aerodynamics[control + '_flag']]
+    coefs      = ['Clift','Cdrag','CX','CY','CZ','CL','CM','CN']
+    t_single   = np.inf
+    t_fused    = np.inf
+    for regime in ['subsonic','transonic','supersonic']:
+        surrogates = aerodynamics.surrogates[regime]
+        training   = aerodynamics.training[regime]
+        for var in variables:
+            grid   = aerodynamics.training[grids[var]]
+            pts    = np.column_stack((np.linspace(grid[0],grid[-1],n_points),Mach))
+            single = [RegularGridInterpolator((grid,training.Mach),training[coef + '_' + var],method = 'linear',bounds_error=False,fill_value=None) for coef in coefs]
+            fused  = surrogates.fused[var](pts)
+            for i,coef in enumerate(coefs):
+                assert np.allclose(fused[:,i],single[i](pts),rtol=1e-12,atol=1e-14,equal_nan=True)
+
+            # best of several queries of all coefficients of the variable
+            for _ in range(n_calls):
+                t0       = time.perf_counter()
+                for surrogate in single:
+                    surrogate(pts)
+                t_single = min(t_single,time.perf_counter() - t0)
+                t0       = time.perf_counter()
+                surrogates.fused[var](pts)
+                t_fused  = min(t_fused,time.perf_counter() - t0)
+        fused = surrogates.fused.derivatives(Mach)
+        assert np.allclose(fused[0],interp1d(training.Mach,training.dClift_dalpha,kind = 'linear',bounds_error=False,fill_value="extrapolate")(Mach),rtol=1e-12,atol=1e-14,equal_nan=True)
+        assert np.allclose(fused[-1],interp1d(training.Mach,training.dCN_dr,kind = 'linear',bounds_error=False,fill_value="extrapolate")(Mach),rtol=1e-12,atol=1e-14,equal_nan=True)
+
+    print('Surrogate query time of one variable, single coefficient interpolators: ' + str(t_single*1E6) + ' us')
+    print('Surrogate query time of one variable, fused surrogate: ' + str(t_fused*1E6) + ' us')
+    assert(t_fused < t_single)
+
+    return
+
+def compare_training_data(serial,parallel):
+    """ Checks that two training data structures hold the same keys and bit-identical values
+    """
+    assert(list(serial.keys()) == list(parallel.keys()))
+    for key in serial.keys():
+        if isinstance(serial[key],dict):
+            compare_training_data(serial[key],parallel[key])
+        elif serial[key] is not None:
+            assert(np.array_equal(serial[key],parallel[key],equal_nan=True))
+
+    return
+
+def aerodynamics_setup(workers):
+
+    vehicle      = vehicle_setup()
+    aerodynamics = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                             = vehicle
+    aerodynamics.settings.number_of_training_workers = workers
+    aerodynamics.training.Mach                       = np.array([0.1, 0.5, 0.85, 1.3, 2.0])
+
+    return aerodynamics
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,29 @@
+# avl_stand_in.py
+#
+# Created:  Oct 2026, RCAIDE Team
+
+""" Stand-in for the AVL executable used by AVL_test.py. It reads the command deck from the standard
+input and, for every output file named in the deck, copies the stored output of the same name from
+avl_files_surrogate into the working directory. """
+
+# ----------------------------------------------------------------------
+#   Imports
+# ----------------------------------------------------------------------
+import os
+import sys
+import shutil
+
+# ----------------------------------------------------------------------
+#   Main
+# ----------------------------------------------------------------------
+def main():
+    stored_folder = os.path.join(os.path.dirname(os.path.abspath(__file__)),'avl_files_surrogate')
+    for line in sys.stdin:
+        filename = line.strip()
+        if filename.endswith('.txt') and os.path.exists(os.path.join(stored_folder,filename)):
+            shutil.copy(os.path.join(stored_folder,filename),filename)
+            print('Wrote ' + filename)
+    return
+
+if __name__ == '__main__':
+    main()
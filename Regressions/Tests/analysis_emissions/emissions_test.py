@@ -79,6 +79,24 @@ def main():
                     print('EI H2O Error: ',diff_EI_H2O)
                     assert (diff_EI_H2O/true_EI_H2O) < 1e-1
                 i += 1
+                
+    if cantera_installation:
+        # a training resumed from the checkpoint of finished grid points and a training on a pool of workers 
+        # must reproduce the training 
+        checkpoint_file = 'CRN_training_checkpoint'
+        training        = []
+        for checkpoint, workers in [(checkpoint_file,1),(checkpoint_file,1),(None,2)]:
+            emissions                                       = base_analysis(vehicle_setup(),emissions_methods[1], True).emissions
+            emissions.training.temperature                  = np.linspace(700, 900, 2) 
+            emissions.settings.training_checkpoint_file     = checkpoint
+            emissions.settings.training_checkpoint_interval = 0. 
+            emissions.settings.number_of_training_workers   = workers
+            RCAIDE.Library.Methods.Emissions.Chemical_Reactor_Network_Method.train_CRN_EI_surrogates(emissions)
+            training.append(emissions.training)
+        os.remove(checkpoint_file + '.pkl')
+        for species in ['EI_CO2','EI_CO','EI_H2O','EI_NO','EI_NO2']:
+            assert np.array_equal(training[0][species],training[1][species])
+            assert np.array_equal(training[0][species],training[2][species])
              
     return 
 
@@ -9,12 +9,17 @@
 import RCAIDE
 from RCAIDE.Framework.Core import Units , Data 
 from RCAIDE.Library.Plots import *
+from RCAIDE.Library.Methods.Geodesics import load_topography
+from RCAIDE.Library.Methods.Noise.Common import generate_terrain_microphone_locations
 
 # Python imports
 import matplotlib.pyplot as plt  
 import sys 
 import os
 import numpy as np     
+from scipy.interpolate import griddata
+import tempfile
+import shutil
 
 sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
 from NASA_X57    import vehicle_setup, configs_setup     
@@ -55,9 +60,61 @@ def main():
     X57_SPL_true   = 96.64761095865973
     X57_diff_SPL   = np.abs(X57_SPL - X57_SPL_true)
     print('Error: ',X57_diff_SPL)
-    assert np.abs((X57_SPL - X57_SPL_true)/X57_SPL_true) < 1e-3 
-     
-    return      
+    assert np.abs((X57_SPL - X57_SPL_true)/X57_SPL_true) < 1e-3
+
+    # evaluating the rotors and control points on a pool of workers must reproduce the serial noise
+    segment        = results.segments.cruise
+    serial_SPL_dBA = np.copy(segment.conditions.noise.hemisphere_SPL_dBA)
+    segment.analyses.noise.settings.number_of_workers = 2
+    segment.analyses.noise.evaluate_noise(segment)
+    assert np.array_equal(segment.conditions.noise.hemisphere_SPL_dBA,serial_SPL_dBA)
+    
+    # parsed topography files are reused by later calls
+    topography_cache_test('LA_Metropolitan_Area.txt')
+
+    return
+
+def topography_cache_test(topography_file):
+    """ Checks that the same file and grid reuse the cached topography and its interpolator, and that another
+        grid resolution or another file are not taken from the cache
+    """
+    settings                         = Data()
+    settings.topography_file         = topography_file
+    settings.microphone_x_resolution = 20
+    settings.microphone_y_resolution = 30
+    
+    # the same file and grid return the cached result
+    topography                       = load_topography(topography_file)
+    assert load_topography(topography_file) is topography
+    cartesian_pts, lat_long_pts      = generate_terrain_microphone_locations(settings)
+    interpolator                     = topography.interpolators.linear
+    cached_cartesian_pts, cached_lat_long_pts = generate_terrain_microphone_locations(settings)
+    assert topography.interpolators.linear is interpolator
+    assert np.array_equal(cartesian_pts,cached_cartesian_pts,equal_nan=True)
+    assert np.array_equal(lat_long_pts,cached_lat_long_pts,equal_nan=True)
+    
+    # another resolution evaluates the elevation at the new microphones
+    settings.microphone_x_resolution = 25
+    cartesian_pts, lat_long_pts      = generate_terrain_microphone_locations(settings)
+    data                             = np.loadtxt(topography_file)
+    elevation                        = griddata((data[:,1],data[:,0]),data[:,2],(lat_long_pts[:,0],lat_long_pts[:,1]),method='linear')
+    assert np.shape(cartesian_pts) == (25*30,3)
+    assert np.allclose(lat_long_pts[:,2],elevation,rtol=1e-12,equal_nan=True)
+    
+    # another file, or the same file once modified, is parsed again
+    directory = tempfile.mkdtemp()
+    try:
+        other_file       = os.path.join(directory,'topography.txt')
+        np.savetxt(other_file,data[::2])
+        other_topography = load_topography(other_file)
+        assert other_topography is not topography
+        assert len(other_topography.elevation) == len(data[::2])
+        np.savetxt(other_file,data[::3])
+        assert len(load_topography(other_file).elevation) == len(data[::3])
+    finally:
+        shutil.rmtree(directory)
+    
+    return
 
 # ----------------------------------------------------------------------
 #   Define the Vehicle Analyses
@@ -10,9 +10,13 @@
 # ----------------------------------------------------------------------
 
 import RCAIDE
-from RCAIDE.Framework.Core import Units 
+from RCAIDE.Framework.Core import Units, Data 
 from RCAIDE.Library.Plots import *      
 from RCAIDE.Library.Methods.Geometry.Planform import wing_planform 
+from RCAIDE.Library.Methods.Noise.Common      import noise_tone_correction, generate_hemisphere_microphone_locations
+from RCAIDE.Library.Methods.Noise.Metrics     import PNL_noise_metric, EPNL_noise_metric
+from RCAIDE.Library.Methods.Noise.Correlation_Buildup.Airframe import airframe_noise
+from RCAIDE.Library.Methods.Noise.Correlation_Buildup.Turbofan import turbofan_engine_noise
 
 import sys
 import matplotlib.pyplot as plt 
@@ -53,10 +57,72 @@ def main():
     print('SPL difference: ',B737_diff_SPL)
     assert np.abs((B737_SPL - B737_SPL_true)/B737_SPL_true) < 1e-3
     
+    # blocks of microphones and EPNL
+    microphone_chunks_test(baseline_results)
+    
+    # tone correction of every control point
+    tone_correction_test()
+    
     # plot aircraft
     plot_3d_vehicle(vehicle, show_figure=False)
     return
 
+def microphone_chunks_test(results):
+    """ Evaluates the noise of the takeoff in several blocks of microphones, checks that the SPL and the
+        EPNL are identical to a single block and pins the EPNL of the engines and of the airframe
+    """
+    segment    = results.segments.takeoff
+    noise      = segment.analyses.noise
+    settings   = noise.settings
+    config     = noise.vehicle
+    conditions = segment.state.conditions
+    mics       = generate_hemisphere_microphone_locations(settings)
+    n_cpts     = int(segment.state.numerics.number_of_control_points)
+    
+    EPNL       = Data()
+    SPL_dBA    = Data()
+    for tag,memory in zip(['single','blocks'],[None, 40*n_cpts*len(settings.center_frequencies)*8*len(mics)/4]):
+        settings.microphone_chunk_memory = memory
+        noise.evaluate_noise(segment)
+        SPL_dBA[tag]        = np.copy(conditions.noise.hemisphere_SPL_dBA)
+        EPNL[tag]           = Data()
+        EPNL[tag].airframe  = airframe_noise(mics,segment,config,settings).EPNL_total
+        propulsor           = config.networks.fuel.propulsors.starboard_propulsor
+        EPNL[tag].engine    = turbofan_engine_noise(mics,propulsor,conditions.noise[propulsor.tag].turbofan,segment,settings).EPNL_total
+    settings.microphone_chunk_memory = 2.5E8
+    
+    assert np.array_equal(SPL_dBA.single,SPL_dBA.blocks)
+    assert np.array_equal(EPNL.single.airframe,EPNL.blocks.airframe)
+    assert np.array_equal(EPNL.single.engine,EPNL.blocks.engine)
+    
+    engine_EPNL        = np.max(EPNL.single.engine)
+    airframe_EPNL      = np.max(EPNL.single.airframe)
+    engine_EPNL_true   = 160.34801279390342
+    airframe_EPNL_true = 122.56799007681664
+    print('Engine EPNL difference: ',np.abs(engine_EPNL - engine_EPNL_true))
+    print('Airframe EPNL difference: ',np.abs(airframe_EPNL - airframe_EPNL_true))
+    assert np.abs((engine_EPNL - engine_EPNL_true)/engine_EPNL_true) < 1e-6
+    assert np.abs((airframe_EPNL - airframe_EPNL_true)/airframe_EPNL_true) < 1e-6
+    return
+
+def tone_correction_test():
+    """ Computes the EPNL of a time history with a tone in the spectrum of every control point, the tone
+        correction applies to all control points
+    """
+    bands          = np.arange(24)
+    level          = np.array([80.,88.,92.,88.,80.])
+    SPL            = level[:,None,None] - 0.5*np.abs(bands - 12)[None,None,:] + np.zeros((1,2,1))
+    SPL[:,1,14]   += 8.
+    
+    tone_correction = noise_tone_correction(SPL)
+    EPNL            = EPNL_noise_metric(PNL_noise_metric(SPL) + tone_correction)
+    EPNL_true       = np.array([103.72884329, 107.16348343])
+    print('Tone corrected EPNL difference: ',np.max(np.abs(EPNL - EPNL_true)))
+    assert np.all(tone_correction[:,0] == 0)
+    assert np.allclose(tone_correction[:,1],8/3,rtol=1e-12)
+    assert np.allclose(EPNL,EPNL_true,rtol=1e-8)
+    return
+
 def base_analysis(vehicle):
 
     # ------------------------------------------------------------------
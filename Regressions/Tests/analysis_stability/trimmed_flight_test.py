@@ -6,8 +6,9 @@
 #  IMPORT
 # ---------------------------------------------------------------------------------------------------------------------- 
 import RCAIDE 
-from RCAIDE.Framework.Core import Units     
+from RCAIDE.Framework.Core import Units, Data     
 from RCAIDE.Library.Plots       import *  
+from RCAIDE.Library.Methods.Stability.Common import compute_dynamic_flight_modes
 
 # python imports  
 import pylab as plt
@@ -63,11 +64,112 @@ def main():
     print('Error3: ',rudder_deflection_diff)
     assert np.abs(rudder_deflection_diff/rudder_deflection_true) < 5e-3    
 
+    # dynamic modes of a vehicle with a product of inertia 
+    full_inertia_tensor_test()
+
     # plt results
     plot_mission(results)
     
     return  
 # ----------------------------------------------------------------------
+#   Full Inertia Tensor Test
+# ----------------------------------------------------------------------
+
+def full_inertia_tensor_test():
+    
+    # stability conditions of three level flight cases at different angles of attack, each case uses its own 
+    # angle of attack in the stability axis inertias 
+    vehicle   = vehicle_setup()
+    vehicle.mass_properties.moments_of_inertia.tensor = np.array([[1285.3,0.0,-60.0],[0.0,1824.9,0.0],[-60.0,0.0,2666.9]])
+    state     = Data()
+    state.conditions = stability_conditions(vehicle,np.array([[2.],[4.],[6.]]) * Units.degrees)
+    compute_dynamic_flight_modes(state,Data(),vehicle)
+    LongModes = state.conditions.dynamic_stability.LongModes
+    LatModes  = state.conditions.dynamic_stability.LatModes 
+    
+    modes      = [LongModes.phugoidFreqHz,LongModes.phugoidDamping,LongModes.shortPeriodFreqHz,LongModes.shortPeriodDamping,
+                  LatModes.dutchRollFreqHz,LatModes.dutchRollDamping,LatModes.rollSubsistenceTimeConstant,LatModes.spiralTimeDoubleHalf]
+    modes_true = [np.array([0.048107318468361096, 0.048107318468361096, 0.048107318468361096]),
+                  np.array([0.04304418737454107, 0.04304418737454107, 0.04304418737454107]),
+                  np.array([0.8360043260537725, 0.8360043260537725, 0.8360043260537725]),
+                  np.array([0.7278713157349984, 0.7278713157349984, 0.7278713157349984]),
+                  np.array([0.504120093680983, 0.5050361453949421, 0.5065690959850777]),
+                  np.array([0.2501453624528246, 0.2506254876970942, 0.2514288268895842]),
+                  np.array([0.1077854560562445, 0.10740173237899517, 0.1067640823232524]),
+                  np.array([82.06164804676854, 82.05172805579733, 82.03524858141213])]
+    
+    for mode,mode_true in zip(modes,modes_true):
+        mode_diff = np.max(np.abs(mode[:,0] - mode_true)/np.abs(mode_true))
+        print('Dynamic Mode Error: ',mode_diff)
+        assert mode_diff < 1e-8
+    
+    return 
+
+def stability_conditions(vehicle,alpha):
+    
+    # stability derivatives representative of the Navion in cruise
+    n_cases    = len(alpha)
+    ones       = np.ones((n_cases,1))
+    u0         = 53.6 
+    rho        = 1.225 
+    conditions = Data()
+    conditions.aerodynamics                         = Data()
+    conditions.aerodynamics.angles                  = Data()
+    conditions.freestream                           = Data()
+    conditions.frames                               = Data()
+    conditions.frames.inertial                      = Data()
+    conditions.static_stability                     = Data()
+    conditions.static_stability.derivatives         = Data()
+    conditions.dynamic_stability                    = Data()
+    conditions.control_surfaces                     = Data()
+    conditions.aerodynamics.angles.alpha            = alpha
+    conditions.freestream.gravity                   = 9.81 * ones
+    conditions.freestream.density                   = rho * ones
+    conditions.freestream.velocity                  = u0 * ones
+    conditions.freestream.dynamic_pressure          = 0.5 * rho * u0**2 * ones 
+    conditions.frames.inertial.velocity_vector      = np.hstack([u0 * ones,0 * ones,0 * ones])
+    conditions.b_ref                                = vehicle.wings.main_wing.spans.projected
+    conditions.c_ref                                = vehicle.wings.main_wing.chords.mean_aerodynamic
+    conditions.S_ref                                = vehicle.reference_area
+    conditions.static_stability.spiral_criteria     = 0 * ones 
+    conditions.dynamic_stability.LongModes          = Data()
+    conditions.dynamic_stability.LatModes           = Data()
+    
+    SSD          = conditions.static_stability.derivatives
+    SSD.CX_u     = -0.1    * ones
+    SSD.CX_alpha =  0.08   * ones
+    SSD.CZ_u     = -0.82   * ones
+    SSD.CZ_alpha = -4.49   * ones
+    SSD.CZ_q     = -3.8    * ones
+    SSD.CM_u     =  0.0    * ones
+    SSD.CM_alpha = -0.683  * ones
+    SSD.CM_q     = -9.96   * ones
+    SSD.CZ_alpha_dot = -1.7  * ones
+    SSD.CM_alpha_dot = -4.36 * ones
+    SSD.CY_beta  = -0.564  * ones
+    SSD.CY_r     =  0.0    * ones
+    SSD.CL_beta  = -0.074  * ones
+    SSD.CL_p     = -0.410  * ones
+    SSD.CL_r     =  0.107  * ones
+    SSD.CN_beta  =  0.071  * ones
+    SSD.CN_p     = -0.0575 * ones
+    SSD.CN_r     = -0.125  * ones 
+    
+    for surface in ['elevator','aileron']:
+        conditions.control_surfaces[surface]                                = Data()
+        conditions.control_surfaces[surface].static_stability               = Data()
+        conditions.control_surfaces[surface].static_stability.coefficients  = Data()
+    elevator       = conditions.control_surfaces.elevator.static_stability.coefficients
+    elevator.lift  =  0.355  * ones
+    elevator.M     = -0.923  * ones
+    aileron        = conditions.control_surfaces.aileron.static_stability.coefficients
+    aileron.Y      =  0.0    * ones
+    aileron.L      = -0.134  * ones
+    aileron.N      = -0.0035 * ones
+    
+    return conditions
+
+# ----------------------------------------------------------------------
 #   Define the Vehicle Analyses
 # ----------------------------------------------------------------------
 
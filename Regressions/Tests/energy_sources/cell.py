@@ -10,6 +10,7 @@
 import RCAIDE  
 from RCAIDE.Framework.Core                                    import Units, Data 
 from RCAIDE.Library.Methods.Energy.Sources.Batteries.Common   import size_module_from_mass ,size_module_from_energy_and_power, find_mass_gain_rate, find_total_mass_gain, find_ragone_properties
+from RCAIDE.Library.Methods.Energy.Sources.Batteries.Common   import load_battery_data, save_battery_raw_data, load_battery_raw_data
 from RCAIDE.Library.Methods.Energy.Sources.Batteries.Aluminum_Air import * 
 from RCAIDE.Framework.Mission.Common                          import Conditions
 from RCAIDE.Library.Plots                                     import * 
@@ -18,6 +19,7 @@ from RCAIDE.Library.Plots                                     import *
 import numpy as np
 import matplotlib.pyplot as plt 
 import matplotlib.cm as cm
+from copy import deepcopy
 
 # local imports 
 import sys 
@@ -44,6 +46,12 @@ def main():
         
     # Lithium-Ion Test
     lithium_ion_battery_test()
+    
+    # Lithium-Ion batched and sequential time-marching 
+    lithium_ion_batched_evaluation_test()
+    
+    # Lithium-Ion shared battery data 
+    lithium_ion_battery_data_test()
     return 
     
      
@@ -174,6 +182,53 @@ def lithium_ion_battery_test():
     axes6.set_xlim([0,7])  
     
     return  
+
+def lithium_ion_batched_evaluation_test():    
+    
+    battery_chemistry     = ['lithium_ion_nmc','lithium_ion_lfp']    
+    for i in range(len(battery_chemistry)):
+        results = []
+        for batched in [True,False]: 
+            vehicle  = vehicle_setup(1.5,0.5,battery_chemistry[i],'Series')
+            configs  = configs_setup(vehicle)
+            for config in configs.values():
+                for network in config.networks:
+                    network.batched_battery_evaluation = batched
+            analyses = analyses_setup(configs)
+            mission  = mission_setup(analyses,vehicle,battery_chemistry[i],1.5,3800) 
+            missions = missions_setup(mission)  
+            results.append(missions.base_mission.evaluate())
+            
+        for segment_batched, segment in zip(results[0].segments.values(),results[1].segments.values()):
+            cell_batched = segment_batched.conditions.energy.bus.battery_modules[battery_chemistry[i]].cell
+            cell         = segment.conditions.energy.bus.battery_modules[battery_chemistry[i]].cell
+            for tag in ['voltage_under_load','temperature','state_of_charge','charge_throughput','heat_energy_generated']:
+                error = np.max(np.abs(cell_batched[tag] - cell[tag])/np.maximum(np.abs(cell[tag]),1E-12))
+                print(battery_chemistry[i] + ' ' + segment.tag + ' batched ' + tag + ' difference: ' + str(error))
+                assert error < 1e-12
+    return 
+
+def lithium_ion_battery_data_test():
+    
+    # battery modules of a chemistry and their copies share one performance map 
+    battery_modules = [RCAIDE.Library.Components.Energy.Sources.Battery_Modules.Lithium_Ion_LFP() for i in range(3)]
+    battery_modules.append(deepcopy(battery_modules[0]))
+    for battery_module in battery_modules:
+        assert battery_module.cell.discharge_performance_map is battery_modules[0].cell.discharge_performance_map  
+    
+    nmc_module      = RCAIDE.Library.Components.Energy.Sources.Battery_Modules.Lithium_Ion_NMC()
+    nmc_module_copy = deepcopy(nmc_module)
+    assert nmc_module_copy.cell.discharge_performance_map.Voltage is nmc_module.cell.discharge_performance_map.Voltage 
+
+    # binary form of the raw data 
+    raw_data = load_battery_data('LiNiMnCoO2',None,None).raw_data
+    save_battery_raw_data(raw_data,'nmc_raw_data_test.npz')
+    npz_data = load_battery_raw_data('nmc_raw_data_test.npz')
+    os.remove('nmc_raw_data_test.npz')
+    for i, Amps in enumerate(raw_data.Voltage):
+        for j , Deg in enumerate(Amps): 
+            assert np.all(npz_data.Voltage[list(raw_data.Voltage.keys())[i]][list(Amps.keys())[j]] == Deg) 
+    return 
  
 def analyses_setup(configs):
 
@@ -0,0 +1,319 @@
+# Regression/scripts/Tests/mission_segments/segment_solver_test.py
+#
+#
+# Created:  Oct 2026, RCAIDE Team
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  IMPORT
+# ----------------------------------------------------------------------------------------------------------------------
+# RCAIDE imports
+import RCAIDE
+from RCAIDE.Framework.Core import Units ,Data, Packing_Layout
+from RCAIDE.Library.Mission.Solver.jacobian import group_columns
+
+# python imports
+import numpy as np
+from copy import deepcopy
+import sys
+import os
+
+sys.path.append(os.path.join( os.path.split(os.path.split(sys.path[0])[0])[0], 'Vehicles'))
+# the analysis functions
+
+from Cessna_172  import vehicle_setup ,configs_setup
+
+# ----------------------------------------------------------------------------------------------------------------------
+#  REGRESSION
+# ----------------------------------------------------------------------------------------------------------------------
+def main():
+
+    # solve the same mission with the default and the colored finite difference jacobian,
+    # and with the compiled conditions
+    cases   = Data()
+    cases.none     = ['none',False]
+    cases.colored  = ['colored',False]
+    cases.compiled = ['none',True]
+    results  = Data()
+    missions = Data()
+    for tag,(solver_jacobian,compiled_conditions) in cases.items():
+        vehicle  = vehicle_setup()
+        configs  = configs_setup(vehicle)
+        analyses = analyses_setup(configs)
+        mission  = mission_setup(analyses,solver_jacobian,compiled_conditions)
+        results[tag]  = mission.evaluate()
+        missions[tag] = mission
+
+    P_truth     = 53642.7801812346
+
+    error = Data()
+    for tag,result in results.items():
+        assert(result.segments.cruise.state.numerics.converged)
+        P   = result.segments.cruise.state.conditions.energy.ice_propeller.internal_combustion_engine.power[-1,0]
+        error[tag] = np.abs((P - P_truth)/P_truth)
+
+    print('Errors:')
+    print(error)
+
+    for k,v in list(error.items()):
+        assert(np.abs(v)<1e-6)
+
+    # the first colored solve probes the sparsity pattern of each segment, the second solve colors
+    # the finite differences with it and reaches the same solution as the dense finite differences
+    results.colored = missions.colored.evaluate()
+    for tag in ['cruise','descent','climb']:
+        dense    = results.none.segments[tag].state
+        colored  = results.colored.segments[tag].state
+        sparsity = colored.numerics.jacobian_sparsity
+        assert(colored.numerics.converged)
+        assert(np.max(group_columns(sparsity))+1 < sparsity.shape[1])
+        assert(np.allclose(colored.unknowns.pack_array(),dense.unknowns.pack_array(),rtol=1e-6,atol=1e-9))
+        assert(np.allclose(colored.conditions.weights.total_mass,dense.conditions.weights.total_mass,rtol=1e-9))
+
+    # packing of the unknowns and residuals with a precomputed layout
+    packing_test(results.colored.segments.cruise)
+
+    # attribute access of the update conditions process
+    conditions_test(results.none.segments.cruise,results.compiled.segments.cruise)
+
+    # memoized atmosphere of a constant altitude segment
+    atmosphere_memo_test(results.none.segments.cruise)
+
+    return
+
+def packing_test(segment):
+    """ Checks that packing with a Packing_Layout matches Data.pack_array/unpack_array
+    """
+    unknowns  = segment.state.unknowns
+    residuals = segment.state.residuals
+    x         = unknowns.pack_array()
+    R         = residuals.pack_array()
+
+    unknowns_layout  = Packing_Layout(unknowns)
+    residuals_layout = Packing_Layout(residuals)
+    unknowns_layout.unpack(x)
+
+    assert(np.all(unknowns_layout.pack() == x))
+    assert(np.all(residuals_layout.pack() == R))
+    assert(np.all(unknowns.pack_array() == x))
+
+    # reassigned values are picked up by the layout
+    residuals.force_x = residuals.force_x + 1.
+    assert(np.all(residuals_layout.pack() == residuals.pack_array()))
+
+    return
+
+def atmosphere_memo_test(segment):
+    """ Checks that the memoized atmosphere of a constant altitude segment matches the computed
+        atmosphere, and that a new altitude is not taken from the memo
+    """
+    freestream = segment.state.conditions.freestream
+    numerics   = segment.state.numerics
+    atmosphere = segment.analyses.atmosphere
+    update     = RCAIDE.Library.Mission.Common.Update.atmosphere
+
+    atmosphere_data = atmosphere.compute_values(freestream.altitude,segment.temperature_deviation)
+    for memoize_atmosphere in [False,True]:
+        numerics.memoize_atmosphere = memoize_atmosphere
+        numerics.atmosphere_memo    = None
+        for i in range(2):
+            update(segment)
+            assert(np.array_equal(freestream.density,atmosphere_data.density))
+
+    # changes to the conditions do not reach the memo
+    freestream.density *= 2.
+    update(segment)
+    assert(np.array_equal(freestream.density,atmosphere_data.density))
+
+    # the memo is not used when memoization is turned off or with another atmosphere
+    numerics.atmosphere_memo.atmosphere_data.density = np.zeros_like(atmosphere_data.density)
+    numerics.memoize_atmosphere = False
+    update(segment)
+    assert(np.array_equal(freestream.density,atmosphere_data.density))
+    numerics.memoize_atmosphere = True
+    numerics.atmosphere_memo.atmosphere = deepcopy(atmosphere)
+    numerics.atmosphere_memo.atmosphere_data.density = np.zeros_like(atmosphere_data.density)
+    update(segment)
+    assert(np.array_equal(freestream.density,atmosphere_data.density))
+
+    # a new altitude is computed
+    freestream.altitude = freestream.altitude + 100.
+    update(segment)
+    atmosphere_data = atmosphere.compute_values(freestream.altitude,segment.temperature_deviation)
+    assert(np.array_equal(freestream.density,atmosphere_data.density))
+    assert(np.array_equal(freestream.speed_of_sound,atmosphere_data.speed_of_sound))
+
+    return
+
+def conditions_test(segment,compiled_segment):
+    """ Checks that the iterate.conditions steps that only move data between conditions (no aerodynamics
+        or propulsion) give the same results with Conditions and with Compiled_Conditions
+    """
+    assert(type(compiled_segment.state.conditions.freestream) == RCAIDE.Framework.Mission.Common.Compiled_Conditions)
+
+    # evaluate both segments at the same unknowns
+    compiled_segment.state.unknowns.unpack_array(segment.state.unknowns.pack_array())
+
+    steps   = ['differentials','orientations','acceleration','angular_acceleration','altitude','gravity','freestream','weights','forces','moments']
+    for seg in [segment,compiled_segment]:
+        for step in steps:
+            seg.process.iterate.conditions[step](seg)
+
+    conditions          = segment.state.conditions
+    compiled_conditions = compiled_segment.state.conditions
+    assert(np.array_equal(conditions.freestream.dynamic_pressure,compiled_conditions.freestream.dynamic_pressure))
+    assert(np.array_equal(conditions.frames.inertial.velocity_vector,compiled_conditions.frames.inertial.velocity_vector))
+
+    return
+
+# ----------------------------------------------------------------------
+#   Define the Mission
+# ----------------------------------------------------------------------
+
+def mission_setup(analyses,solver_jacobian,compiled_conditions):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Mission
+    # ------------------------------------------------------------------
+
+    mission = RCAIDE.Framework.Mission.Sequential_Segments()
+    mission.tag = 'the_mission'
+
+    # unpack Segments module
+    Segments = RCAIDE.Framework.Mission.Segments
+
+    # base segment
+    base_segment = Segments.Segment()
+
+    # ------------------------------------------------------------------
+    #   Cruise Segment: Constant Speed Constant Altitude
+    # ------------------------------------------------------------------
+
+    segment     = Segments.Cruise.Constant_Speed_Constant_Altitude(base_segment)
+    segment.tag = "cruise"
+    segment.analyses.extend( analyses.base )
+    segment.altitude                                   = 12000. * Units.feet
+    segment.air_speed                                  = 119.   * Units.knots
+    segment.distance                                   = 10 * Units.nautical_mile
+    segment.state.numerics.number_of_control_points    = 4
+    segment.state.numerics.solver_jacobian             = solver_jacobian
+    segment.state.numerics.compiled_conditions         = compiled_conditions
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['ice_propeller']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Descent Segment: Constant Speed Constant Rate
+    # ------------------------------------------------------------------
+
+    segment     = Segments.Descent.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "descent"
+    segment.analyses.extend( analyses.base )
+    segment.altitude_end                               = 8000. * Units.feet
+    segment.air_speed                                  = 110.  * Units.knots
+    segment.descent_rate                               = 500.  * Units['ft/min']
+    segment.state.numerics.number_of_control_points    = 4
+    segment.state.numerics.solver_jacobian             = solver_jacobian
+    segment.state.numerics.compiled_conditions         = compiled_conditions
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['ice_propeller']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    # ------------------------------------------------------------------
+    #   Climb Segment: Constant Speed Constant Rate
+    # ------------------------------------------------------------------
+
+    segment     = Segments.Climb.Constant_Speed_Constant_Rate(base_segment)
+    segment.tag = "climb"
+    segment.analyses.extend( analyses.base )
+    segment.altitude_end                               = 10000. * Units.feet
+    segment.air_speed                                  = 90.    * Units.knots
+    segment.climb_rate                                 = 500.   * Units['ft/min']
+    segment.state.numerics.number_of_control_points    = 4
+    segment.state.numerics.solver_jacobian             = solver_jacobian
+    segment.state.numerics.compiled_conditions         = compiled_conditions
+
+    # define flight dynamics to model
+    segment.flight_dynamics.force_x                       = True
+    segment.flight_dynamics.force_z                       = True
+
+    # define flight controls
+    segment.assigned_control_variables.throttle.active               = True
+    segment.assigned_control_variables.throttle.assigned_propulsors  = [['ice_propeller']]
+    segment.assigned_control_variables.body_angle.active             = True
+
+    mission.append_segment(segment)
+
+    return mission
+
+def base_analysis(vehicle):
+
+    # ------------------------------------------------------------------
+    #   Initialize the Analyses
+    # ------------------------------------------------------------------
+    analyses = RCAIDE.Framework.Analyses.Vehicle()
+
+    # ------------------------------------------------------------------
+    #  Weights
+    weights = RCAIDE.Framework.Analyses.Weights.Weights_Transport()
+    weights.vehicle = vehicle
+    analyses.append(weights)
+
+    # ------------------------------------------------------------------
+    #  Aerodynamics Analysis
+    aerodynamics = RCAIDE.Framework.Analyses.Aerodynamics.Vortex_Lattice_Method()
+    aerodynamics.vehicle                            = vehicle
+    aerodynamics.settings.drag_coefficient_increment = 0.0000
+    analyses.append(aerodynamics)
+
+    # ------------------------------------------------------------------
+    #  Energy
+    energy= RCAIDE.Framework.Analyses.Energy.Energy()
+    energy.vehicle  = vehicle
+    analyses.append(energy)
+
+    # ------------------------------------------------------------------
+    #  Planet Analysis
+    planet = RCAIDE.Framework.Analyses.Planets.Earth()
+    analyses.append(planet)
+
+    # ------------------------------------------------------------------
+    #  Atmosphere Analysis
+    atmosphere = RCAIDE.Framework.Analyses.Atmospheric.US_Standard_1976()
+    atmosphere.features.planet = planet.features
+    analyses.append(atmosphere)
+
+    return analyses
+
+def analyses_setup(configs):
+
+    analyses = RCAIDE.Framework.Analyses.Analysis.Container()
+
+    # build a base analysis for each config
+    for tag,config in configs.items():
+        analysis = base_analysis(config)
+        analyses[tag] = analysis
+
+    return analyses
+
+# ----------------------------------------------------------------------
+#   Call Main
+# ----------------------------------------------------------------------
+
+if __name__ == '__main__':
+    main()
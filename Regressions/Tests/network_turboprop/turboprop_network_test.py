@@ -72,9 +72,12 @@ def main():
     print('Errors:')
     print(error)
      
-    for k,v in list(error.items()): 
+    for k,v in list(error.items()):
         assert(np.abs(v)<1e-6)
-    
+
+    # the identical port propulsor references the results of the starboard propulsor
+    shared_conditions_test(configs,missions,results)
+
     # plt the old results
     plot_mission(results)   
     return 
@@ -134,7 +137,34 @@ def base_analysis(vehicle):
     analyses.append(atmosphere)   
     
     # done!
-    return analyses    
+    return analyses
+
+# ----------------------------------------------------------------------
+#   Shared Conditions Test
+# ----------------------------------------------------------------------
+
+def shared_conditions_test(configs,missions,results):
+    segment   = results.segments.climbing_cruise
+    starboard = segment.conditions.energy.starboard_propulsor
+    assert np.shares_memory(segment.conditions.energy.port_propulsor.thrust,starboard.thrust)
+    assert segment.conditions.energy.port_propulsor is not starboard
+
+    # the mission evaluates in place, so keep copies of the thrust computed with shared conditions
+    shared_thrust = Data()
+    for tag in results.segments.keys():
+        shared_thrust[tag] = np.copy(results.segments[tag].conditions.energy.port_propulsor.thrust)
+
+    # deep copies of the starboard propulsor results give the same mission
+    for config in configs:
+        for net in config.networks:
+            net.share_identical_propulsor_conditions = False
+    deepcopy_results = missions.base_mission.evaluate()
+    for tag in deepcopy_results.segments.keys():
+        deepcopy_thrust = deepcopy_results.segments[tag].conditions.energy.port_propulsor.thrust
+        assert np.array_equal(shared_thrust[tag],deepcopy_thrust)
+        assert not np.shares_memory(deepcopy_thrust,deepcopy_results.segments[tag].conditions.energy.starboard_propulsor.thrust)
+
+    return
 
 # ----------------------------------------------------------------------
 #   Plot Mission
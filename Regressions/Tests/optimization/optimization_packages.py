@@ -103,6 +103,81 @@ def main():
     assert( np.isclose(x1 ,  0, atol=1e-1) )
     assert( np.isclose(x2 ,  1, atol=1e-1) )     
 
+    # the swarm evaluated in batches on a pool of workers
+    problem.number_of_workers = 2
+    sys.stdout = open(os.devnull,'w')      
+    outputs = scipy_setup.SciPy_Solve(problem, solver='particle_swarm_optimization' , sense_step = 1.4901161193847656e-08, pop_size =  100 , prob_seed = seed )  
+    sys.stdout = sys.__stdout__  
+    print(outputs)   
+    assert( np.isclose(outputs[1][0],  1, atol=1e-2) )
+    assert( np.isclose(outputs[0][0],  0, atol=1e-1) )
+    assert( np.isclose(outputs[0][1],  1, atol=1e-1) )     
+    
+    # the pool of workers is shut down with the optimization
+    nexus_worker_pools = sys.modules['RCAIDE.Framework.Optimization.Common.Nexus'].nexus_worker_pools
+    assert( id(problem) not in nexus_worker_pools )
+
+    # and when the optimization fails
+    try:
+        scipy_setup.SciPy_Solve(problem, solver='unknown_solver')
+    except ValueError:
+        pass
+    assert( id(problem) not in nexus_worker_pools )
+
+    # ------------------------------------------------------------------
+    #   SLSQP with an Evaluation Cache
+    # ------------------------------------------------------------------ 
+    print('\n\n Checking evaluation cache and parallel finite differences')
+    serial_problem = setup('SLSQP')
+    cached_problem = setup('SLSQP')
+    cached_problem.evaluation_cache_size = 100
+    for nexus in [serial_problem,cached_problem]:
+        nexus.optimization_problem.constraints = np.array([
+            [ 'x1' , '>', -10., 1., 1*Units.less],
+            [ 'x1' , '=',   0., 1., 1*Units.less],
+            [ 'x2' , '>',   1., 1., 1*Units.less],
+            [ 'x2' , '<',   2., 1., 1*Units.less],
+            ],dtype=object)  
+    sys.stdout = open(os.devnull,'w')   
+    serial_outputs = scipy_setup.SciPy_Solve(serial_problem, solver='SLSQP')  
+    cached_outputs = scipy_setup.SciPy_Solve(cached_problem, solver='SLSQP')  
+    sys.stdout = sys.__stdout__  
+    print('Evaluations without and with cache: ' + str(serial_problem.evaluation_count) + ', ' + str(cached_problem.evaluation_count))
+    
+    #   Check Results 
+    assert( np.array_equal(serial_outputs,cached_outputs) )
+    assert( cached_problem.evaluation_count < serial_problem.evaluation_count )
+
+    # the objective of cached inputs is not evaluated again, evaluate runs the procedure so the
+    # results of the nexus are those of the inputs
+    x_a   = np.array([0.5,1.5])
+    x_b   = np.array([0.2,1.2])
+    obj_a = cached_problem.objective(x_a)
+    cached_problem.objective(x_b)
+    count = cached_problem.evaluation_count
+    assert( np.array_equal(cached_problem.objective(x_a),obj_a) )
+    assert( cached_problem.evaluation_count == count )
+    cached_problem.evaluate(x_a)
+    assert( cached_problem.evaluation_count == count + 1 )
+    assert( np.array_equal(cached_problem.obj,obj_a) )
+
+    # finite differences on a pool of workers
+    x                   = np.array([0.5,1.5])
+    grad_obj, jac_con   = serial_problem.finite_difference(x)
+    cached_problem.number_of_workers = 2
+    pgrad_obj, pjac_con = cached_problem.finite_difference(x)
+    assert( np.array_equal(grad_obj,pgrad_obj) )
+    assert( np.array_equal(jac_con,pjac_con) )
+    
+    # the workers are started once and reused by the following batches
+    pool                = nexus_worker_pools[id(cached_problem)]
+    pgrad_obj, pjac_con = cached_problem.finite_difference(x + 0.1)
+    grad_obj, jac_con   = serial_problem.finite_difference(x + 0.1)
+    assert( nexus_worker_pools[id(cached_problem)] is pool )
+    assert( np.array_equal(grad_obj,pgrad_obj) )
+    assert( np.array_equal(jac_con,pjac_con) )
+    cached_problem.stop_workers()
+    assert( id(cached_problem) not in nexus_worker_pools )
 
     return
 
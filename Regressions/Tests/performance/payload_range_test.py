@@ -8,7 +8,7 @@
 # ----------------------------------------------------------------------------------------------------------------------
 # RCAIDE imports  
 import RCAIDE
-from RCAIDE.Framework.Core import Units , Container
+from RCAIDE.Framework.Core import Units , Container, Data
 from RCAIDE.Library.Methods.Performance.compute_payload_range_diagram        import compute_payload_range_diagram
 
 # python imports     
@@ -32,6 +32,25 @@ def main():
     fuel_error =  abs(fuel_r - fuel_r_true) /fuel_r_true
     assert(abs(fuel_error)<1e-6)
     
+    # ranges of the points of the payload range diagram
+    fuel_range_true        = np.array([0., 4570376.9199374765, 5567628.549937335, 7043315.939917731])
+    assert(np.allclose(fuel_payload_range_res.range,fuel_range_true,rtol=1e-6))
+    
+    # the pool of workers, the warm start and the secant update converge to the same fuel tolerance of 1 kg,
+    # which is about 540 m or 1.2e-4 of the shortest range of the diagram
+    modes                  = Data()
+    modes.workers          = Data(number_of_workers = 2)
+    modes.warm_start       = Data(warm_start = True)
+    modes.secant_update    = Data(secant_update = True)
+    modes.all              = Data(number_of_workers = 2, warm_start = True, secant_update = True)
+    for tag,mode in modes.items():
+        mode_payload_range_res = fuel_aircraft_payload_range(**mode)
+        mode_error             = np.max(np.abs(mode_payload_range_res.range[1:] - fuel_range_true[1:])/fuel_range_true[1:])
+        print('Fuel Range Error (' + tag + '): ' + str(mode_error))
+        assert(mode_error<1e-4)
+        assert(np.array_equal(mode_payload_range_res.payload,fuel_payload_range_res.payload))
+        assert(np.array_equal(mode_payload_range_res.fuel,fuel_payload_range_res.fuel))
+    
     electric_r_true = 37039.99999999999
     electric_payload_range_res = electric_aircraft_payload_range()       
     electric_r         =  electric_payload_range_res.range[-1]
@@ -41,7 +60,7 @@ def main():
     return 
     
     
-def fuel_aircraft_payload_range():
+def fuel_aircraft_payload_range(number_of_workers = 1, warm_start = False, secant_update = False):
     
     # vehicle data
     vehicle             = E190_vehicle_setup()
@@ -74,7 +93,10 @@ def fuel_aircraft_payload_range():
                                                            aerodynamics_analysis=aerodynamics,
                                                            cruise_airspeed=airspeed,
                                                            cruise_altitude=altitude, 
-                                                           max_range_guess = max_range_guess)
+                                                           max_range_guess = max_range_guess,
+                                                           number_of_workers = number_of_workers,
+                                                           warm_start = warm_start,
+                                                           secant_update = secant_update)
                                    
     return payload_range_results 
 
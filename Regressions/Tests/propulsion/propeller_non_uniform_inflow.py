@@ -43,6 +43,11 @@ def main():
     # test propeller in arbitrary nonuniform freestream disturbance
     #-------------------------------------------------------------    
     arbitrary_nonuniform_freestream_test()
+
+    #-------------------------------------------------------------
+    # test element-wise newton solve of the inflow against fsolve
+    #-------------------------------------------------------------
+    newton_inflow_solver_test()
      
     return
 
@@ -167,6 +172,44 @@ def arbitrary_nonuniform_freestream_test():
 
     return
 
+def newton_inflow_solver_test():
+    
+    # solve the inflow of the propeller with fsolve and with the element-wise newton iteration, at
+    # conditions where every blade station has a solution
+    velocity_range   = np.array([[30.]])
+    angular_velocity = 2000*Units.rpm 
+    for use_2d_analysis in [False,True]:
+        results = Data()
+        for inflow_solver in ['fsolve','newton']:
+            propeller                       = Test_Propeller() 
+            propeller.use_2d_analysis       = use_2d_analysis
+            propeller.Wake.inflow_solver    = inflow_solver
+            results[inflow_solver]          = propeller_aerodynamic_analysis(propeller, velocity_range,
+                                                                             angular_velocity = angular_velocity,
+                                                                             angle_of_attack = 0, 
+                                                                             altitude = 0,
+                                                                             delta_isa =0 )
+            assert np.all(results[inflow_solver].inflow_converged), "Inflow Solver Regression Failed at Convergence Test"
+        
+        thrust_fsolve = np.linalg.norm(results.fsolve.thrust)
+        thrust_newton = np.linalg.norm(results.newton.thrust)
+        print('\nInflow solver difference, 2D analysis ' + str(use_2d_analysis) + ': ', np.abs(thrust_newton - thrust_fsolve) / thrust_fsolve)
+        assert (np.abs(thrust_newton - thrust_fsolve) / thrust_fsolve < 1e-8), "Inflow Solver Regression Failed at Thrust Test"
+        assert (np.abs(results.newton.torque[0][0] - results.fsolve.torque[0][0]) / results.fsolve.torque[0][0] < 1e-8), "Inflow Solver Regression Failed at Torque Test"
+        assert np.allclose(results.newton.disc_axial_induced_velocity,results.fsolve.disc_axial_induced_velocity,rtol=1e-6,atol=1e-8), "Inflow Solver Regression Failed at Induced Velocity Test"
+    
+    # unknown inflow solvers are rejected
+    propeller                    = Test_Propeller() 
+    propeller.Wake.inflow_solver = 'automatic'
+    try:
+        propeller_aerodynamic_analysis(propeller, velocity_range, angular_velocity = angular_velocity, angle_of_attack = 0, altitude = 0, delta_isa =0 )
+    except ValueError:
+        pass
+    else:
+        raise AssertionError("Inflow Solver Regression Failed at Unknown Solver Test")
+
+    return
+
 if __name__ == '__main__':
     main()
     plt.show()
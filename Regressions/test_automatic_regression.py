@@ -15,6 +15,7 @@ modules = [
     'Tests/analysis_aerodynamics/airfoil_panel_method_convergence.py',
     'Tests/analysis_aerodynamics/VLM_control_surface_test.py',    
     'Tests/analysis_aerodynamics/VLM_moving_surface_test.py',   
+    'Tests/analysis_aerodynamics/VLM_surrogate_training_test.py',
     'Tests/analysis_aerodynamics/AVL_test.py',     
     'Tests/atmosphere/atmosphere.py',
     'Tests/atmosphere/constant_temperature.py',
@@ -34,6 +35,7 @@ modules = [
     'Tests/geometry/fuselage_planform_compute.py',  
     'Tests/future_capability_coverage/coverage_test.py',    
     'Tests/mission_segments/transition_segment_test.py', 
+    'Tests/mission_segments/segment_solver_test.py',
     'Tests/network_electric/electric_btms_test.py', 
     'Tests/network_ducted_fan/electric_ducted_fan_network_test.py',
     'Tests/network_turbofan/turbofan_network_test.py',